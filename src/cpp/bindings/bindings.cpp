@@ -16,6 +16,7 @@
 #include "./system/System.py.hpp"
 #include "./tools/run_unit_tests.py.hpp"
 #include "./version.py.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/TaskControl.hpp"
 
 #include <nanobind/nanobind.h>
@@ -46,6 +47,11 @@ NB_MODULE(_backend, m) // NOLINT
     m.def("get_task_info", &pairinteraction::get_task_info);
     m.def("get_progress_count", &pairinteraction::get_progress_count);
 
+    // wrap profiling functions
+    m.def("reset_profile", &pairinteraction::reset_profile);
+    m.def("get_profile_as_json", &pairinteraction::get_profile_as_json);
+    m.def("get_profile_as_chrome_trace", &pairinteraction::get_profile_as_chrome_trace);
+
     // enums
     bind_operator_type(m);
     bind_parity(m);
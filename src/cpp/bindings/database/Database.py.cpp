@@ -17,6 +17,13 @@ using namespace pairinteraction;
 static void declare_database(nb::module_ &m) {
     m.def("set_ca_bundle_path", &set_ca_bundle_path, "path"_a);
 
+    nb::class_<MatrixElementsCache::Info>(m, "MatrixElementsCacheInfo")
+        .def_ro("hits", &MatrixElementsCache::Info::hits)
+        .def_ro("misses", &MatrixElementsCache::Info::misses)
+        .def_ro("bytes", &MatrixElementsCache::Info::bytes)
+        .def_ro("entries", &MatrixElementsCache::Info::entries)
+        .def_ro("max_bytes", &MatrixElementsCache::Info::max_bytes);
+
     nb::class_<Database>(m, "Database")
         .def(nb::init<>())
         .def(nb::init<bool>(), "download_missing"_a)
@@ -25,8 +32,17 @@ static void declare_database(nb::module_ &m) {
              "database_dir"_a)
         .def("get_download_missing", &Database::get_download_missing)
         .def("get_use_cache", &Database::get_use_cache)
+        .def("set_use_disk_cache", &Database::set_use_disk_cache, "use_disk_cache"_a)
+        .def("get_use_disk_cache", &Database::get_use_disk_cache)
         .def("get_database_dir", &Database::get_database_dir)
-        .def("get_versions_info", &Database::get_versions_info);
+        .def("get_versions_info", &Database::get_versions_info)
+        .def("set_connection_pool_size", &Database::set_connection_pool_size, "size"_a)
+        .def("get_connection_pool_size", &Database::get_connection_pool_size)
+        .def("set_duckdb_threads", &Database::set_duckdb_threads, "threads"_a)
+        .def("set_duckdb_max_memory", &Database::set_duckdb_max_memory, "max_memory"_a)
+        .def_static("clear_cache", &Database::clear_cache)
+        .def_static("get_cache_info", &Database::get_cache_info)
+        .def_static("set_cache_max_bytes", &Database::set_cache_max_bytes, "max_bytes"_a);
 }
 
 void bind_database(nb::module_ &m) { declare_database(m); }
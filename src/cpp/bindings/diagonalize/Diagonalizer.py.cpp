@@ -5,13 +5,16 @@
 
 #include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerFeast.hpp"
+#include "pairinteraction/diagonalize/DiagonalizerLanczos.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerLapackeEvd.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerLapackeEvr.hpp"
 #include "pairinteraction/diagonalize/diagonalize.hpp"
+#include "pairinteraction/diagonalize/track_states.hpp"
 #include "pairinteraction/enums/FloatType.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
 #include "pairinteraction/system/SystemPair.hpp"
 
+#include <nanobind/eigen/dense.h>
 #include <nanobind/eigen/sparse.h>
 #include <nanobind/nanobind.h>
 #include <nanobind/stl/complex.h>
@@ -73,6 +76,23 @@ static void declare_diagonalizer_lapacke_evr(nb::module_ &m, std::string const &
              nb::call_guard<nb::gil_scoped_release>());
 }
 
+template <typename T>
+static void declare_diagonalizer_lanczos(nb::module_ &m, std::string const &type_name) {
+    std::string pyclass_name = "DiagonalizerLanczos" + type_name;
+    using real_t = typename DiagonalizerLanczos<T>::real_t;
+    nb::class_<DiagonalizerLanczos<T>, DiagonalizerInterface<T>> pyclass(m, pyclass_name.c_str());
+    pyclass.def(nb::init<FloatType>(), "float_type"_a = FloatType::FLOAT64)
+        .def("eigh",
+             nb::overload_cast<const Eigen::SparseMatrix<T, Eigen::RowMajor> &, double>(
+                 &DiagonalizerLanczos<T>::eigh, nb::const_),
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("eigh",
+             nb::overload_cast<const Eigen::SparseMatrix<T, Eigen::RowMajor> &,
+                               std::optional<real_t>, std::optional<real_t>, double>(
+                 &DiagonalizerLanczos<T>::eigh, nb::const_),
+             nb::call_guard<nb::gil_scoped_release>());
+}
+
 template <typename T>
 static void declare_diagonalize(nb::module_ &m, std::string const &type_name) {
     std::string pyclass_name = "diagonalize" + type_name;
@@ -82,8 +102,8 @@ static void declare_diagonalize(nb::module_ &m, std::string const &type_name) {
         pyclass_name.c_str(),
         [](nb::list pylist, // NOLINT
            const DiagonalizerInterface<scalar_t> &diagonalizer,
-           std::optional<real_t> min_eigenvalue, std::optional<real_t> max_eigenvalue,
-           double rtol) {
+           std::optional<real_t> min_eigenvalue, std::optional<real_t> max_eigenvalue, double rtol,
+           bool warm_start, bool auto_rotate) {
             std::vector<std::reference_wrapper<T>> systems;
             systems.reserve(pylist.size());
             for (nb::handle_t<T> &&h : pylist) {
@@ -91,11 +111,30 @@ static void declare_diagonalize(nb::module_ &m, std::string const &type_name) {
             }
             {
                 nb::gil_scoped_release release;
-                diagonalize(systems, diagonalizer, min_eigenvalue, max_eigenvalue, rtol);
+                diagonalize(systems, diagonalizer, min_eigenvalue, max_eigenvalue, rtol, warm_start,
+                            auto_rotate);
             }
         },
         "systems"_a, "diagonalizer"_a, "min_eigenvalue"_a = nb::none(),
-        "max_eigenvalue"_a = nb::none(), "rtol"_a = 1e-6);
+        "max_eigenvalue"_a = nb::none(), "rtol"_a = 1e-6, "warm_start"_a = false,
+        "auto_rotate"_a = false);
+}
+
+template <typename T>
+static void declare_track_states(nb::module_ &m, std::string const &type_name) {
+    std::string pyclass_name = "track_states" + type_name;
+    m.def(
+        pyclass_name.c_str(),
+        [](nb::list pylist) { // NOLINT
+            std::vector<std::reference_wrapper<const T>> systems;
+            systems.reserve(pylist.size());
+            for (nb::handle_t<T> &&h : pylist) {
+                systems.push_back(nb::cast<const T &>(h));
+            }
+            nb::gil_scoped_release release;
+            return track_states(systems);
+        },
+        "systems"_a);
 }
 
 void bind_diagonalizer(nb::module_ &m) {
@@ -107,10 +146,17 @@ void bind_diagonalizer(nb::module_ &m) {
     declare_diagonalizer_lapacke_evd<std::complex<double>>(m, "Complex");
     declare_diagonalizer_lapacke_evr<double>(m, "Real");
     declare_diagonalizer_lapacke_evr<std::complex<double>>(m, "Complex");
+    declare_diagonalizer_lanczos<double>(m, "Real");
+    declare_diagonalizer_lanczos<std::complex<double>>(m, "Complex");
 
     declare_diagonalize<SystemAtom<double>>(m, "SystemAtomReal");
     declare_diagonalize<SystemAtom<std::complex<double>>>(m, "SystemAtomComplex");
 
     declare_diagonalize<SystemPair<double>>(m, "SystemPairReal");
     declare_diagonalize<SystemPair<std::complex<double>>>(m, "SystemPairComplex");
+
+    declare_track_states<SystemAtom<double>>(m, "SystemAtomReal");
+    declare_track_states<SystemAtom<std::complex<double>>>(m, "SystemAtomComplex");
+    declare_track_states<SystemPair<double>>(m, "SystemPairReal");
+    declare_track_states<SystemPair<std::complex<double>>>(m, "SystemPairComplex");
 }
@@ -13,5 +13,6 @@ using namespace pairinteraction;
 void bind_float_type(nb::module_ &m) {
     nb::enum_<FloatType>(m, "FloatType")
         .value("FLOAT32", FloatType::FLOAT32)
-        .value("FLOAT64", FloatType::FLOAT64);
+        .value("FLOAT64", FloatType::FLOAT64)
+        .value("FLOAT32_REFINED", FloatType::FLOAT32_REFINED);
 }
@@ -9,9 +9,11 @@
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/ket/KetAtomCreator.hpp"
 #include "pairinteraction/ket/KetPair.hpp"
+#include "pairinteraction/ket/KetPairArrays.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
 #include <complex>
+#include <nanobind/eigen/dense.h>
 #include <nanobind/nanobind.h>
 #include <nanobind/operators.h>
 #include <nanobind/stl/shared_ptr.h>
@@ -82,7 +84,8 @@ static void declare_ket_atom_creator(nb::module_ &m) {
         .def("set_quantum_number_j", &KetAtomCreator::set_quantum_number_j)
         .def("set_quantum_number_l_ryd", &KetAtomCreator::set_quantum_number_l_ryd)
         .def("set_quantum_number_j_ryd", &KetAtomCreator::set_quantum_number_j_ryd)
-        .def("create", &KetAtomCreator::create);
+        .def("create", &KetAtomCreator::create)
+        .def_static("create_many", &KetAtomCreator::create_many);
 }
 
 template <typename T>
@@ -94,10 +97,46 @@ static void declare_ket_pair(nb::module_ &m, std::string const &type_name) {
         .def("__hash__", [](const KetPair<T> &self) { return typename KetPair<T>::hash{}(self); });
 }
 
+// Return a read-only view of the array so that numpy does not copy it
+template <typename Vector>
+static Eigen::Map<const Vector> as_read_only_view(const Vector &vector) {
+    return {vector.data(), vector.size()};
+}
+
+template <typename T>
+static void declare_ket_pair_arrays(nb::module_ &m, std::string const &type_name) {
+    std::string pyclass_name = "KetPairArrays" + type_name;
+    nb::class_<KetPairArrays<T>> pyclass(m, pyclass_name.c_str());
+    pyclass.def("__len__", &KetPairArrays<T>::size)
+        .def("__getitem__",
+             [](const KetPairArrays<T> &self, size_t ket_index) {
+                 if (ket_index >= self.size()) {
+                     throw nb::index_error();
+                 }
+                 return self[ket_index];
+             })
+        .def_prop_ro("state_indices1",
+                     [](const KetPairArrays<T> &self) {
+                         return as_read_only_view(self.get_state_indices1());
+                     })
+        .def_prop_ro("state_indices2",
+                     [](const KetPairArrays<T> &self) {
+                         return as_read_only_view(self.get_state_indices2());
+                     })
+        .def_prop_ro(
+            "energies",
+            [](const KetPairArrays<T> &self) { return as_read_only_view(self.get_energies()); })
+        .def_prop_ro("quantum_numbers_m", [](const KetPairArrays<T> &self) {
+            return as_read_only_view(self.get_quantum_numbers_m());
+        });
+}
+
 void bind_ket(nb::module_ &m) {
     declare_ket(m);
     declare_ket_atom(m);
     declare_ket_atom_creator(m);
     declare_ket_pair<double>(m, "Real");
     declare_ket_pair<std::complex<double>>(m, "Complex");
+    declare_ket_pair_arrays<double>(m, "Real");
+    declare_ket_pair_arrays<std::complex<double>>(m, "Complex");
 }
@@ -9,7 +9,11 @@
 #include "pairinteraction/system/GreenTensorInterpolator.hpp"
 #include "pairinteraction/system/System.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/system/SystemAtomScan.hpp"
 #include "pairinteraction/system/SystemPair.hpp"
+#include "pairinteraction/system/SystemPairScan.hpp"
+#include "pairinteraction/system/dispersion_coefficients.hpp"
+#include "pairinteraction/utils/traits.hpp"
 
 #include <nanobind/eigen/dense.h>
 #include <nanobind/eigen/sparse.h>
@@ -60,12 +64,12 @@ static void declare_system(nb::module_ &m, const std::string &type_name) {
             "diagonalize",
             [](S &self, const DiagonalizerInterface<scalar_t> &diagonalizer,
                std::optional<real_t> min_eigenenergy, std::optional<real_t> max_eigenenergy,
-               double rtol) -> T & {
-                return static_cast<T &>(
-                    self.diagonalize(diagonalizer, min_eigenenergy, max_eigenenergy, rtol));
+               double rtol, bool auto_rotate) -> T & {
+                return static_cast<T &>(self.diagonalize(diagonalizer, min_eigenenergy,
+                                                         max_eigenenergy, rtol, auto_rotate));
             },
             "diagonalizer"_a, "min_eigenenergy"_a = nb::none(), "max_eigenenergy"_a = nb::none(),
-            "rtol"_a = 1e-6, nb::call_guard<nb::gil_scoped_release>())
+            "rtol"_a = 1e-6, "auto_rotate"_a = false, nb::call_guard<nb::gil_scoped_release>())
         .def("is_diagonal", &S::is_diagonal, nb::call_guard<nb::gil_scoped_release>());
 }
 
@@ -87,6 +91,36 @@ static void declare_system_atom(nb::module_ &m, const std::string &type_name) {
         .def("set_green_tensor_interpolator", &S::set_green_tensor_interpolator);
 }
 
+template <typename T>
+static void declare_system_atom_scan(nb::module_ &m, const std::string &type_name) {
+    using S = SystemAtomScan<T>;
+    using basis_t = typename SystemAtomScan<T>::basis_t;
+
+    std::string pyclass_name = "SystemAtomScan" + type_name;
+
+    nb::class_<S> pyclass(m, pyclass_name.c_str());
+    pyclass.def(nb::init<std::shared_ptr<const basis_t>>())
+        .def("set_electric_fields", &S::set_electric_fields,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("set_magnetic_fields", &S::set_magnetic_fields,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("set_diamagnetism_enabled", &S::set_diamagnetism_enabled,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("set_ion_distance_vectors", &S::set_ion_distance_vectors,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("set_ion_charge", &S::set_ion_charge, nb::call_guard<nb::gil_scoped_release>())
+        .def("set_ion_interaction_order", &S::set_ion_interaction_order,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_basis", &S::get_basis, nb::call_guard<nb::gil_scoped_release>())
+        .def("get_electric_fields", &S::get_electric_fields,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_magnetic_fields", &S::get_magnetic_fields,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_ion_distance_vectors", &S::get_ion_distance_vectors,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_systems", &S::get_systems, nb::call_guard<nb::gil_scoped_release>());
+}
+
 template <typename T>
 static void declare_system_pair(nb::module_ &m, const std::string &type_name) {
     using S = SystemPair<T>;
@@ -101,6 +135,25 @@ static void declare_system_pair(nb::module_ &m, const std::string &type_name) {
         .def("set_green_tensor_interpolator", &S::set_green_tensor_interpolator);
 }
 
+template <typename T>
+static void declare_system_pair_scan(nb::module_ &m, const std::string &type_name) {
+    using S = SystemPairScan<T>;
+    using basis_t = typename SystemPairScan<T>::basis_t;
+
+    std::string pyclass_name = "SystemPairScan" + type_name;
+
+    nb::class_<S> pyclass(m, pyclass_name.c_str());
+    pyclass.def(nb::init<std::shared_ptr<const basis_t>>())
+        .def("set_interaction_order", &S::set_interaction_order,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("set_distance_vectors", &S::set_distance_vectors,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_basis", &S::get_basis, nb::call_guard<nb::gil_scoped_release>())
+        .def("get_distance_vectors", &S::get_distance_vectors,
+             nb::call_guard<nb::gil_scoped_release>())
+        .def("get_systems", &S::get_systems, nb::call_guard<nb::gil_scoped_release>());
+}
+
 template <typename T>
 static void declare_green_tensor_interpolator(nb::module_ &m, const std::string &type_name) {
     using CE = typename GreenTensorInterpolator<T>::ConstantEntry;
@@ -133,17 +186,58 @@ static void declare_green_tensor_interpolator(nb::module_ &m, const std::string
              nb::overload_cast<int, int>(&GT::get_spherical_entries, nb::const_));
 }
 
+template <typename T>
+static void declare_dispersion_coefficients(nb::module_ &m, const std::string &type_name) {
+    using real_t = typename traits::NumTraits<T>::real_t;
+    using pair_states_t = std::vector<std::array<size_t, 2>>;
+    using direction_t = std::array<real_t, 3>;
+    using directions_t = std::vector<direction_t>;
+
+    std::string c3_name = "calculate_c3_coefficients" + type_name;
+    std::string c6_name = "calculate_c6_coefficients" + type_name;
+
+    m.def(c3_name.c_str(),
+          nb::overload_cast<const SystemAtom<T> &, const SystemAtom<T> &, const pair_states_t &,
+                            const pair_states_t &, const direction_t &>(
+              &calculate_c3_coefficients<T>),
+          "system1"_a, "system2"_a, "initial_pair_states"_a, "final_pair_states"_a, "direction"_a,
+          nb::call_guard<nb::gil_scoped_release>());
+    m.def(c3_name.c_str(),
+          nb::overload_cast<const SystemAtom<T> &, const SystemAtom<T> &, const pair_states_t &,
+                            const pair_states_t &, const directions_t &>(
+              &calculate_c3_coefficients<T>),
+          "system1"_a, "system2"_a, "initial_pair_states"_a, "final_pair_states"_a, "directions"_a,
+          nb::call_guard<nb::gil_scoped_release>());
+    m.def(c6_name.c_str(),
+          nb::overload_cast<const SystemAtom<T> &, const SystemAtom<T> &, const pair_states_t &,
+                            const direction_t &>(&calculate_c6_coefficients<T>),
+          "system1"_a, "system2"_a, "pair_states"_a, "direction"_a,
+          nb::call_guard<nb::gil_scoped_release>());
+    m.def(c6_name.c_str(),
+          nb::overload_cast<const SystemAtom<T> &, const SystemAtom<T> &, const pair_states_t &,
+                            const directions_t &>(&calculate_c6_coefficients<T>),
+          "system1"_a, "system2"_a, "pair_states"_a, "directions"_a,
+          nb::call_guard<nb::gil_scoped_release>());
+}
+
 void bind_system(nb::module_ &m) {
     declare_system<SystemAtom<double>>(m, "SystemAtomReal");
     declare_system<SystemAtom<std::complex<double>>>(m, "SystemAtomComplex");
     declare_system_atom<double>(m, "Real");
     declare_system_atom<std::complex<double>>(m, "Complex");
+    declare_system_atom_scan<double>(m, "Real");
+    declare_system_atom_scan<std::complex<double>>(m, "Complex");
 
     declare_system<SystemPair<double>>(m, "SystemPairReal");
     declare_system<SystemPair<std::complex<double>>>(m, "SystemPairComplex");
     declare_system_pair<double>(m, "Real");
     declare_system_pair<std::complex<double>>(m, "Complex");
+    declare_system_pair_scan<double>(m, "Real");
+    declare_system_pair_scan<std::complex<double>>(m, "Complex");
 
     declare_green_tensor_interpolator<double>(m, "Real");
     declare_green_tensor_interpolator<std::complex<double>>(m, "Complex");
+
+    declare_dispersion_coefficients<double>(m, "Real");
+    declare_dispersion_coefficients<std::complex<double>>(m, "Complex");
 }
@@ -12,7 +12,6 @@
 #include <Eigen/SparseCore>
 #include <memory>
 #include <set>
-#include <unordered_map>
 #include <vector>
 
 namespace pairinteraction {
@@ -113,24 +112,13 @@ public:
 
 protected:
     Basis(ketvec_t &&kets);
-    int get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const;
     ketvec_t kets;
 
 private:
     const Derived &derived() const;
 
-    struct hash {
-        std::size_t operator()(const std::shared_ptr<const ket_t> &k) const;
-    };
-
-    struct equal_to {
-        bool operator()(const std::shared_ptr<const ket_t> &lhs,
-                        const std::shared_ptr<const ket_t> &rhs) const;
-    };
-
     Transformation<scalar_t> coefficients;
 
-    std::unordered_map<std::shared_ptr<const ket_t>, size_t, hash, equal_to> ket_to_ket_index;
     std::vector<size_t> ket_index_to_state_index;
 
     std::vector<real_t> state_index_to_quantum_number_f;
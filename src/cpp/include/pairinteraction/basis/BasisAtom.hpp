@@ -55,6 +55,7 @@ public:
     const std::string &get_id_of_kets() const;
 
     int get_ket_index_from_id(size_t ket_id) const;
+    int get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const;
 
     Eigen::VectorX<Scalar> get_matrix_elements(std::shared_ptr<const ket_t> ket, OperatorType type,
                                                int q = 0) const override;
@@ -63,10 +64,20 @@ public:
                         int q = 0) const override;
 
 private:
+    struct hash {
+        std::size_t operator()(const std::shared_ptr<const ket_t> &k) const;
+    };
+
+    struct equal_to {
+        bool operator()(const std::shared_ptr<const ket_t> &lhs,
+                        const std::shared_ptr<const ket_t> &rhs) const;
+    };
+
     std::string id_of_kets;
     Database &database;
     std::string species;
     std::unordered_map<size_t, size_t> ket_id_to_ket_index;
+    std::unordered_map<std::shared_ptr<const ket_t>, size_t, hash, equal_to> ket_to_ket_index;
 };
 
 extern template class BasisAtom<double>;
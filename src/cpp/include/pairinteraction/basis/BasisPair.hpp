@@ -4,17 +4,16 @@
 #pragma once
 
 #include "pairinteraction/basis/Basis.hpp"
+#include "pairinteraction/ket/KetPairArrays.hpp"
 #include "pairinteraction/utils/Range.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/eigen_compat.hpp"
-#include "pairinteraction/utils/hash.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
 #include <Eigen/Dense>
 #include <Eigen/SparseCore>
 #include <complex>
 #include <memory>
-#include <unordered_map>
 #include <vector>
 
 namespace pairinteraction {
@@ -37,7 +36,7 @@ struct traits::CrtpTraits<BasisPair<Scalar>> {
     using scalar_t = Scalar;
     using real_t = typename traits::NumTraits<Scalar>::real_t;
     using ket_t = KetPair<Scalar>;
-    using ketvec_t = std::vector<std::shared_ptr<const ket_t>>;
+    using ketvec_t = KetPairArrays<Scalar>;
 };
 
 template <typename Scalar>
@@ -54,19 +53,19 @@ public:
     using ket_t = typename traits::CrtpTraits<Type>::ket_t;
     using ketvec_t = typename traits::CrtpTraits<Type>::ketvec_t;
     using range_t = Range<size_t>;
-    using map_size_t = std::unordered_map<size_t, size_t>;
-    using map_range_t = std::unordered_map<size_t, range_t>;
-    using map_indices_t =
-        std::unordered_map<std::vector<size_t>, size_t, utils::hash<std::vector<size_t>>>;
+    using ranges_t = std::vector<range_t>;
+    using offsets_t = std::vector<size_t>;
+    using indices_t = std::vector<int>;
 
-    BasisPair(Private /*unused*/, ketvec_t &&kets, map_range_t &&map_range_of_state_index2,
-              map_indices_t &&state_indices_to_ket_index,
+    BasisPair(Private /*unused*/, ketvec_t &&kets, ranges_t &&ranges_of_state_index2,
+              offsets_t &&offsets_of_state_index1, indices_t &&ket_indices,
               std::shared_ptr<const BasisAtom<Scalar>> basis1,
               std::shared_ptr<const BasisAtom<Scalar>> basis2);
     const range_t &get_index_range(size_t state_index1) const;
     std::shared_ptr<const BasisAtom<Scalar>> get_basis1() const;
     std::shared_ptr<const BasisAtom<Scalar>> get_basis2() const;
     int get_ket_index_from_tuple(size_t state_index1, size_t state_index2) const;
+    int get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const;
 
     Eigen::VectorX<Scalar> get_matrix_elements(std::shared_ptr<const ket_t> /*ket*/,
                                                OperatorType /*type*/, int /*q*/) const override;
@@ -88,8 +87,12 @@ public:
                         OperatorType type2, int q1 = 0, int q2 = 0) const;
 
 private:
-    map_range_t map_range_of_state_index2;
-    map_indices_t state_indices_to_ket_index;
+    // The pairs (idx1, idx2) with idx2 in the energetically allowed range of idx1 are enumerated
+    // contiguously, starting at the offset of idx1. The flat table of ket indices stores the index
+    // of the ket corresponding to each pair, or -1 if the pair is not part of the basis.
+    ranges_t ranges_of_state_index2;
+    offsets_t offsets_of_state_index1;
+    indices_t ket_indices;
     std::shared_ptr<const BasisAtom<Scalar>> basis1;
     std::shared_ptr<const BasisAtom<Scalar>> basis2;
 };
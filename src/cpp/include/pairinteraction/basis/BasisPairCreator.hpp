@@ -24,6 +24,9 @@ class SystemAtom;
 template <typename Scalar>
 class KetPair;
 
+template <typename Scalar>
+class KetPairArrays;
+
 template <typename Scalar>
 class BasisPairCreator {
     static_assert(traits::NumTraits<Scalar>::from_floating_point_v);
@@ -32,7 +35,7 @@ public:
     using real_t = typename traits::NumTraits<Scalar>::real_t;
     using basis_t = BasisPair<Scalar>;
     using ket_t = KetPair<Scalar>;
-    using ketvec_t = std::vector<std::shared_ptr<const ket_t>>;
+    using ketvec_t = KetPairArrays<Scalar>;
 
     BasisPairCreator() = default;
     BasisPairCreator<Scalar> &add(const SystemAtom<Scalar> &system_atom);
@@ -0,0 +1,69 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include <condition_variable>
+#include <cstddef>
+#include <memory>
+#include <mutex>
+#include <vector>
+
+namespace duckdb {
+class DuckDB;
+class Connection;
+} // namespace duckdb
+
+namespace pairinteraction {
+/**
+ * @class ConnectionPool
+ *
+ * @brief Thread-safe pool of connections to the same DuckDB instance.
+ *
+ * A duckdb::Connection executes only one query at a time. To allow threads to query the database
+ * concurrently, each thread borrows its own connection from the pool for the duration of a query.
+ * Connections are created lazily. If the maximum number of connections is in use, further threads
+ * wait until a connection is returned to the pool.
+ *
+ * Note that temporary tables are only visible to the connection that created them. Tables that
+ * must be accessible by all connections have to be created as regular tables of the in-memory
+ * database.
+ */
+class ConnectionPool {
+public:
+    class Handle {
+    public:
+        Handle(ConnectionPool &pool, std::unique_ptr<duckdb::Connection> connection);
+        Handle(const Handle &) = delete;
+        Handle &operator=(const Handle &) = delete;
+        Handle(Handle &&other) noexcept;
+        Handle &operator=(Handle &&other) = delete;
+        ~Handle();
+
+        duckdb::Connection &operator*() const;
+        duckdb::Connection *operator->() const;
+
+    private:
+        ConnectionPool *pool;
+        std::unique_ptr<duckdb::Connection> connection;
+    };
+
+    ConnectionPool(duckdb::DuckDB &db, std::size_t max_size);
+    ~ConnectionPool();
+
+    Handle acquire();
+    void set_max_size(std::size_t max_size);
+    std::size_t get_max_size() const;
+    std::size_t get_number_of_connections() const;
+
+private:
+    duckdb::DuckDB &db;
+    mutable std::mutex mutex;
+    std::condition_variable cv;
+    std::vector<std::unique_ptr<duckdb::Connection>> idle_connections;
+    std::size_t number_of_connections{0};
+    std::size_t max_size;
+
+    void release(std::unique_ptr<duckdb::Connection> connection);
+};
+} // namespace pairinteraction
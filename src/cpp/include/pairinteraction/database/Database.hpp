@@ -3,21 +3,21 @@
 
 #pragma once
 
+#include "pairinteraction/database/MatrixElementsCache.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
 #include <Eigen/SparseCore>
+#include <atomic>
 #include <complex>
+#include <cstddef>
 #include <filesystem>
-#include <future>
 #include <memory>
-#include <oneapi/tbb.h>
 #include <string>
 #include <vector>
 
 namespace duckdb {
 class DuckDB;
-class Connection;
 } // namespace duckdb
 
 namespace pairinteraction {
@@ -36,6 +36,8 @@ class GitHubDownloader;
 
 class ParquetManager;
 
+class ConnectionPool;
+
 class Database {
 public:
     Database();
@@ -52,6 +54,10 @@ public:
     std::shared_ptr<const KetAtom> get_ket(const std::string &species,
                                            const AtomDescriptionByParameters &description);
 
+    std::vector<std::shared_ptr<const KetAtom>>
+    get_kets(const std::string &species,
+             const std::vector<AtomDescriptionByParameters> &descriptions);
+
     template <typename Scalar>
     std::shared_ptr<const BasisAtom<Scalar>> get_basis(const std::string &species,
                                                        const AtomDescriptionByRanges &description,
@@ -65,8 +71,18 @@ public:
 
     bool get_download_missing() const;
     bool get_use_cache() const;
+    void set_use_disk_cache(bool use_disk_cache);
+    bool get_use_disk_cache() const;
     std::filesystem::path get_database_dir() const;
     std::string get_versions_info() const;
+    void set_connection_pool_size(std::size_t size);
+    std::size_t get_connection_pool_size() const;
+    void set_duckdb_threads(int threads);
+    void set_duckdb_max_memory(const std::string &max_memory);
+
+    static void clear_cache();
+    static MatrixElementsCache::Info get_cache_info();
+    static void set_cache_max_bytes(std::size_t max_bytes);
 
 private:
     struct Table {
@@ -83,21 +99,19 @@ private:
 
     bool download_missing_;
     bool use_cache_;
+    std::atomic<bool> use_disk_cache_{false};
     std::filesystem::path database_dir_;
     std::unique_ptr<duckdb::DuckDB> db;
-    std::unique_ptr<duckdb::Connection> con;
+    std::unique_ptr<ConnectionPool> pool;
     std::unique_ptr<GitHubDownloader> downloader;
     std::unique_ptr<ParquetManager> manager;
 
     static constexpr bool default_download_missing{false};
     static constexpr bool default_use_cache{true};
+    static constexpr const char *default_duckdb_max_memory{"8GB"};
     static const std::filesystem::path default_database_dir;
 
-    using cached_matrix_t = Eigen::SparseMatrix<double, Eigen::RowMajor>;
-    using matrix_elements_cache_t = oneapi::tbb::concurrent_unordered_map<
-        std::string, std::shared_future<std::shared_ptr<const cached_matrix_t>>>;
-
-    static matrix_elements_cache_t &get_matrix_elements_cache();
+    static MatrixElementsCache &get_matrix_elements_cache();
 
     static Database &get_global_instance_without_checks(bool download_missing, bool use_cache,
                                                         std::filesystem::path database_dir);
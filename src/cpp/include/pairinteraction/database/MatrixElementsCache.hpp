@@ -0,0 +1,81 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+
+#include <Eigen/SparseCore>
+#include <cstddef>
+#include <filesystem>
+#include <functional>
+#include <future>
+#include <list>
+#include <memory>
+#include <mutex>
+#include <string>
+#include <unordered_map>
+
+namespace pairinteraction {
+/**
+ * @class MatrixElementsCache
+ *
+ * @brief Thread-safe, memory-budgeted LRU cache for matrix elements loaded from the database.
+ *
+ * If several threads request the same matrix at the same time, the matrix is created only once
+ * and the other threads wait for the result. If the total size of the cached matrices exceeds
+ * the budget, the least recently used matrices are evicted.
+ *
+ * In addition, the class provides methods for storing matrices in binary files, so that matrices
+ * can be shared between processes via a persistent cache on disk.
+ */
+class MatrixElementsCache {
+public:
+    using matrix_t = Eigen::SparseMatrix<double, Eigen::RowMajor>;
+    using matrix_ptr_t = std::shared_ptr<const matrix_t>;
+
+    struct Info {
+        std::size_t hits{0};
+        std::size_t misses{0};
+        std::size_t bytes{0};
+        std::size_t entries{0};
+        std::size_t max_bytes{0};
+    };
+
+    static constexpr std::size_t default_max_bytes{std::size_t{1} << 30};
+
+    MatrixElementsCache(std::size_t max_bytes = default_max_bytes);
+
+    matrix_ptr_t get_or_create(const std::string &key, const std::function<matrix_ptr_t()> &create);
+    void clear();
+    Info get_info() const;
+    void set_max_bytes(std::size_t max_bytes);
+    std::size_t get_max_bytes() const;
+
+    static std::size_t get_size_in_bytes(const matrix_t &matrix);
+    static std::string get_filename(const std::string &key);
+    static void save(const std::filesystem::path &path, const std::string &key,
+                     const matrix_t &matrix);
+    static matrix_ptr_t load(const std::filesystem::path &path, const std::string &key);
+
+private:
+    struct Entry {
+        std::shared_future<matrix_ptr_t> future;
+        std::list<std::string>::iterator lru_it;
+        std::size_t bytes{0};
+        std::size_t generation{0};
+        bool ready{false};
+    };
+
+    mutable std::mutex mutex;
+    std::unordered_map<std::string, Entry> entries;
+    std::list<std::string> lru;
+    std::size_t max_bytes;
+    std::size_t bytes{0};
+    std::size_t hits{0};
+    std::size_t misses{0};
+    std::size_t generation{0};
+
+    void evict();
+};
+} // namespace pairinteraction
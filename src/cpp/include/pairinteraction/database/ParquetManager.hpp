@@ -10,14 +10,12 @@
 #include <unordered_map>
 #include <vector>
 
-namespace duckdb {
-class Connection;
-} // namespace duckdb
-
 namespace pairinteraction {
 
 class GitHubDownloader;
 
+class ConnectionPool;
+
 class ParquetManager {
 public:
     struct PathInfo {
@@ -36,10 +34,11 @@ public:
     };
 
     ParquetManager(std::filesystem::path directory, const GitHubDownloader &downloader,
-                   std::vector<std::string> repo_paths, duckdb::Connection &con, bool use_cache);
+                   std::vector<std::string> repo_paths, ConnectionPool &pool, bool use_cache);
     void scan_local();
     void scan_remote();
     std::string get_path(const std::string &key, const std::string &table);
+    int get_version(const std::string &key);
     std::string get_versions_info() const;
 
 private:
@@ -52,7 +51,7 @@ private:
     std::filesystem::path directory_;
     const GitHubDownloader &downloader;
     std::vector<std::string> repo_paths_;
-    duckdb::Connection &con;
+    ConnectionPool &pool;
     bool use_cache_;
     std::unordered_map<std::string, LocalAssetInfo> local_asset_info;
     std::unordered_map<std::string, RemoteAssetInfo> remote_asset_info;
@@ -0,0 +1,53 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/enums/FloatType.hpp"
+#include "pairinteraction/interfaces/DiagonalizerInterface.hpp"
+#include "pairinteraction/utils/eigen_assertion.hpp"
+
+#include <Eigen/SparseCore>
+#include <complex>
+#include <optional>
+
+namespace pairinteraction {
+/**
+ * @class DiagonalizerLanczos
+ *
+ * @brief Sparse diagonalizer for the eigenpairs within an energy interval.
+ *
+ * In contrast to the other diagonalizers, the matrix is never converted into a dense matrix.
+ * The number of eigenvalues within the interval is obtained from the inertia of LDL^T
+ * factorizations (Sylvester's law of inertia). The eigenpairs are calculated by a thick-restart
+ * Lanczos method with full reorthogonalization, applied to the shift-inverted matrix
+ * (H - sigma)^-1 with sigma being the center of the interval. Converged eigenvectors are locked
+ * so that degenerate eigenvalues are found as well.
+ *
+ * Small matrices, for which a Krylov subspace would not be much smaller than the matrix itself,
+ * are diagonalized with the dense DiagonalizerEigen.
+ *
+ * @tparam Scalar Scalar type of the matrix.
+ */
+template <typename Scalar>
+class DiagonalizerLanczos : public DiagonalizerInterface<Scalar> {
+public:
+    using typename DiagonalizerInterface<Scalar>::real_t;
+
+    DiagonalizerLanczos(FloatType float_type = FloatType::FLOAT64);
+    EigenSystemH<Scalar> eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                              double rtol) const override;
+    EigenSystemH<Scalar> eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                              std::optional<real_t> min_eigenvalue,
+                              std::optional<real_t> max_eigenvalue, double rtol) const override;
+
+private:
+    template <typename ScalarLim>
+    EigenSystemH<Scalar> dispatch_eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                                       real_t min_eigenvalue, real_t max_eigenvalue,
+                                       double rtol) const;
+};
+
+extern template class DiagonalizerLanczos<double>;
+extern template class DiagonalizerLanczos<std::complex<double>>;
+} // namespace pairinteraction
@@ -0,0 +1,57 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/interfaces/DiagonalizerInterface.hpp"
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/traits.hpp"
+
+#include <Eigen/SparseCore>
+#include <complex>
+#include <optional>
+
+namespace pairinteraction {
+
+/**
+ * @function continue_eigensystem
+ *
+ * @brief Calculate the eigenpairs within an energy interval starting from a similar eigensystem
+ *
+ * The eigenvectors of a previous, similar matrix (e.g., of the previous step of a parameter
+ * sweep) are used as the start block of a block Krylov method for the shift-inverted matrix, so
+ * that typically only a few blocks are required until all eigenpairs within the interval are
+ * converged. The number of eigenvalues within the interval is obtained from the inertia of LDL^T
+ * factorizations, so that eigenvalues that moved into the interval are not missed.
+ *
+ * @param matrix  sparse hermitian matrix
+ * @param previous  eigensystem of a similar matrix, used as initial search space
+ * @param min_eigenvalue  lower bound of the interval
+ * @param max_eigenvalue  upper bound of the interval
+ * @param rtol  relative tolerance of the eigenvalues, see DiagonalizerInterface::eigh
+ *
+ * @return the eigensystem within the interval, or std::nullopt if the procedure did not converge,
+ * no finite interval is given, or a full diagonalization is expected to be cheaper
+ *
+ * @tparam Scalar scalar type of the matrix
+ */
+
+template <typename Scalar>
+std::optional<EigenSystemH<Scalar>>
+continue_eigensystem(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<Scalar> &previous,
+                     std::optional<typename traits::NumTraits<Scalar>::real_t> min_eigenvalue,
+                     std::optional<typename traits::NumTraits<Scalar>::real_t> max_eigenvalue,
+                     double rtol);
+
+extern template std::optional<EigenSystemH<double>>
+continue_eigensystem(const Eigen::SparseMatrix<double, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<double> &previous, std::optional<double> min_eigenvalue,
+                     std::optional<double> max_eigenvalue, double rtol);
+extern template std::optional<EigenSystemH<std::complex<double>>>
+continue_eigensystem(const Eigen::SparseMatrix<std::complex<double>, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<std::complex<double>> &previous,
+                     std::optional<double> min_eigenvalue, std::optional<double> max_eigenvalue,
+                     double rtol);
+
+} // namespace pairinteraction
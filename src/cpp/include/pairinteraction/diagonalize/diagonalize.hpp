@@ -15,22 +15,37 @@ class DiagonalizerInterface;
 // Note that although a vector is also constructible from a list, the overload resolution
 // will prefer the initializer list overload because of less conversions required.
 
+// If warm_start is true, the systems are treated as the steps of a parameter sweep. The sweep is
+// split into contiguous chunks that are diagonalized in parallel. Within a chunk, the eigenvectors
+// of the previous step are used as a starting point for the diagonalization of the next step,
+// falling back to the diagonalizer if this does not converge. This is only effective if an
+// energy range is specified.
+
+// If auto_rotate is true, a Hamiltonian that is rotationally symmetric about an axis other than
+// the quantization axis, e.g. because of a tilted field or distance vector, is diagonalized in the
+// frame where the axis is the quantization axis. Thus, the Hamiltonian can be block-diagonalized
+// with respect to the magnetic quantum number m. The eigenvectors are rotated back into the
+// original frame. The rotation is skipped if the basis is not closed under rotations.
+
 template <typename Derived>
 void diagonalize(std::initializer_list<std::reference_wrapper<Derived>> systems,
                  const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
                  std::optional<typename Derived::real_t> min_eigenenergy = {},
-                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6);
+                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6,
+                 bool warm_start = false, bool auto_rotate = false);
 
 template <typename Derived>
 void diagonalize(std::vector<Derived> &systems,
                  const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
                  std::optional<typename Derived::real_t> min_eigenenergy = {},
-                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6);
+                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6,
+                 bool warm_start = false, bool auto_rotate = false);
 
 template <typename Derived>
 void diagonalize(std::vector<std::reference_wrapper<Derived>> systems,
                  const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
                  std::optional<typename Derived::real_t> min_eigenenergy = {},
-                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6);
+                 std::optional<typename Derived::real_t> max_eigenenergy = {}, double rtol = 1e-6,
+                 bool warm_start = false, bool auto_rotate = false);
 
 } // namespace pairinteraction
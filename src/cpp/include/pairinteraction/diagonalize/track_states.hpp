@@ -0,0 +1,53 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+
+#include <Eigen/Dense>
+#include <Eigen/SparseCore>
+#include <functional>
+#include <vector>
+
+namespace pairinteraction {
+
+/**
+ * @function match_states
+ *
+ * @brief Match the states of two eigenbases by their overlaps
+ *
+ * The states are matched greedily, starting with the pair of states with the largest overlap.
+ * Each state is matched at most once.
+ *
+ * @param overlaps  sparse matrix of the overlaps |<psi_i|phi_j>|^2 between the states psi_i of
+ * the first and the states phi_j of the second eigenbasis
+ *
+ * @return vector whose i-th entry is the index of the state of the second eigenbasis that is
+ * matched to the i-th state of the first eigenbasis, or -1 if the state could not be matched
+ */
+Eigen::VectorXi match_states(const Eigen::SparseMatrix<double, Eigen::RowMajor> &overlaps);
+
+/**
+ * @function track_states
+ *
+ * @brief Track the eigenstates of a sequence of diagonalized systems adiabatically
+ *
+ * The overlaps between the eigenbases of consecutive systems are calculated and the states are
+ * matched by match_states in parallel. The matchings are then chained, so that the eigenstates
+ * of all systems are linked to the eigenstates of the first system.
+ *
+ * @param systems  diagonalized systems that are defined on the same basis, e.g., the steps of a
+ * Stark map or pair potential
+ *
+ * @return matrix whose entry (k, i) is the index of the eigenstate of the k-th system that is
+ * adiabatically connected to the i-th eigenstate of the first system, or -1 if the state was lost,
+ * e.g., because it left the energy range of the diagonalization
+ *
+ * @tparam Derived type of the systems
+ */
+template <typename Derived>
+Eigen::MatrixXi track_states(const std::vector<std::reference_wrapper<const Derived>> &systems);
+
+} // namespace pairinteraction
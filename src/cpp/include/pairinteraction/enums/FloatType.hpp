@@ -4,6 +4,7 @@
 #pragma once
 
 namespace pairinteraction {
-// Floating point precision
-enum class FloatType { FLOAT32, FLOAT64 };
+// Floating point precision, FLOAT32_REFINED diagonalizes with single precision and refines the
+// eigenpairs iteratively to the accuracy of double precision
+enum class FloatType { FLOAT32, FLOAT64, FLOAT32_REFINED };
 } // namespace pairinteraction
@@ -44,6 +44,14 @@ protected:
                                             double rtol) const;
     template <typename RealLim>
     Eigen::VectorX<real_t> add_mean(const Eigen::VectorX<RealLim> &eigenvalues, real_t shift) const;
+    static double get_rtol_before_refinement(double rtol);
+    // Refine the eigenpairs of the complete eigensystem of the matrix to the tolerance rtol. If the
+    // refinement does not converge, std::nullopt is returned and the whole matrix must be
+    // diagonalized again with double precision. The number of iterations and fallbacks are
+    // recorded in the profile counters "DiagonalizerInterface::refine: ...".
+    std::optional<EigenSystemH<Scalar>>
+    refine(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+           const EigenSystemH<Scalar> &eigensystem, double rtol) const;
 };
 
 extern template class DiagonalizerInterface<double>;
@@ -9,10 +9,13 @@
 #include <optional>
 #include <string>
 #include <type_traits>
+#include <vector>
 
 namespace pairinteraction {
 class Database;
 
+struct AtomDescriptionByParameters;
+
 class KetAtom;
 
 /**
@@ -38,6 +41,8 @@ public:
     KetAtomCreator &set_quantum_number_l_ryd(double value);
     KetAtomCreator &set_quantum_number_j_ryd(double value);
     std::shared_ptr<const KetAtom> create(Database &database) const;
+    static std::vector<std::shared_ptr<const KetAtom>>
+    create_many(const std::vector<KetAtomCreator> &creators, Database &database);
 
 private:
     std::optional<std::string> species;
@@ -53,6 +58,8 @@ private:
     std::optional<double> quantum_number_j;
     std::optional<double> quantum_number_l_ryd;
     std::optional<double> quantum_number_j_ryd;
+
+    AtomDescriptionByParameters get_description() const;
 };
 
 } // namespace pairinteraction
@@ -6,8 +6,8 @@
 #include "pairinteraction/ket/Ket.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
+#include <array>
 #include <complex>
-#include <initializer_list>
 #include <memory>
 #include <string>
 #include <type_traits>
@@ -15,7 +15,10 @@
 
 namespace pairinteraction {
 template <typename Scalar>
-class BasisPairCreator;
+class BasisPair;
+
+template <typename Scalar>
+class KetPairArrays;
 
 template <typename Scalar>
 class BasisAtom;
@@ -26,13 +29,15 @@ class KetPair : public Ket {
 
     using real_t = typename traits::NumTraits<Scalar>::real_t;
 
-    friend class BasisPairCreator<Scalar>;
+    friend class BasisPair<Scalar>;
+    friend class KetPairArrays<Scalar>;
     struct Private {};
 
 public:
-    KetPair(Private /*unused*/, std::initializer_list<size_t> atomic_indices,
-            std::initializer_list<std::shared_ptr<const BasisAtom<Scalar>>> atomic_bases,
-            real_t energy);
+    using indices_t = std::array<size_t, 2>;
+    using bases_t = std::array<std::shared_ptr<const BasisAtom<Scalar>>, 2>;
+
+    KetPair(Private /*unused*/, indices_t atomic_indices, bases_t atomic_bases, real_t energy);
 
     std::string get_label() const override;
     std::shared_ptr<KetPair<Scalar>>
@@ -47,17 +52,11 @@ public:
     };
 
 private:
-    std::vector<size_t> atomic_indices;
-    std::vector<std::shared_ptr<const BasisAtom<Scalar>>> atomic_bases;
-    static real_t
-    calculate_quantum_number_f(const std::vector<size_t> &indices,
-                               const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> &bases);
-    static real_t
-    calculate_quantum_number_m(const std::vector<size_t> &indices,
-                               const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> &bases);
-    static Parity
-    calculate_parity(const std::vector<size_t> &indices,
-                     const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> &bases);
+    indices_t atomic_indices;
+    bases_t atomic_bases;
+    static real_t calculate_quantum_number_f(const indices_t &indices, const bases_t &bases);
+    static real_t calculate_quantum_number_m(const indices_t &indices, const bases_t &bases);
+    static Parity calculate_parity(const indices_t &indices, const bases_t &bases);
 };
 
 extern template class KetPair<double>;
@@ -0,0 +1,93 @@
+// SPDX-FileCopyrightText: 2024 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+#include "pairinteraction/utils/traits.hpp"
+
+#include <Eigen/Dense>
+#include <array>
+#include <complex>
+#include <cstddef>
+#include <iterator>
+#include <memory>
+
+namespace pairinteraction {
+template <typename Scalar>
+class BasisAtom;
+
+template <typename Scalar>
+class KetPair;
+
+/**
+ * @class KetPairArrays
+ *
+ * @brief Structure-of-arrays storage of the kets of a pair basis.
+ *
+ * The i-th ket is described by the i-th entries of the arrays, i.e., the indices of the states of
+ * the two one-atom bases, the energy, and the magnetic quantum number (NaN if not well-defined).
+ * KetPair objects are only created when a ket is accessed. Copies share the arrays, so that all
+ * pair bases derived from each other by transformations use the same storage.
+ *
+ * @tparam Scalar Complex number type.
+ */
+template <typename Scalar>
+class KetPairArrays {
+    static_assert(traits::NumTraits<Scalar>::from_floating_point_v);
+
+public:
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    using ket_t = KetPair<Scalar>;
+    using bases_t = std::array<std::shared_ptr<const BasisAtom<Scalar>>, 2>;
+
+    class const_iterator {
+    public:
+        using iterator_category = std::input_iterator_tag;
+        using value_type = std::shared_ptr<const ket_t>;
+        using difference_type = std::ptrdiff_t;
+        using pointer = void;
+        using reference = value_type;
+
+        const_iterator(const KetPairArrays *arrays, size_t index);
+        bool operator==(const const_iterator &other) const;
+        value_type operator*() const;
+        const_iterator &operator++();
+
+    private:
+        const KetPairArrays *arrays;
+        size_t index;
+    };
+
+    KetPairArrays(bases_t atomic_bases, Eigen::VectorXi &&state_indices1,
+                  Eigen::VectorXi &&state_indices2, Eigen::VectorX<real_t> &&energies,
+                  Eigen::VectorX<real_t> &&quantum_numbers_m);
+
+    size_t size() const;
+    bool empty() const;
+    std::shared_ptr<const ket_t> operator[](size_t ket_index) const;
+    const_iterator begin() const;
+    const_iterator end() const;
+
+    const bases_t &get_atomic_bases() const;
+    const Eigen::VectorXi &get_state_indices1() const;
+    const Eigen::VectorXi &get_state_indices2() const;
+    const Eigen::VectorX<real_t> &get_energies() const;
+    const Eigen::VectorX<real_t> &get_quantum_numbers_m() const;
+
+private:
+    struct Arrays {
+        bases_t atomic_bases;
+        Eigen::VectorXi state_indices1;
+        Eigen::VectorXi state_indices2;
+        Eigen::VectorX<real_t> energies;
+        Eigen::VectorX<real_t> quantum_numbers_m;
+    };
+
+    std::shared_ptr<const Arrays> arrays;
+};
+
+extern template class KetPairArrays<double>;
+extern template class KetPairArrays<std::complex<double>>;
+} // namespace pairinteraction
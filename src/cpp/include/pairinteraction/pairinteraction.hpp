@@ -10,17 +10,23 @@
 #include "pairinteraction/database/Database.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerFeast.hpp"
+#include "pairinteraction/diagonalize/DiagonalizerLanczos.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerLapackeEvd.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerLapackeEvr.hpp"
 #include "pairinteraction/diagonalize/diagonalize.hpp"
+#include "pairinteraction/diagonalize/track_states.hpp"
 #include "pairinteraction/enums/OperatorType.hpp"
 #include "pairinteraction/enums/Parity.hpp"
 #include "pairinteraction/enums/TransformationType.hpp"
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/ket/KetAtomCreator.hpp"
 #include "pairinteraction/ket/KetPair.hpp"
+#include "pairinteraction/ket/KetPairArrays.hpp"
 #include "pairinteraction/system/GreenTensorInterpolator.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/system/SystemAtomScan.hpp"
 #include "pairinteraction/system/SystemPair.hpp"
+#include "pairinteraction/system/SystemPairScan.hpp"
+#include "pairinteraction/system/dispersion_coefficients.hpp"
 #include "pairinteraction/tools/run_unit_tests.hpp"
 #include "pairinteraction/tools/setup.hpp"
@@ -45,14 +45,21 @@ public:
         Scalar val(double omega) const;
         int row() const noexcept;
         int col() const noexcept;
+        // The range of the frequencies at which the Green tensor was sampled, the splines must not
+        // be evaluated outside of this range
+        double min_omega() const noexcept;
+        double max_omega() const noexcept;
 
     private:
         OmegaDependentEntry(int row, int col, Eigen::Spline<real_t, 1> real_spline,
-                            Eigen::Spline<real_t, 1> imag_spline);
+                            Eigen::Spline<real_t, 1> imag_spline, double min_omega,
+                            double max_omega);
         int row_;
         int col_;
         Eigen::Spline<real_t, 1> real_spline;
         Eigen::Spline<real_t, 1> imag_spline;
+        double min_omega_;
+        double max_omega_;
     };
 
     using Entry = std::variant<ConstantEntry, OmegaDependentEntry>;
@@ -9,6 +9,7 @@
 #include "pairinteraction/utils/traits.hpp"
 
 #include <Eigen/SparseCore>
+#include <array>
 #include <memory>
 #include <optional>
 #include <set>
@@ -20,6 +21,9 @@ enum class TransformationType : unsigned char;
 template <typename Scalar>
 class DiagonalizerInterface;
 
+template <typename Scalar>
+struct EigenSystemH;
+
 template <typename Derived>
 class System
     : public TransformationBuilderInterface<typename traits::CrtpTraits<Derived>::scalar_t> {
@@ -48,7 +52,13 @@ public:
 
     System<Derived> &diagonalize(const DiagonalizerInterface<scalar_t> &diagonalizer,
                                  std::optional<real_t> min_eigenenergy = {},
-                                 std::optional<real_t> max_eigenenergy = {}, double rtol = 1e-6);
+                                 std::optional<real_t> max_eigenenergy = {}, double rtol = 1e-6,
+                                 bool auto_rotate = false);
+    System<Derived> &diagonalize(const DiagonalizerInterface<scalar_t> &diagonalizer,
+                                 std::vector<EigenSystemH<scalar_t>> &eigensystems_of_blocks,
+                                 std::optional<real_t> min_eigenenergy = {},
+                                 std::optional<real_t> max_eigenenergy = {}, double rtol = 1e-6,
+                                 bool auto_rotate = false);
     bool is_diagonal() const;
 
 protected:
@@ -57,7 +67,23 @@ protected:
     mutable bool hamiltonian_requires_construction{true};
     mutable bool hamiltonian_is_diagonal{false};
     mutable std::vector<TransformationType> blockdiagonalizing_labels;
+    // Axis about which the Hamiltonian is rotationally symmetric if it is not the quantization
+    // axis, so that the quantum number m is conserved after rotating the quantization axis to it
+    mutable std::optional<std::array<real_t, 3>> symmetry_axis;
 
     virtual void construct_hamiltonian() const = 0;
+    // Matrix of the rotation in the space of the states of the basis, or nothing if the rotated
+    // kets do not belong to the basis
+    virtual std::optional<Eigen::SparseMatrix<scalar_t, Eigen::RowMajor>>
+    get_rotator_of_states(real_t alpha, real_t beta, real_t gamma) const = 0;
+
+private:
+    System<Derived> &diagonalize_blocks(const DiagonalizerInterface<scalar_t> &diagonalizer,
+                                        std::vector<EigenSystemH<scalar_t>> *eigensystems_of_blocks,
+                                        std::optional<real_t> min_eigenenergy,
+                                        std::optional<real_t> max_eigenenergy, double rtol,
+                                        bool auto_rotate);
+    std::optional<Eigen::SparseMatrix<scalar_t, Eigen::RowMajor>>
+    get_rotator_to_symmetry_axis(double rtol) const;
 };
 } // namespace pairinteraction
@@ -6,9 +6,14 @@
 #include "pairinteraction/system/System.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
+#include <Eigen/SparseCore>
 #include <array>
 #include <limits>
+#include <map>
 #include <memory>
+#include <mutex>
+#include <optional>
+#include <utility>
 #include <vector>
 
 namespace pairinteraction {
@@ -20,9 +25,14 @@ class GreenTensorInterpolator;
 
 class KetAtom;
 
+enum class OperatorType;
+
 template <typename T>
 class SystemAtom;
 
+template <typename Scalar>
+class SystemAtomScan;
+
 template <typename Scalar>
 struct traits::CrtpTraits<SystemAtom<Scalar>> {
     using scalar_t = Scalar;
@@ -53,6 +63,33 @@ public:
         const std::shared_ptr<const GreenTensorInterpolator<Scalar>> &green_tensor_interpolator);
 
 private:
+    friend class SystemAtomScan<Scalar>;
+
+    // Operators of the couplings to the fields, already transformed into the basis of the system,
+    // that are shared by all systems of a SystemAtomScan so that they are calculated only once
+    class FieldOperators {
+    public:
+        FieldOperators(std::shared_ptr<const basis_t> basis,
+                       std::vector<std::pair<OperatorType, int>> terms);
+
+        const std::shared_ptr<const basis_t> &get_basis() const;
+        const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &get_energies() const;
+        real_t get_numerical_precision() const;
+        const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &get_operator(OperatorType type,
+                                                                         int q) const;
+
+    private:
+        std::shared_ptr<const basis_t> basis;
+        std::vector<std::pair<OperatorType, int>> terms;
+        mutable std::once_flag construction_flag;
+        mutable Eigen::SparseMatrix<Scalar, Eigen::RowMajor> energies;
+        mutable real_t numerical_precision{0};
+        mutable std::map<std::pair<OperatorType, int>, Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+            operators;
+
+        void construct() const;
+    };
+
     std::array<real_t, 3> electric_field{0, 0, 0};
     std::array<real_t, 3> magnetic_field{0, 0, 0};
     bool diamagnetism_enabled{false};
@@ -60,8 +97,11 @@ private:
     real_t ion_charge{1};
     int ion_interaction_order{3};
     std::shared_ptr<const GreenTensorInterpolator<Scalar>> green_tensor_interpolator;
+    std::shared_ptr<const FieldOperators> field_operators;
 
     void construct_hamiltonian() const override;
+    std::optional<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+    get_rotator_of_states(real_t alpha, real_t beta, real_t gamma) const override;
 };
 
 extern template class SystemAtom<double>;
@@ -0,0 +1,79 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/traits.hpp"
+
+#include <array>
+#include <complex>
+#include <memory>
+#include <vector>
+
+namespace pairinteraction {
+template <typename Scalar>
+class BasisAtom;
+
+template <typename Scalar>
+class SystemAtom;
+
+/**
+ * @class SystemAtomScan
+ *
+ * @brief Single-atom systems for a sequence of electric and magnetic fields that share the same
+ * basis.
+ *
+ * The Hamiltonian of a single atom is a sum of the unperturbed energies and of multipole operators,
+ * weighted by the spherical components of the fields and of the field of an ion. Only the weights
+ * depend on the fields. Thus, the systems created by this class share the operators, which are
+ * calculated and transformed into the basis only once. Constructing the Hamiltonian of a single
+ * system then reduces to a weighted sum of sparse matrices.
+ *
+ * The fields and ion distance vectors are given per system. A sequence with a single element is
+ * used for all systems and an empty sequence corresponds to a vanishing field or to no ion,
+ * respectively. The systems can be diagonalized like any other single-atom systems, e.g., in
+ * parallel via the diagonalize() function.
+ *
+ * @tparam Scalar Scalar type of the systems.
+ */
+template <typename Scalar>
+class SystemAtomScan {
+public:
+    static_assert(traits::NumTraits<Scalar>::from_floating_point_v);
+
+    using Type = SystemAtomScan<Scalar>;
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    using basis_t = BasisAtom<Scalar>;
+    using system_t = SystemAtom<Scalar>;
+
+    SystemAtomScan(std::shared_ptr<const basis_t> basis);
+
+    Type &set_electric_fields(const std::vector<std::array<real_t, 3>> &fields);
+    Type &set_magnetic_fields(const std::vector<std::array<real_t, 3>> &fields);
+    Type &set_diamagnetism_enabled(bool enable);
+    Type &set_ion_distance_vectors(const std::vector<std::array<real_t, 3>> &vectors);
+    Type &set_ion_charge(real_t charge);
+    Type &set_ion_interaction_order(int value);
+
+    std::shared_ptr<const basis_t> get_basis() const;
+    const std::vector<std::array<real_t, 3>> &get_electric_fields() const;
+    const std::vector<std::array<real_t, 3>> &get_magnetic_fields() const;
+    const std::vector<std::array<real_t, 3>> &get_ion_distance_vectors() const;
+    const std::vector<std::shared_ptr<system_t>> &get_systems() const;
+
+private:
+    std::shared_ptr<const basis_t> basis;
+    std::vector<std::array<real_t, 3>> electric_fields;
+    std::vector<std::array<real_t, 3>> magnetic_fields;
+    bool diamagnetism_enabled{false};
+    std::vector<std::array<real_t, 3>> ion_distance_vectors;
+    real_t ion_charge{1};
+    int ion_interaction_order{3};
+    std::vector<std::shared_ptr<system_t>> systems;
+
+    void create_systems();
+};
+
+extern template class SystemAtomScan<double>;
+extern template class SystemAtomScan<std::complex<double>>;
+} // namespace pairinteraction
@@ -6,9 +6,13 @@
 #include "pairinteraction/system/System.hpp"
 #include "pairinteraction/utils/traits.hpp"
 
+#include <Eigen/SparseCore>
 #include <array>
 #include <limits>
+#include <map>
 #include <memory>
+#include <mutex>
+#include <optional>
 #include <vector>
 
 namespace pairinteraction {
@@ -30,6 +34,9 @@ class BasisAtom;
 template <typename Scalar>
 class GreenTensorInterpolator;
 
+template <typename Scalar>
+class SystemPairScan;
+
 template <typename Scalar>
 struct traits::CrtpTraits<SystemPair<Scalar>> {
     using scalar_t = Scalar;
@@ -56,11 +63,39 @@ public:
         const std::shared_ptr<const GreenTensorInterpolator<Scalar>> &green_tensor_interpolator);
 
 private:
+    friend class SystemPairScan<Scalar>;
+
+    // Tensor products of the multipole operators, already transformed into the pair basis, that
+    // are shared by all systems of a SystemPairScan so that they are calculated only once
+    class InteractionOperators {
+    public:
+        InteractionOperators(std::shared_ptr<const basis_t> basis, int interaction_order,
+                             const std::vector<std::array<real_t, 3>> &distance_vectors);
+
+        const std::shared_ptr<const basis_t> &get_basis() const;
+        const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &get_energies() const;
+        const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &
+        get_tensor_product(int kappa1, int kappa2, int row, int col) const;
+
+    private:
+        std::shared_ptr<const basis_t> basis;
+        std::vector<std::array<int, 4>> terms;
+        mutable std::once_flag construction_flag;
+        mutable Eigen::SparseMatrix<Scalar, Eigen::RowMajor> energies;
+        mutable std::map<std::array<int, 4>, Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+            tensor_products;
+
+        void construct() const;
+    };
+
     int interaction_order{3};
     std::array<real_t, 3> distance_vector{0, 0, std::numeric_limits<real_t>::infinity()};
     std::shared_ptr<const GreenTensorInterpolator<Scalar>> green_tensor_interpolator;
+    std::shared_ptr<const InteractionOperators> interaction_operators;
 
     void construct_hamiltonian() const override;
+    std::optional<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+    get_rotator_of_states(real_t alpha, real_t beta, real_t gamma) const override;
 };
 
 extern template class SystemPair<double>;
@@ -0,0 +1,66 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/traits.hpp"
+
+#include <array>
+#include <complex>
+#include <memory>
+#include <vector>
+
+namespace pairinteraction {
+template <typename Scalar>
+class BasisPair;
+
+template <typename Scalar>
+class SystemPair;
+
+/**
+ * @class SystemPairScan
+ *
+ * @brief Pair systems for a sequence of distance vectors that share the same pair basis.
+ *
+ * The pair Hamiltonian is a sum of the unperturbed energies and of tensor products of multipole
+ * operators, weighted by the entries of the Green tensor. Only the weights depend on the distance
+ * vector. Thus, the systems created by this class share the tensor products, which are
+ * calculated and transformed into the pair basis only once. Constructing the Hamiltonian of a
+ * single system then reduces to a weighted sum of sparse matrices.
+ *
+ * The systems can be diagonalized like any other pair systems, e.g., in parallel via the
+ * diagonalize() function.
+ *
+ * @tparam Scalar Scalar type of the systems.
+ */
+template <typename Scalar>
+class SystemPairScan {
+public:
+    static_assert(traits::NumTraits<Scalar>::from_floating_point_v);
+
+    using Type = SystemPairScan<Scalar>;
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    using basis_t = BasisPair<Scalar>;
+    using system_t = SystemPair<Scalar>;
+
+    SystemPairScan(std::shared_ptr<const basis_t> basis);
+
+    Type &set_interaction_order(int value);
+    Type &set_distance_vectors(const std::vector<std::array<real_t, 3>> &vectors);
+
+    std::shared_ptr<const basis_t> get_basis() const;
+    const std::vector<std::array<real_t, 3>> &get_distance_vectors() const;
+    const std::vector<std::shared_ptr<system_t>> &get_systems() const;
+
+private:
+    std::shared_ptr<const basis_t> basis;
+    int interaction_order{3};
+    std::vector<std::array<real_t, 3>> distance_vectors;
+    std::vector<std::shared_ptr<system_t>> systems;
+
+    void create_systems();
+};
+
+extern template class SystemPairScan<double>;
+extern template class SystemPairScan<std::complex<double>>;
+} // namespace pairinteraction
@@ -0,0 +1,132 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+#include "pairinteraction/utils/traits.hpp"
+
+#include <Eigen/Dense>
+#include <array>
+#include <complex>
+#include <cstddef>
+#include <vector>
+
+namespace pairinteraction {
+template <typename Scalar>
+class SystemAtom;
+
+/**
+ * @function calculate_c3_coefficients
+ *
+ * @brief Calculate the C3 coefficients of the dipole-dipole interaction between pair states
+ *
+ * The C3 coefficient between an initial pair state |a, b> and a final pair state |c, d> is the
+ * matrix element <c, d|V|a, b> * r^3 of the dipole-dipole interaction V, i.e., the interaction is
+ * given by C3 / r^3. Only the required matrix elements of the single-atom dipole operators are
+ * used, the pair Hamiltonian is not constructed.
+ *
+ * @param system1  diagonalized system of the first atom
+ * @param system2  diagonalized system of the second atom
+ * @param initial_pair_states  indices of the eigenstates of the first and the second atom that
+ * form the initial pair states
+ * @param final_pair_states  indices of the eigenstates of the first and the second atom that form
+ * the final pair states
+ * @param direction  direction of the distance vector between the atoms, its norm is irrelevant
+ *
+ * @return vector of the C3 coefficients in atomic units
+ *
+ * @throws std::invalid_argument if the scalar type is real and the direction has a y-component,
+ * because the C3 coefficients are complex in general then. Use the overload for many directions,
+ * which returns complex C3 coefficients, instead.
+ *
+ * @tparam Scalar scalar type of the systems
+ */
+template <typename Scalar>
+Eigen::VectorX<Scalar> calculate_c3_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &initial_pair_states,
+    const std::vector<std::array<size_t, 2>> &final_pair_states,
+    const std::array<typename traits::NumTraits<Scalar>::real_t, 3> &direction);
+
+/**
+ * @function calculate_c3_coefficients
+ *
+ * @brief Calculate the C3 coefficients between pair states for many directions of the distance
+ * vector
+ *
+ * The products of the matrix elements of the spherical components of the dipole operators are
+ * calculated once per pair state. The C3 coefficients for a direction are obtained by contracting
+ * them with the spherical components of the Green tensor of the direction, so that angular maps
+ * of the C3 coefficients are cheap. Directions with a y-component are also supported for real
+ * scalar types.
+ *
+ * @param directions  directions of the distance vector between the atoms, their norms are
+ * irrelevant
+ *
+ * @return matrix whose entry (i, j) is the C3 coefficient of the i-th pair state for the j-th
+ * direction in atomic units
+ */
+template <typename Scalar>
+Eigen::MatrixX<std::complex<typename traits::NumTraits<Scalar>::real_t>> calculate_c3_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &initial_pair_states,
+    const std::vector<std::array<size_t, 2>> &final_pair_states,
+    const std::vector<std::array<typename traits::NumTraits<Scalar>::real_t, 3>> &directions);
+
+/**
+ * @function calculate_c6_coefficients
+ *
+ * @brief Calculate the C6 coefficients of pair states in second-order perturbation theory
+ *
+ * The C6 coefficient of a pair state |a, b> is defined such that the van der Waals interaction is
+ * given by -C6 / r^6. It is calculated from the couplings of |a, b> to all other products of the
+ * eigenstates of the atoms via the dipole-dipole interaction. For each pair state, only its row of
+ * the dipole-dipole interaction is calculated, from the rows of the single-atom dipole operators,
+ * so that the pair Hamiltonian is not constructed. The pair states are processed in parallel.
+ *
+ * If a pair state couples to a degenerate pair state, its C6 coefficient is infinite. In this
+ * case, the effective Hamiltonian of the degenerate subspace must be calculated instead.
+ *
+ * @param system1  diagonalized system of the first atom
+ * @param system2  diagonalized system of the second atom
+ * @param pair_states  indices of the eigenstates of the first and the second atom that form the
+ * pair states
+ * @param direction  direction of the distance vector between the atoms, its norm is irrelevant,
+ * directions with a y-component are also supported for real scalar types
+ *
+ * @return vector of the C6 coefficients in atomic units
+ *
+ * @tparam Scalar scalar type of the systems
+ */
+template <typename Scalar>
+Eigen::VectorX<typename traits::NumTraits<Scalar>::real_t> calculate_c6_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &pair_states,
+    const std::array<typename traits::NumTraits<Scalar>::real_t, 3> &direction);
+
+/**
+ * @function calculate_c6_coefficients
+ *
+ * @brief Calculate the C6 coefficients of pair states for many directions of the distance vector
+ *
+ * For each pair state, the second-order contributions are calculated once per combination of the
+ * spherical components of the dipole operators of both atoms, i.e., as a tensor with 9 x 9
+ * entries. The C6 coefficients for a direction are obtained by contracting this tensor with the
+ * spherical components of the Green tensor of the direction, so that angular maps of the C6
+ * coefficients are cheap. Directions with a y-component are also supported for real scalar types.
+ *
+ * @param directions  directions of the distance vector between the atoms, their norms are
+ * irrelevant
+ *
+ * @return matrix whose entry (i, j) is the C6 coefficient of the i-th pair state for the j-th
+ * direction in atomic units
+ */
+template <typename Scalar>
+Eigen::MatrixX<typename traits::NumTraits<Scalar>::real_t> calculate_c6_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &pair_states,
+    const std::vector<std::array<typename traits::NumTraits<Scalar>::real_t, 3>> &directions);
+
+} // namespace pairinteraction
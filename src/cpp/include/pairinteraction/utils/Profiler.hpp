@@ -0,0 +1,61 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include <chrono>
+#include <string>
+#include <string_view>
+
+namespace pairinteraction {
+
+/**
+ * @class ScopedTimer
+ *
+ * @brief Measure the time spent in a scope and add it to the profile.
+ *
+ * Each thread accumulates its measurements in its own buffer, so that timers in parallel regions
+ * do not contend for a lock. Besides the accumulated time per name and thread, the individual
+ * measurements are recorded for exporting them as a Chrome trace, up to a maximum number of
+ * events per thread.
+ *
+ * @code
+ * {
+ *     ScopedTimer timer("System::diagonalize");
+ *     // ... code to measure ...
+ * }
+ * @endcode
+ */
+class ScopedTimer {
+public:
+    explicit ScopedTimer(std::string_view name);
+    ScopedTimer(const ScopedTimer &) = delete;
+    ScopedTimer &operator=(const ScopedTimer &) = delete;
+    ScopedTimer(ScopedTimer &&) = delete;
+    ScopedTimer &operator=(ScopedTimer &&) = delete;
+    ~ScopedTimer();
+
+private:
+    std::string_view name;
+    std::chrono::steady_clock::time_point start;
+};
+
+/// Add a value (e.g. a matrix dimension or a number of cache hits) to the counter of the given name
+void add_to_profile_counter(std::string_view name, double value = 1);
+
+/// Remove all measurements and counters from the profile
+void reset_profile();
+
+/**
+ * @brief Get the profile as JSON.
+ *
+ * The JSON object contains the accumulated timers, with the number of measurements, the total and
+ * the maximum time in seconds, and the total time per thread, as well as the counters, with the
+ * number of values, their sum, minimum, and maximum.
+ */
+std::string get_profile_as_json();
+
+/// Get the recorded measurements in the Chrome trace event format, see chrome://tracing
+std::string get_profile_as_chrome_trace();
+
+} // namespace pairinteraction
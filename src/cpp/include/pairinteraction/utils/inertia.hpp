@@ -0,0 +1,46 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#pragma once
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/traits.hpp"
+
+#include <Eigen/SparseCholesky>
+#include <Eigen/SparseCore>
+#include <optional>
+
+namespace pairinteraction::utils {
+
+/**
+ * @function count_eigenvalues_below
+ *
+ * @brief Count the eigenvalues of a hermitian matrix that are smaller than sigma
+ *
+ * By Sylvester's law of inertia, the number of eigenvalues smaller than sigma equals the number
+ * of negative entries of D in the LDL^T factorization of the matrix minus sigma.
+ *
+ * @param matrix  sparse hermitian matrix
+ * @param sigma  shift
+ *
+ * @return number of eigenvalues smaller than sigma, or std::nullopt if the factorization failed
+ *
+ * @tparam Scalar scalar type of the matrix
+ */
+
+template <typename Scalar>
+inline std::optional<int>
+count_eigenvalues_below(const Eigen::SparseMatrix<Scalar, Eigen::ColMajor> &matrix,
+                        typename traits::NumTraits<Scalar>::real_t sigma) {
+    Eigen::SparseMatrix<Scalar, Eigen::ColMajor> identity(matrix.rows(), matrix.cols());
+    identity.setIdentity();
+
+    Eigen::SimplicialLDLT<Eigen::SparseMatrix<Scalar, Eigen::ColMajor>, Eigen::Lower> solver;
+    solver.compute(matrix - sigma * identity);
+    if (solver.info() != Eigen::Success) {
+        return std::nullopt;
+    }
+    return static_cast<int>((solver.vectorD().real().array() < 0).count());
+}
+
+} // namespace pairinteraction::utils
@@ -7,6 +7,8 @@
 
 #include <Eigen/SparseCore>
 #include <memory>
+#include <optional>
+#include <stdexcept>
 
 namespace pairinteraction::utils {
 template <typename BasisType>
@@ -25,4 +27,24 @@ get_energies_in_canonical_basis(const std::shared_ptr<const BasisType> &basis) {
 
     return matrix;
 }
+
+// Get the rotator in the space of the states of the basis, or nothing if the rotated kets do not
+// belong to the basis (the rotator is only unitary if also the states are closed under rotations)
+template <typename BasisType>
+std::optional<Eigen::SparseMatrix<typename BasisType::scalar_t, Eigen::RowMajor>>
+get_rotator_of_states(const std::shared_ptr<const BasisType> &basis,
+                      typename BasisType::real_t alpha, typename BasisType::real_t beta,
+                      typename BasisType::real_t gamma) {
+    using scalar_t = typename BasisType::scalar_t;
+
+    Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> rotator;
+    try {
+        rotator = basis->get_rotator(alpha, beta, gamma).matrix;
+    } catch (const std::invalid_argument &) {
+        return std::nullopt;
+    }
+
+    const auto &coefficients = basis->get_coefficients();
+    return (coefficients.adjoint() * rotator * coefficients).eval();
+}
 } // namespace pairinteraction::utils
@@ -68,13 +68,10 @@ Basis<Derived>::Basis(ketvec_t &&kets)
     state_index_to_quantum_number_f.reserve(this->kets.size());
     state_index_to_quantum_number_m.reserve(this->kets.size());
     state_index_to_parity.reserve(this->kets.size());
-    ket_to_ket_index.reserve(this->kets.size());
-    size_t index = 0;
     for (const auto &ket : this->kets) {
         state_index_to_quantum_number_f.push_back(ket->get_quantum_number_f());
         state_index_to_quantum_number_m.push_back(ket->get_quantum_number_m());
         state_index_to_parity.push_back(ket->get_parity());
-        ket_to_ket_index[ket] = index++;
         if (ket->get_quantum_number_f() == std::numeric_limits<real_t>::max()) {
             _has_quantum_number_f = false;
         }
@@ -155,14 +152,6 @@ void Basis<Derived>::set_coefficients(
     _has_parity = false;
 }
 
-template <typename Derived>
-int Basis<Derived>::get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const {
-    if (!ket_to_ket_index.contains(ket)) {
-        return -1;
-    }
-    return ket_to_ket_index.at(ket);
-}
-
 template <typename Derived>
 typename Basis<Derived>::real_t Basis<Derived>::get_quantum_number_f(size_t state_index) const {
     real_t quantum_number_f = state_index_to_quantum_number_f.at(state_index);
@@ -254,7 +243,7 @@ std::shared_ptr<const Derived> Basis<Derived>::get_corresponding_state(size_t ke
 template <typename Derived>
 std::shared_ptr<const Derived>
 Basis<Derived>::get_corresponding_state(std::shared_ptr<const ket_t> ket) const {
-    int ket_index = get_ket_index_from_ket(ket);
+    int ket_index = derived().get_ket_index_from_ket(ket);
     if (ket_index < 0) {
         throw std::invalid_argument("The ket does not belong to the basis.");
     }
@@ -272,7 +261,7 @@ size_t Basis<Derived>::get_corresponding_state_index(size_t ket_index) const {
 
 template <typename Derived>
 size_t Basis<Derived>::get_corresponding_state_index(std::shared_ptr<const ket_t> ket) const {
-    int ket_index = get_ket_index_from_ket(ket);
+    int ket_index = derived().get_ket_index_from_ket(ket);
     if (ket_index < 0) {
         throw std::invalid_argument("The ket does not belong to the basis.");
     }
@@ -309,9 +298,10 @@ Basis<Derived>::get_canonical_state_from_ket(size_t ket_index) const {
               std::numeric_limits<int>::max());
     created->ket_index_to_state_index[ket_index] = 0;
 
-    created->state_index_to_quantum_number_f = {kets[ket_index]->get_quantum_number_f()};
-    created->state_index_to_quantum_number_m = {kets[ket_index]->get_quantum_number_m()};
-    created->state_index_to_parity = {kets[ket_index]->get_parity()};
+    const auto &ket = kets[ket_index];
+    created->state_index_to_quantum_number_f = {ket->get_quantum_number_f()};
+    created->state_index_to_quantum_number_m = {ket->get_quantum_number_m()};
+    created->state_index_to_parity = {ket->get_parity()};
     created->state_index_to_ket_index = {ket_index};
 
     created->_has_quantum_number_f =
@@ -326,7 +316,7 @@ Basis<Derived>::get_canonical_state_from_ket(size_t ket_index) const {
 template <typename Derived>
 std::shared_ptr<const Derived>
 Basis<Derived>::get_canonical_state_from_ket(std::shared_ptr<const ket_t> ket) const {
-    int ket_index = get_ket_index_from_ket(ket);
+    int ket_index = derived().get_ket_index_from_ket(ket);
     if (ket_index < 0) {
         throw std::invalid_argument("The ket does not belong to the basis.");
     }
@@ -389,8 +379,9 @@ Basis<Derived>::get_rotator(real_t alpha, real_t beta, real_t gamma) const {
 
     set_task_status("Constructing basis rotation...");
     for (size_t idx_initial = 0; idx_initial < kets.size(); ++idx_initial) {
-        real_t f = kets[idx_initial]->get_quantum_number_f();
-        real_t m_initial = kets[idx_initial]->get_quantum_number_m();
+        const auto &ket = kets[idx_initial];
+        real_t f = ket->get_quantum_number_f();
+        real_t m_initial = ket->get_quantum_number_m();
 
         assert(2 * f == std::floor(2 * f) && f >= 0);
         assert(2 * m_initial == std::floor(2 * m_initial) && m_initial >= -f && m_initial <= f);
@@ -399,8 +390,11 @@ Basis<Derived>::get_rotator(real_t alpha, real_t beta, real_t gamma) const {
              ++m_final) {
             auto val = wigner::wigner_uppercase_d_matrix<scalar_t>(f, m_initial, m_final, alpha,
                                                                    beta, gamma);
-            size_t idx_final = get_ket_index_from_ket(
-                kets[idx_initial]->get_ket_for_different_quantum_number_m(m_final));
+            int idx_final = derived().get_ket_index_from_ket(
+                ket->get_ket_for_different_quantum_number_m(m_final));
+            if (idx_final < 0) {
+                throw std::invalid_argument("The basis is not closed under rotations.");
+            }
             entries.emplace_back(idx_final, idx_initial, val);
         }
     }
@@ -604,16 +598,17 @@ std::shared_ptr<const Derived> Basis<Derived>::canonicalized() const {
     result->_has_parity = true;
 
     for (size_t i = 0; i < n; ++i) {
-        result->state_index_to_quantum_number_f[i] = kets[i]->get_quantum_number_f();
-        result->state_index_to_quantum_number_m[i] = kets[i]->get_quantum_number_m();
-        result->state_index_to_parity[i] = kets[i]->get_parity();
-        if (kets[i]->get_quantum_number_f() == std::numeric_limits<real_t>::max()) {
+        const auto &ket = kets[i];
+        result->state_index_to_quantum_number_f[i] = ket->get_quantum_number_f();
+        result->state_index_to_quantum_number_m[i] = ket->get_quantum_number_m();
+        result->state_index_to_parity[i] = ket->get_parity();
+        if (ket->get_quantum_number_f() == std::numeric_limits<real_t>::max()) {
             result->_has_quantum_number_f = false;
         }
-        if (kets[i]->get_quantum_number_m() == std::numeric_limits<real_t>::max()) {
+        if (ket->get_quantum_number_m() == std::numeric_limits<real_t>::max()) {
             result->_has_quantum_number_m = false;
         }
-        if (kets[i]->get_parity() == Parity::UNKNOWN) {
+        if (ket->get_parity() == Parity::UNKNOWN) {
             result->_has_parity = false;
         }
     }
@@ -834,17 +829,6 @@ Basis<Derived>::transformed(const Transformation<scalar_t> &transformation) cons
     return transformed;
 }
 
-template <typename Derived>
-size_t Basis<Derived>::hash::operator()(const std::shared_ptr<const ket_t> &k) const {
-    return typename ket_t::hash()(*k);
-}
-
-template <typename Derived>
-bool Basis<Derived>::equal_to::operator()(const std::shared_ptr<const ket_t> &lhs,
-                                          const std::shared_ptr<const ket_t> &rhs) const {
-    return *lhs == *rhs;
-}
-
 // Explicit instantiations
 template class Basis<BasisAtom<double>>;
 template class Basis<BasisAtom<std::complex<double>>>;
@@ -14,8 +14,10 @@ BasisAtom<Scalar>::BasisAtom(Private /*unused*/, ketvec_t &&kets, std::string &&
                              Database &database)
     : Basis<BasisAtom<Scalar>>(std::move(kets)), id_of_kets(std::move(id_of_kets)),
       database(database) {
+    ket_to_ket_index.reserve(this->kets.size());
     for (size_t i = 0; i < this->kets.size(); ++i) {
         ket_id_to_ket_index[this->kets[i]->get_id_in_database()] = i;
+        ket_to_ket_index[this->kets[i]] = i;
     }
 }
 
@@ -37,6 +39,14 @@ int BasisAtom<Scalar>::get_ket_index_from_id(size_t ket_id) const {
     return ket_id_to_ket_index.at(ket_id);
 }
 
+template <typename Scalar>
+int BasisAtom<Scalar>::get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const {
+    if (!ket_to_ket_index.contains(ket)) {
+        return -1;
+    }
+    return ket_to_ket_index.at(ket);
+}
+
 template <typename Scalar>
 const std::string &BasisAtom<Scalar>::get_id_of_kets() const {
     return id_of_kets;
@@ -72,6 +82,17 @@ BasisAtom<Scalar>::get_matrix_elements(std::shared_ptr<const Type> other, Operat
     return matrix_elements;
 }
 
+template <typename Scalar>
+size_t BasisAtom<Scalar>::hash::operator()(const std::shared_ptr<const ket_t> &k) const {
+    return typename ket_t::hash()(*k);
+}
+
+template <typename Scalar>
+bool BasisAtom<Scalar>::equal_to::operator()(const std::shared_ptr<const ket_t> &lhs,
+                                             const std::shared_ptr<const ket_t> &rhs) const {
+    return *lhs == *rhs;
+}
+
 // Explicit instantiations
 template class BasisAtom<double>;
 template class BasisAtom<std::complex<double>>;
@@ -19,20 +19,19 @@
 
 namespace pairinteraction {
 template <typename Scalar>
-BasisPair<Scalar>::BasisPair(Private /*unused*/, ketvec_t &&kets,
-                             map_range_t &&map_range_of_state_index2,
-                             map_indices_t &&state_indices_to_ket_index,
+BasisPair<Scalar>::BasisPair(Private /*unused*/, ketvec_t &&kets, ranges_t &&ranges_of_state_index2,
+                             offsets_t &&offsets_of_state_index1, indices_t &&ket_indices,
                              std::shared_ptr<const BasisAtom<Scalar>> basis1,
                              std::shared_ptr<const BasisAtom<Scalar>> basis2)
     : Basis<BasisPair<Scalar>>(std::move(kets)),
-      map_range_of_state_index2(std::move(map_range_of_state_index2)),
-      state_indices_to_ket_index(std::move(state_indices_to_ket_index)), basis1(std::move(basis1)),
-      basis2(std::move(basis2)) {}
+      ranges_of_state_index2(std::move(ranges_of_state_index2)),
+      offsets_of_state_index1(std::move(offsets_of_state_index1)),
+      ket_indices(std::move(ket_indices)), basis1(std::move(basis1)), basis2(std::move(basis2)) {}
 
 template <typename Scalar>
 const typename BasisPair<Scalar>::range_t &
 BasisPair<Scalar>::get_index_range(size_t state_index1) const {
-    return map_range_of_state_index2.at(state_index1);
+    return ranges_of_state_index2.at(state_index1);
 }
 
 template <typename Scalar>
@@ -47,10 +46,23 @@ std::shared_ptr<const BasisAtom<Scalar>> BasisPair<Scalar>::get_basis2() const {
 
 template <typename Scalar>
 int BasisPair<Scalar>::get_ket_index_from_tuple(size_t state_index1, size_t state_index2) const {
-    if (!state_indices_to_ket_index.contains({state_index1, state_index2})) {
+    if (state_index1 >= ranges_of_state_index2.size()) {
         return -1;
     }
-    return state_indices_to_ket_index.at({state_index1, state_index2});
+    const auto &range = ranges_of_state_index2[state_index1];
+    if (state_index2 < range.min() || state_index2 >= range.max()) {
+        return -1;
+    }
+    return ket_indices[offsets_of_state_index1[state_index1] + state_index2 - range.min()];
+}
+
+template <typename Scalar>
+int BasisPair<Scalar>::get_ket_index_from_ket(std::shared_ptr<const ket_t> ket) const {
+    // The kets are not stored as objects but identified by the indices of their one-atom states
+    if (ket->atomic_bases[0] != basis1 || ket->atomic_bases[1] != basis2) {
+        return -1;
+    }
+    return get_ket_index_from_tuple(ket->atomic_indices[0], ket->atomic_indices[1]);
 }
 
 template <typename Scalar>
@@ -10,6 +10,7 @@
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/ket/KetPair.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/TaskControl.hpp"
 #include "pairinteraction/utils/hash.hpp"
 
@@ -19,6 +20,8 @@
 #include <cmath>
 #include <limits>
 #include <memory>
+#include <numeric>
+#include <oneapi/tbb.h>
 #include <stdexcept>
 #include <unordered_map>
 
@@ -60,6 +63,7 @@ BasisPairCreator<Scalar>::restrict_parity_under_permutation(Parity value) {
 
 template <typename Scalar>
 std::shared_ptr<const BasisPair<Scalar>> BasisPairCreator<Scalar>::create() const {
+    ScopedTimer timer("BasisPairCreator::create");
     set_task_status("Constructing pair basis...");
 
     if (systems_atom.size() != 2) {
@@ -90,32 +94,13 @@ std::shared_ptr<const BasisPair<Scalar>> BasisPairCreator<Scalar>::create() cons
     auto eigenenergies2 = system2.get_eigenenergies();
     real_t *eigenenergies2_begin = eigenenergies2.data();
     real_t *eigenenergies2_end = eigenenergies2_begin + eigenenergies2.size();
+    const auto number_of_states1 = static_cast<size_t>(eigenenergies1.size());
 
-    ketvec_t kets;
-    kets.reserve(eigenenergies1.size() * eigenenergies2.size());
-
-    typename basis_t::map_range_t map_range_of_state_index2;
-    map_range_of_state_index2.reserve(eigenenergies1.size());
-
-    typename basis_t::map_indices_t state_indices_to_ket_index;
-
-    Eigen::Index state_index = 0;
-    std::unordered_map<std::array<size_t, 2>, Eigen::Index, utils::hash<std::array<size_t, 2>>>
-        ket_ids2state_index;
-    std::vector<Eigen::Triplet<Scalar>> transformation_triplets;
-
-    if (has_symmetry_restriction) {
-        transformation_triplets.reserve(eigenenergies1.size() * eigenenergies2.size());
-    }
-
-    double inverse_sqrt_two = 1 / std::sqrt(2.0);
-
-    // Loop only over states with an allowed energy
-    size_t ket_index = 0;
-    for (size_t idx1 = 0; idx1 < static_cast<size_t>(eigenenergies1.size()); ++idx1) {
-        set_task_status("Constructing pair basis...");
-
-        // Get the energetically allowed range of the second index
+    // Get the energetically allowed range of the second index for each state of the first atom.
+    // The pairs (idx1, idx2) within the allowed ranges are enumerated contiguously, starting at
+    // the offset of idx1.
+    typename basis_t::ranges_t ranges_of_state_index2(number_of_states1);
+    oneapi::tbb::parallel_for(size_t{0}, number_of_states1, [&](size_t idx1) {
         size_t min = 0;
         size_t max = eigenenergies2.size();
         if (range_energy.is_finite()) {
@@ -128,14 +113,44 @@ std::shared_ptr<const BasisPair<Scalar>> BasisPairCreator<Scalar>::create() cons
                 std::distance(eigenenergies2_begin,
                               std::upper_bound(eigenenergies2_begin, eigenenergies2_end, max_val2));
         }
-        map_range_of_state_index2.emplace(idx1, typename basis_t::range_t(min, max));
+        ranges_of_state_index2[idx1] = typename basis_t::range_t(min, max);
+    });
+
+    typename basis_t::offsets_t offsets_of_state_index1(number_of_states1 + 1, 0);
+    for (size_t idx1 = 0; idx1 < number_of_states1; ++idx1) {
+        const auto &range = ranges_of_state_index2[idx1];
+        offsets_of_state_index1[idx1 + 1] =
+            offsets_of_state_index1[idx1] + range.max() - range.min();
+    }
 
-        // Loop over the energetically allowed range of the second index
-        for (size_t idx2 = min; idx2 < max; ++idx2) {
-            // Get energy
-            const real_t energy = eigenenergies1[idx1] + eigenenergies2[idx2];
+    // The magnetic quantum number of a pair ket is well-defined if it is well-defined for both
+    // one-atom bases
+    const bool has_quantum_number_m =
+        basis1->has_quantum_number_m() && basis2->has_quantum_number_m();
+    if (!has_quantum_number_m && range_quantum_number_m.is_finite()) {
+        throw std::invalid_argument(
+            "The quantum number m must not be restricted because it is not well-defined.");
+    }
+    auto get_quantum_number_m = [&](size_t idx1, size_t idx2) {
+        if (!has_quantum_number_m) {
+            return std::numeric_limits<real_t>::quiet_NaN();
+        }
+        return basis1->get_quantum_number_m(idx1) + basis2->get_quantum_number_m(idx2);
+    };
+
+    // First pass: mark the pair kets with allowed quantum numbers and count them for each state
+    // of the first atom
+    std::vector<unsigned char> is_allowed(offsets_of_state_index1.back(), 0);
+    std::vector<size_t> ket_offsets(number_of_states1 + 1, 0);
+    oneapi::tbb::parallel_for(size_t{0}, number_of_states1, [&](size_t idx1) {
+        set_task_status("Constructing pair basis...");
+
+        const auto &range = ranges_of_state_index2[idx1];
+        size_t number_of_kets = 0;
+        for (size_t idx2 = range.min(); idx2 < range.max(); ++idx2) {
             assert(!range_energy.is_finite() ||
-                   (energy >= range_energy.min() && energy <= range_energy.max()));
+                   (eigenenergies1[idx1] + eigenenergies2[idx2] >= range_energy.min() &&
+                    eigenenergies1[idx1] + eigenenergies2[idx2] <= range_energy.max()));
 
             // Check the parity of the product of the parities
             if (inferred_product_of_parities != Parity::UNKNOWN) {
@@ -146,38 +161,80 @@ std::shared_ptr<const BasisPair<Scalar>> BasisPairCreator<Scalar>::create() cons
                 }
             }
 
-            // Create a KetPair object
-            auto ket = std::make_shared<ket_t>(
-                typename ket_t::Private(), std::initializer_list<size_t>{idx1, idx2},
-                std::initializer_list<std::shared_ptr<const BasisAtom<Scalar>>>{basis1, basis2},
-                energy);
-
             // Check the quantum number m
-            if (ket->has_quantum_number_m()) {
-                if (range_quantum_number_m.is_finite() &&
-                    (ket->get_quantum_number_m() <
-                         range_quantum_number_m.min() - numerical_precision ||
-                     ket->get_quantum_number_m() >
-                         range_quantum_number_m.max() + numerical_precision)) {
+            if (range_quantum_number_m.is_finite()) {
+                const real_t quantum_number_m = get_quantum_number_m(idx1, idx2);
+                if (quantum_number_m < range_quantum_number_m.min() - numerical_precision ||
+                    quantum_number_m > range_quantum_number_m.max() + numerical_precision) {
                     continue;
                 }
-            } else if (range_quantum_number_m.is_finite()) {
-                throw std::invalid_argument(
-                    "The quantum number m must not be restricted because it is not well-defined.");
             }
 
-            // Store the KetPair object as a ket
-            kets.emplace_back(std::move(ket));
+            is_allowed[offsets_of_state_index1[idx1] + idx2 - range.min()] = 1;
+            ++number_of_kets;
+        }
+        ket_offsets[idx1 + 1] = number_of_kets;
+    });
+    std::partial_sum(ket_offsets.begin(), ket_offsets.end(), ket_offsets.begin());
+
+    // Second pass: store the allowed pair kets as arrays, ordered by (idx1, idx2), and fill the
+    // flat lookup table from the pairs (idx1, idx2) to the ket indices. KetPair objects are only
+    // created when the kets are accessed.
+    const auto number_of_kets = static_cast<Eigen::Index>(ket_offsets.back());
+    Eigen::VectorXi state_indices1(number_of_kets);
+    Eigen::VectorXi state_indices2(number_of_kets);
+    Eigen::VectorX<real_t> energies(number_of_kets);
+    Eigen::VectorX<real_t> quantum_numbers_m(number_of_kets);
+    typename basis_t::indices_t ket_indices(offsets_of_state_index1.back(), -1);
+    oneapi::tbb::parallel_for(size_t{0}, number_of_states1, [&](size_t idx1) {
+        const auto &range = ranges_of_state_index2[idx1];
+        auto ket_index = static_cast<Eigen::Index>(ket_offsets[idx1]);
+        for (size_t idx2 = range.min(); idx2 < range.max(); ++idx2) {
+            size_t i = offsets_of_state_index1[idx1] + idx2 - range.min();
+            if (is_allowed[i] == 0) {
+                continue;
+            }
+            ket_indices[i] = static_cast<int>(ket_index);
+            state_indices1[ket_index] = static_cast<int>(idx1);
+            state_indices2[ket_index] = static_cast<int>(idx2);
+            energies[ket_index] = eigenenergies1[idx1] + eigenenergies2[idx2];
+            quantum_numbers_m[ket_index] = get_quantum_number_m(idx1, idx2);
+            ++ket_index;
+        }
+    });
+    is_allowed = {};
 
-            // Store the ket index after all symmetry contributions have been recorded
-            state_indices_to_ket_index.emplace(std::vector<size_t>{idx1, idx2}, ket_index);
+    ketvec_t kets({basis1, basis2}, std::move(state_indices1), std::move(state_indices2),
+                  std::move(energies), std::move(quantum_numbers_m));
+    std::shared_ptr<const basis_t> basis = std::make_shared<basis_t>(
+        typename basis_t::Private(), std::move(kets), std::move(ranges_of_state_index2),
+        std::move(offsets_of_state_index1), std::move(ket_indices), basis1, basis2);
+    add_to_profile_counter("BasisPairCreator::create: number of kets",
+                           static_cast<double>(basis->get_number_of_kets()));
 
-            // Store a symmetrized coefficient matrix only if inversion or permutation symmetry is
-            // specified
-            auto row_index = static_cast<Eigen::Index>(ket_index++);
-            if (!has_symmetry_restriction) {
+    if (!has_symmetry_restriction) {
+        return basis;
+    }
+
+    // Store a symmetrized coefficient matrix only if inversion or permutation symmetry is
+    // specified. The kets are visited in the order of their indices, so that the symmetrized states
+    // are enumerated deterministically.
+    Eigen::Index state_index = 0;
+    std::unordered_map<std::array<size_t, 2>, Eigen::Index, utils::hash<std::array<size_t, 2>>>
+        ket_ids2state_index;
+    std::vector<Eigen::Triplet<Scalar>> transformation_triplets;
+    transformation_triplets.reserve(basis->get_number_of_kets());
+
+    double inverse_sqrt_two = 1 / std::sqrt(2.0);
+
+    for (size_t idx1 = 0; idx1 < number_of_states1; ++idx1) {
+        const auto &range = basis->get_index_range(idx1);
+        for (size_t idx2 = range.min(); idx2 < range.max(); ++idx2) {
+            int ket_index = basis->get_ket_index_from_tuple(idx1, idx2);
+            if (ket_index < 0) {
                 continue;
             }
+            auto row_index = static_cast<Eigen::Index>(ket_index);
 
             // TODO: on the long run, the states should have IDs and not only the kets. This is in
             // particular of importance if get_corresponding_ket is not working because fields lead
@@ -240,16 +297,6 @@ std::shared_ptr<const BasisPair<Scalar>> BasisPairCreator<Scalar>::create() cons
         }
     }
 
-    kets.shrink_to_fit();
-
-    std::shared_ptr<const basis_t> basis = std::make_shared<basis_t>(
-        typename basis_t::Private(), std::move(kets), std::move(map_range_of_state_index2),
-        std::move(state_indices_to_ket_index), basis1, basis2);
-
-    if (!has_symmetry_restriction) {
-        return basis;
-    }
-
     transformation_triplets.shrink_to_fit();
 
     Eigen::SparseMatrix<Scalar, Eigen::RowMajor> transformation_matrix(
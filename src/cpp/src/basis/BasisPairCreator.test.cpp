@@ -23,6 +23,7 @@
 #include <array>
 #include <cmath>
 #include <doctest/doctest.h>
+#include <stdexcept>
 #include <unordered_map>
 #include <utility>
 #include <vector>
@@ -174,6 +175,55 @@ DOCTEST_TEST_CASE("create a BasisPair") {
         DOCTEST_CHECK(*ket2a != *ket2b);
     }
 
+    DOCTEST_SUBCASE("check lookup of ket indices") {
+        // The kets are ordered by the indices of the one-atom states, so that the lookup table
+        // enumerates all kets in order
+        int expected_ket_index = 0;
+        for (size_t idx1 = 0; idx1 < system.get_basis()->get_number_of_states(); ++idx1) {
+            const auto &range = basis_pair_a->get_index_range(idx1);
+            for (size_t idx2 = range.min(); idx2 < range.max(); ++idx2) {
+                int ket_index = basis_pair_a->get_ket_index_from_tuple(idx1, idx2);
+                if (ket_index >= 0) {
+                    DOCTEST_CHECK(ket_index == expected_ket_index++);
+                }
+            }
+            DOCTEST_CHECK(basis_pair_a->get_ket_index_from_tuple(idx1, range.max()) == -1);
+        }
+        DOCTEST_CHECK(expected_ket_index == static_cast<int>(basis_pair_a->get_number_of_kets()));
+        DOCTEST_CHECK(basis_pair_a->get_ket_index_from_tuple(
+                          system.get_basis()->get_number_of_states(), 0) == -1);
+    }
+
+    DOCTEST_SUBCASE("check the structure-of-arrays storage of kets") {
+        const auto &kets = basis_pair_a->get_kets();
+        DOCTEST_CHECK(kets.size() == basis_pair_a->get_number_of_kets());
+        for (size_t ket_index = 0; ket_index < kets.size(); ++ket_index) {
+            auto idx = static_cast<Eigen::Index>(ket_index);
+            auto idx1 = static_cast<size_t>(kets.get_state_indices1()[idx]);
+            auto idx2 = static_cast<size_t>(kets.get_state_indices2()[idx]);
+            DOCTEST_CHECK(basis_pair_a->get_ket_index_from_tuple(idx1, idx2) ==
+                          static_cast<int>(ket_index));
+            DOCTEST_CHECK(kets.get_quantum_numbers_m()[idx] == doctest::Approx(1));
+
+            // The KetPair objects are created on access and can be looked up in the basis
+            auto ket_pair = kets[ket_index];
+            DOCTEST_CHECK(*ket_pair == *kets[ket_index]);
+            DOCTEST_CHECK(ket_pair->get_energy() == kets.get_energies()[idx]);
+            DOCTEST_CHECK(ket_pair->get_quantum_number_m() == kets.get_quantum_numbers_m()[idx]);
+            DOCTEST_CHECK(basis_pair_a->get_corresponding_state_index(ket_pair) == ket_index);
+        }
+
+        // Bases derived from each other share the arrays
+        auto canonicalized = basis_pair_a->canonicalized();
+        DOCTEST_CHECK(canonicalized->get_kets().get_energies().data() ==
+                      kets.get_energies().data());
+
+        // Kets of a different basis are not found
+        DOCTEST_CHECK_THROWS_AS(
+            basis_pair_a->get_corresponding_state_index(basis_pair_b->get_kets()[0]),
+            std::invalid_argument);
+    }
+
     DOCTEST_SUBCASE("check overlap") {
         auto overlaps = basis_pair_a
                             ->get_matrix_elements(ket, ket, OperatorType::IDENTITY,
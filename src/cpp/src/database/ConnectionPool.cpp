@@ -0,0 +1,95 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/database/ConnectionPool.hpp"
+
+#include <algorithm>
+#include <duckdb.hpp>
+#include <stdexcept>
+#include <utility>
+
+namespace pairinteraction {
+ConnectionPool::Handle::Handle(ConnectionPool &pool, std::unique_ptr<duckdb::Connection> connection)
+    : pool(&pool), connection(std::move(connection)) {}
+
+ConnectionPool::Handle::Handle(Handle &&other) noexcept
+    : pool(other.pool), connection(std::move(other.connection)) {}
+
+ConnectionPool::Handle::~Handle() {
+    if (connection) {
+        pool->release(std::move(connection));
+    }
+}
+
+duckdb::Connection &ConnectionPool::Handle::operator*() const { return *connection; }
+
+duckdb::Connection *ConnectionPool::Handle::operator->() const { return connection.get(); }
+
+ConnectionPool::ConnectionPool(duckdb::DuckDB &db, std::size_t max_size)
+    : db(db), max_size(std::max<std::size_t>(max_size, 1)) {}
+
+ConnectionPool::~ConnectionPool() = default;
+
+ConnectionPool::Handle ConnectionPool::acquire() {
+    std::unique_lock<std::mutex> lock(mutex);
+    cv.wait(lock, [this] { return !idle_connections.empty() || number_of_connections < max_size; });
+
+    // Reuse an idle connection if possible, otherwise open a new one
+    if (!idle_connections.empty()) {
+        auto connection = std::move(idle_connections.back());
+        idle_connections.pop_back();
+        return {*this, std::move(connection)};
+    }
+    ++number_of_connections;
+    lock.unlock();
+
+    try {
+        return {*this, std::make_unique<duckdb::Connection>(db)};
+    } catch (...) {
+        {
+            std::lock_guard<std::mutex> relock(mutex);
+            --number_of_connections;
+        }
+        cv.notify_one();
+        throw;
+    }
+}
+
+void ConnectionPool::release(std::unique_ptr<duckdb::Connection> connection) {
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        if (number_of_connections > max_size) {
+            // The pool has been shrunk, so close the connection
+            --number_of_connections;
+        } else {
+            idle_connections.push_back(std::move(connection));
+        }
+    }
+    cv.notify_one();
+}
+
+void ConnectionPool::set_max_size(std::size_t max_size) {
+    if (max_size == 0) {
+        throw std::invalid_argument("The size of the connection pool must be at least 1.");
+    }
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+        this->max_size = max_size;
+        while (number_of_connections > max_size && !idle_connections.empty()) {
+            idle_connections.pop_back();
+            --number_of_connections;
+        }
+    }
+    cv.notify_all();
+}
+
+std::size_t ConnectionPool::get_max_size() const {
+    std::lock_guard<std::mutex> lock(mutex);
+    return max_size;
+}
+
+std::size_t ConnectionPool::get_number_of_connections() const {
+    std::lock_guard<std::mutex> lock(mutex);
+    return number_of_connections;
+}
+} // namespace pairinteraction
@@ -0,0 +1,59 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/database/ConnectionPool.hpp"
+
+#include <atomic>
+#include <doctest/doctest.h>
+#include <duckdb.hpp>
+#include <oneapi/tbb.h>
+#include <stdexcept>
+
+namespace pairinteraction {
+DOCTEST_TEST_CASE("connection pool reuses connections") {
+    duckdb::DuckDB db(nullptr);
+    ConnectionPool pool(db, 2);
+
+    {
+        auto con1 = pool.acquire();
+        auto con2 = pool.acquire();
+        DOCTEST_CHECK(&*con1 != &*con2);
+        DOCTEST_CHECK(pool.get_number_of_connections() == 2);
+    }
+
+    // Returned connections are reused instead of opening new ones
+    {
+        auto con = pool.acquire();
+        DOCTEST_CHECK(pool.get_number_of_connections() == 2);
+    }
+
+    // Shrinking the pool closes idle connections
+    pool.set_max_size(1);
+    DOCTEST_CHECK(pool.get_max_size() == 1);
+    DOCTEST_CHECK(pool.get_number_of_connections() == 1);
+    DOCTEST_CHECK_THROWS_AS(pool.set_max_size(0), std::invalid_argument);
+}
+
+DOCTEST_TEST_CASE("tables are visible to all pooled connections") {
+    duckdb::DuckDB db(nullptr);
+    ConnectionPool pool(db, 4);
+
+    {
+        auto con = pool.acquire();
+        auto result = con->Query("CREATE TABLE 'numbers' AS SELECT range AS x FROM range(100)");
+        DOCTEST_REQUIRE(!result->HasError());
+    }
+
+    // Query the table concurrently from different connections
+    std::atomic<int> number_of_successes{0};
+    oneapi::tbb::parallel_for(0, 16, [&](int /*idx*/) {
+        auto con = pool.acquire();
+        auto result = con->Query("SELECT SUM(x) FROM 'numbers'");
+        if (!result->HasError() && result->RowCount() == 1) {
+            ++number_of_successes;
+        }
+    });
+    DOCTEST_CHECK(number_of_successes == 16);
+    DOCTEST_CHECK(pool.get_number_of_connections() <= 4);
+}
+} // namespace pairinteraction
@@ -6,11 +6,13 @@
 #include "pairinteraction/basis/BasisAtom.hpp"
 #include "pairinteraction/database/AtomDescriptionByParameters.hpp"
 #include "pairinteraction/database/AtomDescriptionByRanges.hpp"
+#include "pairinteraction/database/ConnectionPool.hpp"
 #include "pairinteraction/database/GitHubDownloader.hpp"
 #include "pairinteraction/database/ParquetManager.hpp"
 #include "pairinteraction/enums/OperatorType.hpp"
 #include "pairinteraction/enums/Parity.hpp"
 #include "pairinteraction/ket/KetAtom.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/TaskControl.hpp"
 #include "pairinteraction/utils/hash.hpp"
 #include "pairinteraction/utils/id_in_database.hpp"
@@ -22,10 +24,14 @@
 #include <fmt/core.h>
 #include <fmt/ranges.h>
 #include <fstream>
+#include <functional>
+#include <map>
 #include <nlohmann/json.hpp>
 #include <oneapi/tbb.h>
+#include <optional>
 #include <spdlog/spdlog.h>
 #include <system_error>
+#include <thread>
 
 namespace pairinteraction {
 
@@ -38,6 +44,31 @@ std::string format_expectation_value_range(const std::string &value_column,
                        standard_deviation_factor, std_column, range.max(),
                        standard_deviation_factor, std_column);
 }
+
+template <typename Scalar>
+std::string get_canonical_ket_ids(const BasisAtom<Scalar> &basis) {
+    // The kets of an atomic basis are sorted by their ids, so that the ids determine the matrix
+    // elements in the canonical basis uniquely. Runs of consecutive ids are stored as ranges to
+    // keep the string short.
+    std::string ket_ids;
+    const auto &kets = basis.get_kets();
+    size_t i = 0;
+    while (i < kets.size()) {
+        size_t first_id = kets[i]->get_id_in_database();
+        size_t last_id = first_id;
+        while (i + 1 < kets.size() && kets[i + 1]->get_id_in_database() == last_id + 1) {
+            ++last_id;
+            ++i;
+        }
+        ++i;
+        if (!ket_ids.empty()) {
+            ket_ids += ",";
+        }
+        ket_ids += first_id == last_id ? fmt::format("{}", first_id)
+                                       : fmt::format("{}-{}", first_id, last_id);
+    }
+    return ket_ids;
+}
 } // namespace
 
 void ensure_consistent_quantum_numbers(bool is_j_total_momentum, double quantum_number_f,
@@ -72,7 +103,8 @@ Database::Database(std::filesystem::path database_dir)
 Database::Database(bool download_missing, bool use_cache, std::filesystem::path database_dir)
     : download_missing_(download_missing), use_cache_(use_cache),
       database_dir_(std::move(database_dir)), db(std::make_unique<duckdb::DuckDB>(nullptr)),
-      con(std::make_unique<duckdb::Connection>(*db)) {
+      pool(std::make_unique<ConnectionPool>(*db,
+                                            std::max(1U, std::thread::hardware_concurrency()))) {
 
     if (database_dir_.empty()) {
         database_dir_ = default_database_dir;
@@ -158,12 +190,7 @@ Database::Database(bool download_missing, bool use_cache, std::filesystem::path
     }
 
     // Limit the memory usage of duckdb's buffer manager
-    {
-        auto result = con->Query("PRAGMA max_memory = '8GB';");
-        if (result->HasError()) {
-            throw cpptrace::runtime_error("Error setting the memory limit: " + result->GetError());
-        }
-    }
+    set_duckdb_max_memory(default_duckdb_max_memory);
 
     // Instantiate a database manager that provides access to database tables. If a table
     // is outdated/not available locally, it will be downloaded if download_missing_ is true.
@@ -172,7 +199,7 @@ Database::Database(bool download_missing, bool use_cache, std::filesystem::path
     }
     downloader = std::make_unique<GitHubDownloader>();
     manager = std::make_unique<ParquetManager>(database_dir_, *downloader, database_repo_paths,
-                                               *con, use_cache_);
+                                               *pool, use_cache_);
     manager->scan_local();
     manager->scan_remote();
 
@@ -185,9 +212,8 @@ Database::Database(bool download_missing, bool use_cache, std::filesystem::path
 
 Database::~Database() = default;
 
-std::shared_ptr<const KetAtom> Database::get_ket(const std::string &species,
-                                                 const AtomDescriptionByParameters &description) {
-    // Check that the specifications are valid
+namespace {
+void ensure_valid_description(const AtomDescriptionByParameters &description) {
     if (!description.quantum_number_m.has_value()) {
         throw std::invalid_argument("The quantum number m must be specified.");
     }
@@ -212,174 +238,175 @@ std::shared_ptr<const KetAtom> Database::get_ket(const std::string &species,
             std::rint(2 * description.quantum_number_m.value())) {
         throw std::invalid_argument("The quantum number m must be an integer or half-integer.");
     }
+}
 
-    // Describe the state
-    std::string where;
-    std::string separator;
-    if (description.energy.has_value()) {
-        // The following condition derives from demanding that quantum number n that corresponds to
-        // the energy "E_n = -1/(2*n^2)" is not off by more than 1 from the actual quantum number n,
-        // i.e., "sqrt(-1/(2*E_n)) - sqrt(-1/(2*E_{n-1})) = 1"
-        where += separator +
-            fmt::format("SQRT(-1/(2*energy)) BETWEEN {} AND {}",
-                        std::sqrt(-1 / (2 * description.energy.value())) - 0.5,
-                        std::sqrt(-1 / (2 * description.energy.value())) + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_f.has_value()) {
-        where += separator + fmt::format("f = {}", description.quantum_number_f.value());
-        separator = " AND ";
-    }
-    if (description.parity != Parity::UNKNOWN) {
-        where += separator + fmt::format("parity = {}", fmt::streamed(description.parity));
-        separator = " AND ";
-    }
-    if (description.quantum_number_n.has_value()) {
-        where += separator + fmt::format("n = {}", description.quantum_number_n.value());
-        separator = " AND ";
-    }
-    if (description.quantum_number_nu.has_value()) {
-        where += separator +
-            fmt::format("nu BETWEEN {} AND {}", description.quantum_number_nu.value() - 0.5,
-                        description.quantum_number_nu.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_nui.has_value()) {
-        where += separator +
-            fmt::format("exp_nui BETWEEN {} AND {}", description.quantum_number_nui.value() - 0.5,
-                        description.quantum_number_nui.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_l.has_value()) {
-        where += separator +
-            fmt::format("exp_l BETWEEN {} AND {}", description.quantum_number_l.value() - 0.5,
-                        description.quantum_number_l.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_s.has_value()) {
-        where += separator +
-            fmt::format("exp_s BETWEEN {} AND {}", description.quantum_number_s.value() - 0.5,
-                        description.quantum_number_s.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_j.has_value()) {
-        where += separator +
-            fmt::format("exp_j BETWEEN {} AND {}", description.quantum_number_j.value() - 0.5,
-                        description.quantum_number_j.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_l_ryd.has_value()) {
-        where += separator +
-            fmt::format("exp_l_ryd BETWEEN {} AND {}",
-                        description.quantum_number_l_ryd.value() - 0.5,
-                        description.quantum_number_l_ryd.value() + 0.5);
-        separator = " AND ";
-    }
-    if (description.quantum_number_j_ryd.has_value()) {
-        where += separator +
-            fmt::format("exp_j_ryd BETWEEN {} AND {}",
-                        description.quantum_number_j_ryd.value() - 0.5,
-                        description.quantum_number_j_ryd.value() + 0.5);
-        separator = " AND ";
-    }
-    if (separator.empty()) {
-        where += "FALSE";
-    }
+// A parameter by which an atomic state can be described. The condition selects the states of the
+// database that are compatible with the described value, the distance is used to select the state
+// that matches the described value best. The placeholder {0} refers to the described value.
+struct DescriptionParameter {
+    std::string name;
+    std::string condition;
+    std::string distance;
+    std::function<std::optional<double>(const AtomDescriptionByParameters &)> get_value;
+};
 
-    std::string orderby;
-    separator = "";
-    if (description.energy.has_value()) {
-        orderby += separator +
-            fmt::format("(SQRT(-1/(2*energy)) - {})^2",
-                        std::sqrt(-1 / (2 * description.energy.value())));
-        separator = " + ";
-    }
-    if (description.quantum_number_nu.has_value()) {
-        orderby += separator + fmt::format("(nu - {})^2", description.quantum_number_nu.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_nui.has_value()) {
-        orderby +=
-            separator + fmt::format("(exp_nui - {})^2", description.quantum_number_nui.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_l.has_value()) {
-        orderby += separator + fmt::format("(exp_l - {})^2", description.quantum_number_l.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_s.has_value()) {
-        orderby += separator + fmt::format("(exp_s - {})^2", description.quantum_number_s.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_j.has_value()) {
-        orderby += separator + fmt::format("(exp_j - {})^2", description.quantum_number_j.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_l_ryd.has_value()) {
-        orderby +=
-            separator + fmt::format("(exp_l_ryd - {})^2", description.quantum_number_l_ryd.value());
-        separator = " + ";
-    }
-    if (description.quantum_number_j_ryd.has_value()) {
-        orderby +=
-            separator + fmt::format("(exp_j_ryd - {})^2", description.quantum_number_j_ryd.value());
-        separator = " + ";
-    }
-    if (separator.empty()) {
-        orderby += "id";
-    }
+const std::vector<DescriptionParameter> &get_description_parameters() {
+    using D = AtomDescriptionByParameters;
+    static const std::vector<DescriptionParameter> parameters = {
+        // The condition on the energy derives from demanding that quantum number n that
+        // corresponds to the energy "E_n = -1/(2*n^2)" is not off by more than 1 from the actual
+        // quantum number n, i.e., "sqrt(-1/(2*E_n)) - sqrt(-1/(2*E_{n-1})) = 1". The described
+        // value is the quantum number n that corresponds to the energy.
+        {"energy", "SQRT(-1/(2*s.energy)) BETWEEN {0}-0.5 AND {0}+0.5",
+         "(SQRT(-1/(2*s.energy)) - {0})^2",
+         [](const D &d) {
+             return d.energy.transform([](double e) { return std::sqrt(-1 / (2 * e)); });
+         }},
+        {"f", "s.f = {0}", "", [](const D &d) { return d.quantum_number_f; }},
+        {"parity", "s.parity = {0}", "",
+         [](const D &d) {
+             return d.parity == Parity::UNKNOWN ? std::nullopt
+                                                : std::optional<double>(static_cast<int>(d.parity));
+         }},
+        {"n", "s.n = {0}", "",
+         [](const D &d) {
+             return d.quantum_number_n.transform([](int n) { return static_cast<double>(n); });
+         }},
+        {"nu", "s.nu BETWEEN {0}-0.5 AND {0}+0.5", "(s.nu - {0})^2",
+         [](const D &d) { return d.quantum_number_nu; }},
+        {"nui", "s.exp_nui BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_nui - {0})^2",
+         [](const D &d) { return d.quantum_number_nui; }},
+        {"l", "s.exp_l BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_l - {0})^2",
+         [](const D &d) { return d.quantum_number_l; }},
+        {"s", "s.exp_s BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_s - {0})^2",
+         [](const D &d) { return d.quantum_number_s; }},
+        {"j", "s.exp_j BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_j - {0})^2",
+         [](const D &d) { return d.quantum_number_j; }},
+        {"l_ryd", "s.exp_l_ryd BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_l_ryd - {0})^2",
+         [](const D &d) { return d.quantum_number_l_ryd; }},
+        {"j_ryd", "s.exp_j_ryd BETWEEN {0}-0.5 AND {0}+0.5", "(s.exp_j_ryd - {0})^2",
+         [](const D &d) { return d.quantum_number_j_ryd; }},
+    };
+    return parameters;
+}
+} // namespace
 
-    // Ask the database for the described state
-    set_task_status("Loading atomic ket from database...");
-    auto result = con->Query(fmt::format(
-        R"(SELECT energy, f, parity, id, n, nu, exp_nui, std_nui, exp_l, std_l, exp_s, std_s,
-        exp_j, std_j, exp_l_ryd, std_l_ryd, exp_j_ryd, std_j_ryd, is_j_total_momentum, is_calculated_with_mqdt, underspecified_channel_contribution, {} AS order_val FROM '{}' WHERE {} ORDER BY order_val ASC LIMIT 2)",
-        orderby, manager->get_path(species, "states"), where));
+std::shared_ptr<const KetAtom> Database::get_ket(const std::string &species,
+                                                 const AtomDescriptionByParameters &description) {
+    return get_kets(species, {description}).front();
+}
 
-    if (result->HasError()) {
-        throw cpptrace::runtime_error("Error querying the database: " + result->GetError());
-    }
+std::vector<std::shared_ptr<const KetAtom>>
+Database::get_kets(const std::string &species,
+                   const std::vector<AtomDescriptionByParameters> &descriptions) {
+    ScopedTimer timer("Database::get_kets");
 
-    if (result->RowCount() == 0) {
-        throw std::invalid_argument("No state found.");
-    }
+    // Check that the specifications are valid
+    for (const auto &description : descriptions) {
+        ensure_valid_description(description);
+    }
+
+    // Group the descriptions by the parameters that they specify, so that the states of each group
+    // can be looked up by a single query
+    const auto &parameters = get_description_parameters();
+    std::map<std::vector<size_t>, std::vector<size_t>> groups;
+    for (size_t idx = 0; idx < descriptions.size(); ++idx) {
+        std::vector<size_t> specified_parameters;
+        for (size_t k = 0; k < parameters.size(); ++k) {
+            if (parameters[k].get_value(descriptions[idx]).has_value()) {
+                specified_parameters.push_back(k);
+            }
+        }
+        groups[specified_parameters].push_back(idx);
+    }
+
+    // The path of the table is obtained before borrowing a connection because caching the table
+    // in memory requires a connection itself
+    set_task_status("Loading atomic kets from database...");
+    std::string path_of_states = manager->get_path(species, "states");
+
+    std::vector<std::shared_ptr<const KetAtom>> kets(descriptions.size());
+    for (const auto &[specified_parameters, indices] : groups) {
+        // Describe the states. The described values are joined with the table of states, so that
+        // the best matching states of all descriptions are obtained at once.
+        std::string columns = "idx";
+        std::string casts = "idx::BIGINT AS idx";
+        std::string where;
+        std::string orderby;
+        for (auto k : specified_parameters) {
+            const auto &parameter = parameters[k];
+            auto column = "d." + parameter.name;
+            columns += ", " + parameter.name;
+            casts += fmt::format(", {0}::DOUBLE AS {0}", parameter.name);
+            where += (where.empty() ? "" : " AND ") +
+                fmt::format(fmt::runtime(parameter.condition), column);
+            if (!parameter.distance.empty()) {
+                orderby += (orderby.empty() ? "" : " + ") +
+                    fmt::format(fmt::runtime(parameter.distance), column);
+            }
+        }
+        if (where.empty()) {
+            where = "FALSE";
+        }
+        if (orderby.empty()) {
+            orderby = "0";
+        }
 
-    // Check the types of the columns
-    const auto &types = result->types;
-    const auto &labels = result->names;
-    const std::vector<duckdb::LogicalType> ref_types = {
-        duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::BIGINT,
-        duckdb::LogicalType::BIGINT,  duckdb::LogicalType::BIGINT,  duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::BOOLEAN, duckdb::LogicalType::BOOLEAN, duckdb::LogicalType::DOUBLE,
-        duckdb::LogicalType::DOUBLE};
+        std::string values;
+        for (auto idx : indices) {
+            values += fmt::format("{}({}", values.empty() ? "" : ", ", idx);
+            for (auto k : specified_parameters) {
+                values += fmt::format(", {}", parameters[k].get_value(descriptions[idx]).value());
+            }
+            values += ")";
+        }
 
-    for (size_t i = 0; i < types.size(); i++) {
-        if (types[i] != ref_types[i]) {
-            throw std::runtime_error("Wrong type for '" + labels[i] + "'. Got " +
-                                     types[i].ToString() + " but expected " +
-                                     ref_types[i].ToString());
+        // Ask the database for the two best matching states of each description
+        auto con = pool->acquire();
+        auto result = con->Query(fmt::format(
+            R"(SELECT s.energy, s.f, s.parity, s.id, s.n, s.nu, s.exp_nui, s.std_nui, s.exp_l, s.std_l,
+            s.exp_s, s.std_s, s.exp_j, s.std_j, s.exp_l_ryd, s.std_l_ryd, s.exp_j_ryd, s.std_j_ryd,
+            s.is_j_total_momentum, s.is_calculated_with_mqdt, s.underspecified_channel_contribution,
+            CAST({0} AS DOUBLE) AS order_val, d.idx
+            FROM '{1}' AS s JOIN (SELECT {2} FROM (VALUES {3}) AS v({4})) AS d ON {5}
+            QUALIFY ROW_NUMBER() OVER (PARTITION BY d.idx ORDER BY {0} ASC) <= 2
+            ORDER BY d.idx ASC, order_val ASC)",
+            orderby, path_of_states, casts, values, columns, where));
+
+        if (result->HasError()) {
+            throw cpptrace::runtime_error("Error querying the database: " + result->GetError());
         }
-    }
 
-    // Get the first chunk of the results (the first chunk is sufficient as we need two rows at
-    // most)
-    auto chunk = result->Fetch();
-
-    // Check that the ket is uniquely specified
-    if (chunk->size() > 1) {
-        auto order_val_0 = duckdb::FlatVector::GetData<double>(chunk->data[21])[0];
-        auto order_val_1 = duckdb::FlatVector::GetData<double>(chunk->data[21])[1];
-
-        if (order_val_1 - order_val_0 <= order_val_0) {
-            // Get a list of possible kets
-            std::vector<KetAtom> kets;
-            kets.reserve(2);
-            for (size_t i = 0; i < 2; ++i) {
-                auto result_quantum_number_m = description.quantum_number_m.value();
+        // Check the types of the columns
+        const auto &types = result->types;
+        const auto &labels = result->names;
+        const std::vector<duckdb::LogicalType> ref_types = {
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::BIGINT,
+            duckdb::LogicalType::BIGINT,  duckdb::LogicalType::BIGINT,  duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::BOOLEAN, duckdb::LogicalType::BOOLEAN, duckdb::LogicalType::DOUBLE,
+            duckdb::LogicalType::DOUBLE,  duckdb::LogicalType::BIGINT};
+
+        for (size_t i = 0; i < types.size(); i++) {
+            if (types[i] != ref_types[i]) {
+                throw std::runtime_error("Wrong type for '" + labels[i] + "'. Got " +
+                                         types[i].ToString() + " but expected " +
+                                         ref_types[i].ToString());
+            }
+        }
+
+        // Construct the candidate states of each description
+        std::map<size_t, std::vector<std::pair<double, KetAtom>>> candidates;
+        for (auto chunk = result->Fetch(); chunk; chunk = result->Fetch()) {
+            auto *chunk_order_val = duckdb::FlatVector::GetData<double>(chunk->data[21]);
+            auto *chunk_idx = duckdb::FlatVector::GetData<int64_t>(chunk->data[22]);
+
+            for (size_t i = 0; i < chunk->size(); ++i) {
+                auto idx = static_cast<size_t>(chunk_idx[i]);
+                auto result_quantum_number_m = descriptions[idx].quantum_number_m.value();
                 auto result_energy = duckdb::FlatVector::GetData<double>(chunk->data[0])[i];
                 auto result_quantum_number_f =
                     duckdb::FlatVector::GetData<double>(chunk->data[1])[i];
@@ -421,73 +448,64 @@ std::shared_ptr<const KetAtom> Database::get_ket(const std::string &species,
                     duckdb::FlatVector::GetData<bool>(chunk->data[19])[i];
                 auto result_underspecified_channel_contribution =
                     duckdb::FlatVector::GetData<double>(chunk->data[20])[i];
-                kets.emplace_back(typename KetAtom::Private(), result_energy,
-                                  result_quantum_number_f, result_quantum_number_m,
-                                  static_cast<Parity>(result_parity), species,
-                                  result_quantum_number_n, result_quantum_number_nu,
-                                  result_quantum_number_nui_exp, result_quantum_number_nui_std,
-                                  result_quantum_number_l_exp, result_quantum_number_l_std,
-                                  result_quantum_number_s_exp, result_quantum_number_s_std,
-                                  result_quantum_number_j_exp, result_quantum_number_j_std,
-                                  result_quantum_number_l_ryd_exp, result_quantum_number_l_ryd_std,
-                                  result_quantum_number_j_ryd_exp, result_quantum_number_j_ryd_std,
-                                  result_is_j_total_momentum, result_is_calculated_with_mqdt,
-                                  result_underspecified_channel_contribution, *this, result_id);
+                candidates[idx].emplace_back(
+                    chunk_order_val[i],
+                    KetAtom(typename KetAtom::Private(), result_energy, result_quantum_number_f,
+                            result_quantum_number_m, static_cast<Parity>(result_parity), species,
+                            result_quantum_number_n, result_quantum_number_nu,
+                            result_quantum_number_nui_exp, result_quantum_number_nui_std,
+                            result_quantum_number_l_exp, result_quantum_number_l_std,
+                            result_quantum_number_s_exp, result_quantum_number_s_std,
+                            result_quantum_number_j_exp, result_quantum_number_j_std,
+                            result_quantum_number_l_ryd_exp, result_quantum_number_l_ryd_std,
+                            result_quantum_number_j_ryd_exp, result_quantum_number_j_ryd_std,
+                            result_is_j_total_momentum, result_is_calculated_with_mqdt,
+                            result_underspecified_channel_contribution, *this, result_id));
             }
+        }
 
-            // Throw an error with the possible kets
-            throw std::invalid_argument(
-                fmt::format("The ket is not uniquely specified. Possible kets are:\n{}\n{}",
-                            fmt::streamed(kets[0]), fmt::streamed(kets[1])));
+        for (auto idx : indices) {
+            auto it = candidates.find(idx);
+            if (it == candidates.end()) {
+                throw std::invalid_argument(
+                    descriptions.size() == 1
+                        ? std::string("No state found.")
+                        : fmt::format("No state found for description {}.", idx));
+            }
+            const auto &candidates_of_description = it->second;
+
+            // Check that the ket is uniquely specified
+            if (candidates_of_description.size() > 1) {
+                auto order_val_0 = candidates_of_description[0].first;
+                auto order_val_1 = candidates_of_description[1].first;
+
+                if (order_val_1 - order_val_0 <= order_val_0) {
+                    throw std::invalid_argument(
+                        fmt::format("The ket is not uniquely specified. Possible kets are:\n{}\n{}",
+                                    fmt::streamed(candidates_of_description[0].second),
+                                    fmt::streamed(candidates_of_description[1].second)));
+                }
+            }
+
+            // Check database consistency
+            const auto &ket = candidates_of_description[0].second;
+            ensure_consistent_quantum_numbers(ket.is_j_total_momentum(), ket.get_quantum_number_f(),
+                                              ket.get_quantum_number_m(),
+                                              ket.get_quantum_number_j());
+
+            kets[idx] = std::make_shared<const KetAtom>(ket);
         }
     }
 
-    // Construct the state
-    auto result_quantum_number_m = description.quantum_number_m.value();
-    auto result_energy = duckdb::FlatVector::GetData<double>(chunk->data[0])[0];
-    auto result_quantum_number_f = duckdb::FlatVector::GetData<double>(chunk->data[1])[0];
-    auto result_parity = duckdb::FlatVector::GetData<int64_t>(chunk->data[2])[0];
-    auto result_id = utils::get_linearized_id_in_database(
-        duckdb::FlatVector::GetData<int64_t>(chunk->data[3])[0], result_quantum_number_m);
-    auto result_quantum_number_n = duckdb::FlatVector::GetData<int64_t>(chunk->data[4])[0];
-    auto result_quantum_number_nu = duckdb::FlatVector::GetData<double>(chunk->data[5])[0];
-    auto result_quantum_number_nui_exp = duckdb::FlatVector::GetData<double>(chunk->data[6])[0];
-    auto result_quantum_number_nui_std = duckdb::FlatVector::GetData<double>(chunk->data[7])[0];
-    auto result_quantum_number_l_exp = duckdb::FlatVector::GetData<double>(chunk->data[8])[0];
-    auto result_quantum_number_l_std = duckdb::FlatVector::GetData<double>(chunk->data[9])[0];
-    auto result_quantum_number_s_exp = duckdb::FlatVector::GetData<double>(chunk->data[10])[0];
-    auto result_quantum_number_s_std = duckdb::FlatVector::GetData<double>(chunk->data[11])[0];
-    auto result_quantum_number_j_exp = duckdb::FlatVector::GetData<double>(chunk->data[12])[0];
-    auto result_quantum_number_j_std = duckdb::FlatVector::GetData<double>(chunk->data[13])[0];
-    auto result_quantum_number_l_ryd_exp = duckdb::FlatVector::GetData<double>(chunk->data[14])[0];
-    auto result_quantum_number_l_ryd_std = duckdb::FlatVector::GetData<double>(chunk->data[15])[0];
-    auto result_quantum_number_j_ryd_exp = duckdb::FlatVector::GetData<double>(chunk->data[16])[0];
-    auto result_quantum_number_j_ryd_std = duckdb::FlatVector::GetData<double>(chunk->data[17])[0];
-    auto result_is_j_total_momentum = duckdb::FlatVector::GetData<bool>(chunk->data[18])[0];
-    auto result_is_calculated_with_mqdt = duckdb::FlatVector::GetData<bool>(chunk->data[19])[0];
-    auto result_underspecified_channel_contribution =
-        duckdb::FlatVector::GetData<double>(chunk->data[20])[0];
-
-    // Check database consistency
-    ensure_consistent_quantum_numbers(result_is_j_total_momentum, result_quantum_number_f,
-                                      result_quantum_number_m, result_quantum_number_j_exp);
-
-    return std::make_shared<const KetAtom>(
-        typename KetAtom::Private(), result_energy, result_quantum_number_f,
-        result_quantum_number_m, static_cast<Parity>(result_parity), species,
-        result_quantum_number_n, result_quantum_number_nu, result_quantum_number_nui_exp,
-        result_quantum_number_nui_std, result_quantum_number_l_exp, result_quantum_number_l_std,
-        result_quantum_number_s_exp, result_quantum_number_s_std, result_quantum_number_j_exp,
-        result_quantum_number_j_std, result_quantum_number_l_ryd_exp,
-        result_quantum_number_l_ryd_std, result_quantum_number_j_ryd_exp,
-        result_quantum_number_j_ryd_std, result_is_j_total_momentum, result_is_calculated_with_mqdt,
-        result_underspecified_channel_contribution, *this, result_id);
+    return kets;
 }
 
 template <typename Scalar>
 std::shared_ptr<const BasisAtom<Scalar>>
 Database::get_basis(const std::string &species, const AtomDescriptionByRanges &description,
                     std::vector<size_t> additional_ket_ids) {
+    ScopedTimer timer("Database::get_basis");
+
     // Describe the states
     std::string where = "(";
     std::string separator;
@@ -573,7 +591,10 @@ Database::get_basis(const std::string &species, const AtomDescriptionByRanges &d
                              fmt::join(additional_ket_ids, ","));
     }
 
-    // Create a table containing the described states
+    // Create a table containing the described states. It is created as a regular table of the
+    // in-memory database, so that it is visible to all connections of the connection pool.
+    std::string path_of_states = manager->get_path(species, "states");
+    auto con = pool->acquire();
     std::string id_of_kets;
     {
         auto result = con->Query(R"(SELECT UUID()::varchar)");
@@ -586,13 +607,12 @@ Database::get_basis(const std::string &species, const AtomDescriptionByRanges &d
     {
         set_task_status("Selecting atomic basis states...");
         auto result = con->Query(fmt::format(
-            R"(CREATE TEMP TABLE '{}' AS SELECT *, {} AS ketid FROM (
+            R"(CREATE TABLE '{}' AS SELECT *, {} AS ketid FROM (
                 SELECT *,
                 UNNEST(list_transform(generate_series(0,(2*f)::bigint),
                 x -> x::double-f)) AS m FROM '{}'
             ) WHERE {})",
-            id_of_kets, utils::SQL_TERM_FOR_LINEARIZED_ID_IN_DATABASE,
-            manager->get_path(species, "states"), where));
+            id_of_kets, utils::SQL_TERM_FOR_LINEARIZED_ID_IN_DATABASE, path_of_states, where));
 
         if (result->HasError()) {
             throw cpptrace::runtime_error("Error creating table: " + result->GetError());
@@ -948,7 +968,7 @@ Eigen::SparseMatrix<Scalar, Eigen::RowMajor> Database::get_matrix_elements_in_ca
     std::shared_ptr<const BasisAtom<Scalar>> initial_basis,
     std::shared_ptr<const BasisAtom<Scalar>> final_basis, OperatorType type, int q) {
     using real_t = typename traits::NumTraits<Scalar>::real_t;
-    using cached_matrix_ptr_t = std::shared_ptr<const cached_matrix_t>;
+    ScopedTimer timer("Database::get_matrix_elements_in_canonical_basis");
 
     std::string specifier;
     int kappa{};
@@ -990,45 +1010,75 @@ Eigen::SparseMatrix<Scalar, Eigen::RowMajor> Database::get_matrix_elements_in_ca
             "The initial and final basis must be expressed using the same kets.");
     }
     std::string id_of_kets = initial_basis->get_id_of_kets();
-    std::string cache_key = fmt::format("{}_{}_{}", specifier, q, id_of_kets);
-    auto &matrix_elements_cache = get_matrix_elements_cache();
-    std::promise<cached_matrix_ptr_t> matrix_promise;
-    auto [cache_it, inserted] =
-        matrix_elements_cache.insert({cache_key, matrix_promise.get_future().share()});
-
-    if (inserted) {
-        try {
-            Eigen::Index dim = initial_basis->get_number_of_kets();
-
-            std::vector<int> outerIndexPtr;
-            std::vector<int> innerIndices;
-            std::vector<real_t> values;
-
-            if (specifier == "identity") {
-                outerIndexPtr.reserve(dim + 1);
-                innerIndices.reserve(dim);
-                values.reserve(dim);
-
-                for (int i = 0; i < dim; i++) {
-                    outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
-                    innerIndices.push_back(i);
-                    values.push_back(1);
-                }
-                outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
 
-            } else {
-                // Check that the specifications are valid
-                if (std::abs(q) > kappa) {
-                    throw std::invalid_argument("Invalid q.");
-                }
+    // Check that the specifications are valid
+    if (specifier != "identity" && std::abs(q) > kappa) {
+        throw std::invalid_argument("Invalid q.");
+    }
+
+    // The matrix elements are cached per set of kets, so that identical bases share them. The
+    // versions of the tables are part of the key to distinguish between different table versions.
+    std::string species = initial_basis->get_species();
+    std::string table_versions;
+    if (specifier == "energy") {
+        table_versions = fmt::format("v{}", manager->get_version(species));
+    } else if (specifier != "identity") {
+        table_versions =
+            fmt::format("v{}_v{}", manager->get_version(species), manager->get_version("misc"));
+    }
+    std::string cache_key = fmt::format("{}_{}_{}_{}_{}", species, table_versions, specifier, q,
+                                        get_canonical_ket_ids(*initial_basis));
+
+    // The cache in memory is shared by all Database instances, which can use different database
+    // directories with different tables of the same version
+    std::string memory_cache_key = fmt::format("{}_{}", database_dir_.string(), cache_key);
+
+    auto create_matrix = [&]() -> MatrixElementsCache::matrix_ptr_t {
+        add_to_profile_counter("Database: matrix elements cache misses");
+
+        Eigen::Index dim = initial_basis->get_number_of_kets();
+
+        // Try to load the matrix from the persistent cache on disk
+        std::filesystem::path disk_cache_path =
+            database_dir_ / "matrix_elements" / MatrixElementsCache::get_filename(cache_key);
+        if (use_disk_cache_ && specifier != "identity") {
+            auto matrix = MatrixElementsCache::load(disk_cache_path, cache_key);
+            if (matrix && matrix->rows() == dim && matrix->cols() == dim) {
+                add_to_profile_counter("Database: matrix elements disk cache hits");
+                return matrix;
+            }
+        }
+
+        std::vector<int> outerIndexPtr;
+        std::vector<int> innerIndices;
+        std::vector<real_t> values;
+
+        if (specifier == "identity") {
+            outerIndexPtr.reserve(dim + 1);
+            innerIndices.reserve(dim);
+            values.reserve(dim);
+
+            for (int i = 0; i < dim; i++) {
+                outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
+                innerIndices.push_back(i);
+                values.push_back(1);
+            }
+            outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
 
-                // Ask the database for the operator
-                set_task_status("Loading matrix elements from database...");
-                std::string species = initial_basis->get_species();
-                duckdb::unique_ptr<duckdb::MaterializedQueryResult> result;
-                if (specifier != "energy") {
-                    result = con->Query(fmt::format(
-                        R"(WITH s AS (
+        } else {
+            // Ask the database for the operator
+            set_task_status("Loading matrix elements from database...");
+            std::string path_of_wigner;
+            std::string path_of_matrix_elements;
+            if (specifier != "energy") {
+                path_of_wigner = manager->get_path("misc", "wigner");
+                path_of_matrix_elements = manager->get_path(species, specifier);
+            }
+            auto con = pool->acquire();
+            duckdb::unique_ptr<duckdb::MaterializedQueryResult> result;
+            if (specifier != "energy") {
+                result = con->Query(fmt::format(
+                    R"(WITH s AS (
                             SELECT id, f, m, ketid FROM '{}'
                         ),
                         b AS (
@@ -1061,92 +1111,136 @@ Eigen::SparseMatrix<Scalar, Eigen::RowMajor> Database::get_matrix_elements_in_ca
                         w.f_initial = s1.f AND w.m_initial = s1.m AND
                         w.f_final = s2.f AND w.m_final = s2.m
                         ORDER BY row ASC, col ASC)",
-                        id_of_kets, manager->get_path("misc", "wigner"), kappa, q,
-                        manager->get_path(species, specifier)));
-                } else {
-                    result = con->Query(fmt::format(
-                        R"(SELECT ketid as row, ketid as col, energy as val FROM '{}' ORDER BY row ASC)",
-                        id_of_kets));
-                }
+                    id_of_kets, path_of_wigner, kappa, q, path_of_matrix_elements));
+            } else {
+                result = con->Query(fmt::format(
+                    R"(SELECT ketid as row, ketid as col, energy as val FROM '{}' ORDER BY row ASC)",
+                    id_of_kets));
+            }
 
-                if (result->HasError()) {
-                    throw cpptrace::runtime_error("Error querying the database: " +
-                                                  result->GetError());
-                }
+            if (result->HasError()) {
+                throw cpptrace::runtime_error("Error querying the database: " + result->GetError());
+            }
 
-                // Check the types of the columns
-                const auto &types = result->types;
-                const auto &labels = result->names;
-                const std::vector<duckdb::LogicalType> ref_types = {duckdb::LogicalType::BIGINT,
-                                                                    duckdb::LogicalType::BIGINT,
-                                                                    duckdb::LogicalType::DOUBLE};
-                for (size_t i = 0; i < types.size(); i++) {
-                    if (types[i] != ref_types[i]) {
-                        throw std::runtime_error("Wrong type for '" + labels[i] + "'.");
-                    }
+            // Check the types of the columns
+            const auto &types = result->types;
+            const auto &labels = result->names;
+            const std::vector<duckdb::LogicalType> ref_types = {duckdb::LogicalType::BIGINT,
+                                                                duckdb::LogicalType::BIGINT,
+                                                                duckdb::LogicalType::DOUBLE};
+            for (size_t i = 0; i < types.size(); i++) {
+                if (types[i] != ref_types[i]) {
+                    throw std::runtime_error("Wrong type for '" + labels[i] + "'.");
                 }
+            }
+
+            set_task_status("Constructing matrix elements...");
+
+            // Construct the matrix
+            int num_entries = static_cast<int>(result->RowCount());
+            outerIndexPtr.reserve(dim + 1);
+            innerIndices.reserve(num_entries);
+            values.reserve(num_entries);
 
-                set_task_status("Constructing matrix elements...");
-
-                // Construct the matrix
-                int num_entries = static_cast<int>(result->RowCount());
-                outerIndexPtr.reserve(dim + 1);
-                innerIndices.reserve(num_entries);
-                values.reserve(num_entries);
-
-                int last_row = -1;
-
-                for (auto chunk = result->Fetch(); chunk; chunk = result->Fetch()) {
-                    auto *chunk_row = duckdb::FlatVector::GetData<int64_t>(chunk->data[0]);
-                    auto *chunk_col = duckdb::FlatVector::GetData<int64_t>(chunk->data[1]);
-                    auto *chunk_val = duckdb::FlatVector::GetData<double>(chunk->data[2]);
-
-                    for (size_t i = 0; i < chunk->size(); i++) {
-                        int row = final_basis->get_ket_index_from_id(chunk_row[i]);
-                        if (row != last_row) {
-                            if (row < last_row) {
-                                throw std::runtime_error("The rows are not sorted.");
-                            }
-                            for (; last_row < row; last_row++) {
-                                outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
-                            }
+            int last_row = -1;
+
+            for (auto chunk = result->Fetch(); chunk; chunk = result->Fetch()) {
+                auto *chunk_row = duckdb::FlatVector::GetData<int64_t>(chunk->data[0]);
+                auto *chunk_col = duckdb::FlatVector::GetData<int64_t>(chunk->data[1]);
+                auto *chunk_val = duckdb::FlatVector::GetData<double>(chunk->data[2]);
+
+                for (size_t i = 0; i < chunk->size(); i++) {
+                    int row = final_basis->get_ket_index_from_id(chunk_row[i]);
+                    if (row != last_row) {
+                        if (row < last_row) {
+                            throw std::runtime_error("The rows are not sorted.");
+                        }
+                        for (; last_row < row; last_row++) {
+                            outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
                         }
-                        innerIndices.push_back(initial_basis->get_ket_index_from_id(chunk_col[i]));
-                        values.push_back(chunk_val[i]);
                     }
+                    innerIndices.push_back(initial_basis->get_ket_index_from_id(chunk_col[i]));
+                    values.push_back(chunk_val[i]);
                 }
+            }
 
-                for (; last_row < dim + 1; last_row++) {
-                    outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
-                }
+            for (; last_row < dim + 1; last_row++) {
+                outerIndexPtr.push_back(static_cast<int>(innerIndices.size()));
             }
+        }
+
+        Eigen::Map<const MatrixElementsCache::matrix_t> matrix_map(
+            dim, dim, values.size(), outerIndexPtr.data(), innerIndices.data(), values.data());
 
-            Eigen::Map<const cached_matrix_t> matrix_map(
-                dim, dim, values.size(), outerIndexPtr.data(), innerIndices.data(), values.data());
+        auto matrix = std::make_shared<const MatrixElementsCache::matrix_t>(matrix_map);
 
-            auto cached_matrix = std::make_shared<const cached_matrix_t>(matrix_map);
-            matrix_promise.set_value(std::move(cached_matrix));
-        } catch (...) {
-            matrix_promise.set_exception(std::current_exception());
-            throw;
+        // Store the matrix in the persistent cache on disk
+        if (use_disk_cache_ && specifier != "identity") {
+            try {
+                MatrixElementsCache::save(disk_cache_path, cache_key, *matrix);
+            } catch (const std::exception &e) {
+                SPDLOG_WARN("Failed to store matrix elements in the cache on disk: {}", e.what());
+            }
         }
-    }
+
+        return matrix;
+    };
+
+    add_to_profile_counter("Database: matrix elements cache lookups");
+    auto matrix = get_matrix_elements_cache().get_or_create(memory_cache_key, create_matrix);
 
     set_task_status("Returning matrix elements in canonical basis...");
 
-    return cache_it->second.get()->template cast<Scalar>();
+    return matrix->template cast<Scalar>();
 }
 
 bool Database::get_download_missing() const { return download_missing_; }
 
 bool Database::get_use_cache() const { return use_cache_; }
 
+void Database::set_use_disk_cache(bool use_disk_cache) { use_disk_cache_ = use_disk_cache; }
+
+bool Database::get_use_disk_cache() const { return use_disk_cache_; }
+
 std::filesystem::path Database::get_database_dir() const { return database_dir_; }
 
 std::string Database::get_versions_info() const { return manager->get_versions_info(); }
 
-Database::matrix_elements_cache_t &Database::get_matrix_elements_cache() {
-    static matrix_elements_cache_t matrix_elements_cache;
+void Database::set_connection_pool_size(std::size_t size) { pool->set_max_size(size); }
+
+std::size_t Database::get_connection_pool_size() const { return pool->get_max_size(); }
+
+void Database::set_duckdb_threads(int threads) {
+    if (threads < 1) {
+        throw std::invalid_argument("The number of threads must be at least 1.");
+    }
+    auto con = pool->acquire();
+    auto result = con->Query(fmt::format("SET GLOBAL threads = {};", threads));
+    if (result->HasError()) {
+        throw cpptrace::runtime_error("Error setting the number of threads: " + result->GetError());
+    }
+}
+
+void Database::set_duckdb_max_memory(const std::string &max_memory) {
+    auto con = pool->acquire();
+    auto result = con->Query(fmt::format("SET GLOBAL max_memory = '{}';", max_memory));
+    if (result->HasError()) {
+        throw cpptrace::runtime_error("Error setting the memory limit: " + result->GetError());
+    }
+}
+
+void Database::clear_cache() { get_matrix_elements_cache().clear(); }
+
+MatrixElementsCache::Info Database::get_cache_info() {
+    return get_matrix_elements_cache().get_info();
+}
+
+void Database::set_cache_max_bytes(std::size_t max_bytes) {
+    get_matrix_elements_cache().set_max_bytes(max_bytes);
+}
+
+MatrixElementsCache &Database::get_matrix_elements_cache() {
+    static MatrixElementsCache matrix_elements_cache;
     return matrix_elements_cache;
 }
 
@@ -0,0 +1,262 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/database/MatrixElementsCache.hpp"
+
+#include <array>
+#include <cstdint>
+#include <filesystem>
+#include <fmt/core.h>
+#include <fstream>
+#include <limits>
+#include <random>
+#include <spdlog/spdlog.h>
+#include <stdexcept>
+#include <system_error>
+
+namespace pairinteraction {
+namespace {
+constexpr std::array<char, 8> file_magic{'P', 'I', 'M', 'A', 'T', 'E', 'L', '1'};
+
+template <typename T>
+void write_binary(std::ofstream &out, const T *data, std::size_t size) {
+    out.write(reinterpret_cast<const char *>(data), static_cast<std::streamsize>(size * sizeof(T)));
+}
+
+template <typename T>
+void read_binary(std::ifstream &in, T *data, std::size_t size) {
+    in.read(reinterpret_cast<char *>(data), static_cast<std::streamsize>(size * sizeof(T)));
+}
+} // namespace
+
+MatrixElementsCache::MatrixElementsCache(std::size_t max_bytes) : max_bytes(max_bytes) {}
+
+MatrixElementsCache::matrix_ptr_t
+MatrixElementsCache::get_or_create(const std::string &key,
+                                   const std::function<matrix_ptr_t()> &create) {
+    std::promise<matrix_ptr_t> promise;
+    std::shared_future<matrix_ptr_t> cached_future;
+    std::size_t entry_generation{};
+
+    {
+        std::lock_guard<std::mutex> lock(mutex);
+
+        if (auto it = entries.find(key); it != entries.end()) {
+            ++hits;
+            lru.splice(lru.begin(), lru, it->second.lru_it);
+            cached_future = it->second.future;
+        } else {
+            // Register the matrix as being created so that other threads wait for it
+            ++misses;
+            entry_generation = ++generation;
+            lru.push_front(key);
+            entries.emplace(
+                key, Entry{promise.get_future().share(), lru.begin(), 0, entry_generation, false});
+        }
+    }
+
+    // If the matrix is cached or currently being created by another thread, wait for it
+    if (cached_future.valid()) {
+        return cached_future.get();
+    }
+
+    matrix_ptr_t matrix;
+    try {
+        matrix = create();
+    } catch (...) {
+        {
+            // Remove the entry so that the creation is retried by the next request
+            std::lock_guard<std::mutex> lock(mutex);
+            if (auto it = entries.find(key);
+                it != entries.end() && it->second.generation == entry_generation) {
+                lru.erase(it->second.lru_it);
+                entries.erase(it);
+            }
+        }
+        promise.set_exception(std::current_exception());
+        throw;
+    }
+
+    {
+        // Account for the size of the matrix unless the cache has been cleared in the meantime
+        std::lock_guard<std::mutex> lock(mutex);
+        if (auto it = entries.find(key);
+            it != entries.end() && it->second.generation == entry_generation) {
+            it->second.bytes = get_size_in_bytes(*matrix) + key.size();
+            it->second.ready = true;
+            bytes += it->second.bytes;
+            evict();
+        }
+    }
+    promise.set_value(matrix);
+
+    return matrix;
+}
+
+void MatrixElementsCache::clear() {
+    std::lock_guard<std::mutex> lock(mutex);
+    entries.clear();
+    lru.clear();
+    bytes = 0;
+    hits = 0;
+    misses = 0;
+}
+
+MatrixElementsCache::Info MatrixElementsCache::get_info() const {
+    std::lock_guard<std::mutex> lock(mutex);
+    return {hits, misses, bytes, entries.size(), max_bytes};
+}
+
+void MatrixElementsCache::set_max_bytes(std::size_t max_bytes) {
+    std::lock_guard<std::mutex> lock(mutex);
+    this->max_bytes = max_bytes;
+    evict();
+}
+
+std::size_t MatrixElementsCache::get_max_bytes() const {
+    std::lock_guard<std::mutex> lock(mutex);
+    return max_bytes;
+}
+
+std::size_t MatrixElementsCache::get_size_in_bytes(const matrix_t &matrix) {
+    return static_cast<std::size_t>(matrix.nonZeros()) *
+        (sizeof(matrix_t::Scalar) + sizeof(matrix_t::StorageIndex)) +
+        static_cast<std::size_t>(matrix.outerSize() + 1) * sizeof(matrix_t::StorageIndex);
+}
+
+std::string MatrixElementsCache::get_filename(const std::string &key) {
+    // FNV-1a hash, which is, in contrast to std::hash, stable across platforms and processes
+    std::uint64_t hash = 14695981039346656037ULL;
+    for (char c : key) {
+        hash ^= static_cast<unsigned char>(c);
+        hash *= 1099511628211ULL;
+    }
+    return fmt::format("{:016x}.bin", hash);
+}
+
+void MatrixElementsCache::save(const std::filesystem::path &path, const std::string &key,
+                               const matrix_t &matrix) {
+    if (!matrix.isCompressed()) {
+        throw std::invalid_argument("The matrix must be compressed.");
+    }
+
+    std::filesystem::create_directories(path.parent_path());
+
+    // Write to a temporary file first and rename it afterwards, so that other processes never
+    // see a partially written file
+    std::random_device rd;
+    auto tmp_path = path;
+    tmp_path += fmt::format(".{:08x}.tmp", rd());
+
+    {
+        std::ofstream out(tmp_path, std::ios::binary);
+        if (!out) {
+            throw std::runtime_error(
+                fmt::format("Failed to open {} for writing", tmp_path.string()));
+        }
+
+        std::array<std::int64_t, 4> header{static_cast<std::int64_t>(key.size()), matrix.rows(),
+                                           matrix.cols(), matrix.nonZeros()};
+        write_binary(out, file_magic.data(), file_magic.size());
+        write_binary(out, header.data(), header.size());
+        write_binary(out, key.data(), key.size());
+        write_binary(out, matrix.outerIndexPtr(), matrix.outerSize() + 1);
+        write_binary(out, matrix.innerIndexPtr(), matrix.nonZeros());
+        write_binary(out, matrix.valuePtr(), matrix.nonZeros());
+
+        if (!out) {
+            out.close();
+            std::filesystem::remove(tmp_path);
+            throw std::runtime_error(fmt::format("Failed to write {}", tmp_path.string()));
+        }
+    }
+
+    std::filesystem::rename(tmp_path, path);
+}
+
+MatrixElementsCache::matrix_ptr_t MatrixElementsCache::load(const std::filesystem::path &path,
+                                                            const std::string &key) {
+    std::ifstream in(path, std::ios::binary);
+    if (!in) {
+        return nullptr;
+    }
+
+    // Check that the file is a matrix file and belongs to the key
+    std::array<char, 8> magic{};
+    std::array<std::int64_t, 4> header{};
+    read_binary(in, magic.data(), magic.size());
+    read_binary(in, header.data(), header.size());
+    auto [key_size, rows, cols, nnz] = header;
+    if (!in || magic != file_magic || rows < 0 || cols < 0 || nnz < 0) {
+        SPDLOG_WARN("Ignoring the invalid matrix elements file {}.", path.string());
+        return nullptr;
+    }
+    if (key_size != static_cast<std::int64_t>(key.size())) {
+        return nullptr;
+    }
+    std::string file_key(key.size(), '\0');
+    read_binary(in, file_key.data(), file_key.size());
+    if (!in || file_key != key) {
+        return nullptr;
+    }
+
+    // Check that the size of the file matches the header before allocating any memory
+    constexpr auto max_index = static_cast<std::int64_t>(std::numeric_limits<int>::max());
+    constexpr auto index_size = static_cast<std::int64_t>(sizeof(matrix_t::StorageIndex));
+    constexpr auto value_size = static_cast<std::int64_t>(sizeof(matrix_t::Scalar));
+    std::error_code ec;
+    auto file_size = static_cast<std::int64_t>(std::filesystem::file_size(path, ec));
+    if (ec || rows >= max_index || cols > max_index || nnz > max_index ||
+        file_size !=
+            static_cast<std::int64_t>(file_magic.size() + sizeof(header)) + key_size +
+                (rows + 1) * index_size + nnz * (index_size + value_size)) {
+        SPDLOG_WARN("Ignoring the invalid matrix elements file {}.", path.string());
+        return nullptr;
+    }
+
+    // Read the arrays directly into the storage of the matrix
+    matrix_t matrix(rows, cols);
+    matrix.resizeNonZeros(nnz);
+    read_binary(in, matrix.outerIndexPtr(), matrix.outerSize() + 1);
+    read_binary(in, matrix.innerIndexPtr(), nnz);
+    read_binary(in, matrix.valuePtr(), nnz);
+
+    // Check that the stored indices are within the bounds of the matrix, so that a corrupted file
+    // cannot cause out-of-bounds accesses later on
+    bool is_valid = static_cast<bool>(in) && matrix.outerIndexPtr()[0] == 0 &&
+        matrix.outerIndexPtr()[matrix.outerSize()] == nnz;
+    for (Eigen::Index row = 0; is_valid && row < matrix.outerSize(); ++row) {
+        auto begin = matrix.outerIndexPtr()[row];
+        auto end = matrix.outerIndexPtr()[row + 1];
+        is_valid = begin <= end && end <= nnz;
+        for (auto idx = begin; is_valid && idx < end; ++idx) {
+            auto col = matrix.innerIndexPtr()[idx];
+            is_valid =
+                col >= 0 && col < cols && (idx == begin || matrix.innerIndexPtr()[idx - 1] < col);
+        }
+    }
+    if (!is_valid) {
+        SPDLOG_WARN("Ignoring the invalid matrix elements file {}.", path.string());
+        return nullptr;
+    }
+
+    return std::make_shared<const matrix_t>(std::move(matrix));
+}
+
+void MatrixElementsCache::evict() {
+    // Evict the least recently used matrices, matrices that are still being created are skipped
+    auto it = lru.end();
+    while (bytes > max_bytes && it != lru.begin()) {
+        --it;
+        auto entry_it = entries.find(*it);
+        if (!entry_it->second.ready) {
+            continue;
+        }
+        SPDLOG_DEBUG("Evicting {} bytes of matrix elements from the cache.",
+                     entry_it->second.bytes);
+        bytes -= entry_it->second.bytes;
+        entries.erase(entry_it);
+        it = lru.erase(it);
+    }
+}
+} // namespace pairinteraction
@@ -0,0 +1,131 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/database/MatrixElementsCache.hpp"
+
+#include <cstdint>
+#include <doctest/doctest.h>
+#include <filesystem>
+#include <fstream>
+#include <stdexcept>
+
+namespace pairinteraction {
+namespace {
+MatrixElementsCache::matrix_ptr_t create_identity(int dim) {
+    MatrixElementsCache::matrix_t matrix(dim, dim);
+    matrix.setIdentity();
+    return std::make_shared<const MatrixElementsCache::matrix_t>(std::move(matrix));
+}
+} // namespace
+
+DOCTEST_TEST_CASE("matrix elements cache hits and misses") {
+    MatrixElementsCache cache;
+    int number_of_creations = 0;
+    auto create = [&]() {
+        ++number_of_creations;
+        return create_identity(10);
+    };
+
+    auto matrix1 = cache.get_or_create("a", create);
+    auto matrix2 = cache.get_or_create("a", create);
+    auto matrix3 = cache.get_or_create("b", create);
+
+    DOCTEST_CHECK(matrix1 == matrix2);
+    DOCTEST_CHECK(matrix1 != matrix3);
+    DOCTEST_CHECK(number_of_creations == 2);
+
+    auto info = cache.get_info();
+    DOCTEST_CHECK(info.hits == 1);
+    DOCTEST_CHECK(info.misses == 2);
+    DOCTEST_CHECK(info.entries == 2);
+    DOCTEST_CHECK(info.bytes == 2 * (MatrixElementsCache::get_size_in_bytes(*matrix1) + 1));
+
+    cache.clear();
+    info = cache.get_info();
+    DOCTEST_CHECK(info.hits == 0);
+    DOCTEST_CHECK(info.misses == 0);
+    DOCTEST_CHECK(info.entries == 0);
+    DOCTEST_CHECK(info.bytes == 0);
+}
+
+DOCTEST_TEST_CASE("matrix elements cache evicts least recently used matrices") {
+    std::size_t bytes_per_entry = MatrixElementsCache::get_size_in_bytes(*create_identity(10)) + 1;
+    MatrixElementsCache cache(2 * bytes_per_entry);
+    auto create = []() { return create_identity(10); };
+
+    cache.get_or_create("a", create);
+    cache.get_or_create("b", create);
+    cache.get_or_create("a", create);
+    cache.get_or_create("c", create);
+
+    auto info = cache.get_info();
+    DOCTEST_CHECK(info.entries == 2);
+    DOCTEST_CHECK(info.bytes == 2 * bytes_per_entry);
+
+    // The matrix "b" was evicted, the matrix "a" is still cached
+    cache.get_or_create("a", create);
+    DOCTEST_CHECK(cache.get_info().misses == 3);
+    cache.get_or_create("b", create);
+    DOCTEST_CHECK(cache.get_info().misses == 4);
+
+    // Shrinking the budget evicts matrices immediately
+    cache.set_max_bytes(bytes_per_entry);
+    DOCTEST_CHECK(cache.get_info().entries == 1);
+    cache.set_max_bytes(0);
+    DOCTEST_CHECK(cache.get_info().entries == 0);
+    DOCTEST_CHECK(cache.get_info().bytes == 0);
+}
+
+DOCTEST_TEST_CASE("matrix elements cache does not store failed creations") {
+    MatrixElementsCache cache;
+    auto create_failing = []() -> MatrixElementsCache::matrix_ptr_t {
+        throw std::runtime_error("Creation failed.");
+    };
+
+    DOCTEST_CHECK_THROWS_AS(cache.get_or_create("a", create_failing), std::runtime_error);
+    DOCTEST_CHECK(cache.get_info().entries == 0);
+    DOCTEST_CHECK_NOTHROW(cache.get_or_create("a", []() { return create_identity(10); }));
+    DOCTEST_CHECK(cache.get_info().entries == 1);
+}
+
+DOCTEST_TEST_CASE("matrix elements cache saves and loads matrices") {
+    auto test_dir = std::filesystem::temp_directory_path() / "pairinteraction_test_cache";
+    std::filesystem::remove_all(test_dir);
+
+    MatrixElementsCache::matrix_t matrix(3, 4);
+    matrix.insert(0, 1) = 1.5;
+    matrix.insert(2, 0) = -2.5;
+    matrix.insert(2, 3) = 3.5;
+    matrix.makeCompressed();
+
+    auto path = test_dir / MatrixElementsCache::get_filename("key");
+    DOCTEST_CHECK(MatrixElementsCache::load(path, "key") == nullptr);
+
+    MatrixElementsCache::save(path, "key", matrix);
+    auto loaded = MatrixElementsCache::load(path, "key");
+    DOCTEST_REQUIRE(loaded != nullptr);
+    DOCTEST_CHECK(loaded->rows() == 3);
+    DOCTEST_CHECK(loaded->cols() == 4);
+    DOCTEST_CHECK(loaded->nonZeros() == 3);
+    DOCTEST_CHECK(loaded->isApprox(matrix));
+
+    // A file that belongs to another key is ignored
+    DOCTEST_CHECK(MatrixElementsCache::load(path, "other") == nullptr);
+
+    // A file with an out-of-bounds column index is ignored
+    {
+        std::fstream file(path, std::ios::binary | std::ios::in | std::ios::out);
+        int col = 4;
+        file.seekp(static_cast<std::streamoff>(8 + 4 * sizeof(std::int64_t) + 3 + 4 * sizeof(int)));
+        file.write(reinterpret_cast<const char *>(&col), sizeof(col));
+    }
+    DOCTEST_CHECK(MatrixElementsCache::load(path, "key") == nullptr);
+
+    // A truncated file is ignored
+    MatrixElementsCache::save(path, "key", matrix);
+    std::filesystem::resize_file(path, std::filesystem::file_size(path) - 1);
+    DOCTEST_CHECK(MatrixElementsCache::load(path, "key") == nullptr);
+
+    std::filesystem::remove_all(test_dir);
+}
+} // namespace pairinteraction
@@ -3,6 +3,7 @@
 
 #include "pairinteraction/database/ParquetManager.hpp"
 
+#include "pairinteraction/database/ConnectionPool.hpp"
 #include "pairinteraction/database/GitHubDownloader.hpp"
 #include "pairinteraction/version.hpp"
 
@@ -76,10 +77,10 @@ void ParquetManager::react_on_rate_limit_reached(std::time_t reset_time) {
 }
 
 ParquetManager::ParquetManager(std::filesystem::path directory, const GitHubDownloader &downloader,
-                               std::vector<std::string> repo_paths, duckdb::Connection &con,
+                               std::vector<std::string> repo_paths, ConnectionPool &pool,
                                bool use_cache)
     : directory_(std::move(directory)), downloader(downloader), repo_paths_(std::move(repo_paths)),
-      con(con), use_cache_(use_cache) {
+      pool(pool), use_cache_(use_cache) {
     // Ensure the local directory exists
     if (!std::filesystem::exists(directory_ / "tables")) {
         fs::create_directories(directory_ / "tables");
@@ -403,10 +404,12 @@ void ParquetManager::cache_table(std::unordered_map<std::string, PathInfo>::iter
         return;
     }
 
-    // Cache the table in memory
+    // Cache the table in memory. It is created as a regular table of the in-memory database, so
+    // that it is visible to all connections of the connection pool.
+    auto con = pool.acquire();
     std::string table_name;
     {
-        auto result = con.Query(R"(SELECT UUID()::varchar)");
+        auto result = con->Query(R"(SELECT UUID()::varchar)");
         if (result->HasError()) {
             throw cpptrace::runtime_error("Error selecting a unique table name: " +
                                           result->GetError());
@@ -416,8 +419,8 @@ void ParquetManager::cache_table(std::unordered_map<std::string, PathInfo>::iter
     }
 
     {
-        auto result = con.Query(fmt::format(R"(CREATE TEMP TABLE '{}' AS SELECT * FROM '{}')",
-                                            table_name, table_it->second.path));
+        auto result = con->Query(fmt::format(R"(CREATE TABLE '{}' AS SELECT * FROM '{}')",
+                                             table_name, table_it->second.path));
         if (result->HasError()) {
             throw cpptrace::runtime_error("Error creating table: " + result->GetError());
         }
@@ -461,6 +464,19 @@ std::string ParquetManager::get_path(const std::string &key, const std::string &
     return table_it->second.path;
 }
 
+int ParquetManager::get_version(const std::string &key) {
+    // Update the local table if a newer version is available remotely
+    this->update_local_asset(key);
+
+    // Return the minor version of the local table, or -1 if there is no local table
+    std::shared_lock<std::shared_mutex> lock(mtx_local);
+    auto asset_it = local_asset_info.find(key);
+    if (asset_it == local_asset_info.end()) {
+        return -1;
+    }
+    return asset_it->second.version_minor;
+}
+
 std::string ParquetManager::get_versions_info() const {
     // Helper lambda returns the version string if available
     auto get_version = [](const auto &map, const std::string &table) -> int {
@@ -3,6 +3,7 @@
 
 #include "pairinteraction/database/ParquetManager.hpp"
 
+#include "pairinteraction/database/ConnectionPool.hpp"
 #include "pairinteraction/database/Database.hpp"
 #include "pairinteraction/database/GitHubDownloader.hpp"
 
@@ -69,11 +70,11 @@ TEST_CASE("ParquetManager functionality with mocked downloader") {
     std::ofstream(test_dir / "tables" / "misc_v1.0" / "wigner.parquet").close();
     std::ofstream(test_dir / "tables" / "misc_v1.1" / "wigner.parquet").close();
     duckdb::DuckDB db(nullptr);
-    duckdb::Connection con(db);
+    ConnectionPool pool(db, 1);
 
     SUBCASE("Check missing table") {
         std::vector<std::string> repo_paths;
-        ParquetManager manager(test_dir, downloader, repo_paths, con, false);
+        ParquetManager manager(test_dir, downloader, repo_paths, pool, false);
         manager.scan_local();
         manager.scan_remote();
 
@@ -85,17 +86,19 @@ TEST_CASE("ParquetManager functionality with mocked downloader") {
 
     SUBCASE("Check version parsing") {
         std::vector<std::string> repo_paths;
-        ParquetManager manager(test_dir, downloader, repo_paths, con, false);
+        ParquetManager manager(test_dir, downloader, repo_paths, pool, false);
         manager.scan_local();
         manager.scan_remote();
 
         std::string expected = (test_dir / "tables" / "misc_v1.1" / "wigner.parquet").string();
         CHECK(manager.get_path("misc", "wigner") == expected);
+        CHECK(manager.get_version("misc") == 1);
+        CHECK(manager.get_version("missing_species") == -1);
     }
 
     SUBCASE("Check update table") {
         std::vector<std::string> repo_paths = {"/test/repo/path"};
-        ParquetManager manager(test_dir, downloader, repo_paths, con, false);
+        ParquetManager manager(test_dir, downloader, repo_paths, pool, false);
         manager.scan_local();
         manager.scan_remote();
 
@@ -118,12 +121,12 @@ DOCTEST_TEST_CASE("ParquetManager functionality with GitHub downloader") {
     }
     GitHubDownloader downloader;
     duckdb::DuckDB db(nullptr);
-    duckdb::Connection con(db);
+    ConnectionPool pool(db, 1);
 
     std::vector<std::string> repo_paths = {"/repos/pairinteraction/database-sqdt/releases/latest",
                                            "/repos/pairinteraction/database-mqdt/releases/latest"};
     ParquetManager manager(Database::get_global_instance().get_database_dir(), downloader,
-                           repo_paths, con, Database::get_global_instance().get_use_cache());
+                           repo_paths, pool, Database::get_global_instance().get_use_cache());
     manager.scan_local();
     manager.scan_remote();
 
@@ -189,6 +189,7 @@ DiagonalizerFeast<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajo
         return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT32>>(
             matrix, min_eigenvalue.value(), max_eigenvalue.value(), rtol);
     case FloatType::FLOAT64:
+    case FloatType::FLOAT32_REFINED: // the refinement requires the complete eigensystem
         return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(
             matrix, min_eigenvalue.value(), max_eigenvalue.value(), rtol);
     default:
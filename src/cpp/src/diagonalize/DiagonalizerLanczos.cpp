@@ -0,0 +1,319 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/diagonalize/DiagonalizerLanczos.hpp"
+
+#include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
+#include "pairinteraction/enums/FloatType.hpp"
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+#include "pairinteraction/utils/inertia.hpp"
+#include "pairinteraction/utils/traits.hpp"
+
+#include <Eigen/Dense>
+#include <Eigen/Eigenvalues>
+#include <Eigen/SparseCholesky>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
+#include <optional>
+#include <random>
+#include <spdlog/spdlog.h>
+#include <stdexcept>
+#include <vector>
+
+namespace pairinteraction {
+// Minimal number of additional Lanczos vectors beyond the number of wanted eigenpairs
+constexpr int MIN_NUMBER_OF_EXTRA_LANCZOS_VECTORS = 32;
+
+// Maximal number of restarts of the Lanczos routine
+constexpr int MAX_NUMBER_OF_RESTARTS = 1000;
+
+template <typename Scalar>
+DiagonalizerLanczos<Scalar>::DiagonalizerLanczos(FloatType float_type)
+    : DiagonalizerInterface<Scalar>(float_type) {}
+
+template <typename Scalar>
+template <typename ScalarLim>
+EigenSystemH<Scalar> DiagonalizerLanczos<Scalar>::dispatch_eigh(
+    const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix, real_t min_eigenvalue,
+    real_t max_eigenvalue, double rtol) const {
+    using real_lim_t = typename traits::NumTraits<ScalarLim>::real_t;
+    using sparse_t = Eigen::SparseMatrix<ScalarLim, Eigen::ColMajor>;
+    using solver_t = Eigen::SimplicialLDLT<sparse_t, Eigen::Lower>;
+    int dim = matrix.rows();
+
+    assert(rtol > 0);
+    assert(rtol < 1);
+
+    // Subtract the mean of the diagonal elements from the diagonal, keeping the matrix sparse
+    real_t shift = matrix.diagonal().real().mean();
+    Eigen::SparseMatrix<Scalar, Eigen::RowMajor> identity(dim, dim);
+    identity.setIdentity();
+    sparse_t shifted_matrix =
+        Eigen::SparseMatrix<Scalar, Eigen::RowMajor>(matrix - shift * identity)
+            .template cast<ScalarLim>();
+    sparse_t identity_lim = identity.template cast<ScalarLim>();
+
+    // Ensure the accuracy the results, see DiagonalizerInterface::subtract_mean
+    double floating_point_error = 5 * std::numeric_limits<real_lim_t>::epsilon();
+
+    if (floating_point_error > rtol) {
+        SPDLOG_WARN(
+            "Because the floating point precision is too low, the eigenvalues cannot be calculated "
+            "accurately. The estimated floating point error ({} * ||H||) is larger than the "
+            "specified tolerance ({} * ||H||). Try to use a 'float_type' with higher precision or "
+            "a larger 'rtol'.",
+            floating_point_error, rtol);
+    }
+
+    auto lower = static_cast<real_lim_t>(min_eigenvalue - shift);
+    auto upper = static_cast<real_lim_t>(max_eigenvalue - shift);
+
+    // Helper function for factorizing the matrix shifted by sigma
+    auto factorize = [&](solver_t &solver, real_lim_t sigma) {
+        solver.compute(shifted_matrix - sigma * identity_lim);
+        return solver.info() == Eigen::Success;
+    };
+
+    // Count the eigenvalues within the interval via Sylvester's law of inertia
+    auto count_eigenvalues_below = [&](real_lim_t sigma) {
+        auto count = utils::count_eigenvalues_below(shifted_matrix, sigma);
+        if (!count.has_value()) {
+            throw std::runtime_error(
+                "Diagonalization error: The LDL^T factorization failed. Try to use a different "
+                "search interval or diagonalizer.");
+        }
+        return count.value();
+    };
+
+    int num_wanted =
+        upper > lower ? count_eigenvalues_below(upper) - count_eigenvalues_below(lower) : 0;
+
+    if (num_wanted <= 0) {
+        return {Eigen::SparseMatrix<Scalar, Eigen::RowMajor>(dim, 0), Eigen::VectorX<real_t>(0)};
+    }
+
+    // Use a dense diagonalizer if the Krylov subspace would not be much smaller than the matrix
+    if (2 * std::max(2 * num_wanted, num_wanted + MIN_NUMBER_OF_EXTRA_LANCZOS_VECTORS) >= dim) {
+        SPDLOG_DEBUG("Diagonalizing a matrix of size {} with a dense diagonalizer as {} "
+                     "eigenvalues are within the search interval.",
+                     dim, num_wanted);
+        const DiagonalizerInterface<Scalar> &diagonalizer =
+            DiagonalizerEigen<Scalar>(this->float_type);
+        return diagonalizer.eigh(matrix, min_eigenvalue, max_eigenvalue, rtol);
+    }
+
+    // Lower bounds on ||H|| because the eigenvalues are bounded by the diagonal entries and the
+    // Frobenius norm satisfies ||H||_F <= sqrt(dim) * ||H||
+    real_lim_t norm = std::max(shifted_matrix.diagonal().cwiseAbs().maxCoeff(),
+                               shifted_matrix.norm() / std::sqrt(static_cast<real_lim_t>(dim)));
+
+    // For a hermitian matrix, the error of an eigenvalue is bounded by the norm of the residual
+    real_lim_t tolerance = static_cast<real_lim_t>(
+        std::max(0.5 * rtol, 10.0 * std::numeric_limits<real_lim_t>::epsilon()) * norm);
+
+    // Factorize the matrix shifted by the center of the interval, slightly moving the shift if it
+    // coincides with an eigenvalue
+    real_lim_t sigma = (lower + upper) / 2;
+    solver_t solver;
+    for (int attempt = 1; !factorize(solver, sigma); ++attempt) {
+        if (attempt == 4) {
+            throw std::runtime_error(
+                "Diagonalization error: The LDL^T factorization failed. Try to use a different "
+                "search interval or diagonalizer.");
+        }
+        sigma += static_cast<real_lim_t>(1e-3 * attempt) * (upper - lower);
+    }
+
+    // Helper function for creating a random start vector, seeded for reproducible results
+    std::mt19937 generator(0);
+    std::normal_distribution<real_lim_t> distribution;
+    auto random_vector = [&]() {
+        Eigen::VectorX<ScalarLim> vector(dim);
+        for (int i = 0; i < dim; ++i) {
+            if constexpr (traits::NumTraits<ScalarLim>::is_complex_v) {
+                vector(i) = ScalarLim(distribution(generator), distribution(generator));
+            } else {
+                vector(i) = distribution(generator);
+            }
+        }
+        return vector;
+    };
+
+    Eigen::MatrixX<ScalarLim> locked_eigenvectors(dim, num_wanted);
+    Eigen::VectorX<real_lim_t> locked_eigenvalues(num_wanted);
+    int num_locked = 0;
+
+    // Helper function for orthogonalizing a vector against the locked eigenvectors and the first
+    // Lanczos vectors, returning the projections onto the Lanczos vectors. Orthogonalizing twice
+    // is sufficient for numerical orthogonality ("twice is enough").
+    auto orthogonalize = [&](Eigen::VectorX<ScalarLim> &vector,
+                             const Eigen::MatrixX<ScalarLim> &lanczos_vectors, int num_vectors) {
+        Eigen::VectorX<ScalarLim> projections = Eigen::VectorX<ScalarLim>::Zero(num_vectors);
+        for (int pass = 0; pass < 2; ++pass) {
+            if (num_locked > 0) {
+                vector -= locked_eigenvectors.leftCols(num_locked) *
+                    (locked_eigenvectors.leftCols(num_locked).adjoint() * vector);
+            }
+            if (num_vectors > 0) {
+                Eigen::VectorX<ScalarLim> coefficients =
+                    lanczos_vectors.leftCols(num_vectors).adjoint() * vector;
+                vector -= lanczos_vectors.leftCols(num_vectors) * coefficients;
+                projections += coefficients;
+            }
+        }
+        return projections;
+    };
+
+    // Thick-restart Lanczos method with full reorthogonalization for the operator (H - sigma)^-1,
+    // whose eigenvalues theta = 1 / (lambda - sigma) with the largest magnitude belong to the
+    // eigenvalues lambda within the interval
+    Eigen::MatrixX<ScalarLim> lanczos_vectors;
+    Eigen::MatrixX<ScalarLim> projected_matrix;
+    int krylov_dim = 0;
+    int num_kept = 0;
+    bool start_new_run = true;
+
+    for (int restart = 0; num_locked < num_wanted; ++restart) {
+        if (restart == MAX_NUMBER_OF_RESTARTS) {
+            throw std::runtime_error(
+                "Diagonalization error: The Lanczos routine did not converge. Try to use a "
+                "smaller search interval, a larger 'rtol', or a different diagonalizer.");
+        }
+
+        int num_missing = num_wanted - num_locked;
+
+        // Start with a random vector that is orthogonal to the locked eigenvectors
+        if (start_new_run) {
+            krylov_dim = std::min(
+                dim - num_locked,
+                std::max(2 * num_missing, num_missing + MIN_NUMBER_OF_EXTRA_LANCZOS_VECTORS));
+            lanczos_vectors.resize(dim, krylov_dim + 1);
+            projected_matrix = Eigen::MatrixX<ScalarLim>::Zero(krylov_dim, krylov_dim);
+            Eigen::VectorX<ScalarLim> start_vector = random_vector();
+            orthogonalize(start_vector, lanczos_vectors, 0);
+            lanczos_vectors.col(0) = start_vector.normalized();
+            num_kept = 0;
+            start_new_run = false;
+        }
+
+        // Extend the Krylov subspace and the projection of the operator onto it
+        for (int j = num_kept; j < krylov_dim; ++j) {
+            Eigen::VectorX<ScalarLim> vector = solver.solve(lanczos_vectors.col(j));
+            Eigen::VectorX<ScalarLim> projections = orthogonalize(vector, lanczos_vectors, j + 1);
+            projected_matrix.col(j).head(j + 1) = projections;
+            projected_matrix.row(j).head(j + 1) = projections.adjoint();
+            projected_matrix(j, j) = std::real(projections(j));
+
+            real_lim_t beta = vector.norm();
+            if (beta <= std::numeric_limits<real_lim_t>::epsilon() * projections.norm()) {
+                // The Krylov subspace is invariant, continue with a random vector
+                vector = random_vector();
+                orthogonalize(vector, lanczos_vectors, j + 1);
+                beta = vector.norm();
+            }
+            lanczos_vectors.col(j + 1) = vector / beta;
+        }
+
+        // Calculate the Ritz pairs and sort them by the magnitude of theta
+        Eigen::SelfAdjointEigenSolver<Eigen::MatrixX<ScalarLim>> eigensolver(projected_matrix);
+        const auto &theta = eigensolver.eigenvalues();
+        std::vector<int> order(krylov_dim);
+        std::iota(order.begin(), order.end(), 0);
+        std::sort(order.begin(), order.end(),
+                  [&](int i, int j) { return std::abs(theta[i]) > std::abs(theta[j]); });
+
+        // Check the convergence of the wanted Ritz pairs via their residuals with respect to H
+        Eigen::MatrixX<ScalarLim> ritz_vectors(dim, num_missing);
+        Eigen::VectorX<real_lim_t> ritz_values(num_missing);
+        bool converged = true;
+        for (int i = 0; i < num_missing && converged; ++i) {
+            ritz_vectors.col(i) =
+                lanczos_vectors.leftCols(krylov_dim) * eigensolver.eigenvectors().col(order[i]);
+            ritz_values(i) = sigma + 1 / theta[order[i]];
+            converged =
+                (shifted_matrix * ritz_vectors.col(i) - ritz_values(i) * ritz_vectors.col(i))
+                    .norm() <= tolerance;
+        }
+
+        // Lock the converged eigenpairs within the interval. If eigenvalues are missing, e.g.,
+        // because of degeneracies, a new run is started in the orthogonal complement.
+        if (converged) {
+            for (int i = 0; i < num_missing; ++i) {
+                if (ritz_values(i) >= lower - tolerance && ritz_values(i) <= upper + tolerance &&
+                    num_locked < num_wanted) {
+                    locked_eigenvectors.col(num_locked) = ritz_vectors.col(i);
+                    locked_eigenvalues(num_locked) = ritz_values(i);
+                    ++num_locked;
+                }
+            }
+            start_new_run = true;
+            continue;
+        }
+
+        // Thick restart, keeping the Ritz vectors with the largest magnitude of theta
+        num_kept = std::min(num_missing + (krylov_dim - num_missing) / 2, krylov_dim - 1);
+        Eigen::MatrixX<ScalarLim> selected_eigenvectors(krylov_dim, num_kept);
+        for (int i = 0; i < num_kept; ++i) {
+            selected_eigenvectors.col(i) = eigensolver.eigenvectors().col(order[i]);
+        }
+        Eigen::VectorX<ScalarLim> residual_vector = lanczos_vectors.col(krylov_dim);
+        lanczos_vectors.leftCols(num_kept) =
+            lanczos_vectors.leftCols(krylov_dim) * selected_eigenvectors;
+        lanczos_vectors.col(num_kept) = residual_vector;
+        projected_matrix.setZero();
+        for (int i = 0; i < num_kept; ++i) {
+            projected_matrix(i, i) = theta[order[i]];
+        }
+    }
+
+    // Sort the eigenpairs by their eigenvalues
+    std::vector<int> order(num_wanted);
+    std::iota(order.begin(), order.end(), 0);
+    std::sort(order.begin(), order.end(),
+              [&](int i, int j) { return locked_eigenvalues[i] < locked_eigenvalues[j]; });
+    Eigen::MatrixX<ScalarLim> evecs(dim, num_wanted);
+    Eigen::VectorX<real_lim_t> evals(num_wanted);
+    for (int i = 0; i < num_wanted; ++i) {
+        evecs.col(i) = locked_eigenvectors.col(order[i]);
+        evals(i) = locked_eigenvalues(order[i]);
+    }
+
+    return {evecs.sparseView(1, 0.5 * rtol / std::sqrt(dim)).template cast<Scalar>(),
+            this->add_mean(evals, shift)};
+}
+
+template <typename Scalar>
+EigenSystemH<Scalar>
+DiagonalizerLanczos<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> & /*matrix*/,
+                                  double /*rtol*/) const {
+    throw std::invalid_argument("The Lanczos routine requires a search interval.");
+}
+
+template <typename Scalar>
+EigenSystemH<Scalar>
+DiagonalizerLanczos<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                                  std::optional<real_t> min_eigenvalue,
+                                  std::optional<real_t> max_eigenvalue, double rtol) const {
+    if (!min_eigenvalue.has_value() || !max_eigenvalue.has_value()) {
+        throw std::invalid_argument("The Lanczos routine requires a search interval.");
+    }
+    switch (this->float_type) {
+    case FloatType::FLOAT32:
+        return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT32>>(
+            matrix, min_eigenvalue.value(), max_eigenvalue.value(), rtol);
+    case FloatType::FLOAT64:
+    case FloatType::FLOAT32_REFINED: // the refinement requires the complete eigensystem
+        return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(
+            matrix, min_eigenvalue.value(), max_eigenvalue.value(), rtol);
+    default:
+        throw std::invalid_argument("Unsupported floating point precision.");
+    }
+}
+
+// Explicit instantiations
+template class DiagonalizerLanczos<double>;
+template class DiagonalizerLanczos<std::complex<double>>;
+} // namespace pairinteraction
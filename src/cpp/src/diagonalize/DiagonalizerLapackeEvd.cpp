@@ -11,6 +11,7 @@
 #include <cmath>
 #include <fmt/core.h>
 #include <spdlog/spdlog.h>
+#include <utility>
 
 #ifdef WITH_MKL
 #include <mkl.h>
@@ -89,6 +90,18 @@ DiagonalizerLapackeEvd<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::Ro
         return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT32>>(matrix, rtol);
     case FloatType::FLOAT64:
         return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(matrix, rtol);
+    case FloatType::FLOAT32_REFINED: {
+        auto eigensystem =
+            this->refine(matrix,
+                         dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT32>>(
+                             matrix, this->get_rtol_before_refinement(rtol)),
+                         rtol);
+        if (eigensystem.has_value()) {
+            return std::move(eigensystem).value();
+        }
+        // Fall back to double precision if the refinement does not converge
+        return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(matrix, rtol);
+    }
     default:
         throw std::invalid_argument("Unsupported floating point precision.");
     }
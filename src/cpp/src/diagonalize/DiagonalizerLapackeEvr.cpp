@@ -12,6 +12,7 @@
 #include <fmt/core.h>
 #include <limits>
 #include <spdlog/spdlog.h>
+#include <utility>
 
 #ifdef WITH_MKL
 #include <mkl.h>
@@ -137,6 +138,24 @@ DiagonalizerLapackeEvr<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::Ro
     case FloatType::FLOAT64:
         return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(
             matrix, min_eigenvalue, max_eigenvalue, rtol);
+    case FloatType::FLOAT32_REFINED: {
+        if (min_eigenvalue.has_value() || max_eigenvalue.has_value()) {
+            // The refinement requires the complete eigensystem, which is restricted afterwards
+            return DiagonalizerInterface<Scalar>::eigh(matrix, min_eigenvalue, max_eigenvalue,
+                                                       rtol);
+        }
+        auto eigensystem = this->refine(
+            matrix,
+            dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT32>>(
+                matrix, std::nullopt, std::nullopt, this->get_rtol_before_refinement(rtol)),
+            rtol);
+        if (eigensystem.has_value()) {
+            return std::move(eigensystem).value();
+        }
+        // Fall back to double precision if the refinement does not converge
+        return dispatch_eigh<traits::restricted_t<Scalar, FloatType::FLOAT64>>(matrix, std::nullopt,
+                                                                               std::nullopt, rtol);
+    }
     default:
         throw std::invalid_argument("Unsupported floating point precision.");
     }
@@ -0,0 +1,203 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/diagonalize/continuation.hpp"
+
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+#include "pairinteraction/utils/inertia.hpp"
+
+#include <Eigen/Dense>
+#include <Eigen/Eigenvalues>
+#include <Eigen/SparseCholesky>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <random>
+#include <spdlog/spdlog.h>
+#include <vector>
+
+namespace pairinteraction {
+// Maximal number of blocks of the Krylov subspace before falling back to a full diagonalization
+constexpr int MAX_NUMBER_OF_ITERATIONS = 6;
+
+template <typename Scalar>
+std::optional<EigenSystemH<Scalar>>
+continue_eigensystem(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<Scalar> &previous,
+                     std::optional<typename traits::NumTraits<Scalar>::real_t> min_eigenvalue,
+                     std::optional<typename traits::NumTraits<Scalar>::real_t> max_eigenvalue,
+                     double rtol) {
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    using dense_t = Eigen::MatrixX<Scalar>;
+    Eigen::Index dim = matrix.rows();
+
+    // The warm start is restricted to finite intervals, for which only a small part of the
+    // spectrum is wanted
+    if (!min_eigenvalue.has_value() || !max_eigenvalue.has_value()) {
+        return std::nullopt;
+    }
+
+    if (previous.eigenvectors.rows() != dim) {
+        return std::nullopt;
+    }
+
+    // Subtract the mean of the diagonal elements from the diagonal, keeping the matrix sparse
+    real_t shift = dim > 0 ? matrix.diagonal().real().mean() : 0;
+    Eigen::SparseMatrix<Scalar, Eigen::ColMajor> identity(dim, dim);
+    identity.setIdentity();
+    Eigen::SparseMatrix<Scalar, Eigen::ColMajor> shifted_matrix = matrix;
+    shifted_matrix -= shift * identity;
+
+    real_t lower = min_eigenvalue.value() - shift;
+    real_t upper = max_eigenvalue.value() - shift;
+
+    // Count the eigenvalues within the interval via Sylvester's law of inertia
+    Eigen::Index num_wanted = 0;
+    if (upper > lower) {
+        auto num_below_upper = utils::count_eigenvalues_below(shifted_matrix, upper);
+        auto num_below_lower = utils::count_eigenvalues_below(shifted_matrix, lower);
+        if (!num_below_upper.has_value() || !num_below_lower.has_value()) {
+            return std::nullopt;
+        }
+        num_wanted = num_below_upper.value() - num_below_lower.value();
+    }
+
+    if (num_wanted <= 0) {
+        return EigenSystemH<Scalar>{Eigen::SparseMatrix<Scalar, Eigen::RowMajor>(dim, 0),
+                                    Eigen::VectorX<real_t>(0)};
+    }
+
+    // The size of a block of the Krylov subspace exceeds the number of wanted eigenpairs by some
+    // buffer vectors, which speed up the convergence of the eigenpairs close to the bounds of the
+    // interval. If the Krylov subspace would not be much smaller than the matrix, a full
+    // diagonalization is cheaper.
+    Eigen::Index block_size = num_wanted + std::max<Eigen::Index>(num_wanted / 2, 8);
+    if (previous.eigenvectors.cols() == 0 || 4 * block_size > dim) {
+        return std::nullopt;
+    }
+
+    // Factorize the matrix shifted by the center of the interval. The eigenvalues within the
+    // interval are the ones closest to the center.
+    real_t sigma = (lower + upper) / 2;
+    Eigen::SimplicialLDLT<Eigen::SparseMatrix<Scalar, Eigen::ColMajor>, Eigen::Lower> solver;
+    solver.compute(shifted_matrix - sigma * identity);
+    if (solver.info() != Eigen::Success) {
+        return std::nullopt;
+    }
+
+    // Lower bounds on ||H|| because the eigenvalues are bounded by the diagonal entries and the
+    // Frobenius norm satisfies ||H||_F <= sqrt(dim) * ||H||
+    real_t norm = std::max(shifted_matrix.diagonal().cwiseAbs().maxCoeff(),
+                           shifted_matrix.norm() / std::sqrt(static_cast<real_t>(dim)));
+
+    // For a hermitian matrix, the error of an eigenvalue is bounded by the norm of the residual
+    auto tolerance = static_cast<real_t>(
+        std::max(0.5 * rtol, 10.0 * std::numeric_limits<real_t>::epsilon()) * norm);
+
+    // Helper function for orthonormalizing a block of vectors against the search space.
+    // Orthogonalizing twice is sufficient for numerical orthogonality ("twice is enough").
+    dense_t search_space(dim, 0);
+    auto orthonormalize = [&](dense_t block) {
+        for (int pass = 0; pass < 2; ++pass) {
+            block -= search_space * (search_space.adjoint() * block);
+        }
+        Eigen::HouseholderQR<dense_t> qr(block);
+        return dense_t(qr.householderQ() * dense_t::Identity(dim, block.cols()));
+    };
+
+    // Start from the previous eigenvectors, filling up the block with random vectors that are
+    // seeded for reproducible results
+    Eigen::Index num_previous = std::min(previous.eigenvectors.cols(), block_size);
+    dense_t block(dim, block_size);
+    block.leftCols(num_previous) = previous.eigenvectors.leftCols(num_previous).toDense();
+    std::mt19937 generator(0);
+    std::normal_distribution<real_t> distribution;
+    for (Eigen::Index j = num_previous; j < block_size; ++j) {
+        for (Eigen::Index i = 0; i < dim; ++i) {
+            if constexpr (traits::NumTraits<Scalar>::is_complex_v) {
+                block(i, j) = Scalar(distribution(generator), distribution(generator));
+            } else {
+                block(i, j) = distribution(generator);
+            }
+        }
+    }
+
+    // Block Krylov method for the operator (H - sigma)^-1, whose eigenvalues theta = 1 / (lambda -
+    // sigma) with the largest magnitude belong to the eigenvalues lambda within the interval
+    dense_t applied_search_space(dim, 0);
+    for (int iteration = 1; iteration <= MAX_NUMBER_OF_ITERATIONS; ++iteration) {
+        Eigen::Index num_vectors = search_space.cols();
+        if (2 * (num_vectors + block_size) > dim) {
+            break;
+        }
+
+        // Extend the search space and its image under the operator
+        block = orthonormalize(block);
+        dense_t applied_block = solver.solve(block);
+        if (solver.info() != Eigen::Success) {
+            return std::nullopt;
+        }
+        search_space.conservativeResize(dim, num_vectors + block_size);
+        search_space.rightCols(block_size) = block;
+        applied_search_space.conservativeResize(dim, num_vectors + block_size);
+        applied_search_space.rightCols(block_size) = applied_block;
+        num_vectors += block_size;
+
+        // Rayleigh-Ritz procedure for the operator
+        dense_t projected = search_space.adjoint() * applied_search_space;
+        projected = (projected + projected.adjoint()).eval() / 2;
+        Eigen::SelfAdjointEigenSolver<dense_t> eigensolver(projected);
+        if (eigensolver.info() != Eigen::Success) {
+            return std::nullopt;
+        }
+        const auto &theta = eigensolver.eigenvalues();
+
+        // Check the convergence of the Ritz pairs within the interval via their residuals with
+        // respect to H
+        std::vector<Eigen::Index> indices;
+        for (Eigen::Index i = 0; i < num_vectors; ++i) {
+            real_t value = sigma + 1 / theta[i];
+            if (theta[i] != 0 && value >= lower && value <= upper) {
+                indices.push_back(i);
+            }
+        }
+        if (static_cast<Eigen::Index>(indices.size()) == num_wanted) {
+            // Sort the eigenpairs by their eigenvalues
+            std::sort(indices.begin(), indices.end(),
+                      [&](Eigen::Index i, Eigen::Index j) { return 1 / theta[i] < 1 / theta[j]; });
+            dense_t ritz_vectors(dim, num_wanted);
+            Eigen::VectorX<real_t> ritz_values(num_wanted);
+            for (Eigen::Index j = 0; j < num_wanted; ++j) {
+                ritz_vectors.col(j) = search_space * eigensolver.eigenvectors().col(indices[j]);
+                ritz_values[j] = sigma + 1 / theta[indices[j]];
+            }
+            dense_t residuals =
+                shifted_matrix * ritz_vectors - ritz_vectors * ritz_values.asDiagonal();
+            if ((residuals.colwise().norm().array() <= tolerance).all()) {
+                SPDLOG_DEBUG("Continued {} eigenpairs of a matrix of size {} after {} iterations.",
+                             num_wanted, dim, iteration);
+                return EigenSystemH<Scalar>{ritz_vectors.sparseView(1, 0.5 * rtol / std::sqrt(dim)),
+                                            ritz_values.array() + shift};
+            }
+        }
+
+        block = applied_block;
+    }
+
+    SPDLOG_DEBUG("The continuation of the eigenpairs of a matrix of size {} did not converge.",
+                 dim);
+    return std::nullopt;
+}
+
+// Explicit instantiations
+template std::optional<EigenSystemH<double>>
+continue_eigensystem(const Eigen::SparseMatrix<double, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<double> &previous, std::optional<double> min_eigenvalue,
+                     std::optional<double> max_eigenvalue, double rtol);
+template std::optional<EigenSystemH<std::complex<double>>>
+continue_eigensystem(const Eigen::SparseMatrix<std::complex<double>, Eigen::RowMajor> &matrix,
+                     const EigenSystemH<std::complex<double>> &previous,
+                     std::optional<double> min_eigenvalue, std::optional<double> max_eigenvalue,
+                     double rtol);
+} // namespace pairinteraction
@@ -0,0 +1,103 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/diagonalize/continuation.hpp"
+
+#include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
+#include "pairinteraction/utils/eigen_assertion.hpp"
+#include "pairinteraction/utils/eigen_compat.hpp"
+
+#include <Eigen/SparseCore>
+#include <doctest/doctest.h>
+#include <random>
+#include <vector>
+
+namespace pairinteraction {
+namespace {
+Eigen::SparseMatrix<double, Eigen::RowMajor> create_matrix(int dim, double slope, double coupling,
+                                                           unsigned int seed) {
+    std::mt19937 gen(seed);
+    std::uniform_real_distribution<double> distribution(-1, 1);
+    std::uniform_int_distribution<int> index_distribution(0, dim - 1);
+
+    std::vector<Eigen::Triplet<double>> triplets;
+    for (int i = 0; i < dim; ++i) {
+        triplets.emplace_back(i, i, slope * i + 0.1 * distribution(gen));
+    }
+    for (int k = 0; k < 4 * dim; ++k) {
+        int row = index_distribution(gen);
+        int col = index_distribution(gen);
+        if (row != col) {
+            double value = coupling * distribution(gen);
+            triplets.emplace_back(row, col, value);
+            triplets.emplace_back(col, row, value);
+        }
+    }
+
+    Eigen::SparseMatrix<double, Eigen::RowMajor> matrix(dim, dim);
+    matrix.setFromTriplets(triplets.begin(), triplets.end());
+    return matrix;
+}
+} // namespace
+
+DOCTEST_TEST_CASE("continue the eigensystems of a parameter sweep") {
+    int dim = 400;
+    double min_eigenvalue = 100;
+    double max_eigenvalue = 130;
+    double rtol = 1e-6;
+    DiagonalizerEigen<double> diagonalizer_eigen;
+    const DiagonalizerInterface<double> &diagonalizer = diagonalizer_eigen;
+
+    auto matrix = create_matrix(dim, 1, 0.5, 42);
+    auto perturbation = create_matrix(dim, 0, 0.5, 43);
+    auto previous = diagonalizer.eigh(matrix, min_eigenvalue, max_eigenvalue, rtol);
+
+    for (double step : {0.001, 0.002, 0.003}) {
+        Eigen::SparseMatrix<double, Eigen::RowMajor> perturbed_matrix =
+            matrix + step * perturbation;
+        auto reference = diagonalizer.eigh(perturbed_matrix, min_eigenvalue, max_eigenvalue, rtol);
+        auto continued = continue_eigensystem<double>(perturbed_matrix, previous, min_eigenvalue,
+                                                      max_eigenvalue, rtol);
+
+        DOCTEST_REQUIRE(continued.has_value());
+        DOCTEST_REQUIRE(continued->eigenvalues.size() == reference.eigenvalues.size());
+        DOCTEST_CHECK((continued->eigenvalues - reference.eigenvalues).cwiseAbs().maxCoeff() <
+                      1e-4);
+
+        // The eigenvectors must be orthonormal eigenvectors of the perturbed matrix
+        Eigen::MatrixX<double> eigenvectors = continued->eigenvectors.toDense();
+        Eigen::MatrixX<double> residuals =
+            perturbed_matrix * eigenvectors - eigenvectors * continued->eigenvalues.asDiagonal();
+        DOCTEST_CHECK(residuals.norm() < 1e-3);
+        DOCTEST_CHECK((eigenvectors.adjoint() * eigenvectors)
+                          .isApprox(Eigen::MatrixX<double>::Identity(eigenvectors.cols(),
+                                                                     eigenvectors.cols()),
+                                    1e-4));
+
+        previous = continued.value();
+    }
+}
+
+DOCTEST_TEST_CASE("continue the eigensystem only if it is worthwhile") {
+    int dim = 400;
+    DiagonalizerEigen<double> diagonalizer_eigen;
+    const DiagonalizerInterface<double> &diagonalizer = diagonalizer_eigen;
+    auto matrix = create_matrix(dim, 1, 0.5, 42);
+    auto previous = diagonalizer.eigh(matrix, 100.0, 130.0, 1e-6);
+
+    // All eigenpairs are wanted
+    DOCTEST_CHECK_FALSE(
+        continue_eigensystem<double>(matrix, previous, std::nullopt, std::nullopt, 1e-6)
+            .has_value());
+
+    // Too many eigenpairs are wanted
+    DOCTEST_CHECK_FALSE(
+        continue_eigensystem<double>(matrix, previous, 0.0, 300.0, 1e-6).has_value());
+
+    // No eigenpairs are within the interval
+    auto empty = continue_eigensystem<double>(matrix, previous, 1000.0, 1100.0, 1e-6);
+    DOCTEST_REQUIRE(empty.has_value());
+    DOCTEST_CHECK(empty->eigenvalues.size() == 0);
+    DOCTEST_CHECK(empty->eigenvectors.rows() == dim);
+}
+} // namespace pairinteraction
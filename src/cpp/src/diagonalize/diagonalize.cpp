@@ -3,61 +3,93 @@
 
 #include "pairinteraction/diagonalize/diagonalize.hpp"
 
+#include "pairinteraction/interfaces/DiagonalizerInterface.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
 #include "pairinteraction/system/SystemPair.hpp"
 #include "pairinteraction/utils/Range.hpp"
 #include "pairinteraction/utils/TaskControl.hpp"
 
+#include <algorithm>
 #include <complex>
 #include <cstddef>
+#include <iterator>
 #include <oneapi/tbb.h>
 #include <optional>
+#include <vector>
 
 namespace pairinteraction {
 
-template <typename Derived>
-void diagonalize(std::initializer_list<std::reference_wrapper<Derived>> systems,
-                 const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
-                 std::optional<typename Derived::real_t> min_eigenenergy,
-                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol) {
+namespace {
+template <typename Derived, typename Iterator>
+void diagonalize_range(Iterator begin, Iterator end,
+                       const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
+                       std::optional<typename Derived::real_t> min_eigenenergy,
+                       std::optional<typename Derived::real_t> max_eigenenergy, double rtol,
+                       bool warm_start, bool auto_rotate) {
     set_task_status("Diagonalizing systems...");
-    oneapi::tbb::parallel_for(
-        oneapi::tbb::blocked_range(systems.begin(), systems.end()), [&](const auto &range) {
-            for (auto &system : range) {
-                system.get().diagonalize(diagonalizer, min_eigenenergy, max_eigenenergy, rtol);
+
+    if (!warm_start) {
+        oneapi::tbb::parallel_for(oneapi::tbb::blocked_range(begin, end), [&](const auto &range) {
+            for (auto &element : range) {
+                Derived &system = element;
+                system.diagonalize(diagonalizer, min_eigenenergy, max_eigenenergy, rtol,
+                                   auto_rotate);
                 set_task_status("Finished diagonalizing one system...", true);
             }
         });
+        return;
+    }
+
+    // Split the sweep into contiguous chunks, one per thread, and sweep through each chunk
+    // sequentially so that the eigensystems of the previous step can be reused
+    auto number_of_systems = std::distance(begin, end);
+    auto number_of_chunks = std::min<std::ptrdiff_t>(
+        number_of_systems, oneapi::tbb::this_task_arena::max_concurrency());
+    oneapi::tbb::parallel_for(
+        oneapi::tbb::blocked_range<std::ptrdiff_t>(0, number_of_chunks), [&](const auto &range) {
+            for (std::ptrdiff_t chunk = range.begin(); chunk != range.end(); ++chunk) {
+                auto chunk_begin = begin + chunk * number_of_systems / number_of_chunks;
+                auto chunk_end = begin + (chunk + 1) * number_of_systems / number_of_chunks;
+                std::vector<EigenSystemH<typename Derived::scalar_t>> eigensystems_of_blocks;
+                for (auto it = chunk_begin; it != chunk_end; ++it) {
+                    Derived &system = *it;
+                    system.diagonalize(diagonalizer, eigensystems_of_blocks, min_eigenenergy,
+                                       max_eigenenergy, rtol, auto_rotate);
+                    set_task_status("Finished diagonalizing one system...", true);
+                }
+            }
+        });
+}
+} // namespace
+
+template <typename Derived>
+void diagonalize(std::initializer_list<std::reference_wrapper<Derived>> systems,
+                 const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
+                 std::optional<typename Derived::real_t> min_eigenenergy,
+                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol,
+                 bool warm_start, bool auto_rotate) {
+    diagonalize_range<Derived>(systems.begin(), systems.end(), diagonalizer, min_eigenenergy,
+                               max_eigenenergy, rtol, warm_start, auto_rotate);
 }
 
 template <typename Derived>
 void diagonalize(std::vector<Derived> &systems,
                  const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
                  std::optional<typename Derived::real_t> min_eigenenergy,
-                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol) {
-    set_task_status("Diagonalizing systems...");
-    oneapi::tbb::parallel_for(
-        oneapi::tbb::blocked_range(systems.begin(), systems.end()), [&](const auto &range) {
-            for (auto &system : range) {
-                system.diagonalize(diagonalizer, min_eigenenergy, max_eigenenergy, rtol);
-                set_task_status("Finished diagonalizing one system...", true);
-            }
-        });
+                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol,
+                 bool warm_start, bool auto_rotate) {
+    diagonalize_range<Derived>(systems.begin(), systems.end(), diagonalizer, min_eigenenergy,
+                               max_eigenenergy, rtol, warm_start, auto_rotate);
 }
 
 template <typename Derived>
 void diagonalize(std::vector<std::reference_wrapper<Derived>> systems,
                  const DiagonalizerInterface<typename Derived::scalar_t> &diagonalizer,
                  std::optional<typename Derived::real_t> min_eigenenergy,
-                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol) {
-    set_task_status("Diagonalizing systems...");
-    oneapi::tbb::parallel_for(
-        oneapi::tbb::blocked_range(systems.begin(), systems.end()), [&](const auto &range) {
-            for (auto &system : range) {
-                system.get().diagonalize(diagonalizer, min_eigenenergy, max_eigenenergy, rtol);
-                set_task_status("Finished diagonalizing one system...", true);
-            }
-        });
+                 std::optional<typename Derived::real_t> max_eigenenergy, double rtol,
+                 bool warm_start, bool auto_rotate) {
+    diagonalize_range<Derived>(systems.begin(), systems.end(), diagonalizer, min_eigenenergy,
+                               max_eigenenergy, rtol, warm_start, auto_rotate);
 }
 
 // Explicit instantiations
@@ -66,15 +98,18 @@ void diagonalize(std::vector<std::reference_wrapper<Derived>> systems,
     template void diagonalize(std::initializer_list<std::reference_wrapper<TYPE<SCALAR>>> systems, \
                               const DiagonalizerInterface<TYPE<SCALAR>::scalar_t> &diagonalizer,   \
                               std::optional<TYPE<SCALAR>::real_t> min_eigenenergy,                 \
-                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol);   \
+                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol,    \
+                              bool warm_start, bool auto_rotate);                                  \
     template void diagonalize(std::vector<TYPE<SCALAR>> &systems,                                  \
                               const DiagonalizerInterface<TYPE<SCALAR>::scalar_t> &diagonalizer,   \
                               std::optional<TYPE<SCALAR>::real_t> min_eigenenergy,                 \
-                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol);   \
+                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol,    \
+                              bool warm_start, bool auto_rotate);                                  \
     template void diagonalize(std::vector<std::reference_wrapper<TYPE<SCALAR>>> systems,           \
                               const DiagonalizerInterface<TYPE<SCALAR>::scalar_t> &diagonalizer,   \
                               std::optional<TYPE<SCALAR>::real_t> min_eigenenergy,                 \
-                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol);
+                              std::optional<TYPE<SCALAR>::real_t> max_eigenenergy, double rtol,    \
+                              bool warm_start, bool auto_rotate);
 #define INSTANTIATE_DIAGONALIZE(SCALAR)                                                            \
     INSTANTIATE_DIAGONALIZE_HELPER(SCALAR, SystemAtom)                                             \
     INSTANTIATE_DIAGONALIZE_HELPER(SCALAR, SystemPair)
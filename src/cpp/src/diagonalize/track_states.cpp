@@ -0,0 +1,112 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/diagonalize/track_states.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/basis/BasisPair.hpp"
+#include "pairinteraction/ket/KetAtom.hpp"
+#include "pairinteraction/ket/KetPair.hpp"
+#include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/system/SystemPair.hpp"
+#include "pairinteraction/utils/TaskControl.hpp"
+
+#include <algorithm>
+#include <complex>
+#include <oneapi/tbb.h>
+#include <stdexcept>
+#include <tuple>
+
+namespace pairinteraction {
+
+Eigen::VectorXi match_states(const Eigen::SparseMatrix<double, Eigen::RowMajor> &overlaps) {
+    // Sort the pairs of states by their overlaps, using a stable sort for reproducible results
+    std::vector<std::tuple<double, int, int>> candidates;
+    candidates.reserve(overlaps.nonZeros());
+    for (int row = 0; row < overlaps.outerSize(); ++row) {
+        for (Eigen::SparseMatrix<double, Eigen::RowMajor>::InnerIterator it(overlaps, row); it;
+             ++it) {
+            if (it.value() > 0) {
+                candidates.emplace_back(it.value(), static_cast<int>(it.row()),
+                                        static_cast<int>(it.col()));
+            }
+        }
+    }
+    std::stable_sort(candidates.begin(), candidates.end(),
+                     [](const auto &a, const auto &b) { return std::get<0>(a) > std::get<0>(b); });
+
+    // Match the states greedily
+    Eigen::VectorXi matches = Eigen::VectorXi::Constant(overlaps.rows(), -1);
+    std::vector<bool> is_matched(overlaps.cols(), false);
+    for (const auto &[overlap, row, col] : candidates) {
+        if (matches[row] == -1 && !is_matched[col]) {
+            matches[row] = col;
+            is_matched[col] = true;
+        }
+    }
+
+    return matches;
+}
+
+template <typename Derived>
+Eigen::MatrixXi track_states(const std::vector<std::reference_wrapper<const Derived>> &systems) {
+    using scalar_t = typename Derived::scalar_t;
+
+    if (systems.empty()) {
+        return {0, 0};
+    }
+
+    // Get the eigenbases, checking that they are expanded in the same kets
+    std::vector<std::shared_ptr<const typename Derived::basis_t>> eigenbases;
+    eigenbases.reserve(systems.size());
+    for (const auto &system : systems) {
+        eigenbases.push_back(system.get().get_eigenbasis());
+    }
+    const auto &kets = eigenbases.front()->get_kets();
+    for (const auto &eigenbasis : eigenbases) {
+        const auto &other_kets = eigenbasis->get_kets();
+        if (other_kets.size() != kets.size() ||
+            !std::equal(kets.begin(), kets.end(), other_kets.begin(),
+                        [](const auto &a, const auto &b) { return a == b || *a == *b; })) {
+            throw std::invalid_argument(
+                "The systems must be defined on the same basis to track their eigenstates.");
+        }
+    }
+
+    // Match the eigenstates of consecutive systems in parallel
+    std::vector<Eigen::VectorXi> matches(systems.size() - 1);
+    oneapi::tbb::parallel_for(size_t(0), matches.size(), [&](size_t idx) {
+        set_task_status("Matching eigenstates...");
+        Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> amplitudes =
+            eigenbases[idx]->get_coefficients().adjoint() * eigenbases[idx + 1]->get_coefficients();
+        Eigen::SparseMatrix<double, Eigen::RowMajor> overlaps =
+            amplitudes.cwiseAbs2().template cast<double>();
+        matches[idx] = match_states(overlaps);
+    });
+
+    // Chain the matchings
+    auto number_of_states = static_cast<Eigen::Index>(eigenbases.front()->get_number_of_states());
+    Eigen::MatrixXi indices(systems.size(), number_of_states);
+    indices.row(0) =
+        Eigen::VectorXi::LinSpaced(number_of_states, 0, static_cast<int>(number_of_states) - 1);
+    for (size_t k = 1; k < systems.size(); ++k) {
+        for (Eigen::Index i = 0; i < number_of_states; ++i) {
+            int previous = indices(k - 1, i);
+            indices(k, i) = previous == -1 ? -1 : matches[k - 1][previous];
+        }
+    }
+
+    return indices;
+}
+
+// Explicit instantiations
+template Eigen::MatrixXi
+track_states(const std::vector<std::reference_wrapper<const SystemAtom<double>>> &systems);
+template Eigen::MatrixXi track_states(
+    const std::vector<std::reference_wrapper<const SystemAtom<std::complex<double>>>> &systems);
+template Eigen::MatrixXi
+track_states(const std::vector<std::reference_wrapper<const SystemPair<double>>> &systems);
+template Eigen::MatrixXi track_states(
+    const std::vector<std::reference_wrapper<const SystemPair<std::complex<double>>>> &systems);
+
+} // namespace pairinteraction
@@ -0,0 +1,93 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/diagonalize/track_states.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/basis/BasisAtomCreator.hpp"
+#include "pairinteraction/database/Database.hpp"
+#include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
+#include "pairinteraction/diagonalize/diagonalize.hpp"
+#include "pairinteraction/system/SystemAtom.hpp"
+
+#include <cmath>
+#include <doctest/doctest.h>
+#include <stdexcept>
+#include <vector>
+
+namespace pairinteraction {
+
+constexpr double VOLT_PER_CM_IN_ATOMIC_UNITS = 1 / 5.14220675112e9;
+
+DOCTEST_TEST_CASE("match states by their overlaps") {
+    Eigen::SparseMatrix<double, Eigen::RowMajor> overlaps(3, 4);
+    overlaps.insert(0, 0) = 0.4;
+    overlaps.insert(0, 1) = 0.6;
+    overlaps.insert(1, 1) = 0.9;
+    overlaps.insert(1, 2) = 0.1;
+    overlaps.insert(2, 3) = 0.0;
+    overlaps.makeCompressed();
+
+    // The state 1 is matched first because of its larger overlap, so that the state 0 has to be
+    // matched to its second best partner, and the state 2 has no partner with a finite overlap
+    auto matches = match_states(overlaps);
+    DOCTEST_CHECK(matches[0] == 0);
+    DOCTEST_CHECK(matches[1] == 1);
+    DOCTEST_CHECK(matches[2] == -1);
+}
+
+DOCTEST_TEST_CASE("track the eigenstates of a Stark map") {
+    auto &database = Database::get_global_instance();
+    DiagonalizerEigen<double> diagonalizer;
+
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(58, 62)
+                     .restrict_quantum_number_l(0, 2)
+                     .restrict_quantum_number_m(0.5, 0.5)
+                     .create(database);
+
+    std::vector<SystemAtom<double>> systems;
+    for (int i = 0; i < 10; ++i) {
+        systems.emplace_back(basis);
+        systems.back().set_electric_field({0, 0, i * 0.1 * VOLT_PER_CM_IN_ATOMIC_UNITS});
+    }
+    diagonalize(systems, diagonalizer);
+
+    std::vector<std::reference_wrapper<const SystemAtom<double>>> references(systems.begin(),
+                                                                             systems.end());
+    auto indices = track_states(references);
+
+    DOCTEST_CHECK(indices.rows() == 10);
+    DOCTEST_CHECK(indices.cols() == static_cast<Eigen::Index>(basis->get_number_of_states()));
+
+    // In weak fields, every eigenstate is adiabatically connected to a unique eigenstate and its
+    // energy changes only slightly
+    for (int k = 1; k < indices.rows(); ++k) {
+        auto energies = systems[k].get_eigenenergies();
+        auto previous_energies = systems[k - 1].get_eigenenergies();
+        std::vector<bool> is_used(indices.cols(), false);
+        for (int i = 0; i < indices.cols(); ++i) {
+            int idx = indices(k, i);
+            int previous_idx = indices(k - 1, i);
+            DOCTEST_REQUIRE(idx >= 0);
+            DOCTEST_CHECK(!is_used[idx]);
+            is_used[idx] = true;
+            DOCTEST_CHECK(std::abs(energies[idx] - previous_energies[previous_idx]) < 1e-6);
+        }
+    }
+
+    // Systems that are defined on different bases can not be tracked
+    auto other_basis = BasisAtomCreator<double>()
+                           .set_species("Rb")
+                           .restrict_quantum_number_n(59, 61)
+                           .restrict_quantum_number_l(0, 2)
+                           .restrict_quantum_number_m(0.5, 0.5)
+                           .create(database);
+    SystemAtom<double> other_system(other_basis);
+    other_system.diagonalize(diagonalizer);
+    references.emplace_back(other_system);
+    DOCTEST_CHECK_THROWS_AS(track_states(references), std::invalid_argument);
+}
+
+} // namespace pairinteraction
@@ -4,13 +4,20 @@
 #include "pairinteraction/interfaces/DiagonalizerInterface.hpp"
 
 #include "pairinteraction/enums/FloatType.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/eigen_compat.hpp"
 
 #include <Eigen/Dense>
+#include <Eigen/Eigenvalues>
 #include <Eigen/SparseCore>
+#include <algorithm>
+#include <cmath>
+#include <limits>
+#include <numeric>
 #include <optional>
 #include <spdlog/spdlog.h>
+#include <vector>
 
 namespace pairinteraction {
 template <typename Scalar>
@@ -91,6 +98,159 @@ DiagonalizerInterface<Scalar>::add_mean(const Eigen::VectorX<RealLim> &shifted_e
     return eigenvalues;
 }
 
+// Estimate the spectral norm of a hermitian matrix by power iteration
+template <typename Scalar>
+typename traits::NumTraits<Scalar>::real_t
+estimate_spectral_norm(const Eigen::MatrixX<Scalar> &matrix) {
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    Eigen::VectorX<Scalar> vector = Eigen::VectorX<Scalar>::Ones(matrix.cols());
+    real_t norm = 0;
+    for (int iteration = 0; iteration < 10 && vector.norm() > 0; ++iteration) {
+        vector = matrix * vector.normalized();
+        norm = vector.norm();
+    }
+    return norm;
+}
+
+template <typename Scalar>
+double DiagonalizerInterface<Scalar>::get_rtol_before_refinement(double rtol) {
+    // Loosen the tolerance so that the diagonalization with single precision does not warn that
+    // the tolerance cannot be met, the refinement recovers the requested tolerance afterwards
+    return std::max(rtol, 10 * static_cast<double>(std::numeric_limits<float>::epsilon()));
+}
+
+template <typename Scalar>
+std::optional<EigenSystemH<Scalar>>
+DiagonalizerInterface<Scalar>::refine(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+                                      const EigenSystemH<Scalar> &eigensystem, double rtol) const {
+    // Refine the eigenpairs with the iterative method of Ogita and Aishima (Japan J. Indust. Appl.
+    // Math. 35, 1007 (2018)). Eigenvalues that are too close to be separated by a refinement step
+    // form clusters, whose eigenvectors are refined by a Rayleigh-Ritz projection instead.
+    constexpr int max_iterations = 5;
+    int dim = matrix.rows();
+
+    if (eigensystem.eigenvalues.size() != dim) {
+        add_to_profile_counter("DiagonalizerInterface::refine: number of fallbacks to float64");
+        return std::nullopt; // only complete eigensystems can be refined
+    }
+    if (dim == 0) {
+        add_to_profile_counter("DiagonalizerInterface::refine: number of iterations", 0);
+        return eigensystem;
+    }
+
+    // Subtract the mean of the diagonal elements from the diagonal
+    real_t shift = matrix.diagonal().real().mean();
+    Eigen::SparseMatrix<Scalar, Eigen::RowMajor> identity(dim, dim);
+    identity.setIdentity();
+    Eigen::SparseMatrix<Scalar, Eigen::RowMajor> shifted_matrix = matrix - shift * identity;
+
+    Eigen::MatrixX<Scalar> evecs = eigensystem.eigenvectors;
+    Eigen::VectorX<real_t> evals = eigensystem.eigenvalues.array() - shift;
+    real_t norm = evals.cwiseAbs().maxCoeff();
+    if (norm == 0) {
+        add_to_profile_counter("DiagonalizerInterface::refine: number of iterations", 0);
+        return eigensystem;
+    }
+
+    auto get_order = [&evals, dim]() {
+        std::vector<int> order(dim);
+        std::iota(order.begin(), order.end(), 0);
+        std::sort(order.begin(), order.end(), [&](int a, int b) { return evals[a] < evals[b]; });
+        return order;
+    };
+
+    for (int iteration = 0;; ++iteration) {
+        // The products with the sparse matrix are the only operations that involve the
+        // Hamiltonian, all other operations are dense matrix products of double precision
+        Eigen::MatrixX<Scalar> product = shifted_matrix * evecs;
+        Eigen::MatrixX<Scalar> s = evecs.adjoint() * product;
+        Eigen::MatrixX<Scalar> r = Eigen::MatrixX<Scalar>::Identity(dim, dim);
+        r.template selfadjointView<Eigen::Lower>().rankUpdate(evecs.adjoint(), -1);
+        r = r.template selfadjointView<Eigen::Lower>().toDenseMatrix();
+
+        // Rayleigh quotients, corrected for the deviation of the norms of the eigenvectors from one
+        evals = s.diagonal().real().array() / (1 - r.diagonal().real().array());
+
+        real_t max_residual = (product - evecs * evals.asDiagonal()).colwise().norm().maxCoeff();
+        if (max_residual <= 0.1 * rtol * norm && r.cwiseAbs().maxCoeff() <= 0.1 * rtol) {
+            add_to_profile_counter("DiagonalizerInterface::refine: number of iterations",
+                                   iteration);
+            break;
+        }
+        if (iteration == max_iterations) {
+            SPDLOG_DEBUG("The refinement of the eigensystem did not converge, the residual is {} * "
+                         "||H||.",
+                         max_residual / norm);
+            add_to_profile_counter("DiagonalizerInterface::refine: number of fallbacks to float64");
+            return std::nullopt;
+        }
+
+        // Group eigenvalues into clusters whose separation is below the accuracy of the
+        // current iterate
+        Eigen::MatrixX<Scalar> s_offdiagonal = s;
+        s_offdiagonal.diagonal().setZero();
+        real_t delta =
+            2 * (estimate_spectral_norm(s_offdiagonal) + norm * estimate_spectral_norm(r));
+
+        std::vector<int> order = get_order();
+        std::vector<int> cluster_of(dim);
+        std::vector<std::vector<int>> clusters;
+        for (int idx = 0; idx < dim; ++idx) {
+            if (idx == 0 || evals[order[idx]] - evals[order[idx - 1]] > delta) {
+                clusters.emplace_back();
+            }
+            clusters.back().push_back(order[idx]);
+            cluster_of[order[idx]] = static_cast<int>(clusters.size()) - 1;
+        }
+
+        // Refinement step
+        Eigen::MatrixX<Scalar> correction(dim, dim);
+        for (int j = 0; j < dim; ++j) {
+            for (int i = 0; i < dim; ++i) {
+                if (cluster_of[i] == cluster_of[j]) {
+                    correction(i, j) = r(i, j) / real_t(2);
+                } else {
+                    correction(i, j) = (s(i, j) + evals[j] * r(i, j)) / (evals[j] - evals[i]);
+                }
+            }
+        }
+        evecs += evecs * correction;
+
+        // Rayleigh-Ritz projection for each cluster
+        for (const auto &cluster : clusters) {
+            if (cluster.size() < 2) {
+                continue;
+            }
+            auto size = static_cast<Eigen::Index>(cluster.size());
+            Eigen::MatrixX<Scalar> subspace(dim, size);
+            for (Eigen::Index idx = 0; idx < size; ++idx) {
+                subspace.col(idx) = evecs.col(cluster[idx]);
+            }
+            Eigen::MatrixX<Scalar> projected_matrix =
+                subspace.adjoint() * (shifted_matrix * subspace);
+            Eigen::MatrixX<Scalar> overlap_matrix = subspace.adjoint() * subspace;
+            Eigen::GeneralizedSelfAdjointEigenSolver<Eigen::MatrixX<Scalar>> eigensolver(
+                projected_matrix, overlap_matrix);
+            subspace *= eigensolver.eigenvectors();
+            for (Eigen::Index idx = 0; idx < size; ++idx) {
+                evecs.col(cluster[idx]) = subspace.col(idx);
+            }
+        }
+    }
+
+    // Sort the eigenpairs by the eigenvalues
+    std::vector<int> order = get_order();
+    Eigen::MatrixX<Scalar> sorted_evecs(dim, dim);
+    Eigen::VectorX<real_t> sorted_evals(dim);
+    for (int idx = 0; idx < dim; ++idx) {
+        sorted_evecs.col(idx) = evecs.col(order[idx]);
+        sorted_evals[idx] = evals[order[idx]];
+    }
+
+    return EigenSystemH<Scalar>{sorted_evecs.sparseView(1, 0.5 * rtol / std::sqrt(dim)),
+                                this->add_mean(sorted_evals, shift)};
+}
+
 template <typename Scalar>
 EigenSystemH<Scalar>
 DiagonalizerInterface<Scalar>::eigh(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
@@ -8,6 +8,9 @@
 #include "pairinteraction/enums/Parity.hpp"
 
 #include <cmath>
+#include <map>
+#include <string>
+#include <utility>
 
 namespace pairinteraction {
 KetAtomCreator::KetAtomCreator(std::string species, int n, double l, double j, double m)
@@ -91,19 +94,48 @@ std::shared_ptr<const KetAtom> KetAtomCreator::create(Database &database) const
         throw std::runtime_error("Species not set.");
     }
 
-    AtomDescriptionByParameters description{parity,
-                                            energy,
-                                            quantum_number_f,
-                                            quantum_number_m,
-                                            quantum_number_n,
-                                            quantum_number_nu,
-                                            quantum_number_nui,
-                                            quantum_number_l,
-                                            quantum_number_s,
-                                            quantum_number_j,
-                                            quantum_number_l_ryd,
-                                            quantum_number_j_ryd};
-
-    return database.get_ket(species.value(), description);
+    return database.get_ket(species.value(), get_description());
+}
+
+std::vector<std::shared_ptr<const KetAtom>>
+KetAtomCreator::create_many(const std::vector<KetAtomCreator> &creators, Database &database) {
+    // Group the creators by species so that the kets of each species are obtained by a single
+    // database query
+    std::map<std::string, std::vector<size_t>> indices_per_species;
+    for (size_t i = 0; i < creators.size(); ++i) {
+        if (!creators[i].species.has_value()) {
+            throw std::runtime_error("Species not set.");
+        }
+        indices_per_species[creators[i].species.value()].push_back(i);
+    }
+
+    std::vector<std::shared_ptr<const KetAtom>> kets(creators.size());
+    for (const auto &[species, indices] : indices_per_species) {
+        std::vector<AtomDescriptionByParameters> descriptions;
+        descriptions.reserve(indices.size());
+        for (auto i : indices) {
+            descriptions.push_back(creators[i].get_description());
+        }
+        auto kets_of_species = database.get_kets(species, descriptions);
+        for (size_t k = 0; k < indices.size(); ++k) {
+            kets[indices[k]] = std::move(kets_of_species[k]);
+        }
+    }
+    return kets;
+}
+
+AtomDescriptionByParameters KetAtomCreator::get_description() const {
+    return {parity,
+            energy,
+            quantum_number_f,
+            quantum_number_m,
+            quantum_number_n,
+            quantum_number_nu,
+            quantum_number_nui,
+            quantum_number_l,
+            quantum_number_s,
+            quantum_number_j,
+            quantum_number_l_ryd,
+            quantum_number_j_ryd};
 }
 } // namespace pairinteraction
@@ -7,6 +7,7 @@
 #include "pairinteraction/ket/KetAtom.hpp"
 
 #include <doctest/doctest.h>
+#include <vector>
 
 namespace pairinteraction {
 DOCTEST_TEST_CASE("create a ket for rubidium") {
@@ -50,4 +51,30 @@ DOCTEST_TEST_CASE("test for equality") {
     DOCTEST_CHECK(*ket1 != *ket3);
 }
 
+DOCTEST_TEST_CASE("create many kets at once") {
+    Database &database = Database::get_global_instance();
+    std::vector<KetAtomCreator> creators;
+    for (int n = 58; n < 63; ++n) {
+        creators.emplace_back("Rb", n, 1, 0.5, 0.5);
+        creators.emplace_back("Rb", n, 1, 1.5, -0.5);
+    }
+    creators.push_back(KetAtomCreator()
+                           .set_species("Sr88_singlet")
+                           .set_quantum_number_n(60)
+                           .set_quantum_number_l(1)
+                           .set_quantum_number_f(1)
+                           .set_quantum_number_m(0)
+                           .set_quantum_number_s(0));
+
+    auto kets = KetAtomCreator::create_many(creators, database);
+    DOCTEST_REQUIRE(kets.size() == creators.size());
+    for (size_t i = 0; i < creators.size(); ++i) {
+        DOCTEST_CHECK(*kets[i] == *creators[i].create(database));
+    }
+
+    // Errors are reported as if the kets were created one by one
+    creators.emplace_back("Rb", 60, 1, 0.5, 1.5);
+    DOCTEST_CHECK_THROWS(KetAtomCreator::create_many(creators, database));
+}
+
 } // namespace pairinteraction
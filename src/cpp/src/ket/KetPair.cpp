@@ -10,21 +10,16 @@
 
 #include <limits>
 #include <string>
+#include <utility>
 
 namespace pairinteraction {
 template <typename Scalar>
-KetPair<Scalar>::KetPair(
-    Private /*unused*/, std::initializer_list<size_t> atomic_indices,
-    std::initializer_list<std::shared_ptr<const BasisAtom<Scalar>>> atomic_bases, real_t energy)
+KetPair<Scalar>::KetPair(Private /*unused*/, indices_t atomic_indices, bases_t atomic_bases,
+                         real_t energy)
     : Ket(energy, calculate_quantum_number_f(atomic_indices, atomic_bases),
           calculate_quantum_number_m(atomic_indices, atomic_bases),
           calculate_parity(atomic_indices, atomic_bases)),
-      atomic_indices(atomic_indices), atomic_bases(atomic_bases) {
-    if (atomic_indices.size() != atomic_bases.size()) {
-        throw std::invalid_argument(
-            "The number of atomic indices, and atomic bases must be the same.");
-    }
-}
+      atomic_indices(atomic_indices), atomic_bases(std::move(atomic_bases)) {}
 
 template <typename Scalar>
 std::string KetPair<Scalar>::get_label() const {
@@ -88,17 +83,16 @@ size_t KetPair<Scalar>::hash::operator()(const KetPair<Scalar> &k) const {
 }
 
 template <typename Scalar>
-typename KetPair<Scalar>::real_t KetPair<Scalar>::calculate_quantum_number_f(
-    const std::vector<size_t> & /*indices*/,
-    const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> & /*bases*/) {
+typename KetPair<Scalar>::real_t
+KetPair<Scalar>::calculate_quantum_number_f(const indices_t & /*indices*/,
+                                            const bases_t & /*bases*/) {
     // Because this ket state is not symmetrized, the quantum_number_f is not well-defined.
     return std::numeric_limits<real_t>::max();
 }
 
 template <typename Scalar>
-typename KetPair<Scalar>::real_t KetPair<Scalar>::calculate_quantum_number_m(
-    const std::vector<size_t> &indices,
-    const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> &bases) {
+typename KetPair<Scalar>::real_t
+KetPair<Scalar>::calculate_quantum_number_m(const indices_t &indices, const bases_t &bases) {
     for (const auto &basis : bases) {
         if (!basis->has_quantum_number_m()) {
             return std::numeric_limits<real_t>::max();
@@ -112,9 +106,7 @@ typename KetPair<Scalar>::real_t KetPair<Scalar>::calculate_quantum_number_m(
 }
 
 template <typename Scalar>
-Parity KetPair<Scalar>::calculate_parity(
-    const std::vector<size_t> & /*indices*/,
-    const std::vector<std::shared_ptr<const BasisAtom<Scalar>>> & /*bases*/) {
+Parity KetPair<Scalar>::calculate_parity(const indices_t & /*indices*/, const bases_t & /*bases*/) {
     // Because this ket state is not symmetrized, the parity is not well-defined.
     return Parity::UNKNOWN;
 }
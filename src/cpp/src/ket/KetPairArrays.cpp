@@ -0,0 +1,110 @@
+// SPDX-FileCopyrightText: 2024 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/ket/KetPairArrays.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/ket/KetPair.hpp"
+
+#include <cassert>
+#include <memory>
+#include <utility>
+
+namespace pairinteraction {
+template <typename Scalar>
+KetPairArrays<Scalar>::const_iterator::const_iterator(const KetPairArrays *arrays, size_t index)
+    : arrays(arrays), index(index) {}
+
+template <typename Scalar>
+bool KetPairArrays<Scalar>::const_iterator::operator==(const const_iterator &other) const {
+    return arrays == other.arrays && index == other.index;
+}
+
+template <typename Scalar>
+typename KetPairArrays<Scalar>::const_iterator::value_type
+KetPairArrays<Scalar>::const_iterator::operator*() const {
+    return (*arrays)[index];
+}
+
+template <typename Scalar>
+typename KetPairArrays<Scalar>::const_iterator &
+KetPairArrays<Scalar>::const_iterator::operator++() {
+    ++index;
+    return *this;
+}
+
+template <typename Scalar>
+KetPairArrays<Scalar>::KetPairArrays(bases_t atomic_bases, Eigen::VectorXi &&state_indices1,
+                                     Eigen::VectorXi &&state_indices2,
+                                     Eigen::VectorX<real_t> &&energies,
+                                     Eigen::VectorX<real_t> &&quantum_numbers_m)
+    : arrays(std::make_shared<const Arrays>(
+          Arrays{std::move(atomic_bases), std::move(state_indices1), std::move(state_indices2),
+                 std::move(energies), std::move(quantum_numbers_m)})) {
+    assert(arrays->state_indices1.size() == arrays->energies.size());
+    assert(arrays->state_indices2.size() == arrays->energies.size());
+    assert(arrays->quantum_numbers_m.size() == arrays->energies.size());
+}
+
+template <typename Scalar>
+size_t KetPairArrays<Scalar>::size() const {
+    return arrays->energies.size();
+}
+
+template <typename Scalar>
+bool KetPairArrays<Scalar>::empty() const {
+    return arrays->energies.size() == 0;
+}
+
+template <typename Scalar>
+std::shared_ptr<const typename KetPairArrays<Scalar>::ket_t>
+KetPairArrays<Scalar>::operator[](size_t ket_index) const {
+    auto idx = static_cast<Eigen::Index>(ket_index);
+    return std::make_shared<const ket_t>(
+        typename ket_t::Private(),
+        typename ket_t::indices_t{static_cast<size_t>(arrays->state_indices1[idx]),
+                                  static_cast<size_t>(arrays->state_indices2[idx])},
+        arrays->atomic_bases, arrays->energies[idx]);
+}
+
+template <typename Scalar>
+typename KetPairArrays<Scalar>::const_iterator KetPairArrays<Scalar>::begin() const {
+    return {this, 0};
+}
+
+template <typename Scalar>
+typename KetPairArrays<Scalar>::const_iterator KetPairArrays<Scalar>::end() const {
+    return {this, size()};
+}
+
+template <typename Scalar>
+const typename KetPairArrays<Scalar>::bases_t &KetPairArrays<Scalar>::get_atomic_bases() const {
+    return arrays->atomic_bases;
+}
+
+template <typename Scalar>
+const Eigen::VectorXi &KetPairArrays<Scalar>::get_state_indices1() const {
+    return arrays->state_indices1;
+}
+
+template <typename Scalar>
+const Eigen::VectorXi &KetPairArrays<Scalar>::get_state_indices2() const {
+    return arrays->state_indices2;
+}
+
+template <typename Scalar>
+const Eigen::VectorX<typename KetPairArrays<Scalar>::real_t> &
+KetPairArrays<Scalar>::get_energies() const {
+    return arrays->energies;
+}
+
+template <typename Scalar>
+const Eigen::VectorX<typename KetPairArrays<Scalar>::real_t> &
+KetPairArrays<Scalar>::get_quantum_numbers_m() const {
+    return arrays->quantum_numbers_m;
+}
+
+// Explicit instantiations
+template class KetPairArrays<double>;
+template class KetPairArrays<std::complex<double>>;
+} // namespace pairinteraction
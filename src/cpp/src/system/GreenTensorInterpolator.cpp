@@ -37,9 +37,10 @@ int GreenTensorInterpolator<Scalar>::ConstantEntry::col() const noexcept {
 
 template <typename Scalar>
 GreenTensorInterpolator<Scalar>::OmegaDependentEntry::OmegaDependentEntry(
-    int row, int col, Eigen::Spline<real_t, 1> real_spline, Eigen::Spline<real_t, 1> imag_spline)
+    int row, int col, Eigen::Spline<real_t, 1> real_spline, Eigen::Spline<real_t, 1> imag_spline,
+    double min_omega, double max_omega)
     : row_(row), col_(col), real_spline(std::move(real_spline)),
-      imag_spline(std::move(imag_spline)) {}
+      imag_spline(std::move(imag_spline)), min_omega_(min_omega), max_omega_(max_omega) {}
 
 template <typename Scalar>
 Scalar GreenTensorInterpolator<Scalar>::OmegaDependentEntry::val(double omega) const {
@@ -60,6 +61,16 @@ int GreenTensorInterpolator<Scalar>::OmegaDependentEntry::col() const noexcept {
     return col_;
 }
 
+template <typename Scalar>
+double GreenTensorInterpolator<Scalar>::OmegaDependentEntry::min_omega() const noexcept {
+    return min_omega_;
+}
+
+template <typename Scalar>
+double GreenTensorInterpolator<Scalar>::OmegaDependentEntry::max_omega() const noexcept {
+    return max_omega_;
+}
+
 template <typename Scalar>
 void GreenTensorInterpolator<Scalar>::create_entries_from_cartesian(
     int kappa1, int kappa2, const Eigen::MatrixX<Scalar> &tensor_in_cartesian_coordinates) {
@@ -154,8 +165,9 @@ void GreenTensorInterpolator<Scalar>::create_entries_from_cartesian(
                 vec_imag, spline_degree, knots);
         }
 
-        entries.emplace_back(
-            OmegaDependentEntry(row, col, std::move(real_spline), std::move(imag_spline)));
+        entries.emplace_back(OmegaDependentEntry(row, col, std::move(real_spline),
+                                                 std::move(imag_spline), knots.minCoeff(),
+                                                 knots.maxCoeff()));
     }
     entries_map[{kappa1, kappa2}] = std::move(entries);
 }
@@ -5,16 +5,20 @@
 
 #include "pairinteraction/basis/BasisAtom.hpp"
 #include "pairinteraction/basis/BasisPair.hpp"
+#include "pairinteraction/diagonalize/continuation.hpp"
 #include "pairinteraction/enums/TransformationType.hpp"
 #include "pairinteraction/interfaces/DiagonalizerInterface.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
 #include "pairinteraction/system/SystemPair.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/TaskControl.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/eigen_compat.hpp"
 
 #include <Eigen/SparseCore>
 #include <algorithm>
+#include <atomic>
+#include <cmath>
 #include <complex>
 #include <limits>
 #include <memory>
@@ -198,6 +202,7 @@ System<Derived> &System<Derived>::transform(const Transformation<scalar_t> &tran
     // A transformed system might have lost its block-diagonalizability if the
     // transformation was not a sorting
     blockdiagonalizing_labels.clear();
+    symmetry_axis.reset();
 
     return *this;
 }
@@ -221,7 +226,69 @@ System<Derived> &System<Derived>::transform(const Sorting &transformation) {
 template <typename Derived>
 System<Derived> &System<Derived>::diagonalize(const DiagonalizerInterface<scalar_t> &diagonalizer,
                                               std::optional<real_t> min_eigenenergy,
-                                              std::optional<real_t> max_eigenenergy, double rtol) {
+                                              std::optional<real_t> max_eigenenergy, double rtol,
+                                              bool auto_rotate) {
+    return diagonalize_blocks(diagonalizer, nullptr, min_eigenenergy, max_eigenenergy, rtol,
+                              auto_rotate);
+}
+
+template <typename Derived>
+System<Derived> &
+System<Derived>::diagonalize(const DiagonalizerInterface<scalar_t> &diagonalizer,
+                             std::vector<EigenSystemH<scalar_t>> &eigensystems_of_blocks,
+                             std::optional<real_t> min_eigenenergy,
+                             std::optional<real_t> max_eigenenergy, double rtol, bool auto_rotate) {
+    return diagonalize_blocks(diagonalizer, &eigensystems_of_blocks, min_eigenenergy,
+                              max_eigenenergy, rtol, auto_rotate);
+}
+
+template <typename Derived>
+std::optional<Eigen::SparseMatrix<typename System<Derived>::scalar_t, Eigen::RowMajor>>
+System<Derived>::get_rotator_to_symmetry_axis(double rtol) const {
+    if (!symmetry_axis.has_value() || !basis->has_quantum_number_m() || matrix.rows() == 0) {
+        return std::nullopt;
+    }
+
+    // Get the Euler angles of the rotation R so that R^dagger H R is the Hamiltonian with the
+    // symmetry axis as the quantization axis. If the axis lies within the xz-plane, we only rotate
+    // about the y-axis so that the rotator stays real.
+    const auto &[x, y, z] = *symmetry_axis;
+    real_t alpha = 0;
+    real_t beta = -std::atan2(std::hypot(x, y), z);
+    real_t gamma = 0;
+    if (y == 0) {
+        beta = -std::atan2(x, z);
+    } else {
+        gamma = -std::atan2(y, x);
+    }
+
+    auto rotator = get_rotator_of_states(alpha, beta, gamma);
+    if (!rotator.has_value()) {
+        SPDLOG_DEBUG("The kets are not closed under rotations, skipping the automatic rotation.");
+        return std::nullopt;
+    }
+
+    // The rotator is only unitary if the basis is closed under rotations
+    Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> identity(rotator->rows(), rotator->cols());
+    identity.setIdentity();
+    Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> deviation = rotator->adjoint() * *rotator;
+    deviation -= identity;
+    if (deviation.nonZeros() > 0 && deviation.coeffs().cwiseAbs().maxCoeff() > rtol) {
+        SPDLOG_DEBUG("The basis is not closed under rotations, skipping the automatic rotation.");
+        return std::nullopt;
+    }
+
+    return rotator;
+}
+
+template <typename Derived>
+System<Derived> &
+System<Derived>::diagonalize_blocks(const DiagonalizerInterface<scalar_t> &diagonalizer,
+                                    std::vector<EigenSystemH<scalar_t>> *eigensystems_of_blocks,
+                                    std::optional<real_t> min_eigenenergy,
+                                    std::optional<real_t> max_eigenenergy, double rtol,
+                                    bool auto_rotate) {
+    ScopedTimer timer("System::diagonalize");
     set_task_status("Preparing Hamiltonian...");
 
     if (hamiltonian_requires_construction) {
@@ -230,46 +297,146 @@ System<Derived> &System<Derived>::diagonalize(const DiagonalizerInterface<scalar
     }
 
     if (this->is_diagonal()) {
+        if (eigensystems_of_blocks != nullptr) {
+            eigensystems_of_blocks->clear();
+        }
         return *this;
     }
 
     Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> eigenvectors;
     Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> eigenenergies;
 
+    add_to_profile_counter("System::diagonalize: matrix dimension", matrix.rows());
+    add_to_profile_counter("System::diagonalize: matrix nnz", matrix.nonZeros());
+
+    // If the Hamiltonian is rotationally symmetric about an axis other than the quantization
+    // axis, diagonalize it in the rotated frame where the quantum number m is conserved. The
+    // eigenvectors are rotated back afterwards.
+    auto labels = blockdiagonalizing_labels;
+    std::optional<Eigen::SparseMatrix<scalar_t, Eigen::RowMajor>> rotator;
+    if (auto_rotate) {
+        ScopedTimer rotation_timer("System::diagonalize: rotation");
+        rotator = get_rotator_to_symmetry_axis(rtol);
+    }
+    if (rotator.has_value()) {
+        Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> rotated_matrix =
+            rotator->adjoint() * matrix * *rotator;
+
+        // Check that the rotation restores the conservation of m, neglecting couplings that are
+        // smaller than the tolerance
+        real_t max_coupling = 0.1 * rtol *
+            (matrix.nonZeros() == 0 ? real_t(0) : matrix.coeffs().cwiseAbs().maxCoeff());
+        bool is_m_conserved = true;
+        for (int row = 0; row < rotated_matrix.outerSize() && is_m_conserved; ++row) {
+            for (typename Eigen::SparseMatrix<scalar_t, Eigen::RowMajor>::InnerIterator it(
+                     rotated_matrix, row);
+                 it; ++it) {
+                if (std::abs(it.value()) > max_coupling &&
+                    std::abs(basis->get_quantum_number_m(it.row()) -
+                             basis->get_quantum_number_m(it.col())) > 0.25) {
+                    is_m_conserved = false;
+                    break;
+                }
+            }
+        }
+
+        if (is_m_conserved) {
+            matrix = std::move(rotated_matrix);
+            auto it = labels.begin();
+            if (it != labels.end() && *it == TransformationType::SORT_BY_QUANTUM_NUMBER_F) {
+                ++it;
+            }
+            labels.insert(it, TransformationType::SORT_BY_QUANTUM_NUMBER_M);
+            SPDLOG_DEBUG("Diagonalizing the Hamiltonian in the frame of its symmetry axis.");
+            add_to_profile_counter("System::diagonalize: number of rotated Hamiltonians");
+        } else {
+            SPDLOG_DEBUG("The rotated Hamiltonian does not conserve m, skipping the automatic "
+                         "rotation.");
+            rotator.reset();
+        }
+    }
+
     // Sort the Hamiltonian according to the block structure
-    if (!blockdiagonalizing_labels.empty()) {
-        auto sorter = get_sorter(blockdiagonalizing_labels);
+    if (!labels.empty()) {
+        ScopedTimer sorting_timer("System::diagonalize: sorting");
+        auto sorter = get_sorter(labels);
         matrix = matrix.twistedBy(sorter.matrix.inverse());
         basis = basis->transformed(sorter);
+        if (rotator.has_value()) {
+            *rotator = rotator->twistedBy(sorter.matrix.inverse());
+        }
     }
 
     // Get the indices of the blocks
-    auto blocks = get_indices_of_blocks(blockdiagonalizing_labels);
+    auto blocks = get_indices_of_blocks(labels);
 
-    assert((blockdiagonalizing_labels.empty() && blocks.size() == 1) ||
-           !blockdiagonalizing_labels.empty());
+    assert((labels.empty() && blocks.size() == 1) || !labels.empty());
 
     SPDLOG_DEBUG("Diagonalizing the Hamiltonian with {} blocks.", blocks.size());
+    add_to_profile_counter("System::diagonalize: number of blocks", blocks.size());
+
+    // The eigensystems of a previous, similar Hamiltonian can only be reused if the block
+    // structure agrees
+    bool has_previous_eigensystems = eigensystems_of_blocks != nullptr &&
+        eigensystems_of_blocks->size() == blocks.size() &&
+        std::equal(blocks.begin(), blocks.end(), eigensystems_of_blocks->begin(),
+                   [](const auto &block, const auto &eigensys) {
+                       return static_cast<Eigen::Index>(block.size()) ==
+                           eigensys.eigenvectors.rows();
+                   });
 
     // Diagonalize the blocks in parallel
     std::vector<Eigen::VectorX<real_t>> eigenenergies_blocks(blocks.size());
     std::vector<Eigen::SparseMatrix<scalar_t, Eigen::RowMajor>> eigenvectors_blocks(blocks.size());
+    std::atomic<size_t> number_of_continued_blocks = 0;
     oneapi::tbb::parallel_for(
         oneapi::tbb::blocked_range<size_t>(0, blocks.size()), [&](const auto &range) {
             for (size_t idx = range.begin(); idx != range.end(); ++idx) {
                 set_task_status("Diagonalizing Hamiltonian blocks...");
-                auto eigensys = min_eigenenergy.has_value() || max_eigenenergy.has_value()
-                    ? diagonalizer.eigh(matrix.block(blocks[idx].start, blocks[idx].start,
-                                                     blocks[idx].size(), blocks[idx].size()),
-                                        min_eigenenergy, max_eigenenergy, rtol)
-                    : diagonalizer.eigh(matrix.block(blocks[idx].start, blocks[idx].start,
-                                                     blocks[idx].size(), blocks[idx].size()),
-                                        rtol);
-                eigenvectors_blocks[idx] = eigensys.eigenvectors;
-                eigenenergies_blocks[idx] = eigensys.eigenvalues;
+                ScopedTimer block_timer("System::diagonalize: eigensolver");
+                add_to_profile_counter("System::diagonalize: block dimension", blocks[idx].size());
+                Eigen::SparseMatrix<scalar_t, Eigen::RowMajor> block = matrix.block(
+                    blocks[idx].start, blocks[idx].start, blocks[idx].size(), blocks[idx].size());
+
+                // Warm start from the eigenvectors of the previous Hamiltonian, fall back to the
+                // diagonalizer if the continuation does not converge
+                std::optional<EigenSystemH<scalar_t>> eigensys;
+                if (has_previous_eigensystems) {
+                    eigensys = continue_eigensystem(block, (*eigensystems_of_blocks)[idx],
+                                                    min_eigenenergy, max_eigenenergy, rtol);
+                    if (eigensys.has_value()) {
+                        ++number_of_continued_blocks;
+                    }
+                }
+                if (!eigensys.has_value()) {
+                    eigensys = min_eigenenergy.has_value() || max_eigenenergy.has_value()
+                        ? diagonalizer.eigh(block, min_eigenenergy, max_eigenenergy, rtol)
+                        : diagonalizer.eigh(block, rtol);
+                }
+
+                eigenvectors_blocks[idx] = std::move(eigensys->eigenvectors);
+                eigenenergies_blocks[idx] = std::move(eigensys->eigenvalues);
             }
         });
 
+    if (has_previous_eigensystems) {
+        SPDLOG_DEBUG("Continued the eigensystems of {} out of {} blocks.",
+                     number_of_continued_blocks.load(), blocks.size());
+        add_to_profile_counter("System::diagonalize: number of continued blocks",
+                               number_of_continued_blocks.load());
+    }
+
+    // The remaining steps combine the eigensystems of the blocks and fix the phases
+    ScopedTimer combining_timer("System::diagonalize: combining eigensystems");
+
+    // Store the eigensystems of the blocks so that they can be reused for a similar Hamiltonian
+    if (eigensystems_of_blocks != nullptr) {
+        eigensystems_of_blocks->resize(blocks.size());
+        for (size_t idx = 0; idx < blocks.size(); ++idx) {
+            (*eigensystems_of_blocks)[idx] = {eigenvectors_blocks[idx], eigenenergies_blocks[idx]};
+        }
+    }
+
     // Get the number of non-zeros per row of the combined eigenvector matrix
     std::vector<Eigen::Index> non_zeros_per_inner_index;
     non_zeros_per_inner_index.reserve(matrix.rows());
@@ -316,6 +483,13 @@ System<Derived> &System<Derived>::diagonalize(const DiagonalizerInterface<scalar
             eigenvectors.nonZeros() ==
             std::accumulate(non_zeros_per_inner_index.begin(), non_zeros_per_inner_index.end(), 0));
 
+        // Rotate the eigenvectors back into the frame of the user
+        if (rotator.has_value()) {
+            set_task_status("Rotating eigenvectors...");
+            eigenvectors =
+                (*rotator * eigenvectors).pruned(1, 0.5 * rtol / std::sqrt(matrix.rows()));
+        }
+
         // Get the combined eigenenergy matrix
         eigenenergies.reserve(Eigen::VectorXi::Constant(num_cols, 1));
         Eigen::Index offset = 0;
@@ -9,6 +9,7 @@
 #include "pairinteraction/enums/TransformationType.hpp"
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/system/GreenTensorInterpolator.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/eigen_compat.hpp"
 #include "pairinteraction/utils/operator.hpp"
@@ -22,12 +23,99 @@
 #include <iterator>
 #include <limits>
 #include <memory>
+#include <oneapi/tbb.h>
+#include <optional>
 #include <set>
 #include <spdlog/spdlog.h>
+#include <utility>
 #include <variant>
 #include <vector>
 
 namespace pairinteraction {
+// Estimate the numerical precision from the spread of the unperturbed energies so that we can
+// decide which terms of the Hamiltonian to keep
+template <typename Scalar>
+typename traits::NumTraits<Scalar>::real_t
+estimate_numerical_precision(const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &energies) {
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    Eigen::VectorX<real_t> diag = energies.diagonal().real();
+    real_t scale = (diag - diag.mean() * Eigen::VectorX<real_t>::Ones(diag.size())).norm();
+    return 100 * scale * std::numeric_limits<real_t>::epsilon();
+}
+
+// Get the axis to which all vectors are parallel or antiparallel, if there is such an axis
+template <typename Real>
+std::optional<std::array<Real, 3>>
+get_common_axis(const std::vector<std::array<Real, 3>> &vectors) {
+    if (vectors.empty()) {
+        return std::nullopt;
+    }
+    Eigen::Map<const Eigen::Vector3<Real>> axis(vectors.front().data());
+    for (const auto &vector : vectors) {
+        Eigen::Map<const Eigen::Vector3<Real>> vector_map(vector.data());
+        if (axis.cross(vector_map).norm() >
+            std::sqrt(std::numeric_limits<Real>::epsilon()) * axis.norm() * vector_map.norm()) {
+            return std::nullopt;
+        }
+    }
+    return vectors.front();
+}
+
+template <typename Scalar>
+SystemAtom<Scalar>::FieldOperators::FieldOperators(std::shared_ptr<const basis_t> basis,
+                                                   std::vector<std::pair<OperatorType, int>> terms)
+    : basis(std::move(basis)), terms(std::move(terms)) {}
+
+template <typename Scalar>
+const std::shared_ptr<const typename SystemAtom<Scalar>::basis_t> &
+SystemAtom<Scalar>::FieldOperators::get_basis() const {
+    return basis;
+}
+
+template <typename Scalar>
+const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &
+SystemAtom<Scalar>::FieldOperators::get_energies() const {
+    std::call_once(construction_flag, [this] { construct(); });
+    return energies;
+}
+
+template <typename Scalar>
+typename SystemAtom<Scalar>::real_t
+SystemAtom<Scalar>::FieldOperators::get_numerical_precision() const {
+    std::call_once(construction_flag, [this] { construct(); });
+    return numerical_precision;
+}
+
+template <typename Scalar>
+const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &
+SystemAtom<Scalar>::FieldOperators::get_operator(OperatorType type, int q) const {
+    std::call_once(construction_flag, [this] { construct(); });
+    return operators.at({type, q});
+}
+
+template <typename Scalar>
+void SystemAtom<Scalar>::FieldOperators::construct() const {
+    const auto &coefficients = basis->get_coefficients();
+
+    auto energies_in_canonical_basis = utils::get_energies_in_canonical_basis(basis);
+    numerical_precision = estimate_numerical_precision(energies_in_canonical_basis);
+    energies = coefficients.adjoint() * energies_in_canonical_basis * coefficients;
+
+    // Transform the operators from the canonical basis into the actual basis so that the
+    // construction of a Hamiltonian reduces to a weighted sum
+    std::vector<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>> matrices(terms.size());
+    tbb::parallel_for(size_t(0), terms.size(), [&](size_t idx) {
+        const auto &[type, q] = terms[idx];
+        matrices[idx] = coefficients.adjoint() *
+            basis->get_database().get_matrix_elements_in_canonical_basis(basis, basis, type, q) *
+            coefficients;
+    });
+
+    for (size_t idx = 0; idx < terms.size(); ++idx) {
+        operators.emplace(terms[idx], std::move(matrices[idx]));
+    }
+}
+
 template <typename Scalar>
 SystemAtom<Scalar>::SystemAtom(std::shared_ptr<const basis_t> basis)
     : System<SystemAtom<Scalar>>(std::move(basis)) {}
@@ -42,6 +130,7 @@ SystemAtom<Scalar> &SystemAtom<Scalar>::set_electric_field(const std::array<real
     }
 
     electric_field = field;
+    field_operators.reset();
 
     return *this;
 }
@@ -56,6 +145,7 @@ SystemAtom<Scalar> &SystemAtom<Scalar>::set_magnetic_field(const std::array<real
     }
 
     magnetic_field = field;
+    field_operators.reset();
 
     return *this;
 }
@@ -64,6 +154,7 @@ template <typename Scalar>
 SystemAtom<Scalar> &SystemAtom<Scalar>::set_diamagnetism_enabled(bool enable) {
     this->hamiltonian_requires_construction = true;
     diamagnetism_enabled = enable;
+    field_operators.reset();
     return *this;
 }
 
@@ -78,6 +169,7 @@ SystemAtom<Scalar>::set_ion_distance_vector(const std::array<real_t, 3> &vector)
     }
 
     ion_distance_vector = vector;
+    field_operators.reset();
 
     return *this;
 }
@@ -86,6 +178,7 @@ template <typename Scalar>
 SystemAtom<Scalar> &SystemAtom<Scalar>::set_ion_charge(real_t charge) {
     this->hamiltonian_requires_construction = true;
     ion_charge = charge;
+    field_operators.reset();
     return *this;
 }
 
@@ -96,6 +189,7 @@ SystemAtom<Scalar> &SystemAtom<Scalar>::set_ion_interaction_order(int value) {
         throw std::invalid_argument("The order of the Rydberg-ion interaction must be 2 or 3");
     }
     ion_interaction_order = value;
+    field_operators.reset();
     return *this;
 }
 
@@ -104,14 +198,29 @@ SystemAtom<Scalar> &SystemAtom<Scalar>::set_green_tensor_interpolator(
     const std::shared_ptr<const GreenTensorInterpolator<Scalar>> &green_tensor_interpolator) {
     this->hamiltonian_requires_construction = true;
     this->green_tensor_interpolator = green_tensor_interpolator;
+    field_operators.reset();
     return *this;
 }
 
 template <typename Scalar>
 void SystemAtom<Scalar>::construct_hamiltonian() const {
-    auto get_operator_matrix = [this](OperatorType type, int q = 0) {
-        return this->basis->get_database().get_matrix_elements_in_canonical_basis(
-            this->basis, this->basis, type, q);
+    ScopedTimer timer("SystemAtom::construct_hamiltonian");
+
+    // If the system belongs to a scan, the operators are shared by all systems of the scan and
+    // already transformed into the actual basis
+    bool use_field_operators = field_operators && field_operators->get_basis() == this->basis;
+
+    Eigen::SparseMatrix<Scalar, Eigen::RowMajor> queried_operator_matrix;
+    auto get_operator_matrix =
+        [this, use_field_operators, &queried_operator_matrix](
+            OperatorType type, int q = 0) -> const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> & {
+        if (use_field_operators) {
+            return field_operators->get_operator(type, q);
+        }
+        queried_operator_matrix =
+            this->basis->get_database().get_matrix_elements_in_canonical_basis(
+                this->basis, this->basis, type, q);
+        return queried_operator_matrix;
     };
     // Helper function for constructing matrices of spherical harmonics operators in the
     // canonical basis. The full Hamiltonian is transformed into the actual basis at the end.
@@ -130,18 +239,20 @@ void SystemAtom<Scalar>::construct_hamiltonian() const {
     };
 
     // Construct the unperturbed Hamiltonian in the canonical atomic basis
-    this->matrix = utils::get_energies_in_canonical_basis(this->basis);
+    real_t numerical_precision = 0;
+    if (use_field_operators) {
+        this->matrix = field_operators->get_energies();
+        numerical_precision = field_operators->get_numerical_precision();
+    } else {
+        this->matrix = utils::get_energies_in_canonical_basis(this->basis);
+        numerical_precision = estimate_numerical_precision(this->matrix);
+    }
 
     this->hamiltonian_is_diagonal = false;
     bool sort_by_quantum_number_f = this->basis->has_quantum_number_f();
     bool sort_by_quantum_number_m = this->basis->has_quantum_number_m();
     bool sort_by_parity = this->basis->has_parity();
 
-    // Estimate the numerical precision so that we can decide which terms to keep
-    Eigen::VectorX<real_t> diag = this->matrix.diagonal().real();
-    real_t scale = (diag - diag.mean() * Eigen::VectorX<real_t>::Ones(diag.size())).norm();
-    real_t numerical_precision = 100 * scale * std::numeric_limits<real_t>::epsilon();
-
     real_t typical_magnetic_dipole = 1e2;     // ~n^1
     real_t typical_electric_dipole = 1e4;     // ~n^2
     real_t typical_electric_quadrupole = 1e8; // ~n^4
@@ -348,8 +459,10 @@ void SystemAtom<Scalar>::construct_hamiltonian() const {
     }
 
     // Transform from the canonical basis into the actual basis
-    this->matrix =
-        this->basis->get_coefficients().adjoint() * this->matrix * this->basis->get_coefficients();
+    if (!use_field_operators) {
+        this->matrix = this->basis->get_coefficients().adjoint() * this->matrix *
+            this->basis->get_coefficients();
+    }
 
     // Store which labels can be used to block-diagonalize the Hamiltonian
     this->blockdiagonalizing_labels.clear();
@@ -362,6 +475,28 @@ void SystemAtom<Scalar>::construct_hamiltonian() const {
     if (sort_by_parity) {
         this->blockdiagonalizing_labels.push_back(TransformationType::SORT_BY_PARITY);
     }
+
+    // If m is not conserved, the Hamiltonian might still be rotationally symmetric about the
+    // common axis of the fields and the ion
+    this->symmetry_axis.reset();
+    if (!sort_by_quantum_number_m && !green_tensor_interpolator) {
+        std::vector<std::array<real_t, 3>> vectors;
+        if (std::isfinite(distance) && ion_interaction_order >= 2) {
+            vectors.push_back(ion_distance_vector);
+        }
+        for (const auto &field : {electric_field, magnetic_field}) {
+            if (field != std::array<real_t, 3>{0, 0, 0}) {
+                vectors.push_back(field);
+            }
+        }
+        this->symmetry_axis = get_common_axis(vectors);
+    }
+}
+
+template <typename Scalar>
+std::optional<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+SystemAtom<Scalar>::get_rotator_of_states(real_t alpha, real_t beta, real_t gamma) const {
+    return utils::get_rotator_of_states(this->basis, alpha, beta, gamma);
 }
 
 // Explicit instantiations
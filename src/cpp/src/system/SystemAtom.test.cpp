@@ -14,17 +14,26 @@
 #include "pairinteraction/enums/FloatType.hpp"
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/ket/KetAtomCreator.hpp"
+#include "pairinteraction/system/SystemAtomScan.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 
 #include <Eigen/Eigenvalues>
+#include <algorithm>
+#include <array>
 #include <cmath>
+#include <complex>
 #include <doctest/doctest.h>
 #include <fmt/ranges.h>
+#include <stdexcept>
+#include <string>
+#include <vector>
 
 namespace pairinteraction {
 
 constexpr double VOLT_PER_CM_IN_ATOMIC_UNITS = 1 / 5.14220675112e9;
 constexpr double UM_IN_ATOMIC_UNITS = 1 / 5.29177210544e-5;
 constexpr double HARTREE_IN_GHZ = 6579683.920501762;
+constexpr double GAUSS_IN_ATOMIC_UNITS = 1 / 2.35051757077e9;
 
 DOCTEST_TEST_CASE("construct and diagonalize a small Hamiltonian") {
     auto &database = Database::get_global_instance();
@@ -134,6 +143,47 @@ DOCTEST_TEST_CASE("construct an atomic Hamiltonian in a non-canonical atomic bas
     DOCTEST_CHECK(transformed_system.get_matrix().isApprox(expected_matrix, 1e-11));
 }
 
+DOCTEST_TEST_CASE("construct atomic Hamiltonians for a scan of fields") {
+    auto &database = Database::get_global_instance();
+
+    auto basis = BasisAtomCreator<std::complex<double>>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(59, 61)
+                     .restrict_quantum_number_l(0, 2)
+                     .create(database);
+
+    std::vector<std::array<double, 3>> electric_fields;
+    std::vector<std::array<double, 3>> magnetic_fields;
+    for (double field : {0.0, 0.5, 1.0}) {
+        electric_fields.push_back({0, field * VOLT_PER_CM_IN_ATOMIC_UNITS, 0});
+        magnetic_fields.push_back(
+            {field * 100 * GAUSS_IN_ATOMIC_UNITS, 0, 50 * GAUSS_IN_ATOMIC_UNITS});
+    }
+    std::vector<std::array<double, 3>> ion_distance_vectors{{0, 0, 20 * UM_IN_ATOMIC_UNITS}};
+
+    SystemAtomScan<std::complex<double>> scan(basis);
+    scan.set_electric_fields(electric_fields)
+        .set_magnetic_fields(magnetic_fields)
+        .set_ion_distance_vectors(ion_distance_vectors)
+        .set_diamagnetism_enabled(true);
+    DOCTEST_REQUIRE(scan.get_systems().size() == electric_fields.size());
+
+    for (size_t i = 0; i < electric_fields.size(); ++i) {
+        SystemAtom<std::complex<double>> reference_system(basis);
+        reference_system.set_electric_field(electric_fields[i])
+            .set_magnetic_field(magnetic_fields[i])
+            .set_ion_distance_vector(ion_distance_vectors[0])
+            .set_diamagnetism_enabled(true);
+
+        Eigen::SparseMatrix<std::complex<double>, Eigen::RowMajor> difference =
+            scan.get_systems()[i]->get_matrix() - reference_system.get_matrix();
+        DOCTEST_CHECK(difference.norm() <= 1e-11 * reference_system.get_matrix().norm());
+    }
+
+    DOCTEST_CHECK_THROWS_AS(scan.set_ion_distance_vectors({{0, 0, 1}, {0, 0, 2}}),
+                            std::invalid_argument);
+}
+
 DOCTEST_TEST_CASE("construct and diagonalize multiple Hamiltonians in parallel" *
                   doctest::skip(true)) {
     // TODO For a slow database, the fast parallelized construction of the tiny Hamiltonians seems
@@ -187,6 +237,7 @@ DOCTEST_TEST_CASE("construct and diagonalize a Hamiltonian using different metho
     std::vector<std::unique_ptr<DiagonalizerInterface<std::complex<double>>>> diagonalizers;
     std::vector<double> rtols;
     double eps{};
+    bool is_refined = false;
     DOCTEST_SUBCASE("Double precision") {
         diagonalizers.push_back(std::make_unique<DiagonalizerEigen<std::complex<double>>>());
 #ifdef WITH_LAPACKE
@@ -217,6 +268,24 @@ DOCTEST_TEST_CASE("construct and diagonalize a Hamiltonian using different metho
         eps = std::numeric_limits<float>::epsilon();
     }
 
+    DOCTEST_SUBCASE("Single precision with refinement") {
+        diagonalizers.push_back(
+            std::make_unique<DiagonalizerEigen<std::complex<double>>>(FloatType::FLOAT32_REFINED));
+#ifdef WITH_LAPACKE
+        diagonalizers.push_back(std::make_unique<DiagonalizerLapackeEvd<std::complex<double>>>(
+            FloatType::FLOAT32_REFINED));
+        diagonalizers.push_back(std::make_unique<DiagonalizerLapackeEvr<std::complex<double>>>(
+            FloatType::FLOAT32_REFINED));
+#endif
+#ifdef WITH_MKL
+        diagonalizers.push_back(std::make_unique<DiagonalizerFeast<std::complex<double>>>(
+            300, FloatType::FLOAT32_REFINED));
+#endif
+        rtols = {1e-1, 1e-6, 1e-9};
+        eps = std::numeric_limits<double>::epsilon();
+        is_refined = true;
+    }
+
     // Diagonalize using pairinteraction
     for (double rtol_eigenenergies : rtols) {
         double atol_eigenvectors =
@@ -230,11 +299,26 @@ DOCTEST_TEST_CASE("construct and diagonalize a Hamiltonian using different metho
                                        2 * VOLT_PER_CM_IN_ATOMIC_UNITS,
                                        3 * VOLT_PER_CM_IN_ATOMIC_UNITS});
 
+            reset_profile();
+
             // We specify a search interval because this is required if the FEAST routine is
             // used. To avoid overflows, the interval ranges from half the smallest possible
             // value to half the largest possible value.
             system.diagonalize(*diagonalizer, std::numeric_limits<float>::lowest() / 2,
                                std::numeric_limits<float>::max() / 2, rtol_eigenenergies);
+
+            // Check that the eigenpairs were refined rather than diagonalized again with double
+            // precision, FEAST does not compute the complete eigensystem and is never refined
+            if (is_refined &&
+                dynamic_cast<DiagonalizerFeast<std::complex<double>> *>(diagonalizer.get()) ==
+                    nullptr) {
+                auto profile = get_profile_as_json();
+                DOCTEST_CHECK(profile.find("DiagonalizerInterface::refine: number of iterations") !=
+                              std::string::npos);
+                DOCTEST_CHECK(profile.find("DiagonalizerInterface::refine: number of fallbacks") ==
+                              std::string::npos);
+            }
+
             auto eigenenergies_pairinteraction = system.get_eigenenergies();
             auto eigenvectors_pairinteraction = system.get_eigenbasis()->get_coefficients();
 
@@ -401,4 +485,65 @@ DOCTEST_TEST_CASE("atom ion interaction") {
     }
 }
 
+DOCTEST_TEST_CASE("diagonalize a Hamiltonian with tilted fields in the frame of the fields") {
+    auto &database = Database::get_global_instance();
+    DiagonalizerEigen<std::complex<double>> diagonalizer;
+
+    auto basis = BasisAtomCreator<std::complex<double>>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(59, 61)
+                     .restrict_quantum_number_l(0, 2)
+                     .create(database);
+
+    // Parallel electric and magnetic fields that are tilted with respect to the quantization axis
+    std::array<double, 3> direction{1, 2, 3};
+    auto create_system = [&]() {
+        SystemAtom<std::complex<double>> system(basis);
+        std::array<double, 3> electric_field{};
+        std::array<double, 3> magnetic_field{};
+        for (size_t i = 0; i < 3; ++i) {
+            electric_field[i] = direction[i] * VOLT_PER_CM_IN_ATOMIC_UNITS;
+            magnetic_field[i] = direction[i] * 10 * GAUSS_IN_ATOMIC_UNITS;
+        }
+        system.set_electric_field(electric_field).set_magnetic_field(magnetic_field);
+        return system;
+    };
+
+    auto reference_system = create_system();
+    reference_system.diagonalize(diagonalizer, {}, {}, 1e-10);
+
+    reset_profile();
+    auto system = create_system();
+    Eigen::MatrixXcd matrix = system.get_matrix();
+    system.diagonalize(diagonalizer, {}, {}, 1e-10, true);
+    DOCTEST_CHECK(get_profile_as_json().find("number of rotated Hamiltonians") !=
+                  std::string::npos);
+
+    // The eigenenergies agree with the ones obtained without the rotation
+    auto eigenenergies = system.get_eigenenergies();
+    auto reference_eigenenergies = reference_system.get_eigenenergies();
+    DOCTEST_REQUIRE(eigenenergies.size() == reference_eigenenergies.size());
+    std::sort(eigenenergies.begin(), eigenenergies.end());
+    std::sort(reference_eigenenergies.begin(), reference_eigenenergies.end());
+    for (Eigen::Index i = 0; i < eigenenergies.size(); ++i) {
+        DOCTEST_CHECK(std::abs(eigenenergies[i] - reference_eigenenergies[i]) * HARTREE_IN_GHZ <
+                      1e-6);
+    }
+
+    // The eigenvectors are given in the frame of the user and diagonalize the original Hamiltonian
+    Eigen::MatrixXcd eigenvectors =
+        basis->get_coefficients().adjoint() * system.get_eigenbasis()->get_coefficients();
+    Eigen::MatrixXcd diagonalized = eigenvectors.adjoint() * matrix * eigenvectors;
+    diagonalized.diagonal().setZero();
+    DOCTEST_CHECK(diagonalized.norm() * HARTREE_IN_GHZ < 1e-6);
+
+    // Without a common axis of the fields, the Hamiltonian is not rotated
+    reset_profile();
+    auto tilted_system = create_system();
+    tilted_system.set_magnetic_field({0, 0, 10 * GAUSS_IN_ATOMIC_UNITS});
+    tilted_system.diagonalize(diagonalizer, {}, {}, 1e-10, true);
+    DOCTEST_CHECK(get_profile_as_json().find("number of rotated Hamiltonians") ==
+                  std::string::npos);
+}
+
 } // namespace pairinteraction
@@ -0,0 +1,181 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/system/SystemAtomScan.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/enums/OperatorType.hpp"
+#include "pairinteraction/system/SystemAtom.hpp"
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <complex>
+#include <limits>
+#include <memory>
+#include <stdexcept>
+#include <utility>
+#include <vector>
+
+namespace pairinteraction {
+template <typename Scalar>
+SystemAtomScan<Scalar>::SystemAtomScan(std::shared_ptr<const basis_t> basis)
+    : basis(std::move(basis)) {}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &
+SystemAtomScan<Scalar>::set_electric_fields(const std::vector<std::array<real_t, 3>> &fields) {
+    electric_fields = fields;
+    create_systems();
+    return *this;
+}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &
+SystemAtomScan<Scalar>::set_magnetic_fields(const std::vector<std::array<real_t, 3>> &fields) {
+    magnetic_fields = fields;
+    create_systems();
+    return *this;
+}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &SystemAtomScan<Scalar>::set_diamagnetism_enabled(bool enable) {
+    diamagnetism_enabled = enable;
+    create_systems();
+    return *this;
+}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &SystemAtomScan<Scalar>::set_ion_distance_vectors(
+    const std::vector<std::array<real_t, 3>> &vectors) {
+    ion_distance_vectors = vectors;
+    create_systems();
+    return *this;
+}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &SystemAtomScan<Scalar>::set_ion_charge(real_t charge) {
+    ion_charge = charge;
+    create_systems();
+    return *this;
+}
+
+template <typename Scalar>
+SystemAtomScan<Scalar> &SystemAtomScan<Scalar>::set_ion_interaction_order(int value) {
+    if (value < 2 || value > 3) {
+        throw std::invalid_argument("The order of the Rydberg-ion interaction must be 2 or 3");
+    }
+
+    ion_interaction_order = value;
+    create_systems();
+
+    return *this;
+}
+
+template <typename Scalar>
+std::shared_ptr<const typename SystemAtomScan<Scalar>::basis_t>
+SystemAtomScan<Scalar>::get_basis() const {
+    return basis;
+}
+
+template <typename Scalar>
+const std::vector<std::array<typename SystemAtomScan<Scalar>::real_t, 3>> &
+SystemAtomScan<Scalar>::get_electric_fields() const {
+    return electric_fields;
+}
+
+template <typename Scalar>
+const std::vector<std::array<typename SystemAtomScan<Scalar>::real_t, 3>> &
+SystemAtomScan<Scalar>::get_magnetic_fields() const {
+    return magnetic_fields;
+}
+
+template <typename Scalar>
+const std::vector<std::array<typename SystemAtomScan<Scalar>::real_t, 3>> &
+SystemAtomScan<Scalar>::get_ion_distance_vectors() const {
+    return ion_distance_vectors;
+}
+
+template <typename Scalar>
+const std::vector<std::shared_ptr<typename SystemAtomScan<Scalar>::system_t>> &
+SystemAtomScan<Scalar>::get_systems() const {
+    return systems;
+}
+
+template <typename Scalar>
+void SystemAtomScan<Scalar>::create_systems() {
+    size_t number_of_systems =
+        std::max({electric_fields.size(), magnetic_fields.size(), ion_distance_vectors.size()});
+    for (size_t size :
+         {electric_fields.size(), magnetic_fields.size(), ion_distance_vectors.size()}) {
+        if (size > 1 && size != number_of_systems) {
+            throw std::invalid_argument(
+                "The numbers of electric fields, magnetic fields, and ion distance vectors must "
+                "either agree or be at most one.");
+        }
+    }
+
+    auto get_element = [](const std::vector<std::array<real_t, 3>> &vectors, size_t idx,
+                          std::array<real_t, 3> default_value) {
+        if (vectors.empty()) {
+            return default_value;
+        }
+        return vectors.size() == 1 ? vectors.front() : vectors[idx];
+    };
+    auto is_nonzero = [](const std::array<real_t, 3> &vector) {
+        return std::ranges::any_of(vector, [](real_t v) { return v != 0; });
+    };
+    auto is_finite = [](const std::array<real_t, 3> &vector) {
+        return std::ranges::all_of(vector, [](real_t v) { return std::isfinite(v); });
+    };
+
+    // Collect the operators that are required by any of the systems. The operators are
+    // calculated lazily when the first Hamiltonian is constructed.
+    bool has_electric_field = std::ranges::any_of(electric_fields, is_nonzero);
+    bool has_magnetic_field = std::ranges::any_of(magnetic_fields, is_nonzero);
+    bool has_ion = std::ranges::any_of(ion_distance_vectors, is_finite);
+
+    std::vector<std::pair<OperatorType, int>> terms;
+    if (has_electric_field || has_ion) {
+        for (int q = -1; q <= 1; ++q) {
+            terms.emplace_back(OperatorType::ELECTRIC_DIPOLE, q);
+        }
+    }
+    if (has_magnetic_field) {
+        for (int q = -1; q <= 1; ++q) {
+            terms.emplace_back(OperatorType::MAGNETIC_DIPOLE, q);
+        }
+    }
+    if ((diamagnetism_enabled && has_magnetic_field) || (has_ion && ion_interaction_order >= 3)) {
+        for (int q = -2; q <= 2; ++q) {
+            terms.emplace_back(OperatorType::ELECTRIC_QUADRUPOLE, q);
+        }
+    }
+    if (diamagnetism_enabled && has_magnetic_field) {
+        terms.emplace_back(OperatorType::ELECTRIC_QUADRUPOLE_ZERO, 0);
+    }
+
+    auto field_operators =
+        std::make_shared<const typename system_t::FieldOperators>(basis, std::move(terms));
+
+    constexpr real_t infinity = std::numeric_limits<real_t>::infinity();
+    std::vector<std::shared_ptr<system_t>> new_systems;
+    new_systems.reserve(number_of_systems);
+    for (size_t idx = 0; idx < number_of_systems; ++idx) {
+        auto system = std::make_shared<system_t>(basis);
+        system->set_electric_field(get_element(electric_fields, idx, {0, 0, 0}));
+        system->set_magnetic_field(get_element(magnetic_fields, idx, {0, 0, 0}));
+        system->set_diamagnetism_enabled(diamagnetism_enabled);
+        system->set_ion_distance_vector(get_element(ion_distance_vectors, idx, {0, 0, infinity}));
+        system->set_ion_charge(ion_charge);
+        system->set_ion_interaction_order(ion_interaction_order);
+        system->field_operators = field_operators;
+        new_systems.push_back(std::move(system));
+    }
+    systems = std::move(new_systems);
+}
+
+// Explicit instantiations
+template class SystemAtomScan<double>;
+template class SystemAtomScan<std::complex<double>>;
+} // namespace pairinteraction
@@ -13,6 +13,7 @@
 #include "pairinteraction/ket/KetPair.hpp"
 #include "pairinteraction/system/GreenTensorInterpolator.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
 #include "pairinteraction/utils/Range.hpp"
 #include "pairinteraction/utils/eigen_assertion.hpp"
 #include "pairinteraction/utils/eigen_compat.hpp"
@@ -23,12 +24,20 @@
 #include "pairinteraction/utils/traits.hpp"
 
 #include <Eigen/SparseCore>
+#include <algorithm>
 #include <array>
 #include <cmath>
 #include <complex>
+#include <fmt/core.h>
 #include <limits>
 #include <memory>
+#include <oneapi/tbb.h>
+#include <optional>
+#include <set>
 #include <spdlog/spdlog.h>
+#include <unordered_map>
+#include <utility>
+#include <variant>
 #include <vector>
 
 namespace pairinteraction {
@@ -152,7 +161,7 @@ GreenTensorInterpolator<Scalar> construct_green_tensor_interpolator(
 
 template <typename Scalar>
 OperatorMatrices<Scalar>
-construct_operator_matrices(const GreenTensorInterpolator<Scalar> &green_tensor_interpolator,
+construct_operator_matrices(const std::set<std::pair<int, int>> &kappas,
                             const std::shared_ptr<const BasisAtom<Scalar>> &basis1,
                             const std::shared_ptr<const BasisAtom<Scalar>> &basis2) {
     // Helper function for constructing matrices of spherical harmonics operators
@@ -176,21 +185,17 @@ construct_operator_matrices(const GreenTensorInterpolator<Scalar> &green_tensor_
     OperatorMatrices<Scalar> op;
 
     // Operator matrices for Rydberg-Rydberg interaction
-    if (!green_tensor_interpolator.get_spherical_entries(1, 1).empty() ||
-        !green_tensor_interpolator.get_spherical_entries(1, 2).empty()) {
+    if (kappas.contains({1, 1}) || kappas.contains({1, 2})) {
         op.d1 = get_matrices(basis1, OperatorType::ELECTRIC_DIPOLE, {-1, 0, +1}, true);
     }
-    if (!green_tensor_interpolator.get_spherical_entries(1, 1).empty() ||
-        !green_tensor_interpolator.get_spherical_entries(2, 1).empty()) {
+    if (kappas.contains({1, 1}) || kappas.contains({2, 1})) {
         op.d2 = get_matrices(basis2, OperatorType::ELECTRIC_DIPOLE, {-1, 0, +1}, false);
     }
-    if (!green_tensor_interpolator.get_spherical_entries(2, 2).empty() ||
-        !green_tensor_interpolator.get_spherical_entries(2, 1).empty()) {
+    if (kappas.contains({2, 2}) || kappas.contains({2, 1})) {
         op.q1 = get_matrices(basis1, OperatorType::ELECTRIC_QUADRUPOLE, {-2, -1, 0, +1, +2}, true);
         op.q1.push_back(get_matrices(basis1, OperatorType::ELECTRIC_QUADRUPOLE_ZERO, {0}, true)[0]);
     }
-    if (!green_tensor_interpolator.get_spherical_entries(2, 2).empty() ||
-        !green_tensor_interpolator.get_spherical_entries(1, 2).empty()) {
+    if (kappas.contains({2, 2}) || kappas.contains({1, 2})) {
         op.q2 = get_matrices(basis2, OperatorType::ELECTRIC_QUADRUPOLE, {-2, -1, 0, +1, +2}, false);
         op.q2.push_back(
             get_matrices(basis2, OperatorType::ELECTRIC_QUADRUPOLE_ZERO, {0}, false)[0]);
@@ -199,6 +204,150 @@ construct_operator_matrices(const GreenTensorInterpolator<Scalar> &green_tensor_
     return op;
 }
 
+template <typename Scalar>
+std::set<std::pair<int, int>>
+get_kappas_with_entries(const GreenTensorInterpolator<Scalar> &green_tensor_interpolator) {
+    std::set<std::pair<int, int>> kappas;
+    for (const auto &[kappa1, kappa2] :
+         std::initializer_list<std::pair<int, int>>{{1, 1}, {1, 2}, {2, 1}, {2, 2}}) {
+        if (!green_tensor_interpolator.get_spherical_entries(kappa1, kappa2).empty()) {
+            kappas.emplace(kappa1, kappa2);
+        }
+    }
+    return kappas;
+}
+
+template <typename Scalar>
+Eigen::VectorX<typename traits::NumTraits<Scalar>::real_t>
+get_energies_of_states(const std::shared_ptr<const BasisAtom<Scalar>> &basis) {
+    // The energies of the states are approximated by the expectation values of the energies of the
+    // kets, neglecting the energy shifts due to fields
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+    Eigen::VectorX<real_t> energies_of_kets(basis->get_number_of_kets());
+    for (Eigen::Index idx = 0; idx < energies_of_kets.size(); ++idx) {
+        energies_of_kets[idx] = basis->get_ket(static_cast<size_t>(idx))->get_energy();
+    }
+    Eigen::SparseMatrix<real_t, Eigen::RowMajor> probabilities =
+        basis->get_coefficients().cwiseAbs2();
+    return probabilities.transpose() * energies_of_kets;
+}
+
+template <typename Scalar>
+Eigen::SparseMatrix<Scalar, Eigen::RowMajor> weight_by_omega_dependent_entry(
+    const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &matrix,
+    const Eigen::VectorX<typename traits::NumTraits<Scalar>::real_t> &energies,
+    const typename GreenTensorInterpolator<Scalar>::OmegaDependentEntry &entry) {
+    // Multiply each matrix element by the entry of the Green tensor at the transition frequency of
+    // the matrix element. The transition frequencies are grouped into narrow bins so that the
+    // spline is evaluated only once per distinct transition frequency. The bins are much narrower
+    // than the frequency scale on which Green tensors vary, e.g., the linewidth of a cavity mode.
+    // The spline is not extrapolated, transition frequencies outside of the sampled range raise an
+    // error instead.
+    constexpr double bin_width = 1e-10; // in atomic units, i.e., about 0.66 MHz
+    const double min_omega = entry.min_omega();
+    const double max_omega = entry.max_omega();
+    std::unordered_map<long long, Scalar> values_of_bins;
+
+    Eigen::SparseMatrix<Scalar, Eigen::RowMajor> weighted_matrix = matrix;
+    for (int row = 0; row < weighted_matrix.outerSize(); ++row) {
+        for (typename Eigen::SparseMatrix<Scalar, Eigen::RowMajor>::InnerIterator it(
+                 weighted_matrix, row);
+             it; ++it) {
+            double omega = std::abs(energies[it.row()] - energies[it.col()]);
+            if (omega < min_omega || omega > max_omega) {
+                throw std::invalid_argument(fmt::format(
+                    "The transition energy {:g} (atomic units) lies outside of the range [{:g}, "
+                    "{:g}] in which the Green tensor was sampled. The sampled transition energies "
+                    "must cover all transitions of the atoms, including zero.",
+                    omega, min_omega, max_omega));
+            }
+            long long bin = std::llround(omega / bin_width);
+            auto [value_of_bin, inserted] = values_of_bins.try_emplace(bin);
+            if (inserted) {
+                // Rounding to the bin can leave the sampled range by up to half a bin width
+                value_of_bin->second = entry.val(
+                    std::clamp(static_cast<double>(bin) * bin_width, min_omega, max_omega));
+            }
+            it.valueRef() *= value_of_bin->second;
+        }
+    }
+
+    return weighted_matrix;
+}
+
+template <typename Scalar>
+SystemPair<Scalar>::InteractionOperators::InteractionOperators(
+    std::shared_ptr<const basis_t> basis, int interaction_order,
+    const std::vector<std::array<real_t, 3>> &distance_vectors)
+    : basis(std::move(basis)) {
+    // Collect the terms of the Green tensors that occur for any of the distance vectors
+    std::set<std::array<int, 4>> unique_terms;
+    for (const auto &distance_vector : distance_vectors) {
+        auto green_tensor_interpolator =
+            construct_green_tensor_interpolator<Scalar>(distance_vector, interaction_order);
+        for (const auto &[kappa1, kappa2] : get_kappas_with_entries(green_tensor_interpolator)) {
+            for (const auto &entry :
+                 green_tensor_interpolator.get_spherical_entries(kappa1, kappa2)) {
+                std::visit(
+                    [&](const auto &e) { unique_terms.insert({kappa1, kappa2, e.row(), e.col()}); },
+                    entry);
+            }
+        }
+    }
+    terms.assign(unique_terms.begin(), unique_terms.end());
+}
+
+template <typename Scalar>
+const std::shared_ptr<const typename SystemPair<Scalar>::basis_t> &
+SystemPair<Scalar>::InteractionOperators::get_basis() const {
+    return basis;
+}
+
+template <typename Scalar>
+const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &
+SystemPair<Scalar>::InteractionOperators::get_energies() const {
+    std::call_once(construction_flag, [this] { construct(); });
+    return energies;
+}
+
+template <typename Scalar>
+const Eigen::SparseMatrix<Scalar, Eigen::RowMajor> &
+SystemPair<Scalar>::InteractionOperators::get_tensor_product(int kappa1, int kappa2, int row,
+                                                             int col) const {
+    std::call_once(construction_flag, [this] { construct(); });
+    return tensor_products.at({kappa1, kappa2, row, col});
+}
+
+template <typename Scalar>
+void SystemPair<Scalar>::InteractionOperators::construct() const {
+    std::set<std::pair<int, int>> kappas;
+    for (const auto &term : terms) {
+        kappas.emplace(term[0], term[1]);
+    }
+    auto op = construct_operator_matrices(kappas, basis->get_basis1(), basis->get_basis2());
+
+    const auto &coefficients = basis->get_coefficients();
+
+    energies =
+        coefficients.adjoint() * utils::get_energies_in_canonical_basis(basis) * coefficients;
+
+    // Calculate the tensor products and transform them from the canonical basis into the actual
+    // basis so that the construction of a Hamiltonian reduces to a weighted sum
+    std::vector<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>> products(terms.size());
+    tbb::parallel_for(size_t(0), terms.size(), [&](size_t idx) {
+        const auto &[kappa1, kappa2, row, col] = terms[idx];
+        const auto &op1 = kappa1 == 1 ? op.d1 : op.q1;
+        const auto &op2 = kappa2 == 1 ? op.d2 : op.q2;
+        products[idx] = coefficients.adjoint() *
+            utils::calculate_tensor_product_in_canonical_basis(basis, basis, op1[row], op2[col]) *
+            coefficients;
+    });
+
+    for (size_t idx = 0; idx < terms.size(); ++idx) {
+        tensor_products.emplace(terms[idx], std::move(products[idx]));
+    }
+}
+
 template <typename Scalar>
 SystemPair<Scalar>::SystemPair(std::shared_ptr<const basis_t> basis)
     : System<SystemPair<Scalar>>(std::move(basis)) {}
@@ -217,6 +366,7 @@ SystemPair<Scalar> &SystemPair<Scalar>::set_interaction_order(int value) {
     }
 
     interaction_order = value;
+    interaction_operators.reset();
 
     return *this;
 }
@@ -236,6 +386,7 @@ SystemPair<Scalar> &SystemPair<Scalar>::set_distance_vector(const std::array<rea
     }
 
     distance_vector = vector;
+    interaction_operators.reset();
 
     return *this;
 }
@@ -252,12 +403,14 @@ SystemPair<Scalar> &SystemPair<Scalar>::set_green_tensor_interpolator(
     }
 
     this->green_tensor_interpolator = green_tensor_interpolator;
+    interaction_operators.reset();
 
     return *this;
 }
 
 template <typename Scalar>
 void SystemPair<Scalar>::construct_hamiltonian() const {
+    ScopedTimer timer("SystemPair::construct_hamiltonian");
     auto basis1 = this->basis->get_basis1();
     auto basis2 = this->basis->get_basis2();
 
@@ -269,10 +422,21 @@ void SystemPair<Scalar>::construct_hamiltonian() const {
             construct_green_tensor_interpolator<Scalar>(distance_vector, interaction_order));
     }
 
-    auto op = construct_operator_matrices(*green_tensor_interpolator_ptr, basis1, basis2);
+    // If the system belongs to a scan, the operators are shared by all systems of the scan and
+    // already transformed into the actual basis
+    bool use_interaction_operators =
+        interaction_operators && interaction_operators->get_basis() == this->basis;
+
+    OperatorMatrices<Scalar> op;
+    if (use_interaction_operators) {
+        this->matrix = interaction_operators->get_energies();
+    } else {
+        op = construct_operator_matrices(get_kappas_with_entries(*green_tensor_interpolator_ptr),
+                                         basis1, basis2);
 
-    // Construct the unperturbed Hamiltonian in the canonical pair basis
-    this->matrix = utils::get_energies_in_canonical_basis(this->basis);
+        // Construct the unperturbed Hamiltonian in the canonical pair basis
+        this->matrix = utils::get_energies_in_canonical_basis(this->basis);
+    }
 
     this->hamiltonian_is_diagonal = false;
     bool sort_by_quantum_number_f = this->basis->has_quantum_number_f();
@@ -285,44 +449,74 @@ void SystemPair<Scalar>::construct_hamiltonian() const {
     // D_2,right uses normal convention.
 
     // Helper function for adding Rydberg-Rydberg interaction
-    auto add_interaction = [this, &sort_by_quantum_number_f, &sort_by_quantum_number_m](
-                               const auto &entries, const auto &op1, const auto &op2, int delta) {
-        for (const auto &entry : entries) {
-            if (std::holds_alternative<
-                    typename GreenTensorInterpolator<Scalar>::OmegaDependentEntry>(entry)) {
-                throw std::logic_error(
-                    "Green tensor with omega dependent entries is currently not supported.");
+    // For omega dependent entries, the Green tensor is evaluated at the transition frequencies of
+    // the multipole operators. To treat both atoms on an equal footing, we average over the
+    // contributions where the transition frequency of the first or the second atom is used. For
+    // resonant processes, both transition frequencies are identical.
+    Eigen::VectorX<real_t> energies1;
+    Eigen::VectorX<real_t> energies2;
+    auto add_interaction = [this, &green_tensor_interpolator_ptr, use_interaction_operators,
+                            &basis1, &basis2, &energies1, &energies2, &sort_by_quantum_number_f,
+                            &sort_by_quantum_number_m](int kappa1, int kappa2, const auto &op1,
+                                                       const auto &op2, int delta) {
+        for (const auto &entry :
+             green_tensor_interpolator_ptr->get_spherical_entries(kappa1, kappa2)) {
+            int row = std::visit([](const auto &e) { return e.row(); }, entry);
+            int col = std::visit([](const auto &e) { return e.col(); }, entry);
+
+            if (const auto *constant_entry =
+                    std::get_if<typename GreenTensorInterpolator<Scalar>::ConstantEntry>(&entry)) {
+                if (use_interaction_operators) {
+                    this->matrix += constant_entry->val() *
+                        interaction_operators->get_tensor_product(kappa1, kappa2, row, col);
+                } else {
+                    this->matrix += constant_entry->val() *
+                        utils::calculate_tensor_product_in_canonical_basis(this->basis, this->basis,
+                                                                           op1[row], op2[col]);
+                }
+            } else {
+                const auto &omega_dependent_entry =
+                    std::get<typename GreenTensorInterpolator<Scalar>::OmegaDependentEntry>(entry);
+                if (energies1.size() == 0) {
+                    energies1 = get_energies_of_states(basis1);
+                    energies2 = get_energies_of_states(basis2);
+                }
+                this->matrix += 0.5 *
+                    (utils::calculate_tensor_product_in_canonical_basis(
+                         this->basis, this->basis,
+                         weight_by_omega_dependent_entry(op1[row], energies1,
+                                                         omega_dependent_entry),
+                         op2[col]) +
+                     utils::calculate_tensor_product_in_canonical_basis(
+                         this->basis, this->basis, op1[row],
+                         weight_by_omega_dependent_entry(op2[col], energies2,
+                                                         omega_dependent_entry)));
             }
 
-            const auto &constant_entry =
-                std::get<typename GreenTensorInterpolator<Scalar>::ConstantEntry>(entry);
-            this->matrix += constant_entry.val() *
-                utils::calculate_tensor_product_in_canonical_basis(this->basis, this->basis,
-                                                                   op1[constant_entry.row()],
-                                                                   op2[constant_entry.col()]);
-
             sort_by_quantum_number_f = false;
-            if (constant_entry.row() != constant_entry.col() + delta) {
+            if (row != col + delta) {
                 sort_by_quantum_number_m = false;
             }
         }
     };
 
     // Dipole-dipole interaction
-    add_interaction(green_tensor_interpolator_ptr->get_spherical_entries(1, 1), op.d1, op.d2, 0);
+    add_interaction(1, 1, op.d1, op.d2, 0);
 
     // Dipole-quadrupole interaction
-    add_interaction(green_tensor_interpolator_ptr->get_spherical_entries(1, 2), op.d1, op.q2, -1);
+    add_interaction(1, 2, op.d1, op.q2, -1);
 
     // Quadrupole-dipole interaction
-    add_interaction(green_tensor_interpolator_ptr->get_spherical_entries(2, 1), op.q1, op.d2, +1);
+    add_interaction(2, 1, op.q1, op.d2, +1);
 
     // Quadrupole-quadrupole interaction
-    add_interaction(green_tensor_interpolator_ptr->get_spherical_entries(2, 2), op.q1, op.q2, 0);
+    add_interaction(2, 2, op.q1, op.q2, 0);
 
     // Transform from the canonical basis into the actual basis
-    this->matrix =
-        this->basis->get_coefficients().adjoint() * this->matrix * this->basis->get_coefficients();
+    if (!use_interaction_operators) {
+        this->matrix = this->basis->get_coefficients().adjoint() * this->matrix *
+            this->basis->get_coefficients();
+    }
 
     // Store which labels can be used to block-diagonalize the Hamiltonian
     this->blockdiagonalizing_labels.clear();
@@ -335,6 +529,32 @@ void SystemPair<Scalar>::construct_hamiltonian() const {
     if (sort_by_parity) {
         this->blockdiagonalizing_labels.push_back(TransformationType::SORT_BY_PARITY);
     }
+
+    // If m is not conserved because the distance vector is tilted, the Hamiltonian is
+    // rotationally symmetric about the distance vector as long as the atoms are not subject to
+    // fields, which is checked when the rotation is applied
+    this->symmetry_axis.reset();
+    if (!sort_by_quantum_number_m && !green_tensor_interpolator) {
+        this->symmetry_axis = distance_vector;
+    }
+}
+
+template <typename Scalar>
+std::optional<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>>
+SystemPair<Scalar>::get_rotator_of_states(real_t alpha, real_t beta, real_t gamma) const {
+    auto rotator1 = utils::get_rotator_of_states(this->basis->get_basis1(), alpha, beta, gamma);
+    auto rotator2 = utils::get_rotator_of_states(this->basis->get_basis2(), alpha, beta, gamma);
+    if (!rotator1.has_value() || !rotator2.has_value()) {
+        return std::nullopt;
+    }
+
+    // The rotator of the pair states is the tensor product of the rotators of the atomic states
+    const auto &coefficients = this->basis->get_coefficients();
+    return (coefficients.adjoint() *
+            utils::calculate_tensor_product_in_canonical_basis(this->basis, this->basis, *rotator1,
+                                                               *rotator2) *
+            coefficients)
+        .eval();
 }
 
 // Explicit instantiations
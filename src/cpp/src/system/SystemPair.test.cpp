@@ -10,16 +10,24 @@
 #include "pairinteraction/database/Database.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerEigen.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerFeast.hpp"
+#include "pairinteraction/diagonalize/DiagonalizerLanczos.hpp"
 #include "pairinteraction/diagonalize/DiagonalizerLapackeEvr.hpp"
 #include "pairinteraction/diagonalize/diagonalize.hpp"
 #include "pairinteraction/ket/KetAtom.hpp"
 #include "pairinteraction/ket/KetAtomCreator.hpp"
+#include "pairinteraction/system/GreenTensorInterpolator.hpp"
 #include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/system/SystemPairScan.hpp"
 #include "pairinteraction/utils/Range.hpp"
 
+#include <algorithm>
+#include <array>
 #include <cmath>
 #include <doctest/doctest.h>
 #include <fmt/ranges.h>
+#include <limits>
+#include <memory>
+#include <vector>
 
 namespace pairinteraction {
 
@@ -105,6 +113,218 @@ DOCTEST_TEST_CASE("construct a pair Hamiltonian in a non-canonical pair basis")
     DOCTEST_CHECK(transformed_system.get_matrix().isApprox(expected_matrix, 1e-11));
 }
 
+DOCTEST_TEST_CASE("construct pair Hamiltonians for a scan of distance vectors") {
+    auto &database = Database::get_global_instance();
+
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(60, 61)
+                     .restrict_quantum_number_l(0, 2)
+                     .restrict_quantum_number_m(-0.5, 0.5)
+                     .create(database);
+    SystemAtom<double> system(basis);
+    auto pair_basis = BasisPairCreator<double>().add(system).add(system).create();
+
+    std::vector<std::array<double, 3>> distance_vectors;
+    for (double angle : {0.0, 0.5, 1.0}) {
+        for (double distance : {3.0, 6.0}) {
+            distance_vectors.push_back({distance * UM_IN_ATOMIC_UNITS * std::sin(angle), 0,
+                                        distance * UM_IN_ATOMIC_UNITS * std::cos(angle)});
+        }
+    }
+    distance_vectors.push_back({0, 0, std::numeric_limits<double>::infinity()});
+
+    SystemPairScan<double> scan(pair_basis);
+    scan.set_interaction_order(4).set_distance_vectors(distance_vectors);
+    DOCTEST_REQUIRE(scan.get_systems().size() == distance_vectors.size());
+
+    for (size_t i = 0; i < distance_vectors.size(); ++i) {
+        SystemPair<double> reference_system(pair_basis);
+        reference_system.set_interaction_order(4).set_distance_vector(distance_vectors[i]);
+
+        Eigen::SparseMatrix<double, Eigen::RowMajor> difference =
+            scan.get_systems()[i]->get_matrix() - reference_system.get_matrix();
+        DOCTEST_CHECK(difference.norm() <= 1e-11 * reference_system.get_matrix().norm());
+    }
+}
+
+DOCTEST_TEST_CASE("construct a pair Hamiltonian with an omega dependent Green tensor") {
+    auto &database = Database::get_global_instance();
+
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(60, 61)
+                     .restrict_quantum_number_l(0, 1)
+                     .restrict_quantum_number_m(-0.5, 0.5)
+                     .create(database);
+    SystemAtom<double> system(basis);
+    auto pair_basis = BasisPairCreator<double>().add(system).add(system).create();
+
+    // Green tensor of the dipole-dipole interaction along the z-axis
+    double distance = 3 * UM_IN_ATOMIC_UNITS;
+    Eigen::MatrixX<double> tensor = Eigen::MatrixX<double>::Identity(3, 3);
+    tensor(2, 2) = -2;
+    tensor /= std::pow(distance, 3);
+
+    auto constant_interpolator = std::make_shared<GreenTensorInterpolator<double>>();
+    constant_interpolator->create_entries_from_cartesian(1, 1, tensor);
+    SystemPair<double> constant_system(pair_basis);
+    constant_system.set_green_tensor_interpolator(constant_interpolator);
+
+    // An omega dependent Green tensor that does not depend on omega must give the same Hamiltonian
+    std::vector<double> omegas{0, 1e-4, 2e-4, 3e-4, 4e-4};
+    std::vector<Eigen::MatrixX<double>> tensors(omegas.size(), tensor);
+    auto omega_dependent_interpolator = std::make_shared<GreenTensorInterpolator<double>>();
+    omega_dependent_interpolator->create_entries_from_cartesian(1, 1, tensors, omegas);
+    SystemPair<double> omega_dependent_system(pair_basis);
+    omega_dependent_system.set_green_tensor_interpolator(omega_dependent_interpolator);
+
+    Eigen::SparseMatrix<double, Eigen::RowMajor> difference =
+        omega_dependent_system.get_matrix() - constant_system.get_matrix();
+    DOCTEST_CHECK(difference.norm() <= 1e-9 * constant_system.get_matrix().norm());
+
+    // If the Green tensor decreases with omega, the off-resonant couplings are weakened
+    for (size_t i = 0; i < omegas.size(); ++i) {
+        tensors[i] = tensor / (1 + omegas[i] / omegas[1]);
+    }
+    auto decaying_interpolator = std::make_shared<GreenTensorInterpolator<double>>();
+    decaying_interpolator->create_entries_from_cartesian(1, 1, tensors, omegas);
+    SystemPair<double> decaying_system(pair_basis);
+    decaying_system.set_green_tensor_interpolator(decaying_interpolator);
+
+    Eigen::SparseMatrix<double, Eigen::RowMajor> interaction =
+        constant_system.get_matrix() -
+        Eigen::SparseMatrix<double, Eigen::RowMajor>(
+            constant_system.get_matrix().diagonal().asDiagonal());
+    Eigen::SparseMatrix<double, Eigen::RowMajor> decaying_interaction =
+        decaying_system.get_matrix() -
+        Eigen::SparseMatrix<double, Eigen::RowMajor>(
+            decaying_system.get_matrix().diagonal().asDiagonal());
+    DOCTEST_CHECK(decaying_interaction.norm() < interaction.norm());
+
+    // The Green tensor is not extrapolated to transition frequencies outside of the sampled range
+    std::vector<double> shifted_omegas{1e-5, 2e-5, 3e-5, 4e-5, 5e-5};
+    auto shifted_interpolator = std::make_shared<GreenTensorInterpolator<double>>();
+    shifted_interpolator->create_entries_from_cartesian(1, 1, tensors, shifted_omegas);
+    SystemPair<double> shifted_system(pair_basis);
+    shifted_system.set_green_tensor_interpolator(shifted_interpolator);
+    DOCTEST_CHECK_THROWS_AS(shifted_system.get_matrix(), std::invalid_argument);
+}
+
+DOCTEST_TEST_CASE("diagonalize with lanczos") {
+    auto &database = Database::get_global_instance();
+
+    // Construct the state of interest
+    auto ket = KetAtomCreator()
+                   .set_species("Rb")
+                   .set_quantum_number_n(60)
+                   .set_quantum_number_l(0)
+                   .set_quantum_number_j(0.5)
+                   .set_quantum_number_m(0.5)
+                   .create(database);
+
+    // Construct the pair basis
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(ket->get_quantum_number_n() - 3,
+                                                ket->get_quantum_number_n() + 3)
+                     .restrict_quantum_number_l(ket->get_quantum_number_l() - 1,
+                                                ket->get_quantum_number_l() + 1)
+                     .create(database);
+    SystemAtom<double> system(basis);
+
+    auto basis_pair = BasisPairCreator<double>()
+                          .add(system)
+                          .add(system)
+                          .restrict_energy(2 * ket->get_energy() - 20 / HARTREE_IN_GHZ,
+                                           2 * ket->get_energy() + 20 / HARTREE_IN_GHZ)
+                          .create();
+    DOCTEST_MESSAGE("Number of states in pair basis: ", basis_pair->get_number_of_states());
+
+    // Diagonalize the system with the sparse and with a dense diagonalizer
+    double min_energy = 2 * ket->get_energy() - 0.5 / HARTREE_IN_GHZ;
+    double max_energy = 2 * ket->get_energy() + 0.5 / HARTREE_IN_GHZ;
+
+    auto system_pair_lanczos = SystemPair<double>(basis_pair);
+    system_pair_lanczos.set_distance_vector({0, 0, 3 * UM_IN_ATOMIC_UNITS});
+    system_pair_lanczos.diagonalize(DiagonalizerLanczos<double>(), min_energy, max_energy);
+
+    auto system_pair_eigen = SystemPair<double>(basis_pair);
+    system_pair_eigen.set_distance_vector({0, 0, 3 * UM_IN_ATOMIC_UNITS});
+    system_pair_eigen.diagonalize(DiagonalizerEigen<double>(), min_energy, max_energy);
+
+    // Compare the sorted eigenenergies
+    auto eigenenergies_lanczos = system_pair_lanczos.get_eigenenergies();
+    auto eigenenergies_eigen = system_pair_eigen.get_eigenenergies();
+    DOCTEST_REQUIRE(eigenenergies_lanczos.size() == eigenenergies_eigen.size());
+    std::sort(eigenenergies_lanczos.begin(), eigenenergies_lanczos.end());
+    std::sort(eigenenergies_eigen.begin(), eigenenergies_eigen.end());
+    for (Eigen::Index i = 0; i < eigenenergies_eigen.size(); ++i) {
+        DOCTEST_CHECK(std::abs(eigenenergies_lanczos[i] - eigenenergies_eigen[i]) * HARTREE_IN_GHZ <
+                      1e-6);
+    }
+}
+
+DOCTEST_TEST_CASE("diagonalize a pair Hamiltonian with a tilted distance vector") {
+    auto &database = Database::get_global_instance();
+    DiagonalizerEigen<double> diagonalizer;
+
+    auto ket = KetAtomCreator()
+                   .set_species("Rb")
+                   .set_quantum_number_n(60)
+                   .set_quantum_number_l(0)
+                   .set_quantum_number_j(0.5)
+                   .set_quantum_number_m(0.5)
+                   .create(database);
+
+    // Without fields, the atomic and the pair basis are closed under rotations
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(58, 62)
+                     .restrict_quantum_number_l(0, 2)
+                     .create(database);
+    SystemAtom<double> system(basis);
+
+    auto basis_pair = BasisPairCreator<double>()
+                          .add(system)
+                          .add(system)
+                          .restrict_energy(2 * ket->get_energy() - 10 / HARTREE_IN_GHZ,
+                                           2 * ket->get_energy() + 10 / HARTREE_IN_GHZ)
+                          .create();
+    DOCTEST_MESSAGE("Number of states in pair basis: ", basis_pair->get_number_of_states());
+
+    std::array<double, 3> distance_vector{-2 * UM_IN_ATOMIC_UNITS, 0, 3 * UM_IN_ATOMIC_UNITS};
+
+    auto system_pair = SystemPair<double>(basis_pair);
+    system_pair.set_distance_vector(distance_vector);
+    Eigen::SparseMatrix<double, Eigen::RowMajor> matrix = system_pair.get_matrix();
+    system_pair.diagonalize(diagonalizer, {}, {}, 1e-10, true);
+
+    auto reference_system_pair = SystemPair<double>(basis_pair);
+    reference_system_pair.set_distance_vector(distance_vector);
+    reference_system_pair.diagonalize(diagonalizer, {}, {}, 1e-10);
+
+    // Compare the sorted eigenenergies
+    auto eigenenergies = system_pair.get_eigenenergies();
+    auto reference_eigenenergies = reference_system_pair.get_eigenenergies();
+    DOCTEST_REQUIRE(eigenenergies.size() == reference_eigenenergies.size());
+    std::sort(eigenenergies.begin(), eigenenergies.end());
+    std::sort(reference_eigenenergies.begin(), reference_eigenenergies.end());
+    for (Eigen::Index i = 0; i < eigenenergies.size(); ++i) {
+        DOCTEST_CHECK(std::abs(eigenenergies[i] - reference_eigenenergies[i]) * HARTREE_IN_GHZ <
+                      1e-6);
+    }
+
+    // The eigenvectors are given in the frame of the user and diagonalize the original Hamiltonian
+    Eigen::SparseMatrix<double, Eigen::RowMajor> eigenvectors =
+        basis_pair->get_coefficients().adjoint() * system_pair.get_eigenbasis()->get_coefficients();
+    Eigen::SparseMatrix<double, Eigen::RowMajor> diagonalized =
+        eigenvectors.adjoint() * matrix * eigenvectors;
+    Eigen::SparseMatrix<double, Eigen::RowMajor> off_diagonal = diagonalized -
+        Eigen::SparseMatrix<double, Eigen::RowMajor>(diagonalized.diagonal().asDiagonal());
+    DOCTEST_CHECK(off_diagonal.norm() * HARTREE_IN_GHZ < 1e-6);
+}
+
 #ifdef WITH_LAPACKE
 DOCTEST_TEST_CASE("diagonalize with lapacke_evr") {
     auto &database = Database::get_global_instance();
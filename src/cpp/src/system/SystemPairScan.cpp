@@ -0,0 +1,87 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/system/SystemPairScan.hpp"
+
+#include "pairinteraction/basis/BasisPair.hpp"
+#include "pairinteraction/system/SystemPair.hpp"
+
+#include <complex>
+#include <memory>
+#include <stdexcept>
+#include <vector>
+
+namespace pairinteraction {
+template <typename Scalar>
+SystemPairScan<Scalar>::SystemPairScan(std::shared_ptr<const basis_t> basis)
+    : basis(std::move(basis)) {}
+
+template <typename Scalar>
+SystemPairScan<Scalar> &SystemPairScan<Scalar>::set_interaction_order(int value) {
+    if (value < 3 || value > 5) {
+        throw std::invalid_argument("The order must be 3, 4, or 5.");
+    }
+
+    interaction_order = value;
+    create_systems();
+
+    return *this;
+}
+
+template <typename Scalar>
+SystemPairScan<Scalar> &
+SystemPairScan<Scalar>::set_distance_vectors(const std::vector<std::array<real_t, 3>> &vectors) {
+    if (!traits::NumTraits<Scalar>::is_complex_v) {
+        for (const auto &vector : vectors) {
+            if (vector[1] != 0) {
+                throw std::invalid_argument("The distance vectors must not have a y-component if "
+                                            "the scalar type is real.");
+            }
+        }
+    }
+
+    distance_vectors = vectors;
+    create_systems();
+
+    return *this;
+}
+
+template <typename Scalar>
+std::shared_ptr<const typename SystemPairScan<Scalar>::basis_t>
+SystemPairScan<Scalar>::get_basis() const {
+    return basis;
+}
+
+template <typename Scalar>
+const std::vector<std::array<typename SystemPairScan<Scalar>::real_t, 3>> &
+SystemPairScan<Scalar>::get_distance_vectors() const {
+    return distance_vectors;
+}
+
+template <typename Scalar>
+const std::vector<std::shared_ptr<typename SystemPairScan<Scalar>::system_t>> &
+SystemPairScan<Scalar>::get_systems() const {
+    return systems;
+}
+
+template <typename Scalar>
+void SystemPairScan<Scalar>::create_systems() {
+    // The operators are calculated lazily when the first Hamiltonian is constructed
+    auto interaction_operators = std::make_shared<const typename system_t::InteractionOperators>(
+        basis, interaction_order, distance_vectors);
+
+    systems.clear();
+    systems.reserve(distance_vectors.size());
+    for (const auto &distance_vector : distance_vectors) {
+        auto system = std::make_shared<system_t>(basis);
+        system->set_interaction_order(interaction_order);
+        system->set_distance_vector(distance_vector);
+        system->interaction_operators = interaction_operators;
+        systems.push_back(std::move(system));
+    }
+}
+
+// Explicit instantiations
+template class SystemPairScan<double>;
+template class SystemPairScan<std::complex<double>>;
+} // namespace pairinteraction
@@ -0,0 +1,373 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/system/dispersion_coefficients.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/database/Database.hpp"
+#include "pairinteraction/enums/OperatorType.hpp"
+#include "pairinteraction/ket/KetAtom.hpp"
+#include "pairinteraction/system/GreenTensorInterpolator.hpp"
+#include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/utils/Profiler.hpp"
+#include "pairinteraction/utils/TaskControl.hpp"
+
+#include <Eigen/SparseCore>
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <complex>
+#include <limits>
+#include <memory>
+#include <oneapi/tbb.h>
+#include <stdexcept>
+#include <utility>
+#include <variant>
+#include <vector>
+
+namespace pairinteraction {
+namespace {
+
+// Dipole operators and energies of the eigenstates of the atoms. The dipole-dipole interaction at
+// unit distance is V = Σ_{ij} G_{ij} d1[i] ⊗ d2[j], where G is the spherical Green tensor.
+template <typename Scalar>
+struct DipoleOperators {
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+
+    std::array<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>, 3> d1;
+    std::array<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>, 3> d2;
+    Eigen::VectorX<real_t> energies1;
+    Eigen::VectorX<real_t> energies2;
+
+    DipoleOperators(const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2);
+};
+
+template <typename Scalar>
+std::array<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>, 3>
+get_dipole_matrices(const std::shared_ptr<const BasisAtom<Scalar>> &basis, bool conjugate) {
+    // Same convention as for the construction of the pair Hamiltonian, the operators of the first
+    // atom use the conjugated convention
+    std::array<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>, 3> matrices;
+    int factor = conjugate ? -1 : 1;
+    for (int q = -1; q <= 1; ++q) {
+        auto matrix_elements = (std::pow(factor, q) *
+                                basis->get_database().get_matrix_elements_in_canonical_basis(
+                                    basis, basis, OperatorType::ELECTRIC_DIPOLE, factor * q))
+                                   .eval();
+        matrices[q + 1] =
+            basis->get_coefficients().adjoint() * matrix_elements * basis->get_coefficients();
+    }
+    return matrices;
+}
+
+template <typename Scalar>
+DipoleOperators<Scalar>::DipoleOperators(const SystemAtom<Scalar> &system1,
+                                         const SystemAtom<Scalar> &system2)
+    : d1(get_dipole_matrices(system1.get_eigenbasis(), true)),
+      d2(get_dipole_matrices(system2.get_eigenbasis(), false)),
+      energies1(system1.get_eigenenergies()), energies2(system2.get_eigenenergies()) {}
+
+// Get the spherical components of the dyadic Green function of the dipole-dipole interaction at a
+// distance of one bohr, so that the interaction equals the C3 coefficient in atomic units
+template <typename Real>
+Eigen::Matrix3<std::complex<Real>> get_green_tensor(const std::array<Real, 3> &direction) {
+    using complex_t = std::complex<Real>;
+
+    Eigen::Map<const Eigen::Vector3<Real>> direction_map(direction.data(), direction.size());
+    Real norm = direction_map.norm();
+    if (!std::isfinite(norm) || norm == 0) {
+        throw std::invalid_argument(
+            "The direction of the distance vector must be finite and non-zero.");
+    }
+    Eigen::Vector3<Real> unitvec = direction_map / norm;
+
+    GreenTensorInterpolator<complex_t> green_tensor_interpolator;
+    green_tensor_interpolator.create_entries_from_cartesian(
+        1, 1,
+        (Eigen::Matrix3<Real>::Identity() - 3 * unitvec * unitvec.transpose())
+            .template cast<complex_t>());
+    Eigen::Matrix3<complex_t> green_tensor = Eigen::Matrix3<complex_t>::Zero();
+    for (const auto &entry : green_tensor_interpolator.get_spherical_entries(1, 1)) {
+        const auto &constant_entry =
+            std::get<typename GreenTensorInterpolator<complex_t>::ConstantEntry>(entry);
+        green_tensor(constant_entry.row(), constant_entry.col()) = constant_entry.val();
+    }
+    return green_tensor;
+}
+
+template <typename Scalar>
+std::vector<Eigen::Matrix3<std::complex<typename traits::NumTraits<Scalar>::real_t>>>
+get_green_tensors(
+    const std::vector<std::array<typename traits::NumTraits<Scalar>::real_t, 3>> &directions) {
+    std::vector<Eigen::Matrix3<std::complex<typename traits::NumTraits<Scalar>::real_t>>>
+        green_tensors;
+    green_tensors.reserve(directions.size());
+    for (const auto &direction : directions) {
+        green_tensors.push_back(get_green_tensor(direction));
+    }
+    return green_tensors;
+}
+
+template <typename Scalar>
+void check_pair_states(const std::vector<std::array<size_t, 2>> &pair_states,
+                       const DipoleOperators<Scalar> &op) {
+    for (const auto &[idx1, idx2] : pair_states) {
+        if (std::cmp_greater_equal(idx1, op.energies1.size()) ||
+            std::cmp_greater_equal(idx2, op.energies2.size())) {
+            throw std::invalid_argument("The index of an eigenstate of an atom is out of range.");
+        }
+    }
+}
+
+// Get the row of the dipole operators for the given state as a dense matrix whose columns belong to
+// the components of the operator and whose rows belong to the states that are coupled
+template <typename Scalar>
+Eigen::MatrixX3<Scalar>
+get_dense_row(const std::array<Eigen::SparseMatrix<Scalar, Eigen::RowMajor>, 3> &matrices,
+              size_t row, std::vector<Eigen::Index> &coupled_states) {
+    coupled_states.clear();
+    for (const auto &matrix : matrices) {
+        for (typename Eigen::SparseMatrix<Scalar, Eigen::RowMajor>::InnerIterator it(
+                 matrix, static_cast<Eigen::Index>(row));
+             it; ++it) {
+            coupled_states.push_back(it.col());
+        }
+    }
+    std::sort(coupled_states.begin(), coupled_states.end());
+    coupled_states.erase(std::unique(coupled_states.begin(), coupled_states.end()),
+                         coupled_states.end());
+
+    Eigen::MatrixX3<Scalar> dense_row =
+        Eigen::MatrixX3<Scalar>::Zero(static_cast<Eigen::Index>(coupled_states.size()), 3);
+    for (Eigen::Index q = 0; q < 3; ++q) {
+        for (typename Eigen::SparseMatrix<Scalar, Eigen::RowMajor>::InnerIterator it(
+                 matrices[q], static_cast<Eigen::Index>(row));
+             it; ++it) {
+            auto pos = std::lower_bound(coupled_states.begin(), coupled_states.end(), it.col()) -
+                coupled_states.begin();
+            dense_row(pos, q) = it.value();
+        }
+    }
+    return dense_row;
+}
+
+// Get the products row(k, i) * conj(row(k, j)) of the components of a dense row, stored in the
+// column 3 * i + j
+template <typename Scalar>
+Eigen::MatrixX<Scalar> get_products_of_components(const Eigen::MatrixX3<Scalar> &dense_row) {
+    Eigen::MatrixX<Scalar> products(dense_row.rows(), 9);
+    for (Eigen::Index i = 0; i < 3; ++i) {
+        for (Eigen::Index j = 0; j < 3; ++j) {
+            products.col(3 * i + j) = dense_row.col(i).cwiseProduct(dense_row.col(j).conjugate());
+        }
+    }
+    return products;
+}
+
+// Contract a tensor T of second-order contributions with the Green tensor,
+// Σ_{ijkl} G_{ij} conj(G_{kl}) T_{3i+k, 3j+l}
+template <typename Scalar, typename Real>
+Real contract(const Eigen::Matrix<Scalar, 9, 9> &tensor,
+              const Eigen::Matrix3<std::complex<Real>> &green_tensor) {
+    std::complex<Real> value = 0;
+    for (Eigen::Index i = 0; i < 3; ++i) {
+        for (Eigen::Index j = 0; j < 3; ++j) {
+            for (Eigen::Index k = 0; k < 3; ++k) {
+                for (Eigen::Index l = 0; l < 3; ++l) {
+                    value += green_tensor(i, j) * std::conj(green_tensor(k, l)) *
+                        tensor(3 * i + k, 3 * j + l);
+                }
+            }
+        }
+    }
+    return value.real();
+}
+
+} // namespace
+
+template <typename Scalar>
+Eigen::MatrixX<std::complex<typename traits::NumTraits<Scalar>::real_t>> calculate_c3_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &initial_pair_states,
+    const std::vector<std::array<size_t, 2>> &final_pair_states,
+    const std::vector<std::array<typename traits::NumTraits<Scalar>::real_t, 3>> &directions) {
+    using complex_t = std::complex<typename traits::NumTraits<Scalar>::real_t>;
+
+    ScopedTimer timer("calculate_c3_coefficients");
+
+    if (initial_pair_states.size() != final_pair_states.size()) {
+        throw std::invalid_argument(
+            "The number of initial and final pair states must be the same.");
+    }
+
+    auto green_tensors = get_green_tensors<Scalar>(directions);
+    DipoleOperators<Scalar> op(system1, system2);
+    check_pair_states(initial_pair_states, op);
+    check_pair_states(final_pair_states, op);
+
+    // The tensor T_{ij} = <c|d1[i]|a> <d|d2[j]|b> is calculated once per pair state, so that
+    // <c, d|V|a, b> = Σ_{ij} G_{ij} T_{ij} is cheap to evaluate for many directions
+    Eigen::MatrixX<complex_t> c3_coefficients(initial_pair_states.size(), directions.size());
+    for (size_t idx = 0; idx < initial_pair_states.size(); ++idx) {
+        const auto &[a, b] = initial_pair_states[idx];
+        const auto &[c, d] = final_pair_states[idx];
+        Eigen::Vector3<Scalar> row1;
+        Eigen::Vector3<Scalar> row2;
+        for (Eigen::Index q = 0; q < 3; ++q) {
+            row1[q] = op.d1[q].coeff(static_cast<Eigen::Index>(c), static_cast<Eigen::Index>(a));
+            row2[q] = op.d2[q].coeff(static_cast<Eigen::Index>(d), static_cast<Eigen::Index>(b));
+        }
+        Eigen::Matrix3<complex_t> tensor = (row1 * row2.transpose()).template cast<complex_t>();
+        for (size_t dir = 0; dir < directions.size(); ++dir) {
+            c3_coefficients(static_cast<Eigen::Index>(idx), static_cast<Eigen::Index>(dir)) =
+                green_tensors[dir].cwiseProduct(tensor).sum();
+        }
+    }
+
+    return c3_coefficients;
+}
+
+template <typename Scalar>
+Eigen::VectorX<Scalar> calculate_c3_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &initial_pair_states,
+    const std::vector<std::array<size_t, 2>> &final_pair_states,
+    const std::array<typename traits::NumTraits<Scalar>::real_t, 3> &direction) {
+    // For a distance vector with a y-component, the Green tensor is complex so that the C3
+    // coefficients are complex in general and cannot be returned for a real scalar type
+    if (!traits::NumTraits<Scalar>::is_complex_v && direction[1] != 0) {
+        throw std::invalid_argument(
+            "The distance vector must not have a y-component if the scalar type is real. Use the "
+            "overload for many directions, which returns complex C3 coefficients.");
+    }
+    auto c3_coefficients = calculate_c3_coefficients(system1, system2, initial_pair_states,
+                                                     final_pair_states, std::vector{direction});
+    if constexpr (traits::NumTraits<Scalar>::is_complex_v) {
+        return c3_coefficients.col(0);
+    } else {
+        return c3_coefficients.col(0).real();
+    }
+}
+
+template <typename Scalar>
+Eigen::MatrixX<typename traits::NumTraits<Scalar>::real_t> calculate_c6_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &pair_states,
+    const std::vector<std::array<typename traits::NumTraits<Scalar>::real_t, 3>> &directions) {
+    using real_t = typename traits::NumTraits<Scalar>::real_t;
+
+    ScopedTimer timer("calculate_c6_coefficients");
+
+    auto green_tensors = get_green_tensors<Scalar>(directions);
+    DipoleOperators<Scalar> op(system1, system2);
+    check_pair_states(pair_states, op);
+
+    Eigen::MatrixX<real_t> c6_coefficients(pair_states.size(), directions.size());
+    oneapi::tbb::parallel_for(size_t(0), pair_states.size(), [&](size_t idx) {
+        set_task_status("Calculating C6 coefficients...");
+
+        const auto &[a, b] = pair_states[idx];
+
+        // Rows of the dipole operators, restricted to the states k and l that are coupled to a
+        // and b, so that <a, b|V|k, l> = Σ_{ij} G_{ij} row1(k, i) row2(l, j)
+        std::vector<Eigen::Index> coupled_states1;
+        std::vector<Eigen::Index> coupled_states2;
+        Eigen::MatrixX3<Scalar> row1 = get_dense_row(op.d1, a, coupled_states1);
+        Eigen::MatrixX3<Scalar> row2 = get_dense_row(op.d2, b, coupled_states2);
+
+        // Inverse energy differences for the second-order energy shift, the C6 coefficient is the
+        // negative energy shift. Couplings to degenerate pair states are collected separately,
+        // where pair states count as degenerate if their energies agree up to the floating point
+        // precision.
+        real_t energy =
+            op.energies1[static_cast<Eigen::Index>(a)] + op.energies2[static_cast<Eigen::Index>(b)];
+        real_t degeneracy_tolerance =
+            10 * std::numeric_limits<real_t>::epsilon() * std::abs(energy);
+        Eigen::MatrixX<Scalar> weights = Eigen::MatrixX<Scalar>::Zero(row1.rows(), row2.rows());
+        Eigen::MatrixX<Scalar> degeneracies =
+            Eigen::MatrixX<Scalar>::Zero(row1.rows(), row2.rows());
+        bool has_degeneracies = false;
+        for (Eigen::Index k = 0; k < row1.rows(); ++k) {
+            for (Eigen::Index l = 0; l < row2.rows(); ++l) {
+                if (std::cmp_equal(coupled_states1[k], a) &&
+                    std::cmp_equal(coupled_states2[l], b)) {
+                    continue;
+                }
+                real_t difference =
+                    op.energies1[coupled_states1[k]] + op.energies2[coupled_states2[l]] - energy;
+                if (std::abs(difference) <= degeneracy_tolerance) {
+                    degeneracies(k, l) = 1;
+                    has_degeneracies = true;
+                } else {
+                    weights(k, l) = 1 / difference;
+                }
+            }
+        }
+
+        // The tensor of the second-order contributions is calculated once per pair state, so that
+        // C6 = Σ_{kl} weights(k, l) |<a, b|V|k, l>|^2 is cheap to evaluate for many directions
+        Eigen::MatrixX<Scalar> products1 = get_products_of_components(row1);
+        Eigen::MatrixX<Scalar> products2 = get_products_of_components(row2);
+        Eigen::Matrix<Scalar, 9, 9> tensor = products1.transpose() * weights * products2;
+        Eigen::Matrix<Scalar, 9, 9> degenerate_tensor = Eigen::Matrix<Scalar, 9, 9>::Zero();
+        if (has_degeneracies) {
+            degenerate_tensor = products1.transpose() * degeneracies * products2;
+        }
+
+        real_t numerical_precision = 100 * std::numeric_limits<real_t>::epsilon();
+        for (size_t dir = 0; dir < directions.size(); ++dir) {
+            real_t c6 = contract(tensor, green_tensors[dir]);
+            if (has_degeneracies &&
+                contract(degenerate_tensor, green_tensors[dir]) > numerical_precision *
+                        degenerate_tensor.norm() * green_tensors[dir].squaredNorm()) {
+                c6 = std::numeric_limits<real_t>::infinity();
+            }
+            c6_coefficients(static_cast<Eigen::Index>(idx), static_cast<Eigen::Index>(dir)) = c6;
+        }
+    });
+
+    return c6_coefficients;
+}
+
+template <typename Scalar>
+Eigen::VectorX<typename traits::NumTraits<Scalar>::real_t> calculate_c6_coefficients(
+    const SystemAtom<Scalar> &system1, const SystemAtom<Scalar> &system2,
+    const std::vector<std::array<size_t, 2>> &pair_states,
+    const std::array<typename traits::NumTraits<Scalar>::real_t, 3> &direction) {
+    return calculate_c6_coefficients(system1, system2, pair_states, std::vector{direction}).col(0);
+}
+
+// Explicit instantiations
+template Eigen::MatrixX<std::complex<double>>
+calculate_c3_coefficients(const SystemAtom<double> &, const SystemAtom<double> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::vector<std::array<double, 3>> &);
+template Eigen::MatrixX<std::complex<double>> calculate_c3_coefficients(
+    const SystemAtom<std::complex<double>> &, const SystemAtom<std::complex<double>> &,
+    const std::vector<std::array<size_t, 2>> &, const std::vector<std::array<size_t, 2>> &,
+    const std::vector<std::array<double, 3>> &);
+template Eigen::VectorX<double>
+calculate_c3_coefficients(const SystemAtom<double> &, const SystemAtom<double> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::array<double, 3> &);
+template Eigen::VectorX<std::complex<double>> calculate_c3_coefficients(
+    const SystemAtom<std::complex<double>> &, const SystemAtom<std::complex<double>> &,
+    const std::vector<std::array<size_t, 2>> &, const std::vector<std::array<size_t, 2>> &,
+    const std::array<double, 3> &);
+template Eigen::MatrixX<double>
+calculate_c6_coefficients(const SystemAtom<double> &, const SystemAtom<double> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::vector<std::array<double, 3>> &);
+template Eigen::MatrixX<double> calculate_c6_coefficients(
+    const SystemAtom<std::complex<double>> &, const SystemAtom<std::complex<double>> &,
+    const std::vector<std::array<size_t, 2>> &, const std::vector<std::array<double, 3>> &);
+template Eigen::VectorX<double>
+calculate_c6_coefficients(const SystemAtom<double> &, const SystemAtom<double> &,
+                          const std::vector<std::array<size_t, 2>> &,
+                          const std::array<double, 3> &);
+template Eigen::VectorX<double> calculate_c6_coefficients(
+    const SystemAtom<std::complex<double>> &, const SystemAtom<std::complex<double>> &,
+    const std::vector<std::array<size_t, 2>> &, const std::array<double, 3> &);
+} // namespace pairinteraction
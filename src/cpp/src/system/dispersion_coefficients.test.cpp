@@ -0,0 +1,189 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/system/dispersion_coefficients.hpp"
+
+#include "pairinteraction/basis/BasisAtom.hpp"
+#include "pairinteraction/basis/BasisAtomCreator.hpp"
+#include "pairinteraction/basis/BasisPair.hpp"
+#include "pairinteraction/basis/BasisPairCreator.hpp"
+#include "pairinteraction/database/Database.hpp"
+#include "pairinteraction/ket/KetAtom.hpp"
+#include "pairinteraction/ket/KetAtomCreator.hpp"
+#include "pairinteraction/system/SystemAtom.hpp"
+#include "pairinteraction/system/SystemPair.hpp"
+
+#include <array>
+#include <cmath>
+#include <complex>
+#include <doctest/doctest.h>
+#include <numbers>
+#include <stdexcept>
+#include <vector>
+
+namespace pairinteraction {
+DOCTEST_TEST_CASE("calculate C3 and C6 coefficients without constructing the pair Hamiltonian") {
+    auto &database = Database::get_global_instance();
+
+    auto basis = BasisAtomCreator<double>()
+                     .set_species("Rb")
+                     .restrict_quantum_number_n(58, 62)
+                     .restrict_quantum_number_l(0, 2)
+                     .create(database);
+    SystemAtom<double> system(basis);
+
+    std::vector<std::array<size_t, 2>> pair_states;
+    for (int l = 0; l <= 1; ++l) {
+        auto ket = KetAtomCreator()
+                       .set_species("Rb")
+                       .set_quantum_number_n(60)
+                       .set_quantum_number_l(l)
+                       .set_quantum_number_j(0.5)
+                       .set_quantum_number_m(0.5)
+                       .create(database);
+        size_t idx = basis->get_corresponding_state_index(ket);
+        pair_states.push_back({idx, idx});
+    }
+    pair_states.push_back({pair_states[0][0], pair_states[1][0]});
+    std::vector<std::array<size_t, 2>> swapped_pair_states;
+    for (const auto &[idx1, idx2] : pair_states) {
+        swapped_pair_states.push_back({idx2, idx1});
+    }
+
+    // Reference values from the pair Hamiltonian in the full product basis at a distance of one
+    // bohr, for a tilted distance vector
+    std::array<double, 3> direction = {1, 0, 2};
+    double norm = std::sqrt(5.0);
+    auto basis_pair = BasisPairCreator<double>().add(system).add(system).create();
+    SystemPair<double> system_pair(basis_pair);
+    system_pair.set_distance_vector({1 / norm, 0, 2 / norm});
+    const auto &matrix = system_pair.get_matrix();
+
+    auto c3_coefficients =
+        calculate_c3_coefficients(system, system, pair_states, swapped_pair_states, direction);
+    auto c6_coefficients = calculate_c6_coefficients(system, system, pair_states, direction);
+    DOCTEST_REQUIRE(c3_coefficients.size() == 3);
+    DOCTEST_REQUIRE(c6_coefficients.size() == 3);
+
+    for (size_t idx = 0; idx < pair_states.size(); ++idx) {
+        auto row = basis_pair->get_ket_index_from_tuple(pair_states[idx][0], pair_states[idx][1]);
+        auto col = basis_pair->get_ket_index_from_tuple(swapped_pair_states[idx][0],
+                                                        swapped_pair_states[idx][1]);
+        DOCTEST_CHECK(std::abs(c3_coefficients[idx] - matrix.coeff(col, row)) <=
+                      1e-12 * std::abs(matrix.coeff(col, row)));
+    }
+
+    // The C6 coefficients are only well-defined for the pair states that do not couple to
+    // degenerate pair states, which excludes the last pair state
+    for (size_t idx = 0; idx < 2; ++idx) {
+        auto row = basis_pair->get_ket_index_from_tuple(pair_states[idx][0], pair_states[idx][1]);
+        double energy = matrix.coeff(row, row);
+        double c6_reference = 0;
+        for (Eigen::SparseMatrix<double, Eigen::RowMajor>::InnerIterator it(matrix, row); it;
+             ++it) {
+            if (it.col() != row) {
+                c6_reference +=
+                    it.value() * it.value() / (matrix.coeff(it.col(), it.col()) - energy);
+            }
+        }
+        DOCTEST_MESSAGE("C6 coefficient in atomic units: ", c6_coefficients[idx]);
+        DOCTEST_CHECK(std::abs(c6_coefficients[idx] - c6_reference) <=
+                      1e-9 * std::abs(c6_reference));
+    }
+    DOCTEST_CHECK(std::isinf(c6_coefficients[2]));
+
+    // Invalid input
+    DOCTEST_CHECK_THROWS_AS(
+        calculate_c6_coefficients(system, system, {{basis->get_number_of_states(), 0}}, direction),
+        std::invalid_argument);
+    DOCTEST_CHECK_THROWS_AS(
+        calculate_c6_coefficients(system, system, pair_states, std::array<double, 3>{0, 1, 0}),
+        std::invalid_argument);
+}
+
+DOCTEST_TEST_CASE("calculate angular maps of C3 and C6 coefficients") {
+    auto &database = Database::get_global_instance();
+
+    auto basis_real = BasisAtomCreator<double>()
+                          .set_species("Rb")
+                          .restrict_quantum_number_n(58, 62)
+                          .restrict_quantum_number_l(0, 2)
+                          .create(database);
+    auto basis_complex = BasisAtomCreator<std::complex<double>>()
+                             .set_species("Rb")
+                             .restrict_quantum_number_n(58, 62)
+                             .restrict_quantum_number_l(0, 2)
+                             .create(database);
+    SystemAtom<double> system_real(basis_real);
+    SystemAtom<std::complex<double>> system_complex(basis_complex);
+
+    std::vector<std::array<size_t, 2>> pair_states;
+    std::vector<std::array<size_t, 2>> swapped_pair_states;
+    for (int l = 1; l <= 2; ++l) {
+        auto ket = KetAtomCreator()
+                       .set_species("Rb")
+                       .set_quantum_number_n(60)
+                       .set_quantum_number_l(l)
+                       .set_quantum_number_j(l + 0.5)
+                       .set_quantum_number_m(0.5)
+                       .create(database);
+        size_t idx = basis_real->get_corresponding_state_index(ket);
+        DOCTEST_REQUIRE(idx == basis_complex->get_corresponding_state_index(ket));
+        pair_states.push_back({idx, idx});
+    }
+    for (const auto &[idx1, idx2] : pair_states) {
+        swapped_pair_states.push_back({idx2, idx1});
+    }
+
+    // Directions on a grid of polar and azimuthal angles
+    std::vector<std::array<double, 3>> directions;
+    for (double theta : {0.0, 0.3, 1.0, std::numbers::pi / 2}) {
+        for (double phi : {0.0, 0.5, 2.0}) {
+            directions.push_back({std::sin(theta) * std::cos(phi), std::sin(theta) * std::sin(phi),
+                                  std::cos(theta)});
+        }
+    }
+
+    // The angular maps obtained with the real systems must agree with the coefficients obtained
+    // with the complex systems for each direction separately
+    auto c3_map = calculate_c3_coefficients(system_real, system_real, pair_states,
+                                            swapped_pair_states, directions);
+    auto c6_map = calculate_c6_coefficients(system_real, system_real, pair_states, directions);
+    DOCTEST_REQUIRE(c3_map.rows() == 2);
+    DOCTEST_REQUIRE(c3_map.cols() == static_cast<Eigen::Index>(directions.size()));
+    DOCTEST_REQUIRE(c6_map.rows() == 2);
+    DOCTEST_REQUIRE(c6_map.cols() == static_cast<Eigen::Index>(directions.size()));
+
+    for (size_t dir = 0; dir < directions.size(); ++dir) {
+        auto c3 = calculate_c3_coefficients(system_complex, system_complex, pair_states,
+                                            swapped_pair_states, directions[dir]);
+        auto c6 =
+            calculate_c6_coefficients(system_complex, system_complex, pair_states, directions[dir]);
+        auto c6_real =
+            calculate_c6_coefficients(system_real, system_real, pair_states, directions[dir]);
+        for (Eigen::Index idx = 0; idx < 2; ++idx) {
+            DOCTEST_CHECK(std::abs(c3_map(idx, static_cast<Eigen::Index>(dir)) - c3[idx]) <=
+                          1e-10 * std::abs(c3[idx]) + 1e-14);
+            DOCTEST_CHECK(std::abs(c6_map(idx, static_cast<Eigen::Index>(dir)) - c6[idx]) <=
+                          1e-10 * std::abs(c6[idx]));
+            DOCTEST_CHECK(std::abs(c6_real[idx] - c6[idx]) <= 1e-10 * std::abs(c6[idx]));
+        }
+    }
+
+    // The complex C3 coefficients for a single direction with a y-component cannot be returned for
+    // real systems
+    DOCTEST_CHECK_THROWS_AS(calculate_c3_coefficients(system_real, system_real, pair_states,
+                                                      swapped_pair_states, directions[4]),
+                            std::invalid_argument);
+
+    // For states with m = 1/2, the C6 coefficients do not depend on the azimuthal angle
+    for (Eigen::Index idx = 0; idx < 2; ++idx) {
+        for (Eigen::Index dir = 0; dir < c6_map.cols(); dir += 3) {
+            DOCTEST_CHECK(std::abs(c6_map(idx, dir + 1) - c6_map(idx, dir)) <=
+                          1e-10 * std::abs(c6_map(idx, dir)));
+            DOCTEST_CHECK(std::abs(c6_map(idx, dir + 2) - c6_map(idx, dir)) <=
+                          1e-10 * std::abs(c6_map(idx, dir)));
+        }
+    }
+}
+} // namespace pairinteraction
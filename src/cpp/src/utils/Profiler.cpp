@@ -0,0 +1,204 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/utils/Profiler.hpp"
+
+#include <algorithm>
+#include <atomic>
+#include <cstddef>
+#include <map>
+#include <memory>
+#include <mutex>
+#include <nlohmann/json.hpp>
+#include <string>
+#include <vector>
+
+namespace pairinteraction {
+namespace {
+
+constexpr std::size_t MAX_NUMBER_OF_EVENTS_PER_THREAD = 100000;
+
+struct TimerStats {
+    std::size_t count{0};
+    double total_seconds{0};
+    double max_seconds{0};
+};
+
+struct CounterStats {
+    std::size_t count{0};
+    double sum{0};
+    double min{0};
+    double max{0};
+};
+
+struct TraceEvent {
+    std::string name;
+    double start_microseconds;
+    double duration_microseconds;
+};
+
+struct ThreadProfile {
+    std::size_t thread_index;
+    std::mutex mutex; // only contended if the profile is read or reset
+    std::map<std::string, TimerStats, std::less<>> timers;
+    std::map<std::string, CounterStats, std::less<>> counters;
+    std::vector<TraceEvent> events;
+    std::size_t number_of_dropped_events{0};
+};
+
+struct Registry {
+    std::mutex mutex;
+    std::vector<std::shared_ptr<ThreadProfile>> thread_profiles;
+    // time point to which the start times of the trace events refer, atomic so that timers can
+    // read it without locking the registry
+    std::atomic<std::chrono::steady_clock::rep> origin{
+        std::chrono::steady_clock::now().time_since_epoch().count()};
+};
+
+Registry &registry() {
+    static Registry value;
+    return value;
+}
+
+ThreadProfile &thread_profile() {
+    // The registry keeps the profile alive after the thread has exited, so that its measurements
+    // are not lost
+    thread_local std::shared_ptr<ThreadProfile> value = [] {
+        auto &reg = registry();
+        std::scoped_lock lock(reg.mutex);
+        auto profile = std::make_shared<ThreadProfile>();
+        profile->thread_index = reg.thread_profiles.size();
+        reg.thread_profiles.push_back(profile);
+        return profile;
+    }();
+    return *value;
+}
+
+std::chrono::steady_clock::time_point get_origin() {
+    return std::chrono::steady_clock::time_point(
+        std::chrono::steady_clock::duration(registry().origin.load()));
+}
+
+template <typename Stats>
+Stats &get_stats(std::map<std::string, Stats, std::less<>> &map, std::string_view name) {
+    auto it = map.find(name);
+    if (it == map.end()) {
+        it = map.emplace(std::string(name), Stats{}).first;
+    }
+    return it->second;
+}
+
+} // namespace
+
+ScopedTimer::ScopedTimer(std::string_view name)
+    : name(name), start(std::chrono::steady_clock::now()) {}
+
+ScopedTimer::~ScopedTimer() {
+    auto end = std::chrono::steady_clock::now();
+    double seconds = std::chrono::duration<double>(end - start).count();
+    double start_microseconds =
+        std::chrono::duration<double, std::micro>(start - get_origin()).count();
+
+    auto &profile = thread_profile();
+    std::scoped_lock lock(profile.mutex);
+    auto &stats = get_stats(profile.timers, name);
+    ++stats.count;
+    stats.total_seconds += seconds;
+    stats.max_seconds = std::max(stats.max_seconds, seconds);
+    if (profile.events.size() < MAX_NUMBER_OF_EVENTS_PER_THREAD) {
+        profile.events.push_back({std::string(name), start_microseconds, seconds * 1e6});
+    } else {
+        ++profile.number_of_dropped_events;
+    }
+}
+
+void add_to_profile_counter(std::string_view name, double value) {
+    auto &profile = thread_profile();
+    std::scoped_lock lock(profile.mutex);
+    auto &stats = get_stats(profile.counters, name);
+    stats.min = stats.count == 0 ? value : std::min(stats.min, value);
+    stats.max = stats.count == 0 ? value : std::max(stats.max, value);
+    ++stats.count;
+    stats.sum += value;
+}
+
+void reset_profile() {
+    auto &reg = registry();
+    std::scoped_lock lock(reg.mutex);
+    for (auto &profile : reg.thread_profiles) {
+        std::scoped_lock profile_lock(profile->mutex);
+        profile->timers.clear();
+        profile->counters.clear();
+        profile->events.clear();
+        profile->number_of_dropped_events = 0;
+    }
+    reg.origin.store(std::chrono::steady_clock::now().time_since_epoch().count());
+}
+
+std::string get_profile_as_json() {
+    std::map<std::string, TimerStats, std::less<>> timers;
+    std::map<std::string, CounterStats, std::less<>> counters;
+    nlohmann::json timers_per_thread = nlohmann::json::object();
+
+    auto &reg = registry();
+    std::scoped_lock lock(reg.mutex);
+    for (auto &profile : reg.thread_profiles) {
+        std::scoped_lock profile_lock(profile->mutex);
+        for (const auto &[name, thread_stats] : profile->timers) {
+            auto &stats = get_stats(timers, name);
+            stats.count += thread_stats.count;
+            stats.total_seconds += thread_stats.total_seconds;
+            stats.max_seconds = std::max(stats.max_seconds, thread_stats.max_seconds);
+            timers_per_thread[name][std::to_string(profile->thread_index)] =
+                thread_stats.total_seconds;
+        }
+        for (const auto &[name, thread_stats] : profile->counters) {
+            auto &stats = get_stats(counters, name);
+            stats.min = stats.count == 0 ? thread_stats.min : std::min(stats.min, thread_stats.min);
+            stats.max = stats.count == 0 ? thread_stats.max : std::max(stats.max, thread_stats.max);
+            stats.count += thread_stats.count;
+            stats.sum += thread_stats.sum;
+        }
+    }
+
+    nlohmann::json json = {{"timers", nlohmann::json::object()},
+                           {"counters", nlohmann::json::object()}};
+    for (const auto &[name, stats] : timers) {
+        json["timers"][name] = {{"count", stats.count},
+                                {"total_seconds", stats.total_seconds},
+                                {"max_seconds", stats.max_seconds},
+                                {"total_seconds_per_thread", timers_per_thread[name]}};
+    }
+    for (const auto &[name, stats] : counters) {
+        json["counters"][name] = {
+            {"count", stats.count}, {"sum", stats.sum}, {"min", stats.min}, {"max", stats.max}};
+    }
+    return json.dump();
+}
+
+std::string get_profile_as_chrome_trace() {
+    nlohmann::json events = nlohmann::json::array();
+    std::size_t number_of_dropped_events = 0;
+
+    auto &reg = registry();
+    std::scoped_lock lock(reg.mutex);
+    for (auto &profile : reg.thread_profiles) {
+        std::scoped_lock profile_lock(profile->mutex);
+        for (const auto &event : profile->events) {
+            events.push_back({{"name", event.name},
+                              {"ph", "X"},
+                              {"ts", event.start_microseconds},
+                              {"dur", event.duration_microseconds},
+                              {"pid", 0},
+                              {"tid", profile->thread_index}});
+        }
+        number_of_dropped_events += profile->number_of_dropped_events;
+    }
+
+    nlohmann::json json = {{"traceEvents", std::move(events)},
+                           {"displayTimeUnit", "ms"},
+                           {"otherData", {{"number_of_dropped_events", number_of_dropped_events}}}};
+    return json.dump();
+}
+
+} // namespace pairinteraction
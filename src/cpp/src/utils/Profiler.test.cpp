@@ -0,0 +1,42 @@
+// SPDX-FileCopyrightText: 2026 PairInteraction Developers
+// SPDX-License-Identifier: LGPL-3.0-or-later
+
+#include "pairinteraction/utils/Profiler.hpp"
+
+#include <doctest/doctest.h>
+#include <nlohmann/json.hpp>
+#include <oneapi/tbb.h>
+
+namespace pairinteraction {
+DOCTEST_TEST_CASE("accumulate timers and counters over threads") {
+    reset_profile();
+
+    {
+        ScopedTimer timer("outer");
+        oneapi::tbb::parallel_for(0, 16, [](int i) {
+            ScopedTimer inner_timer("inner");
+            add_to_profile_counter("dimension", i);
+        });
+    }
+
+    auto profile = nlohmann::json::parse(get_profile_as_json());
+    DOCTEST_CHECK(profile["timers"]["outer"]["count"] == 1);
+    DOCTEST_CHECK(profile["timers"]["inner"]["count"] == 16);
+    DOCTEST_CHECK(profile["timers"]["outer"]["total_seconds"].get<double>() >=
+                  profile["timers"]["inner"]["max_seconds"].get<double>());
+    DOCTEST_CHECK(!profile["timers"]["inner"]["total_seconds_per_thread"].empty());
+    DOCTEST_CHECK(profile["counters"]["dimension"]["count"] == 16);
+    DOCTEST_CHECK(profile["counters"]["dimension"]["sum"] == 120);
+    DOCTEST_CHECK(profile["counters"]["dimension"]["min"] == 0);
+    DOCTEST_CHECK(profile["counters"]["dimension"]["max"] == 15);
+
+    auto trace = nlohmann::json::parse(get_profile_as_chrome_trace());
+    DOCTEST_CHECK(trace["traceEvents"].size() == 17);
+    DOCTEST_CHECK(trace["traceEvents"][0]["ph"] == "X");
+
+    reset_profile();
+    profile = nlohmann::json::parse(get_profile_as_json());
+    DOCTEST_CHECK(profile["timers"].empty());
+    DOCTEST_CHECK(profile["counters"].empty());
+}
+} // namespace pairinteraction
@@ -223,28 +223,43 @@ del _setup_ca_bundle
 # ---------------------------------------------------------------------------------------
 # Import pairinteraction
 # ---------------------------------------------------------------------------------------
-from pairinteraction import (
-    green_tensor,
-    perturbative,
-    real,
-    visualization,
-)
+from pairinteraction import real
 from pairinteraction._backend import (
     VERSION_MAJOR as _VERSION_MAJOR,
     VERSION_MINOR as _VERSION_MINOR,
     VERSION_PATCH as _VERSION_PATCH,
     run_unit_tests,
 )
+from pairinteraction._lazy_import import create_lazy_attribute_hooks
 from pairinteraction.basis import BasisAtom, BasisPair
 from pairinteraction.custom_logging import configure_logging
 from pairinteraction.database import Database, print_database_info
-from pairinteraction.diagonalization import diagonalize
+from pairinteraction.diagonalization import diagonalize, diagonalize_async, iter_diagonalize, track_states
 from pairinteraction.ket import KetAtom, KetPair
-from pairinteraction.perturbative import C3, C6, EffectiveSystemPair
+from pairinteraction.lifetimes import get_lifetimes, get_transition_rates_many
+from pairinteraction.profiling import get_profile, reset_profile, save_profile
 from pairinteraction.state import StateAtom, StatePair
-from pairinteraction.system import SystemAtom, SystemPair
+from pairinteraction.system import SystemAtom, SystemAtomScan, SystemPair, SystemPairScan
 from pairinteraction.units import ureg
 
+if TYPE_CHECKING:
+    from pairinteraction import green_tensor, perturbative, visualization
+    from pairinteraction.perturbative import C3, C6, EffectiveSystemPair
+
+# The following attributes are imported on first access, since importing them pulls in heavy dependencies
+# (e.g. numba and matplotlib) that are not needed by most scripts
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "C3": ("pairinteraction.perturbative", "C3"),
+    "C6": ("pairinteraction.perturbative", "C6"),
+    "EffectiveSystemPair": ("pairinteraction.perturbative", "EffectiveSystemPair"),
+    "green_tensor": ("pairinteraction.green_tensor", None),
+    "perturbative": ("pairinteraction.perturbative", None),
+    "visualization": ("pairinteraction.visualization", None),
+}
+
+__getattr__, __dir__ = create_lazy_attribute_hooks(globals(), _LAZY_ATTRIBUTES)
+
+
 __all__ = [
     "C3",
     "C6",
@@ -257,14 +272,24 @@ __all__ = [
     "StateAtom",
     "StatePair",
     "SystemAtom",
+    "SystemAtomScan",
     "SystemPair",
+    "SystemPairScan",
     "configure_logging",
     "diagonalize",
+    "diagonalize_async",
+    "get_lifetimes",
+    "get_profile",
+    "get_transition_rates_many",
     "green_tensor",
+    "iter_diagonalize",
     "perturbative",
     "print_database_info",
     "real",
+    "reset_profile",
     "run_unit_tests",
+    "save_profile",
+    "track_states",
     "ureg",
     "visualization",
 ]
@@ -276,4 +301,5 @@ __version__ = f"{_VERSION_MAJOR}.{_VERSION_MINOR}.{_VERSION_PATCH}"
 # Clean up namespace
 # ---------------------------------------------------------------------------------------
 del _VERSION_MAJOR, _VERSION_MINOR, _VERSION_PATCH
+del create_lazy_attribute_hooks
 del _setup_dynamic_libraries  # don't delete _setup_test_mode, since it is used in tests/conftest.py
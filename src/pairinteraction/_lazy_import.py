@@ -0,0 +1,41 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def create_lazy_attribute_hooks(
+    module_globals: dict[str, Any], lazy_attributes: Mapping[str, tuple[str, str | None]]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Create the module-level ``__getattr__`` and ``__dir__`` functions for attributes imported on first access.
+
+    Args:
+        module_globals: The globals of the module, in which each attribute is stored after its first access.
+        lazy_attributes: A mapping from the attribute names to tuples of the module to import and the name of the
+            attribute within this module, or None if the attribute is the module itself.
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions, which must be assigned to the module.
+
+    """
+    module_name = module_globals["__name__"]
+
+    def get_lazy_attribute(name: str) -> object:
+        if name not in lazy_attributes:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+        lazy_module_name, attribute = lazy_attributes[name]
+        lazy_module = import_module(lazy_module_name)
+        value = lazy_module if attribute is None else getattr(lazy_module, attribute)
+        module_globals[name] = value
+        return value
+
+    def list_attributes() -> list[str]:
+        return sorted(set(module_globals) | set(lazy_attributes))
+
+    return get_lazy_attribute, list_attributes
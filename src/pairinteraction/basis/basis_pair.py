@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, TypeAlias, TypeGuard, cast, overload
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeAlias, TypeGuard, cast, overload
 
 import numpy as np
 from scipy.sparse import csr_matrix
@@ -34,6 +34,15 @@ BasisPairLike: TypeAlias = "BasisPair | tuple[BasisAtom, BasisAtom] | Sequence[B
 logger = logging.getLogger(__name__)
 
 
+class KetArrays(NamedTuple):
+    """Structure-of-arrays representation of the kets of a pair basis."""
+
+    state_indices1: NDArray
+    state_indices2: NDArray
+    energies: NDArray | PintArray
+    quantum_numbers_m: NDArray
+
+
 def is_basis_pair_like(obj: Any) -> TypeGuard[BasisPairLike]:
     return isinstance(obj, BasisPair) or is_basis_atom_tuple(obj)
 
@@ -237,8 +246,7 @@ class BasisPair(BasisBase[KetPair, StatePair]):
         pair_energies_au = [get_ketpairlike_energy(ket, system_atoms, "hartree") for ket in kets]
         min_energy_au, max_energy_au = min(pair_energies_au), max(pair_energies_au)
 
-        cpp_kets = basis_pair._cpp.get_kets()
-        all_energies_au = np.array([ket_cpp.get_energy() for ket_cpp in cpp_kets])
+        all_energies_au = basis_pair.get_ket_arrays(unit="hartree").energies
         deltas = np.maximum(np.maximum(min_energy_au - all_energies_au, all_energies_au - max_energy_au), 0)
         delta_energy = float(np.partition(deltas, number_of_kets - 1)[number_of_kets - 1]) + 1e-10
 
@@ -299,6 +307,40 @@ class BasisPair(BasisBase[KetPair, StatePair]):
             return int(id_max)
         raise TypeError(f"Unknown type: {type(ket)=}")
 
+    def get_ket_arrays(self, unit: str | None = None) -> KetArrays:
+        """Return the kets of the basis as arrays instead of KetPair objects.
+
+        For large bases, this is much faster and needs much less memory than iterating over `kets`.
+        The i-th entries of the arrays describe the i-th ket, i.e. the indices of the eigenstates of the
+        two `system_atoms` that form the ket, its energy, and its magnetic quantum number m
+        (NaN if m is not well-defined).
+        The basis stores its kets in this form and creates KetPair objects only when they are accessed.
+        Apart from the energies, which are converted to the given unit,
+        the arrays are read-only views of the data stored in the basis.
+
+        Examples:
+            >>> import pairinteraction as pi
+            >>> ket = pi.KetAtom("Rb", n=60, l=0, m=0.5)
+            >>> system = pi.SystemAtom(pi.BasisAtom("Rb", n=(58, 62), l=(0, 2))).diagonalize()
+            >>> pair_energy = 2 * ket.get_energy("GHz")
+            >>> energy_range = (pair_energy - 3, pair_energy + 3)
+            >>> pair_basis = pi.BasisPair([system, system], energy=energy_range, energy_unit="GHz")
+            >>> ket_arrays = pair_basis.get_ket_arrays(unit="GHz")
+            >>> len(ket_arrays.energies) == pair_basis.number_of_kets
+            True
+
+        Args:
+            unit: The unit to which to convert the energies.
+                Default None will return a `pint.Quantity`.
+
+        Returns:
+            The state indices of the first and second atom, the energies, and the magnetic quantum numbers of the kets.
+
+        """
+        ket_arrays = self._cpp.get_kets()
+        energies = QuantityArray.convert_au_to_user(ket_arrays.energies, "energy", unit)
+        return KetArrays(ket_arrays.state_indices1, ket_arrays.state_indices2, energies, ket_arrays.quantum_numbers_m)
+
     @overload
     def get_amplitudes(self, other: KetPairLike | StatePairLike) -> NDArray: ...
 
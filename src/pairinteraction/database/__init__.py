@@ -1,6 +1,6 @@
 # SPDX-FileCopyrightText: 2025 PairInteraction Developers
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from pairinteraction.database.database import Database, print_database_info
+from pairinteraction.database.database import CacheInfo, Database, print_database_info
 
-__all__ = ["Database", "print_database_info"]
+__all__ = ["CacheInfo", "Database", "print_database_info"]
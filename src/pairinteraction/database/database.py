@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING, ClassVar, NamedTuple
 
 from pairinteraction import _backend
 from pairinteraction.custom_logging import _flush_pending_logs
@@ -16,6 +16,16 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+class CacheInfo(NamedTuple):
+    """Statistics of the in-memory cache of matrix elements."""
+
+    hits: int
+    misses: int
+    bytes: int
+    entries: int
+    max_bytes: int
+
+
 class Database:
     """Class for handling the databases for the PairInteraction package.
 
@@ -34,6 +44,7 @@ class Database:
         download_missing: bool = False,
         use_cache: bool = True,
         database_dir: str | os.PathLike[str] = "",
+        use_disk_cache: bool = False,
     ) -> None:
         """Create a new database instance with the given parameters.
 
@@ -42,9 +53,13 @@ class Database:
             use_cache: Whether to load the Wigner 3j symbols table into memory. Default True.
             database_dir: The directory where the databases are stored.
                 Default "", i.e. use the default directory (the user's cache directory).
+            use_disk_cache: Whether to store the matrix elements loaded from the databases in a persistent cache
+                inside the database directory, so that later processes can load them without querying the databases
+                again. Default False.
 
         """
         self._cpp = _backend.Database(download_missing, use_cache, database_dir)
+        self._cpp.set_use_disk_cache(use_disk_cache)
         _flush_pending_logs()  # call it manually because constructors of classes from nanobind cannot be decorated
 
     @classmethod
@@ -68,18 +83,20 @@ class Database:
         download_missing: bool = False,
         use_cache: bool = True,
         database_dir: str | os.PathLike[str] = "",
+        use_disk_cache: bool = False,
     ) -> None:
         """Initialize the global database with the given parameters.
 
         The arguments are the same as for the constructor of this class.
         """
-        db = cls(download_missing, use_cache, database_dir)
+        db = cls(download_missing, use_cache, database_dir, use_disk_cache)
         if cls._global_database is None:
             cls._global_database = db
         elif (
             cls._global_database.download_missing == db.download_missing
             and cls._global_database.use_cache == db.use_cache
             and cls._global_database.database_dir == db.database_dir
+            and cls._global_database.use_disk_cache == db.use_disk_cache
         ):
             pass  # already initialized with the same parameters
         else:
@@ -99,6 +116,11 @@ class Database:
         """Whether to load the Wigner 3j symbols table into memory."""
         return self._cpp.get_use_cache()
 
+    @property
+    def use_disk_cache(self) -> bool:
+        """Whether to store the matrix elements in a persistent cache inside the database directory."""
+        return self._cpp.get_use_disk_cache()
+
     @property
     def database_dir(self) -> Path:
         """The directory where the databases are stored."""
@@ -108,6 +130,74 @@ class Database:
         """Return a formatted table of local and remote database versions."""
         return self._cpp.get_versions_info()
 
+    @property
+    def connection_pool_size(self) -> int:
+        """The maximum number of connections that are used to query the databases concurrently."""
+        return self._cpp.get_connection_pool_size()
+
+    def set_connection_pool_size(self, size: int) -> None:
+        """Set the maximum number of connections that are used to query the databases concurrently.
+
+        Each thread that queries the databases borrows its own connection from a pool of connections,
+        so that e.g. the Hamiltonians of many systems can be constructed in parallel.
+
+        Args:
+            size: The maximum number of connections. Default is the number of hardware threads.
+
+        """
+        self._cpp.set_connection_pool_size(size)
+
+    def set_duckdb_threads(self, threads: int) -> None:
+        """Set the number of threads that DuckDB uses for executing a single query.
+
+        Args:
+            threads: The number of threads. Default of DuckDB is the number of hardware threads.
+
+        """
+        self._cpp.set_duckdb_threads(threads)
+
+    def set_duckdb_max_memory(self, max_memory: str) -> None:
+        """Set the memory limit of the buffer manager of DuckDB.
+
+        Args:
+            max_memory: The memory limit as string, e.g. "8GB" (the default).
+
+        """
+        self._cpp.set_duckdb_max_memory(max_memory)
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Clear the in-memory cache of matrix elements and reset its statistics.
+
+        The cache is shared by all database instances. It stores the matrix elements of the operators
+        for each set of atomic kets, so that bases with the same kets do not need to load them again.
+        """
+        _backend.Database.clear_cache()
+
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return the statistics of the in-memory cache of matrix elements.
+
+        Returns:
+            The number of cache hits and misses, the approximate memory used by the cached matrices in bytes,
+            the number of cached matrices, and the memory budget of the cache in bytes.
+
+        """
+        info = _backend.Database.get_cache_info()
+        return CacheInfo(info.hits, info.misses, info.bytes, info.entries, info.max_bytes)
+
+    @staticmethod
+    def set_cache_max_bytes(max_bytes: int) -> None:
+        """Set the memory budget of the in-memory cache of matrix elements.
+
+        If the cached matrices need more memory than the budget, the least recently used matrices are evicted.
+
+        Args:
+            max_bytes: The memory budget in bytes. Default of the cache is 1 GiB, 0 disables caching.
+
+        """
+        _backend.Database.set_cache_max_bytes(max_bytes)
+
 
 def print_database_info(
     download_missing: bool = True,
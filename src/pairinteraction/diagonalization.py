@@ -2,9 +2,16 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 from __future__ import annotations
 
+import asyncio
+import itertools
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import TYPE_CHECKING, Any, Literal, TypeAlias, TypeVar, overload
 
+import numpy as np
 from typing_extensions import deprecated
 
 from pairinteraction import _backend
@@ -12,16 +19,18 @@ from pairinteraction.enums import get_cpp_float_type
 from pairinteraction.units import QuantityScalar
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Sequence
+    from collections.abc import AsyncIterator, Callable, Generator, Iterable, Iterator, Sequence
+
+    from scipy.sparse import csr_matrix
 
     from pairinteraction.enums import FloatType
     from pairinteraction.system import SystemBase
-    from pairinteraction.units import PintFloat
+    from pairinteraction.units import NDArray, PintArray, PintFloat
 
     Quantity = TypeVar("Quantity", bound="float | PintFloat")
 
 
-Diagonalizer = Literal["eigen", "lapacke_evd", "lapacke_evr", "feast"]
+Diagonalizer = Literal["eigen", "lapacke_evd", "lapacke_evr", "feast", "lanczos"]
 UnionCPPDiagonalizer: TypeAlias = "_backend.DiagonalizerInterfaceReal | _backend.DiagonalizerInterfaceComplex"
 UnionCPPDiagonalizerType: TypeAlias = "type[_backend.DiagonalizerInterfaceReal | _backend.DiagonalizerInterfaceComplex]"
 
@@ -31,12 +40,14 @@ _DiagonalizerDict: dict[str, dict[Diagonalizer, UnionCPPDiagonalizerType]] = {
         "lapacke_evd": _backend.DiagonalizerLapackeEvdReal,
         "lapacke_evr": _backend.DiagonalizerLapackeEvrReal,
         "feast": _backend.DiagonalizerFeastReal,
+        "lanczos": _backend.DiagonalizerLanczosReal,
     },
     "complex": {
         "eigen": _backend.DiagonalizerEigenComplex,
         "lapacke_evd": _backend.DiagonalizerLapackeEvdComplex,
         "lapacke_evr": _backend.DiagonalizerLapackeEvrComplex,
         "feast": _backend.DiagonalizerFeastComplex,
+        "lanczos": _backend.DiagonalizerLanczosComplex,
     },
 }
 
@@ -51,6 +62,9 @@ def diagonalize(
     energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
     energy_range_unit: str | None = None,
     m0: int | None = None,
+    *,
+    warm_start: bool = False,
+    auto_rotate: bool = False,
 ) -> None: ...
 
 
@@ -66,6 +80,8 @@ def diagonalize(
     *,
     energy_unit: str | None,
     m0: int | None = None,
+    warm_start: bool = False,
+    auto_rotate: bool = False,
 ) -> None: ...
 
 
@@ -79,6 +95,8 @@ def diagonalize(
     energy_range_unit: str | None = None,
     m0: int | None = None,
     *,
+    warm_start: bool = False,
+    auto_rotate: bool = False,
     energy_unit: str | None = None,
 ) -> None:
     """Diagonalize a list of systems in parallel using the C++ backend.
@@ -100,7 +118,13 @@ def diagonalize(
     Args:
         systems: A list of `SystemAtom` or `SystemPair` objects, which will get diagonalized inplace.
         diagonalizer: The diagonalizer method to use. Defaults to "eigen".
+            The "feast" and "lanczos" diagonalizers require an energy_range. The "lanczos" diagonalizer works
+            directly on the sparse Hamiltonian and is well suited for large bases with a narrow energy_range.
         float_type: The floating point precision to use for the diagonalization. Defaults to "float64".
+            With "float32_refined", the Hamiltonian is diagonalized with single precision and the eigenpairs are
+            refined with double precision until they meet rtol. If the refinement of a block of the Hamiltonian
+            does not converge, the whole block is diagonalized again with "float64". This only applies to the dense
+            diagonalizers, the "feast" and "lanczos" diagonalizers use "float64" instead.
         rtol: The relative tolerance allowed for eigenenergies. The error in eigenenergies is bounded
             by rtol * ||H||, where ||H|| is the norm of the Hamiltonian matrix. Defaults to 1e-6.
         sort_by_energy: Whether to sort the resulting basis by energy. Defaults to True.
@@ -110,6 +134,16 @@ def diagonalize(
             Defaults to (None, None), i.e. calculate all eigenenergies.
         energy_range_unit: The unit in which the energy_range is given. Defaults to None assumes pint objects.
         m0: The search subspace size for the FEAST diagonalizer. Defaults to None.
+        warm_start: Whether to treat the systems as consecutive steps of a parameter sweep, e.g. of a Stark map.
+            If True, the eigenvectors of the previous system are used as a starting point for diagonalizing the
+            next one, only falling back to the chosen diagonalizer if this does not converge. This can speed up
+            smooth sweeps considerably but is only effective if a finite energy_range is given. Defaults to False.
+        auto_rotate: Whether to diagonalize the Hamiltonian in a rotated frame if the Hamiltonian is rotationally
+            symmetric about an axis other than the quantization axis, e.g. for parallel fields or a distance vector
+            that are tilted with respect to the z-axis. In the rotated frame, the Hamiltonian conserves the
+            magnetic quantum number m and can be diagonalized block-wise, which can speed up the diagonalization
+            considerably. The eigenstates are returned in the original frame. The rotation is skipped if the basis
+            is not closed under rotations, e.g. because of a restricted m. Defaults to False.
         energy_unit: Deprecated, use energy_range_unit instead.
 
     """
@@ -132,7 +166,15 @@ def diagonalize(
         if energy is not None:
             energy_range_au[i] = QuantityScalar.convert_user_to_au(energy, energy_range_unit, "energy")
 
-    cpp_diagonalize_fct(cpp_systems, cpp_diagonalizer, energy_range_au[0], energy_range_au[1], rtol)
+    cpp_diagonalize_fct(
+        cpp_systems,
+        cpp_diagonalizer,
+        energy_range_au[0],
+        energy_range_au[1],
+        rtol,
+        warm_start=warm_start,
+        auto_rotate=auto_rotate,
+    )
 
     for system, cpp_system in zip(systems, cpp_systems, strict=True):
         if sort_by_energy:
@@ -141,6 +183,338 @@ def diagonalize(
         system._cpp = cpp_system
 
 
+@dataclass
+class DiagonalizationResult:
+    """Reduced result of diagonalizing a single system, as yielded by `iter_diagonalize`."""
+
+    index: int
+    """The index of the system within the sequence of systems."""
+    eigenenergies: NDArray | PintArray
+    """The eigenenergies of the system."""
+    overlaps: NDArray | None
+    """The overlaps of the eigenstates with the states of interest, of shape (number of states of interest,
+    number of eigenstates), or None if no states of interest were given."""
+    eigenvectors: csr_matrix | None
+    """The selected columns of the eigenbasis coefficient matrix, or None if no eigenvectors were selected."""
+
+
+def iter_diagonalize(
+    systems: Iterable[SystemBase[Any]],
+    diagonalizer: Diagonalizer = "eigen",
+    float_type: FloatType = "float64",
+    rtol: float = 1e-6,
+    sort_by_energy: bool = True,
+    energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
+    energy_range_unit: str | None = None,
+    m0: int | None = None,
+    *,
+    max_in_flight: int = 16,
+    states_of_interest: Sequence[Any] | None = None,
+    eigenvector_indices: Sequence[int] | slice | None = None,
+    unit: str | None = None,
+    warm_start: bool = False,
+    auto_rotate: bool = False,
+) -> Iterator[DiagonalizationResult]:
+    """Diagonalize a (possibly huge) sequence of systems in chunks and yield reduced results.
+
+    In contrast to `diagonalize`, which keeps all systems together with their eigenbases alive, this generator takes
+    at most `max_in_flight` systems at once from the given iterable, diagonalizes them in parallel using the
+    C++ backend, and yields a `DiagonalizationResult` for each system in the original order. Afterwards, no reference
+    to the system is kept. Thus, if the systems are created lazily, e.g. by a generator expression,
+    each system and its eigenbasis can be garbage collected right after its result has been yielded,
+    and the memory consumption is bounded by the size of a chunk.
+
+    Examples:
+        >>> import numpy as np
+        >>> import pairinteraction as pi
+        >>> ket = pi.KetAtom("Rb", n=60, l=0, m=0.5)
+        >>> basis = pi.BasisAtom("Rb", n=(58, 63), l=(0, 3))
+        >>> systems = (pi.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in np.linspace(0, 1, 5))
+        >>> results = list(pi.iter_diagonalize(systems, max_in_flight=2, states_of_interest=[ket], unit="GHz"))
+        >>> print(len(results), results[0].overlaps.shape == (1, basis.number_of_states))
+        5 True
+
+    Args:
+        systems: An iterable of `SystemAtom` or `SystemPair` objects, which will get diagonalized inplace.
+        diagonalizer: The diagonalizer method to use, see `diagonalize`.
+        float_type: The floating point precision to use for the diagonalization, see `diagonalize`.
+        rtol: The relative tolerance allowed for eigenenergies, see `diagonalize`.
+        sort_by_energy: Whether to sort the resulting basis by energy. Defaults to True.
+        energy_range: A tuple specifying an energy range, in which eigenvalues should be calculated,
+            see `diagonalize`.
+        energy_range_unit: The unit in which the energy_range is given. Defaults to None assumes pint objects.
+        m0: The search subspace size for the FEAST diagonalizer. Defaults to None.
+        max_in_flight: The maximum number of systems that are diagonalized at once. Larger numbers allow
+            for more parallelism, smaller numbers reduce the memory consumption. Defaults to 16.
+        states_of_interest: Kets or states (e.g. KetAtom, a tuple of two KetAtom, or StatePair), for which the overlaps
+            with the eigenstates are calculated. Defaults to None, i.e. no overlaps are calculated.
+        eigenvector_indices: Indices or a slice of the eigenvectors that are returned.
+            Defaults to None, i.e. no eigenvectors are returned.
+        unit: The unit to which to convert the eigenenergies.
+            Default None will return a `pint.Quantity`.
+        warm_start: Whether to use the eigenvectors of the previous step as a starting point within a chunk,
+            see `diagonalize`.
+        auto_rotate: Whether to diagonalize the Hamiltonian in the frame of its symmetry axis, see `diagonalize`.
+
+    Yields:
+        A `DiagonalizationResult` for each system.
+
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+
+    index = 0
+    systems_iterator = iter(systems)
+    while chunk := list(itertools.islice(systems_iterator, max_in_flight)):
+        diagonalize(
+            chunk,
+            diagonalizer,
+            float_type,
+            rtol,
+            sort_by_energy,
+            energy_range,
+            energy_range_unit,
+            m0,
+            warm_start=warm_start,
+            auto_rotate=auto_rotate,
+        )
+
+        # Release the systems one by one, so that their eigenbases are freed as early as possible
+        chunk.reverse()
+        while chunk:
+            system = chunk.pop()
+            eigenbasis = system.get_eigenbasis()
+
+            overlaps = None
+            if states_of_interest is not None:
+                overlaps = np.array([eigenbasis.get_overlaps(state) for state in states_of_interest])
+
+            eigenvectors = None
+            if eigenvector_indices is not None:
+                eigenvectors = eigenbasis.get_coefficients()[:, eigenvector_indices]
+
+            result = DiagonalizationResult(index, system.get_eigenenergies(unit), overlaps, eigenvectors)
+            del system, eigenbasis
+            yield result
+            index += 1
+
+
+@dataclass
+class DiagonalizationProgress:
+    """Progress of a diagonalization started by `diagonalize_async`."""
+
+    number_of_finished_systems: int
+    """The number of systems that have been diagonalized so far."""
+    number_of_systems: int
+    """The total number of systems."""
+    task_info: str
+    """The last status message of the C++ backend."""
+
+
+class DiagonalizationTask:
+    """A running diagonalization as returned by `diagonalize_async`.
+
+    The task can be awaited, which waits until all systems are diagonalized, and asynchronously iterated over,
+    which yields a `DiagonalizationProgress` whenever further systems have been diagonalized.
+    If the awaiting coroutine gets cancelled or `cancel` is called, an abort of the diagonalization is requested
+    from the C++ backend, which stops at the next possibility.
+    """
+
+    def __init__(self, systems: Sequence[SystemBase[Any]], poll_interval: float, **kwargs: Any) -> None:
+        self._number_of_systems = len(systems)
+        self._poll_interval = poll_interval
+        self._started = threading.Event()
+        # guards the cancellation request and whether the C++ backend is running, so that an abort is only
+        # requested while this task is running and the global abort flag is never left behind
+        self._lock = threading.Lock()
+        self._running = False
+        self._cancel_requested = False
+        loop = asyncio.get_running_loop()
+        self._future = loop.run_in_executor(_get_async_executor(), partial(self._run, systems, **kwargs))
+
+    def _run(self, systems: Sequence[SystemBase[Any]], **kwargs: Any) -> None:
+        with self._lock:
+            if self._cancel_requested:
+                raise _backend.TaskAbortedError
+            _backend.reset_task_status()
+            self._running = True
+        self._started.set()
+        try:
+            diagonalize(systems, **kwargs)
+        finally:
+            with self._lock:
+                self._running = False
+                _backend.reset_task_status()
+
+    def cancel(self) -> None:
+        """Request a cooperative abort of the diagonalization.
+
+        Has no effect on the C++ backend if the diagonalization has already finished.
+        """
+        with self._lock:
+            self._cancel_requested = True
+            if self._running:
+                _backend.request_task_abort()
+
+    def done(self) -> bool:
+        """Return whether the diagonalization has finished, failed or was cancelled."""
+        return self._future.done()
+
+    def __await__(self) -> Generator[Any, None, None]:
+        return self._wait().__await__()
+
+    async def _wait(self) -> None:
+        try:
+            # shield the future, since the running diagonalization can not be cancelled by asyncio
+            await asyncio.shield(self._future)
+        except asyncio.CancelledError:
+            self.cancel()
+            # wait for the backend to stop, since it still modifies the systems
+            await asyncio.wait([self._future])
+            if not self._future.cancelled():
+                self._future.exception()  # mark the exception (usually TaskAbortedError) as retrieved
+            raise
+        except _backend.TaskAbortedError:
+            if self._cancel_requested:
+                raise asyncio.CancelledError from None
+            raise
+
+    def __aiter__(self) -> AsyncIterator[DiagonalizationProgress]:
+        return self._iterate_progress()
+
+    async def _iterate_progress(self) -> AsyncIterator[DiagonalizationProgress]:
+        number_of_finished_systems = 0
+        while not self._future.done():
+            await asyncio.wait([self._future], timeout=self._poll_interval)
+            if not self._started.is_set() or self._future.done():
+                continue
+            progress_count = min(_backend.get_progress_count(), self._number_of_systems)
+            if progress_count > number_of_finished_systems:
+                number_of_finished_systems = progress_count
+                yield DiagonalizationProgress(
+                    number_of_finished_systems, self._number_of_systems, _backend.get_task_info()
+                )
+
+        await self
+        if number_of_finished_systems < self._number_of_systems:
+            yield DiagonalizationProgress(self._number_of_systems, self._number_of_systems, "")
+
+
+_async_executor: ThreadPoolExecutor | None = None
+
+
+def _get_async_executor() -> ThreadPoolExecutor:
+    # a single worker, since the task status and progress count of the C++ backend are global
+    global _async_executor  # noqa: PLW0603
+    if _async_executor is None:
+        _async_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pairinteraction-diagonalize")
+    return _async_executor
+
+
+def diagonalize_async(
+    systems: Sequence[SystemBase[Any]],
+    diagonalizer: Diagonalizer = "eigen",
+    float_type: FloatType = "float64",
+    rtol: float = 1e-6,
+    sort_by_energy: bool = True,
+    energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
+    energy_range_unit: str | None = None,
+    m0: int | None = None,
+    *,
+    warm_start: bool = False,
+    auto_rotate: bool = False,
+    poll_interval: float = 0.05,
+) -> DiagonalizationTask:
+    """Diagonalize a list of systems in parallel without blocking the asyncio event loop.
+
+    The diagonalization is done by `diagonalize` on a dedicated worker thread, while the C++ backend releases the GIL.
+    Diagonalizations that are started by `diagonalize_async` are executed one after another, since the task status
+    and progress count of the C++ backend are shared by the whole process. For the same reason, no other
+    diagonalization should run at the same time, e.g. by calling `diagonalize` from another thread.
+
+    Examples:
+        >>> import asyncio
+        >>> import pairinteraction as pi
+        >>> basis = pi.BasisAtom("Rb", n=(58, 63), l=(0, 3))
+        >>> systems = [pi.SystemAtom(basis).set_magnetic_field([0, 0, b], unit="gauss") for b in range(1, 4)]
+        >>> async def main() -> None:
+        ...     async for progress in pi.diagonalize_async(systems):
+        ...         print(f"{progress.number_of_finished_systems} / {progress.number_of_systems}")
+        >>> asyncio.run(main())  # doctest: +ELLIPSIS
+        ...3 / 3
+        >>> print(systems[0].is_diagonal)
+        True
+
+    Args:
+        systems: A list of `SystemAtom` or `SystemPair` objects, which will get diagonalized inplace.
+            The systems must not be modified until the returned task has finished.
+        diagonalizer: The diagonalizer method to use, see `diagonalize`.
+        float_type: The floating point precision to use for the diagonalization, see `diagonalize`.
+        rtol: The relative tolerance allowed for eigenenergies, see `diagonalize`.
+        sort_by_energy: Whether to sort the resulting basis by energy. Defaults to True.
+        energy_range: A tuple specifying an energy range, in which eigenvalues should be calculated,
+            see `diagonalize`.
+        energy_range_unit: The unit in which the energy_range is given. Defaults to None assumes pint objects.
+        m0: The search subspace size for the FEAST diagonalizer. Defaults to None.
+        warm_start: Whether to use the eigenvectors of the previous system as a starting point, see `diagonalize`.
+        auto_rotate: Whether to diagonalize the Hamiltonian in the frame of its symmetry axis, see `diagonalize`.
+        poll_interval: The interval in seconds, in which the progress of the C++ backend is polled. Defaults to 0.05.
+
+    Returns:
+        A `DiagonalizationTask`, which can be awaited or asynchronously iterated over to obtain progress events.
+        Must be called from within a running event loop.
+
+    """
+    return DiagonalizationTask(
+        systems,
+        poll_interval,
+        diagonalizer=diagonalizer,
+        float_type=float_type,
+        rtol=rtol,
+        sort_by_energy=sort_by_energy,
+        energy_range=energy_range,
+        energy_range_unit=energy_range_unit,
+        m0=m0,
+        warm_start=warm_start,
+        auto_rotate=auto_rotate,
+    )
+
+
+def track_states(systems: Sequence[SystemBase[Any]]) -> NDArray:
+    """Track the eigenstates of a sequence of diagonalized systems adiabatically.
+
+    The overlaps between the eigenbases of consecutive systems are calculated and the eigenstates are matched
+    greedily, starting with the pair of eigenstates with the largest overlap. This is done in parallel using the
+    C++ backend. The matchings are chained, so that the eigenstates of all systems are linked to the eigenstates
+    of the first system.
+
+    Examples:
+        >>> import numpy as np
+        >>> import pairinteraction as pi
+        >>> basis = pi.BasisAtom("Rb", n=(58, 63), l=(0, 3), m=(0.5, 0.5))
+        >>> systems = [pi.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in np.linspace(0, 1, 5)]
+        >>> pi.diagonalize(systems)
+        >>> indices = pi.track_states(systems)
+        >>> print(indices.shape == (len(systems), basis.number_of_states))
+        True
+        >>> energies = np.array([s.get_eigenenergies(unit="GHz")[i] for s, i in zip(systems, indices)])
+
+    Args:
+        systems: A list of diagonalized `SystemAtom` or `SystemPair` objects, which must be defined on the same basis,
+            e.g. the steps of a Stark map or a pair potential.
+
+    Returns:
+        An integer array of shape (len(systems), number of eigenstates of the first system). The entry (k, i) is the
+        index of the eigenstate of the k-th system that is adiabatically connected to the i-th eigenstate of the first
+        system, or -1 if the eigenstate was lost, e.g. because it left the energy range of the diagonalization.
+
+    """
+    if len(systems) == 0:
+        return np.zeros((0, 0), dtype=int)
+    cpp_track_states_fct = get_cpp_track_states_function(systems[0])
+    return np.array(cpp_track_states_fct([s._cpp for s in systems]))
+
+
 def get_cpp_diagonalize_function(system: SystemBase[Any]) -> Callable[..., None]:
     if isinstance(system._cpp, _backend.SystemAtomReal):
         return _backend.diagonalizeSystemAtomReal
@@ -156,6 +530,21 @@ def get_cpp_diagonalize_function(system: SystemBase[Any]) -> Callable[..., None]
     )
 
 
+def get_cpp_track_states_function(system: SystemBase[Any]) -> Callable[..., NDArray]:
+    if isinstance(system._cpp, _backend.SystemAtomReal):
+        return _backend.track_statesSystemAtomReal
+    if isinstance(system._cpp, _backend.SystemAtomComplex):
+        return _backend.track_statesSystemAtomComplex
+    if isinstance(system._cpp, _backend.SystemPairReal):
+        return _backend.track_statesSystemPairReal
+    if isinstance(system._cpp, _backend.SystemPairComplex):
+        return _backend.track_statesSystemPairComplex
+    raise TypeError(
+        f"system must be of type SystemAtomReal, SystemPairReal, SystemAtomComplex, or SystemPairComplex, "
+        f"not {type(system)}"
+    )
+
+
 def get_cpp_diagonalizer(
     diagonalizer: Diagonalizer,
     system: SystemBase[Any],
@@ -5,10 +5,11 @@ from typing import Literal
 
 from pairinteraction import _backend
 
-FloatType = Literal["float32", "float64"]
+FloatType = Literal["float32", "float64", "float32_refined"]
 _FloatTypeDict: dict[FloatType, _backend.FloatType] = {
     "float32": _backend.FloatType.FLOAT32,
     "float64": _backend.FloatType.FLOAT64,
+    "float32_refined": _backend.FloatType.FLOAT32_REFINED,
 }
 
 OperatorType = Literal[
@@ -1,10 +1,13 @@
 # SPDX-FileCopyrightText: 2025 PairInteraction Developers
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
+from __future__ import annotations
+
 from functools import lru_cache
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pairinteraction.units import NDArray
 
     def scipy_bessel_function(v: int, z: complex) -> complex: ...
 else:
@@ -26,3 +29,12 @@ def cached_bessel_function_2(z: complex) -> complex:
     return scipy_bessel_function(2, z)
     # for even a bit more speedup:
     # return (2.0 / z) * cached_bessel_function_1(z) - cached_bessel_function_0(z)  # noqa: ERA001
+
+
+def bessel_functions_012(z: NDArray) -> tuple[NDArray, NDArray, NDArray]:
+    """Evaluate the Bessel functions of order 0, 1, and 2 for an array of (complex) arguments."""
+    return (
+        scipy_bessel_function(0, z),  # type: ignore [arg-type, return-value]
+        scipy_bessel_function(1, z),  # type: ignore [arg-type, return-value]
+        scipy_bessel_function(2, z),  # type: ignore [arg-type, return-value]
+    )
@@ -11,9 +11,10 @@ from typing import TYPE_CHECKING, Literal, TypeVar
 import numpy as np
 import scipy.constants as const
 from numba import njit
-from scipy.integrate import quad
+from scipy.integrate import quad, quad_vec
 
 from pairinteraction.green_tensor.bessel_function import (
+    bessel_functions_012,
     cached_bessel_function_0,
     cached_bessel_function_1,
     cached_bessel_function_2,
@@ -34,7 +35,11 @@ if TYPE_CHECKING:
     def njit(cache: bool) -> Callable[[Callable[P, R]], Callable[P, R]]: ...
 
 
-__all__ = ["dynamic_green_tensor_homogeneous", "dynamic_green_tensor_scattered"]
+__all__ = [
+    "dynamic_green_tensor_homogeneous",
+    "dynamic_green_tensor_scattered",
+    "dynamic_green_tensor_scattered_many",
+]
 
 
 def dynamic_green_tensor_homogeneous(
@@ -163,6 +168,70 @@ def dynamic_green_tensor_scattered(
     return gt_scattered
 
 
+def dynamic_green_tensor_scattered_many(
+    pos1: NDArray,
+    pos2: NDArray,
+    z1: NDArray,
+    z2: NDArray,
+    omega: NDArray,
+    epsilon0: NDArray,
+    epsilon1: NDArray,
+    epsilon2: NDArray,
+    *,
+    only_real_part: bool = False,
+) -> NDArray:
+    """Assemble the total scattering Green tensors for many configurations at once.
+
+    In contrast to calling `dynamic_green_tensor_scattered` for each configuration, all nine entries of the Green
+    tensor of a configuration are calculated by a single vectorized quadrature along the elliptical path and a single
+    vectorized quadrature along the real axis. Each configuration has its own adaptive quadrature, so that its
+    accuracy does not depend on the other configurations.
+
+    Args:
+        pos1: Position vectors of atom A as array of shape (n, 3) (m)
+        pos2: Position vectors of atom B as array of shape (n, 3) (m)
+        z1: z-coordinates of the first surface as array of shape (n,) (m)
+        z2: z-coordinates of the second surface as array of shape (n,) (m)
+        omega: Angular frequencies (i.e. 2*pi*f) as array of shape (n,) in 1/s
+        epsilon0: Electric permittivities of the medium between the two surfaces as array of shape (n,)
+        epsilon1: Electric permittivities of the upper medium as array of shape (n,)
+        epsilon2: Electric permittivities of the lower medium as array of shape (n,)
+        only_real_part: If True, only the real part of the Green tensors is calculated (default: False)
+
+    Returns: The Scattering Green Tensors (general complex values) as array of shape (n, 3, 3) (1/m)
+
+    """
+    pos1 = np.asarray(pos1, dtype=float).reshape(-1, 3)
+    pos2 = np.asarray(pos2, dtype=float).reshape(-1, 3)
+    z1, z2, omega = (np.asarray(v, dtype=float).ravel() for v in (z1, z2, omega))
+    epsilon0, epsilon1, epsilon2 = (np.asarray(v, dtype=complex).ravel() for v in (epsilon0, epsilon1, epsilon2))
+
+    # Ensure z1 is the lower surface and z2 is the upper surface
+    is_swapped = z1 > z2
+    z1, z2 = np.where(is_swapped, z2, z1), np.where(is_swapped, z1, z2)
+    epsilon1, epsilon2 = np.where(is_swapped, epsilon2, epsilon1), np.where(is_swapped, epsilon1, epsilon2)
+    if not np.all((z1 < pos1[:, 2]) & (pos1[:, 2] < z2) & (z1 < pos2[:, 2]) & (pos2[:, 2] < z2)):
+        raise ValueError("Both atoms must be located between the two surfaces (i.e. z1 < z_atom < z2).")
+
+    distance = pos2 - pos1
+    height = z2 - z1
+
+    rho = np.sqrt(distance[:, 0] ** 2 + distance[:, 1] ** 2)
+    phi = np.where(rho != 0, np.atan2(distance[:, 1], distance[:, 0]), 0)
+
+    z_ges = pos1[:, 2] + pos2[:, 2] - 2 * z1
+    z_diff = pos1[:, 2] - pos2[:, 2]
+
+    args = (omega, height, rho, phi, epsilon0, epsilon1, epsilon2, z_ges, z_diff)
+    g_elliptic = elliptic_integral_many(*args, only_real_part=only_real_part)
+    g_real = real_axis_integral_many(*args, only_real_part=only_real_part)
+
+    # prefactor see comment in dynamic_green_tensor_homogeneous
+    prefactor = -1 / (epsilon0 * const.epsilon_0 * const.hbar)
+    gt_scattered: NDArray = prefactor[:, np.newaxis, np.newaxis] * (g_elliptic + g_real)
+    return gt_scattered
+
+
 @njit(cache=True)
 def branch(epsilon: complex, k: float, k_rho: complex) -> complex:
     """Calculate the perpendicular wave vector component with positive imaginary part.
@@ -636,3 +705,208 @@ def real_axis_integral(
         epsrel=1e-9,
     )
     return real_real + 1j * imag_real
+
+
+""" The batched versions of the integrals evaluate all entries of the scattering Green Tensors of many configurations.
+    The nine entries of a configuration are integrated at once by an adaptive quadrature of a vector-valued integrand.
+    The elliptical path and the real axis are parametrized such that the integration limits are the same for all
+    configurations.
+    """
+
+
+@njit(cache=True)
+def integrand_many(
+    k_rho: NDArray,
+    dk_rho: NDArray,
+    k0: NDArray,
+    epsilon0: NDArray,
+    epsilon1: NDArray,
+    epsilon2: NDArray,
+    h: NDArray,
+    phi: NDArray,
+    z_ges: NDArray,
+    z_diff: NDArray,
+    j0: NDArray,
+    j1: NDArray,
+    j2: NDArray,
+) -> NDArray:
+    """Calculate the integrands of all entries of the scattering Green Tensors of many configurations.
+
+    The entries are the same as in `Gs` and `Gp`, but they are calculated at once for all entries, reusing the
+    reflection coefficients and the Bessel functions.
+
+    Returns: The integrands (including the Jacobian dk_rho) as array of shape (n, 3, 3)
+
+    """
+    result = np.zeros((len(k_rho), 3, 3), dtype=np.complex128)
+    for i in range(len(k_rho)):
+        kz = branch(epsilon0[i], k0[i], k_rho[i])
+        if (k0[i] == 0 and kz == 0) or (k_rho[i] == 0 and dk_rho[i] == 0):
+            continue
+        k1z = branch(epsilon1[i], k0[i], k_rho[i])
+        k2z = branch(epsilon2[i], k0[i], k_rho[i])
+
+        rs_plus = rs(kz, k1z)
+        rs_minus = rs(kz, k2z)
+        rp_plus = rp(kz, k1z, epsilon1[i])
+        rp_minus = rp(kz, k2z, epsilon2[i])
+
+        args = (kz, h[i], z_ges[i], z_diff[i])
+        as_plus = A_plus(rs_plus, rs_minus, *args)
+        ap_plus = A_plus(rp_plus, rp_minus, *args)
+        ap_minus = A_minus(rp_plus, rp_minus, *args)
+        bp_plus = B_plus(rp_plus, rp_minus, *args)
+        bp_minus = B_minus(rp_plus, rp_minus, *args)
+
+        cos_phi = math.cos(phi[i])
+        sin_phi = math.sin(phi[i])
+        cos_2phi = math.cos(2 * phi[i])
+        sin_2phi = math.sin(2 * phi[i])
+
+        # s-polarized part (only the in-plane entries are non-zero)
+        gs_xx = as_plus / 2 * (j0[i] + j2[i] * cos_2phi)
+        gs_yy = as_plus / 2 * (j0[i] - j2[i] * cos_2phi)
+        gs_xy = -as_plus / 2 * j2[i] * sin_2phi
+
+        # p-polarized part
+        gp_xx = ap_minus / 2 * (j0[i] - j2[i] * cos_2phi)
+        gp_yy = ap_minus / 2 * (j0[i] + j2[i] * cos_2phi)
+        gp_xy = ap_minus / 2 * j2[i] * sin_2phi
+        gp_xz = 1j * (k_rho[i] / kz) * bp_plus * j1[i] * cos_phi
+        gp_yz = 1j * (k_rho[i] / kz) * bp_plus * j1[i] * sin_phi
+        gp_zx = -1j * (k_rho[i] / kz) * bp_minus * j1[i] * cos_phi
+        gp_zy = -1j * (k_rho[i] / kz) * bp_minus * j1[i] * sin_phi
+        gp_zz = -(k_rho[i] ** 2 / kz**2) * ap_plus * j0[i]
+
+        prefactor = 1j / (4 * np.pi) * (k_rho[i] / kz) * np.exp(1j * kz * h[i]) * dk_rho[i]
+        ks = k0[i] ** 2
+        kp = kz**2
+        result[i, 0, 0] = prefactor * (ks * gs_xx - kp * gp_xx)
+        result[i, 0, 1] = prefactor * (ks * gs_xy - kp * gp_xy)
+        result[i, 0, 2] = prefactor * (-kp * gp_xz)
+        result[i, 1, 0] = prefactor * (ks * gs_xy - kp * gp_xy)
+        result[i, 1, 1] = prefactor * (ks * gs_yy - kp * gp_yy)
+        result[i, 1, 2] = prefactor * (-kp * gp_yz)
+        result[i, 2, 0] = prefactor * (-kp * gp_zx)
+        result[i, 2, 1] = prefactor * (-kp * gp_zy)
+        result[i, 2, 2] = prefactor * (-kp * gp_zz)
+    return result
+
+
+def integrate_many(
+    integrand: Callable[[float, slice], NDArray], a: float, b: float, n: int, *, only_real_part: bool
+) -> NDArray:
+    """Integrate the batched integrand with a separate adaptive quadrature for each configuration.
+
+    The integrand is called with the integration variable and the slice of the configurations to evaluate. The error
+    of a configuration is controlled relative to its largest entry. Because the configurations are not integrated
+    together, a configuration with a badly conditioned or non-finite integrand cannot stop the refinement of the
+    others.
+    """
+    result = np.zeros((n, 3, 3), dtype=float if only_real_part else complex)
+    for i in range(n):
+        configuration = slice(i, i + 1)
+
+        def integrand_of_configuration(x: float, configuration: slice = configuration) -> NDArray:
+            values = integrand(x, configuration)[0]
+            return np.real(values) if only_real_part else values
+
+        result[i], _ = quad_vec(integrand_of_configuration, a, b, epsrel=1e-9, norm="max")
+    return result
+
+
+def elliptic_integral_many(
+    omega: NDArray,
+    h: NDArray,
+    rho: NDArray,
+    phi: NDArray,
+    epsilon0: NDArray,
+    epsilon1: NDArray,
+    epsilon2: NDArray,
+    z_ges: NDArray,
+    z_diff: NDArray,
+    *,
+    only_real_part: bool = False,
+) -> NDArray:
+    """Evaluate the elliptic part of the integral for all entries of many configurations.
+
+    The arguments are arrays of shape (n,) with the same meaning as for `elliptic_integral`.
+
+    Returns: The values of the integral along the elliptical path as array of shape (n, 3, 3) (1/m)
+
+    """
+    k_vac = omega / const.c  # magnitude of wave vector in vacuum
+    k0 = k_vac * np.sqrt(epsilon0)
+
+    # Elliptical path in complex plane to avoid singularities (Integral from 0 to 2k_maj)
+    k1 = k_vac * np.sqrt(epsilon1)
+    k2 = k_vac * np.sqrt(epsilon2)
+    kl_max = np.maximum.reduce([np.real(k0), np.real(k1), np.real(k2)])
+
+    k_maj = (kl_max + k_vac) / 2  # major axis of ellipse
+    k_min = np.where(rho != 0, np.minimum(k_vac, 1 / np.where(rho != 0, rho, 1)), k_vac)
+
+    def integrand(t: float, i: slice) -> NDArray:
+        k_rho = k_maj[i] * (1 + np.cos(t)) - 1j * k_min[i] * np.sin(t)
+        dk_rho = -k_maj[i] * np.sin(t) - 1j * k_min[i] * np.cos(t)
+        j0, j1, j2 = bessel_functions_012(k_rho * rho[i])
+        return integrand_many(
+            k_rho, dk_rho, k0[i], epsilon0[i], epsilon1[i], epsilon2[i], h[i], phi[i], z_ges[i], z_diff[i], j0, j1, j2
+        )
+
+    return integrate_many(integrand, np.pi, 0, len(omega), only_real_part=only_real_part)
+
+
+def real_axis_integral_many(
+    omega: NDArray,
+    h: NDArray,
+    rho: NDArray,
+    phi: NDArray,
+    epsilon0: NDArray,
+    epsilon1: NDArray,
+    epsilon2: NDArray,
+    z_ges: NDArray,
+    z_diff: NDArray,
+    *,
+    only_real_part: bool = False,
+) -> NDArray:
+    """Evaluate the real axis part of the integral for all entries of many configurations.
+
+    The arguments are arrays of shape (n,) with the same meaning as for `real_axis_integral`.
+
+    Returns: The values of the integral along the real axis as array of shape (n, 3, 3) (1/m)
+
+    """
+    k_vac = omega / const.c  # magnitude of wave vector in vacuum
+    k0 = k_vac * np.sqrt(epsilon0)
+    k1 = k_vac * np.sqrt(epsilon1)
+    k2 = k_vac * np.sqrt(epsilon2)
+
+    kl_max = np.maximum.reduce([np.real(k0), np.real(k1), np.real(k2)])
+    k_maj = (kl_max + k_vac) / 2
+
+    # Estimate the upper limit for the real axis integral and map the interval [2*k_maj, upper_limit] to [0, 1]
+    upper_limit = np.sqrt((745 / h) ** 2 + 1)
+    lower_limit = 2 * k_maj
+    length = (upper_limit - lower_limit).astype(complex)
+
+    def integrand(s: float, i: slice) -> NDArray:
+        k_rho = lower_limit[i] + s * length[i]
+        j0, j1, j2 = bessel_functions_012(k_rho * rho[i])
+        return integrand_many(
+            k_rho,
+            length[i],
+            k0[i],
+            epsilon0[i],
+            epsilon1[i],
+            epsilon2[i],
+            h[i],
+            phi[i],
+            z_ges[i],
+            z_diff[i],
+            j0,
+            j1,
+            j2,
+        )
+
+    return integrate_many(integrand, 0, 1, len(omega), only_real_part=only_real_part)
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, overload
 
@@ -11,7 +12,7 @@ import numpy as np
 from pairinteraction.units import QuantityArray, QuantityScalar, ureg
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Collection
+    from collections.abc import Callable, Collection, Sequence
 
     from pairinteraction.green_tensor.green_tensor_interpolator import GreenTensorInterpolator
     from pairinteraction.units import (
@@ -125,9 +126,138 @@ class GreenTensorBase(ABC):
         dimension = self._get_dimension(kappa1, kappa2, scaled)
         return QuantityArray.convert_au_to_user(scaled_gt_au / prefactor, dimension, unit)
 
+    @overload
+    def get_many(
+        self,
+        kappa1: int,
+        kappa2: int,
+        transition_energies: Collection[PintFloat] | PintArray | Collection[float] | NDArray,
+        transition_energies_unit: str | None = None,
+        unit: None = None,
+        *,
+        positions: Sequence[tuple[ArrayLike | PintArrayLike, ArrayLike | PintArrayLike]] | None = None,
+        positions_unit: str | None = None,
+        scaled: bool = False,
+    ) -> PintArray: ...
+
+    @overload
+    def get_many(
+        self,
+        kappa1: int,
+        kappa2: int,
+        transition_energies: Collection[PintFloat] | PintArray | Collection[float] | NDArray,
+        transition_energies_unit: str | None = None,
+        *,
+        unit: str,
+        positions: Sequence[tuple[ArrayLike | PintArrayLike, ArrayLike | PintArrayLike]] | None = None,
+        positions_unit: str | None = None,
+        scaled: bool = False,
+    ) -> NDArray: ...
+
+    def get_many(
+        self,
+        kappa1: int,
+        kappa2: int,
+        transition_energies: Collection[PintFloat] | PintArray | Collection[float] | NDArray,
+        transition_energies_unit: str | None = None,
+        unit: str | None = None,
+        *,
+        positions: Sequence[tuple[ArrayLike | PintArrayLike, ArrayLike | PintArrayLike]] | None = None,
+        positions_unit: str | None = None,
+        scaled: bool = False,
+    ) -> PintArray | NDArray:
+        """Calculate the Green tensor for many transition energies and optionally many positions at once.
+
+        This is equivalent to calling :meth:`get` for each transition energy (and each pair of positions),
+        but Green tensors that require a numerical integration are evaluated by one vectorized quadrature for all
+        entries of a Green tensor, which is much faster than integrating the entries one by one.
+
+        Args:
+            kappa1: The rank of the first multipole operator.
+            kappa2: The rank of the second multipole operator.
+            transition_energies: The transition energies at which to evaluate the Green tensor.
+            transition_energies_unit: The unit of the transition energies.
+                Default None, which means that the transition energies must be given as pint object.
+            unit: The unit to which to convert the result.
+                Default None, which means that the result is returned as pint object.
+            positions: A list of position pairs (pos1, pos2) of the two atoms at which to evaluate the Green tensor.
+                Default None, which means that the positions of this Green tensor are used.
+            positions_unit: The unit of the positions, e.g. "micrometer".
+                Default None, which means that the positions must be given as pint objects.
+            scaled: If True, the Green tensor is returned with the prefactor for the interaction
+                already included (the unit has to be adopted accordingly).
+                Default False, which means that the bare Green tensor is returned.
+
+        Returns:
+            The Green tensors in cartesian coordinates as an array of shape (len(transition_energies), 3, 3),
+            or of shape (len(positions), len(transition_energies), 3, 3) if positions are given.
+
+        """
+        omegas_au = np.array(
+            [
+                QuantityScalar.convert_user_to_au(omega, transition_energies_unit, "energy")
+                for omega in transition_energies
+            ]
+        )
+        if positions is None:
+            pos1_au, pos2_au = self.pos1_au[np.newaxis], self.pos2_au[np.newaxis]
+        else:
+            pos1_au, pos2_au = (
+                np.array(
+                    [
+                        [QuantityScalar.convert_user_to_au(v, positions_unit, "distance") for v in pair[i]]
+                        for pair in positions
+                    ]
+                ).reshape(-1, 3)
+                for i in range(2)
+            )
+
+        # in the static limit, the Green tensor does not depend on the transition energy
+        omegas_for_calculation = np.zeros(1) if self.static_limit else omegas_au
+        scaled_gt_au = self._get_scaled_many_au(kappa1, kappa2, pos1_au, pos2_au, omegas_for_calculation)
+        scaled_gt_au = np.broadcast_to(scaled_gt_au, (len(pos1_au), len(omegas_au), *scaled_gt_au.shape[2:]))
+
+        prefactor = np.ones(len(omegas_au))
+        if not scaled:
+            prefactor = np.array([self._get_prefactor_au(kappa1, kappa2, omega_au) for omega_au in omegas_au])
+        scaled_gt_au = scaled_gt_au / prefactor[:, np.newaxis, np.newaxis]
+        if positions is None:
+            scaled_gt_au = scaled_gt_au[0]
+
+        dimension = self._get_dimension(kappa1, kappa2, scaled)
+        return QuantityArray.convert_au_to_user(scaled_gt_au, dimension, unit)
+
     @abstractmethod
     def _get_scaled_au(self, kappa1: int, kappa2: int, transition_energy_au: float) -> NDArray: ...
 
+    def _get_scaled_many_au(
+        self, kappa1: int, kappa2: int, pos1_au: NDArray, pos2_au: NDArray, transition_energies_au: NDArray
+    ) -> NDArray:
+        """Calculate the scaled Green tensors for all pairs of positions and all transition energies in atomic units.
+
+        Subclasses that evaluate the Green tensor numerically should override this method by a vectorized
+        implementation, by default the Green tensors are calculated one by one.
+
+        Args:
+            kappa1: The rank of the first multipole operator.
+            kappa2: The rank of the second multipole operator.
+            pos1_au: The positions of the first atom as an array of shape (n_positions, 3) in atomic units.
+            pos2_au: The positions of the second atom as an array of shape (n_positions, 3) in atomic units.
+            transition_energies_au: The transition energies as an array of shape (n_energies,) in atomic units.
+
+        Returns:
+            The scaled Green tensors as an array of shape (n_positions, n_energies, 3**kappa1, 3**kappa2).
+
+        """
+        green_tensor = copy.copy(self)
+        scaled_gt_list = []
+        for pos1, pos2 in zip(pos1_au, pos2_au, strict=True):
+            green_tensor.pos1_au, green_tensor.pos2_au = pos1, pos2
+            scaled_gt_list.append(
+                [green_tensor._get_scaled_au(kappa1, kappa2, omega) for omega in transition_energies_au]
+            )
+        return np.array(scaled_gt_list)
+
     @staticmethod
     def _get_prefactor_au(kappa1: int, kappa2: int, transition_energy_au: float) -> float:
         r"""Get the prefactor to get the interaction strength from the Green tensor.
@@ -216,7 +346,7 @@ class GreenTensorBase(ABC):
                 for omega in transition_energies
             ]
             gti = GTIClass()
-            scaled_gt_list = [self.get(1, 1, omega, scaled=True) for omega in omegas_pint]
+            scaled_gt_list = list(self.get_many(1, 1, omegas_pint, scaled=True))
             gti.set_list(1, 1, scaled_gt_list, omegas_pint, scaled=True)
             return gti
 
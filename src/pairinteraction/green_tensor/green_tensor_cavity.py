@@ -11,7 +11,7 @@ from typing_extensions import override
 
 from pairinteraction.green_tensor.dynamic_green_tensor import (
     dynamic_green_tensor_homogeneous,
-    dynamic_green_tensor_scattered,
+    dynamic_green_tensor_scattered_many,
 )
 from pairinteraction.green_tensor.green_tensor_base import GreenTensorBase
 from pairinteraction.green_tensor.utils import (
@@ -125,25 +125,40 @@ class GreenTensorCavity(GreenTensorBase):
 
     @override
     def _get_scaled_au(self, kappa1: int, kappa2: int, transition_energy_au: float) -> NDArray:
+        pos1_au, pos2_au = self.pos1_au[np.newaxis], self.pos2_au[np.newaxis]
+        return self._get_scaled_many_au(kappa1, kappa2, pos1_au, pos2_au, np.array([transition_energy_au]))[0, 0]
+
+    @override
+    def _get_scaled_many_au(
+        self, kappa1: int, kappa2: int, pos1_au: NDArray, pos2_au: NDArray, transition_energies_au: NDArray
+    ) -> NDArray:
         if kappa1 == 1 and kappa2 == 1:
-            return self._get_scaled_dipole_dipole_au(transition_energy_au)
+            return self._get_scaled_dipole_dipole_many_au(pos1_au, pos2_au, transition_energies_au)
         raise NotImplementedError("Only dipole-dipole Green tensors are currently implemented.")
 
-    def _get_scaled_dipole_dipole_au(self, transition_energy_au: float) -> NDArray:
-        """Calculate the dipole dipole Green tensor in cartesian coordinates for a cavity in atomic units.
+    def _get_scaled_dipole_dipole_many_au(
+        self, pos1_au: NDArray, pos2_au: NDArray, transition_energies_au: NDArray
+    ) -> NDArray:
+        """Calculate the dipole dipole Green tensors in cartesian coordinates for a cavity in atomic units.
+
+        The scattered part of the Green tensors is calculated for all pairs of positions and all transition energies
+        by `dynamic_green_tensor_scattered_many`, which integrates all entries of a Green tensor at once.
 
         Args:
-            transition_energy_au: The transition energy in atomic units at which to evaluate the Green tensor.
+            pos1_au: The positions of the first atom as an array of shape (n_positions, 3) in atomic units.
+            pos2_au: The positions of the second atom as an array of shape (n_positions, 3) in atomic units.
+            transition_energies_au: The transition energies as an array of shape (n_energies,) in atomic units.
 
         Returns:
-            The dipole dipole Green tensor in cartesian coordinates as a 3x3 array in atomic units (i.e. 1/bohr).
+            The dipole dipole Green tensors in cartesian coordinates as an array of shape
+            (n_positions, n_energies, 3, 3) in atomic units (i.e. 1/bohr).
 
         """
         au_to_meter: float = ureg.Quantity(1, "atomic_unit_of_length").to("meter").magnitude
         lab_to_local_rotation = get_lab_to_local_rotation_matrix(self.surface_normal)
 
-        pos1_local_m = rotate_vector_to_local(self.pos1_au * au_to_meter, lab_to_local_rotation)
-        pos2_local_m = rotate_vector_to_local(self.pos2_au * au_to_meter, lab_to_local_rotation)
+        pos1_local_m = rotate_vector_to_local(pos1_au.T * au_to_meter, lab_to_local_rotation).T
+        pos2_local_m = rotate_vector_to_local(pos2_au.T * au_to_meter, lab_to_local_rotation).T
         point_on_plane1_local_m = rotate_vector_to_local(self.point_on_plane1_au * au_to_meter, lab_to_local_rotation)
         point_on_plane2_local_m = rotate_vector_to_local(self.point_on_plane2_au * au_to_meter, lab_to_local_rotation)
 
@@ -152,18 +167,48 @@ class GreenTensorCavity(GreenTensorBase):
         if np.isclose(z1_m, z2_m, atol=1e-12):
             raise ValueError("The two cavity planes must be distinct.")
 
-        omega_hz = ureg.Quantity(transition_energy_au, "hartree").to("hbar Hz").magnitude
-        epsilon = evaluate_relative_permittivity(self.epsilon, transition_energy_au, "hartree")
-        epsilon1 = evaluate_relative_permittivity(self.surface1_epsilon, transition_energy_au, "hartree")
-        epsilon2 = evaluate_relative_permittivity(self.surface2_epsilon, transition_energy_au, "hartree")
+        omega_hz = ureg.Quantity(transition_energies_au, "hartree").to("hbar Hz").magnitude
+        epsilon = np.array(
+            [evaluate_relative_permittivity(self.epsilon, energy, "hartree") for energy in transition_energies_au]
+        )
+        epsilon1 = np.array(
+            [
+                evaluate_relative_permittivity(self.surface1_epsilon, energy, "hartree")
+                for energy in transition_energies_au
+            ]
+        )
+        epsilon2 = np.array(
+            [
+                evaluate_relative_permittivity(self.surface2_epsilon, energy, "hartree")
+                for energy in transition_energies_au
+            ]
+        )
+
+        # evaluate all combinations of positions and transition energies at once
+        idx_pos, idx_energy = np.indices((len(pos1_au), len(transition_energies_au))).reshape(2, -1)
 
         # unit: # m^(-3) [hbar]^(-1) [epsilon_0]^(-1)
-        gt = dynamic_green_tensor_scattered(
-            pos1_local_m, pos2_local_m, z1_m, z2_m, omega_hz, epsilon, epsilon1, epsilon2, only_real_part=True
+        gt = dynamic_green_tensor_scattered_many(
+            pos1_local_m[idx_pos],
+            pos2_local_m[idx_pos],
+            np.full(len(idx_pos), z1_m),
+            np.full(len(idx_pos), z2_m),
+            omega_hz[idx_energy],
+            epsilon[idx_energy],
+            epsilon1[idx_energy],
+            epsilon2[idx_energy],
+            only_real_part=True,
         )
         if not self.without_vacuum_contribution:
-            gt += dynamic_green_tensor_homogeneous(pos1_local_m, pos2_local_m, omega_hz, epsilon, only_real_part=True)
+            gt += np.array(
+                [
+                    dynamic_green_tensor_homogeneous(
+                        pos1_local_m[i], pos2_local_m[i], omega_hz[j], epsilon[j], only_real_part=True
+                    )
+                    for i, j in zip(idx_pos, idx_energy, strict=True)
+                ]
+            )
         gt = rotate_tensor_to_lab(gt, lab_to_local_rotation)
         to_au = au_to_meter ** (-3) * ((4 * np.pi) ** (-1)) / (const.epsilon_0 * const.hbar)
         # hbar * epsilon_0 = (4*np.pi)**(-1) in atomic units
-        return np.real(gt) / to_au
+        return np.real(gt).reshape(len(pos1_au), len(transition_energies_au), 3, 3) / to_au
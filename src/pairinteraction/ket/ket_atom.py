@@ -6,19 +6,20 @@ from functools import cached_property
 from typing import TYPE_CHECKING, Literal, overload
 
 import numpy as np
-from scipy.special import exprel
 
 from pairinteraction import _backend
 from pairinteraction.database import Database
 from pairinteraction.enums import OperatorType, Parity, get_cpp_parity
 from pairinteraction.ket.ket_base import KetBase
-from pairinteraction.units import QuantityArray, QuantityScalar, ureg
+from pairinteraction.units import QuantityArray, QuantityScalar
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     from typing_extensions import Self
 
     from pairinteraction.enums import OperatorType, Parity
-    from pairinteraction.units import NDArray, PintArray, PintComplex, PintFloat
+    from pairinteraction.units import ArrayLike, NDArray, PintArray, PintArrayLike, PintComplex, PintFloat
 
 
 class KetAtom(KetBase):
@@ -67,7 +68,7 @@ class KetAtom(KetBase):
 
     _cpp: _backend.KetAtom
 
-    def __init__(  # noqa: C901, PLR0912
+    def __init__(
         self,
         species: str,
         n: int | None = None,
@@ -106,40 +107,112 @@ class KetAtom(KetBase):
             database: Which database to use. Default None, i.e. use the global database instance.
 
         """
-        creator = _backend.KetAtomCreator()
-        creator.set_species(species)
+        energy_au = None
         if energy is not None:
             energy_au = QuantityScalar.convert_user_to_au(energy, energy_unit, "energy")
-            creator.set_energy(energy_au)
-        if f is not None:
-            creator.set_quantum_number_f(f)
-        if m is not None:
-            creator.set_quantum_number_m(m)
+        creator = _get_ket_atom_creator(
+            species,
+            n=n,
+            nu=nu,
+            nui=nui,
+            l=l,
+            s=s,
+            j=j,
+            l_ryd=l_ryd,
+            j_ryd=j_ryd,
+            f=f,
+            m=m,
+            energy_au=energy_au,
+            parity=parity,
+        )
+        self._cpp = creator.create(_get_database(database)._cpp)
+
+    @classmethod
+    def from_arrays(
+        cls: type[Self],
+        species: str,
+        n: ArrayLike | None = None,
+        nu: ArrayLike | None = None,
+        nui: ArrayLike | None = None,
+        l: ArrayLike | None = None,
+        s: ArrayLike | None = None,
+        j: ArrayLike | None = None,
+        l_ryd: ArrayLike | None = None,
+        j_ryd: ArrayLike | None = None,
+        f: ArrayLike | None = None,
+        m: ArrayLike | None = None,
+        energy: ArrayLike | PintArrayLike | None = None,
+        energy_unit: str | None = None,
+        parity: Parity | Sequence[Parity] | None = None,
+        database: Database | None = None,
+    ) -> list[Self]:
+        """Create many single-atom canonical basis states at once.
+
+        This is equivalent to creating a KetAtom for each set of quantum numbers,
+        but all kets are obtained by a single database query, which is much faster for many kets.
+        The quantum numbers can be given as one-dimensional arrays or as scalars,
+        which are broadcast to the length of the arrays.
+
+        Examples:
+            >>> import pairinteraction as pi
+            >>> kets = pi.KetAtom.from_arrays("Rb", n=[60, 61, 62], l=0, j=0.5, m=0.5)
+            >>> [str(ket) for ket in kets]
+            ['|Rb:60,S_1/2,1/2⟩', '|Rb:61,S_1/2,1/2⟩', '|Rb:62,S_1/2,1/2⟩']
+
+        Args:
+            species: The atomic species, see `KetAtom.species`.
+            n: The quantum numbers n. Default None, i.e. load from the database.
+            nu: The quantum numbers nu. Default None, i.e. load from the database.
+            nui: The quantum numbers nui. Default None, i.e. load from the database.
+            l: The quantum numbers l. Default None, i.e. load from the database.
+            s: The quantum numbers s. Default None, i.e. load from the database.
+            j: The quantum numbers j. Default None, i.e. load from the database.
+            l_ryd: The quantum numbers l_ryd. Default None, i.e. load from the database.
+            j_ryd: The quantum numbers j_ryd. Default None, i.e. load from the database.
+            f: The quantum numbers f. Default None, i.e. load from the database.
+            m: The quantum numbers m. This should always be provided.
+            energy: The energies. Default None, i.e. load from the database.
+            energy_unit: In which unit the energies are given, e.g. "GHz".
+                Default None, i.e. energies are provided as pint object.
+            parity: The parities. Default None, i.e. load from the database.
+            database: Which database to use. Default None, i.e. use the global database instance.
+
+        Returns:
+            The list of kets.
+
+        """
+        energy_au = None
+        if energy is not None:
+            energy_au = QuantityArray.convert_user_to_au(energy, energy_unit, "energy")
+
+        quantum_numbers = {
+            "n": n,
+            "nu": nu,
+            "nui": nui,
+            "l": l,
+            "s": s,
+            "j": j,
+            "l_ryd": l_ryd,
+            "j_ryd": j_ryd,
+            "f": f,
+            "m": m,
+        }
+        arrays = {key: np.asarray(value) for key, value in quantum_numbers.items() if value is not None}
+        if energy_au is not None:
+            arrays["energy_au"] = np.asarray(energy_au)
         if parity is not None:
-            creator.set_parity(get_cpp_parity(parity))
-        if n is not None:
-            if not (isinstance(n, int) or n.is_integer()):
-                raise ValueError("Quantum number n must be an integer.")
-            creator.set_quantum_number_n(int(n))
-        if nu is not None:
-            creator.set_quantum_number_nu(nu)
-        if nui is not None:
-            creator.set_quantum_number_nui(nui)
-        if l is not None:
-            creator.set_quantum_number_l(l)
-        if s is not None:
-            creator.set_quantum_number_s(s)
-        if j is not None:
-            creator.set_quantum_number_j(j)
-        if l_ryd is not None:
-            creator.set_quantum_number_l_ryd(l_ryd)
-        if j_ryd is not None:
-            creator.set_quantum_number_j_ryd(j_ryd)
-        if database is None:
-            if Database.get_global_database() is None:
-                Database.initialize_global_database()
-            database = Database.get_global_database()
-        self._cpp = creator.create(database._cpp)
+            arrays["parity"] = np.asarray(parity, dtype=object)
+        shape = np.broadcast_shapes(*(array.shape for array in arrays.values())) or (1,)
+        if len(shape) > 1:
+            raise ValueError("The quantum numbers must be given as scalars or one-dimensional arrays.")
+        arrays = {key: np.broadcast_to(array, shape).tolist() for key, array in arrays.items()}
+
+        creators = []
+        for i in range(shape[0]):
+            values = {key: array[i] for key, array in arrays.items()}
+            creators.append(_get_ket_atom_creator(species, **values))
+        kets_cpp = _backend.KetAtomCreator.create_many(creators, _get_database(database)._cpp)
+        return [cls._from_cpp_object(ket_cpp) for ket_cpp in kets_cpp]
 
     @cached_property
     def database(self) -> Database:
@@ -369,68 +442,76 @@ class KetAtom(KetBase):
             The lifetime of the state.
 
         """
-        _, transition_rates = self.get_spontaneous_transition_rates()
-        transition_rates_au = transition_rates.to_base_units().magnitude
-        if temperature is not None:
-            _, black_body_transition_rates = self.get_black_body_transition_rates(temperature, temperature_unit)
-            transition_rates_au = np.append(transition_rates_au, black_body_transition_rates.to_base_units().magnitude)
-
-        lifetime_au = 1 / np.sum(transition_rates_au)
+        from pairinteraction.lifetimes import get_lifetimes
 
-        return QuantityScalar.convert_au_to_user(lifetime_au, "time", unit)
+        lifetimes = get_lifetimes([self], temperature, temperature_unit, unit)  # type: ignore [call-overload]
+        return lifetimes[0]  # type: ignore [no-any-return]
 
     def _get_transition_rates(
         self, which_transitions: Literal["spontaneous", "black_body"], temperature_au: float | None = None
     ) -> tuple[list[KetAtom], NDArray]:
-        from pairinteraction.basis import BasisAtomReal
-        from pairinteraction.system import SystemAtomReal
+        from pairinteraction.lifetimes import _get_transition_rates_many_au
 
         assert which_transitions in ["spontaneous", "black_body"]
 
         is_spontaneous = which_transitions == "spontaneous"
-        n_max = self.n + 30
-
-        energy_range = None
-        if is_spontaneous:
-            energy_range = (-1, self.get_energy("hartree"))
-
-        basis = BasisAtomReal(
-            self.species,
-            n=(1, n_max),
-            l=(self.l - 1, self.l + 1),
-            m=(self.m - 1, self.m + 1),
-            energy=energy_range,
-            energy_unit="hartree",
-            additional_kets=[self],  # needed to make get_matrix_elements(self, ...) work
-            database=self.database,
-        )
-        system = SystemAtomReal(basis)
-
-        relevant_kets = basis.kets
-        energy_differences_au = self.get_energy("hartree") - system.get_eigenenergies("hartree")
-        electric_dipole_moments_au = np.zeros(len(basis.kets))
-        for q in [-1, 0, 1]:
-            # the different entries are only at most once nonzero -> we can just add the arrays
-            el_di_m = basis.get_matrix_elements(self, "electric_dipole", q)
-            electric_dipole_moments_au += el_di_m.to_base_units().magnitude
-
-        transition_rates_au = (
-            (4 / 3)
-            * np.abs(electric_dipole_moments_au) ** 2
-            * energy_differences_au**2
-            / ureg.Quantity(1, "speed_of_light").to_base_units().magnitude ** 3
-        )
-
-        if is_spontaneous:
-            transition_rates_au *= energy_differences_au
-        else:
+        if not is_spontaneous:
             assert temperature_au is not None, "Temperature must be given for black body transitions."
-            if temperature_au == 0:
-                transition_rates_au *= 0
-            else:  # for numerical stability we use 1 / exprel(x) = x / (exp(x) - 1)
-                transition_rates_au *= temperature_au / exprel(energy_differences_au / temperature_au)
-
-        mask = transition_rates_au != 0
-        relevant_kets = [ket for ket, is_relevant in zip(relevant_kets, mask, strict=True) if is_relevant]
-        transition_rates_au = transition_rates_au[mask]
-        return relevant_kets, transition_rates_au
+
+        relevant_kets, transition_rates_au = _get_transition_rates_many_au([self], is_spontaneous, temperature_au)
+        return relevant_kets, transition_rates_au[0]
+
+
+def _get_ket_atom_creator(  # noqa: C901, PLR0912
+    species: str,
+    *,
+    n: int | None = None,
+    nu: float | None = None,
+    nui: float | None = None,
+    l: float | None = None,
+    s: float | None = None,
+    j: float | None = None,
+    l_ryd: float | None = None,
+    j_ryd: float | None = None,
+    f: float | None = None,
+    m: float | None = None,
+    energy_au: float | None = None,
+    parity: Parity | None = None,
+) -> _backend.KetAtomCreator:
+    creator = _backend.KetAtomCreator()
+    creator.set_species(species)
+    if energy_au is not None:
+        creator.set_energy(energy_au)
+    if f is not None:
+        creator.set_quantum_number_f(f)
+    if m is not None:
+        creator.set_quantum_number_m(m)
+    if parity is not None:
+        creator.set_parity(get_cpp_parity(parity))
+    if n is not None:
+        if not (isinstance(n, int) or n.is_integer()):
+            raise ValueError("Quantum number n must be an integer.")
+        creator.set_quantum_number_n(int(n))
+    if nu is not None:
+        creator.set_quantum_number_nu(nu)
+    if nui is not None:
+        creator.set_quantum_number_nui(nui)
+    if l is not None:
+        creator.set_quantum_number_l(l)
+    if s is not None:
+        creator.set_quantum_number_s(s)
+    if j is not None:
+        creator.set_quantum_number_j(j)
+    if l_ryd is not None:
+        creator.set_quantum_number_l_ryd(l_ryd)
+    if j_ryd is not None:
+        creator.set_quantum_number_j_ryd(j_ryd)
+    return creator
+
+
+def _get_database(database: Database | None) -> Database:
+    if database is None:
+        if Database.get_global_database() is None:
+            Database.initialize_global_database()
+        database = Database.get_global_database()
+    return database
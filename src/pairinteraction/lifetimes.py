@@ -0,0 +1,299 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, overload
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.special import exprel
+
+from pairinteraction.enums import get_cpp_operator_type
+from pairinteraction.units import QuantityArray, QuantityScalar, ureg
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from pairinteraction.basis import BasisAtomReal
+    from pairinteraction.ket import KetAtom
+    from pairinteraction.units import NDArray, PintArray, PintFloat
+
+
+@overload
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["spontaneous"],
+    *,
+    unit: None = None,
+) -> tuple[list[KetAtom], PintArray]: ...
+
+
+@overload
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["spontaneous"],
+    *,
+    unit: str,
+) -> tuple[list[KetAtom], NDArray]: ...
+
+
+@overload
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["black_body"],
+    temperature: float | PintFloat,
+    temperature_unit: str | None = None,
+    unit: None = None,
+) -> tuple[list[KetAtom], PintArray]: ...
+
+
+@overload
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["black_body"],
+    temperature: PintFloat,
+    *,
+    unit: str,
+) -> tuple[list[KetAtom], NDArray]: ...
+
+
+@overload
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["black_body"],
+    temperature: float,
+    temperature_unit: str,
+    unit: str,
+) -> tuple[list[KetAtom], NDArray]: ...
+
+
+def get_transition_rates_many(
+    kets: Sequence[KetAtom],
+    which_transitions: Literal["spontaneous", "black_body"],
+    temperature: float | PintFloat | None = None,
+    temperature_unit: str | None = None,
+    unit: str | None = None,
+) -> tuple[list[KetAtom], NDArray | PintArray]:
+    """Calculate the spontaneous or black body transition rates of many kets at once.
+
+    This is equivalent to calling `KetAtom.get_spontaneous_transition_rates` or
+    `KetAtom.get_black_body_transition_rates` for each ket, but much faster for many kets.
+    Kets of the same species and orbital angular momentum share one basis of possible final states,
+    so that the database is queried only once per species and orbital angular momentum,
+    and the electric dipole matrix elements of all kets are obtained by a single sparse matrix product.
+
+    Examples:
+        >>> import pairinteraction as pi
+        >>> kets = [pi.KetAtom("Rb", n=n, l=0, j=0.5, m=0.5) for n in range(60, 63)]
+        >>> relevant_kets, rates = pi.get_transition_rates_many(kets, "spontaneous", unit="1/ms")
+        >>> rates.shape == (len(kets), len(relevant_kets))
+        True
+
+    Args:
+        kets: The kets for which to calculate the transition rates.
+        which_transitions: Whether to calculate the "spontaneous" or the "black_body" transition rates.
+        temperature: The temperature, for which to calculate the black body transition rates.
+            Must only be given for black body transitions.
+        temperature_unit: The unit of the temperature.
+            Default None will assume the temperature is given as `pint.Quantity`.
+        unit: The unit to which to convert the result.
+            Default None will return a `pint.Quantity`.
+
+    Returns:
+        The relevant final states and the transition rates as array of shape (len(kets), len(relevant_kets)).
+        The entry (i, j) is the transition rate from the i-th ket to the j-th relevant state.
+
+    """
+    if which_transitions not in ["spontaneous", "black_body"]:
+        raise ValueError(f"Unknown transitions '{which_transitions}', must be 'spontaneous' or 'black_body'.")
+    is_spontaneous = which_transitions == "spontaneous"
+
+    temperature_au = None
+    if is_spontaneous and temperature is not None:
+        raise ValueError("A temperature must only be given for black body transitions.")
+    if not is_spontaneous:
+        if temperature is None:
+            raise ValueError("A temperature must be given for black body transitions.")
+        temperature_au = QuantityScalar.convert_user_to_au(temperature, temperature_unit, "temperature")
+
+    relevant_kets, transition_rates_au = _get_transition_rates_many_au(kets, is_spontaneous, temperature_au)
+    transition_rates = QuantityArray.convert_au_to_user(transition_rates_au, "transition_rate", unit)
+    return relevant_kets, transition_rates
+
+
+@overload
+def get_lifetimes(
+    kets: Sequence[KetAtom],
+    temperature: float | PintFloat | None = None,
+    temperature_unit: str | None = None,
+    unit: None = None,
+) -> PintArray: ...
+
+
+@overload
+def get_lifetimes(kets: Sequence[KetAtom], *, unit: str) -> NDArray: ...
+
+
+@overload
+def get_lifetimes(kets: Sequence[KetAtom], temperature: PintFloat, *, unit: str) -> NDArray: ...
+
+
+@overload
+def get_lifetimes(kets: Sequence[KetAtom], temperature: float, temperature_unit: str, unit: str) -> NDArray: ...
+
+
+def get_lifetimes(
+    kets: Sequence[KetAtom],
+    temperature: float | PintFloat | None = None,
+    temperature_unit: str | None = None,
+    unit: str | None = None,
+) -> NDArray | PintArray:
+    """Calculate the lifetimes of many kets at once.
+
+    This is equivalent to calling `KetAtom.get_lifetime` for each ket, but much faster for many kets,
+    see `get_transition_rates_many`.
+
+    Examples:
+        >>> import pairinteraction as pi
+        >>> kets = [pi.KetAtom("Rb", n=n, l=0, j=0.5, m=0.5) for n in range(60, 63)]
+        >>> lifetimes = pi.get_lifetimes(kets, temperature=300, temperature_unit="K", unit="us")
+        >>> lifetimes.shape
+        (3,)
+
+    Args:
+        kets: The kets for which to calculate the lifetimes.
+        temperature: The temperature, for which to calculate the black body transition rates.
+            Default None will not include black body transitions.
+        temperature_unit: The unit of the temperature.
+            Default None will assume the temperature is given as `pint.Quantity`.
+        unit: The unit to which to convert the result.
+            Default None will return a `pint.Quantity`.
+
+    Returns:
+        The lifetimes of the kets.
+
+    """
+    temperature_au = None
+    if temperature is not None:
+        temperature_au = QuantityScalar.convert_user_to_au(temperature, temperature_unit, "temperature")
+
+    total_transition_rates_au = np.zeros(len(kets))
+    for ket_indices, basis in _get_shared_bases(kets, restrict_energy=temperature_au is None):
+        group = [kets[i] for i in ket_indices]
+        transition_rates_au = _calculate_transition_rates_au(group, basis, True, temperature_au)
+        total_transition_rates_au[ket_indices] = np.asarray(transition_rates_au.sum(axis=1)).ravel()
+
+    lifetimes_au = 1 / total_transition_rates_au
+    return QuantityArray.convert_au_to_user(lifetimes_au, "time", unit)
+
+
+def _get_transition_rates_many_au(
+    kets: Sequence[KetAtom], is_spontaneous: bool, temperature_au: float | None
+) -> tuple[list[KetAtom], NDArray]:
+    """Calculate either the spontaneous or the black body transition rates of the kets in atomic units."""
+    # the bases of different groups can overlap, thus we map each relevant final state to a unique column
+    columns: dict[KetAtom, int] = {}
+    blocks: list[tuple[list[int], list[int], NDArray]] = []
+    for ket_indices, basis in _get_shared_bases(kets, restrict_energy=is_spontaneous):
+        group = [kets[i] for i in ket_indices]
+        transition_rates_au = _calculate_transition_rates_au(group, basis, is_spontaneous, temperature_au)
+
+        # only keep the final states with a nonzero transition rate from at least one of the kets
+        relevant_indices = np.unique(transition_rates_au.indices)
+        block_columns = [columns.setdefault(basis.get_ket(int(i)), len(columns)) for i in relevant_indices]
+        blocks.append((ket_indices, block_columns, transition_rates_au[:, relevant_indices].toarray()))
+
+    transition_rates_au = np.zeros((len(kets), len(columns)))
+    for ket_indices, block_columns, block in blocks:
+        transition_rates_au[np.ix_(ket_indices, block_columns)] += block
+
+    relevant_kets = list(columns)
+    return relevant_kets, transition_rates_au
+
+
+def _get_shared_bases(kets: Sequence[KetAtom], *, restrict_energy: bool) -> list[tuple[list[int], BasisAtomReal]]:
+    """Group the kets by species and l and create one basis of possible final states for each group.
+
+    The basis of a group contains the final states of all its kets. The final states that are not relevant for a
+    particular ket, e.g. states with n larger than the n of the ket + 30, are excluded when calculating
+    the transition rates.
+    """
+    from pairinteraction.basis import BasisAtomReal
+
+    groups: dict[tuple[str, float], list[int]] = {}
+    for i, ket in enumerate(kets):
+        groups.setdefault((ket.species, ket.l), []).append(i)
+
+    bases = []
+    for (species, l), ket_indices in groups.items():
+        group = [kets[i] for i in ket_indices]
+        energy_range = None
+        if restrict_energy:
+            energy_range = (-1, max(ket.get_energy("hartree") for ket in group))
+
+        basis = BasisAtomReal(
+            species,
+            n=(1, max(ket.n for ket in group) + 30),
+            l=(l - 1, l + 1),
+            m=(min(ket.m for ket in group) - 1, max(ket.m for ket in group) + 1),
+            energy=energy_range,
+            energy_unit="hartree",
+            additional_kets=group,  # needed to obtain the matrix elements of the kets themselves
+            database=group[0].database,
+        )
+        bases.append((ket_indices, basis))
+
+    return bases
+
+
+def _calculate_transition_rates_au(
+    kets: Sequence[KetAtom], basis: BasisAtomReal, include_spontaneous: bool, temperature_au: float | None
+) -> csr_matrix:
+    """Calculate the transition rates from the kets to the states of the basis as sparse matrix in atomic units.
+
+    The spontaneous transition rates are included if include_spontaneous is True,
+    the black body transition rates are included if a temperature is given.
+    """
+    from pairinteraction.system import SystemAtomReal
+
+    energies_au = SystemAtomReal(basis).get_hamiltonian("hartree").diagonal()
+    rows = [basis.get_corresponding_state_index(ket) for ket in kets]
+
+    # the different components q are at most once nonzero for each pair of states -> we can just add them
+    electric_dipole = get_cpp_operator_type("electric_dipole")
+    dipole_matrix_au = sum(basis._cpp.get_matrix_elements(basis._cpp, electric_dipole, q) for q in [-1, 0, 1])
+    selection = csr_matrix((np.ones(len(rows)), (np.arange(len(rows)), rows)), shape=(len(rows), len(energies_au)))
+    electric_dipole_moments_au = (selection @ dipole_matrix_au).tocsr()
+    electric_dipole_moments_au.sort_indices()
+
+    row_indices = np.repeat(np.arange(len(rows)), np.diff(electric_dipole_moments_au.indptr))
+    energy_differences_au = energies_au[np.asarray(rows)[row_indices]] - energies_au[electric_dipole_moments_au.indices]
+
+    # the basis is shared by kets with different n, but each ket only decays to final states with n up to its own
+    # n + 30, like if a separate basis was used for each ket
+    n_final = np.array([ket.get_quantum_number_n() for ket in basis._cpp.get_kets()])
+    n_max = np.array([ket.n for ket in kets]) + 30
+    is_included = n_final[electric_dipole_moments_au.indices] <= n_max[row_indices]
+
+    einstein_factors_au = (
+        (4 / 3)
+        * np.abs(electric_dipole_moments_au.data) ** 2
+        * energy_differences_au**2
+        / ureg.Quantity(1, "speed_of_light").to_base_units().magnitude ** 3
+    )
+
+    einstein_factors_au[~is_included] = 0
+
+    transition_rates_au = np.zeros_like(einstein_factors_au)
+    if include_spontaneous:
+        transition_rates_au += einstein_factors_au * np.clip(energy_differences_au, 0, None)
+    if temperature_au is not None and temperature_au != 0:
+        # for numerical stability we use 1 / exprel(x) = x / (exp(x) - 1)
+        transition_rates_au += einstein_factors_au * temperature_au / exprel(energy_differences_au / temperature_au)
+
+    matrix = csr_matrix(
+        (transition_rates_au, electric_dipole_moments_au.indices, electric_dipole_moments_au.indptr),
+        shape=electric_dipole_moments_au.shape,
+    )
+    matrix.eliminate_zeros()
+    return matrix
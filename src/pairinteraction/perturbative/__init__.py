@@ -3,6 +3,12 @@
 
 from pairinteraction.perturbative.c3 import C3, C3Real
 from pairinteraction.perturbative.c6 import C6, C6Real
+from pairinteraction.perturbative.dispersion_coefficients import (
+    get_c3_angular_map,
+    get_c3_coefficients,
+    get_c6_angular_map,
+    get_c6_coefficients,
+)
 from pairinteraction.perturbative.effective_system_pair import EffectiveSystemPair, EffectiveSystemPairReal
 from pairinteraction.perturbative.perturbative import (
     create_system_for_perturbative,
@@ -19,7 +25,11 @@ __all__ = [
     "EffectiveSystemPair",
     "EffectiveSystemPairReal",
     "create_system_for_perturbative",
+    "get_c3_angular_map",
+    "get_c3_coefficients",
     "get_c3_from_system",
+    "get_c6_angular_map",
+    "get_c6_coefficients",
     "get_c6_from_system",
     "get_effective_hamiltonian_from_system",
 ]
@@ -0,0 +1,284 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, overload
+
+import numpy as np
+
+from pairinteraction import _backend
+from pairinteraction.units import QuantityArray
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from pairinteraction.ket import KetAtomTuple
+    from pairinteraction.system import SystemAtom
+    from pairinteraction.units import ArrayLike, NDArray, PintArray
+
+
+@overload
+def get_c3_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    unit: None = None,
+) -> PintArray: ...
+
+
+@overload
+def get_c3_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    *,
+    unit: str,
+) -> NDArray: ...
+
+
+def get_c3_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    unit: str | None = None,
+) -> NDArray | PintArray:
+    r"""Calculate the :math:`C_3` coefficients between the pair states ``|a, b>`` and ``|b, a>`` for many pair states.
+
+    For each ket tuple (a, b), the :math:`C_3` coefficient is the matrix element of the dipole-dipole interaction
+    between ``|a, b>`` and ``|b, a>`` times :math:`r^3`, like in the `C3` class.
+    In contrast to the `C3` class, the matrix elements are calculated directly from the dipole matrix elements of the
+    atoms for all ket tuples in one call, without constructing a `SystemPair`.
+
+    Args:
+        ket_tuples: The ket tuples (a, b), where a and b must be of the same species.
+        system_atoms: The diagonalized systems of the two atoms, whose eigenstates correspond to the kets.
+        angle_degree: The angle between the distance vector and the z-axis in degrees.
+            90 degrees corresponds to the x-axis. Defaults to 0, which corresponds to the z-axis.
+        unit: The unit in which to return the :math:`C_3` coefficients. Default None returns a pint object.
+
+    Returns:
+        The :math:`C_3` coefficients of the ket tuples.
+
+    """
+    initial_pair_states = _get_indices_of_pair_states(ket_tuples, system_atoms)
+    final_pair_states = _get_indices_of_pair_states([(ket2, ket1) for ket1, ket2 in ket_tuples], system_atoms)
+    cpp_function = _get_cpp_function(system_atoms, "calculate_c3_coefficients")
+    c3_au = np.real_if_close(
+        cpp_function(
+            system_atoms[0]._cpp,
+            system_atoms[1]._cpp,
+            initial_pair_states,
+            final_pair_states,
+            _get_direction(angle_degree),
+        )
+    )
+    return QuantityArray.convert_au_to_user(c3_au, "c3", unit)
+
+
+@overload
+def get_c6_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    unit: None = None,
+) -> PintArray: ...
+
+
+@overload
+def get_c6_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    *,
+    unit: str,
+) -> NDArray: ...
+
+
+def get_c6_coefficients(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    angle_degree: float = 0,
+    unit: str | None = None,
+) -> NDArray | PintArray:
+    r"""Calculate the :math:`C_6` coefficients of many pair states ``|a, b>``.
+
+    The :math:`C_6` coefficients are defined such that the van der Waals interaction potential is given by
+    :math:`V(r) = -C_6/r^6`, like in the `C6` class. They are calculated in second-order perturbation theory, taking
+    into account the dipole-dipole interaction with all products of the eigenstates of the two atoms.
+    In contrast to the `C6` class, no `SystemPair` is constructed. Instead, the C++ backend calculates for each pair
+    state only its row of the dipole-dipole interaction from the dipole matrix elements of the atoms.
+    This makes it cheap to calculate the :math:`C_6` coefficients of a whole list of pair states in one call.
+
+    If a pair state couples to a degenerate pair state, e.g. ``|a, b>`` to ``|b, a>``, its :math:`C_6` coefficient is
+    infinite. Use the `EffectiveSystemPair` class with the degenerate pair states as model space instead.
+
+    Args:
+        ket_tuples: The ket tuples (a, b) of the pair states.
+        system_atoms: The diagonalized systems of the two atoms, whose eigenstates correspond to the kets.
+        angle_degree: The angle between the distance vector and the z-axis in degrees.
+            90 degrees corresponds to the x-axis. Defaults to 0, which corresponds to the z-axis.
+        unit: The unit in which to return the :math:`C_6` coefficients. Default None returns a pint object.
+
+    Returns:
+        The :math:`C_6` coefficients of the ket tuples.
+
+    """
+    pair_states = _get_indices_of_pair_states(ket_tuples, system_atoms)
+    cpp_function = _get_cpp_function(system_atoms, "calculate_c6_coefficients")
+    c6_au = np.asarray(
+        cpp_function(system_atoms[0]._cpp, system_atoms[1]._cpp, pair_states, _get_direction(angle_degree))
+    )
+    return QuantityArray.convert_au_to_user(c6_au, "c6", unit)
+
+
+@overload
+def get_c3_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    unit: None = None,
+) -> PintArray: ...
+
+
+@overload
+def get_c3_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    *,
+    unit: str,
+) -> NDArray: ...
+
+
+def get_c3_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    unit: str | None = None,
+) -> NDArray | PintArray:
+    r"""Calculate the :math:`C_3` coefficients of many pair states for many directions of the distance vector.
+
+    Like `get_c3_coefficients`, but for a grid of polar angles :math:`\theta` and azimuthal angles :math:`\phi`.
+    The products of the dipole matrix elements are calculated only once per pair state and spherical components of
+    the dipole operators. The :math:`C_3` coefficient for a direction is then obtained by contracting them with the
+    spherical components of the dipole-dipole Green tensor of the direction, which is cheap.
+
+    Args:
+        ket_tuples: The ket tuples (a, b), where a and b must be of the same species.
+        system_atoms: The diagonalized systems of the two atoms, whose eigenstates correspond to the kets.
+        theta_degree: The angles between the distance vector and the z-axis in degrees.
+        phi_degree: The angles between the projection of the distance vector onto the xy-plane and the x-axis in
+            degrees. Must be broadcastable with theta_degree. Defaults to 0.
+        unit: The unit in which to return the :math:`C_3` coefficients. Default None returns a pint object.
+
+    Returns:
+        The :math:`C_3` coefficients as a complex array of shape ``(len(ket_tuples), *shape)``, where ``shape`` is
+        the broadcasted shape of theta_degree and phi_degree. The array is always complex, since the :math:`C_3`
+        coefficients are complex in general if the distance vector has a y-component.
+
+    """
+    directions, shape = _get_directions(theta_degree, phi_degree)
+    initial_pair_states = _get_indices_of_pair_states(ket_tuples, system_atoms)
+    final_pair_states = _get_indices_of_pair_states([(ket2, ket1) for ket1, ket2 in ket_tuples], system_atoms)
+    cpp_function = _get_cpp_function(system_atoms, "calculate_c3_coefficients")
+    c3_au = np.asarray(
+        cpp_function(system_atoms[0]._cpp, system_atoms[1]._cpp, initial_pair_states, final_pair_states, directions),
+        dtype=complex,
+    ).reshape(len(ket_tuples), *shape)
+    return QuantityArray.convert_au_to_user(c3_au, "c3", unit)
+
+
+@overload
+def get_c6_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    unit: None = None,
+) -> PintArray: ...
+
+
+@overload
+def get_c6_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    *,
+    unit: str,
+) -> NDArray: ...
+
+
+def get_c6_angular_map(
+    ket_tuples: Sequence[KetAtomTuple],
+    system_atoms: tuple[SystemAtom, SystemAtom],
+    theta_degree: float | ArrayLike,
+    phi_degree: float | ArrayLike = 0,
+    unit: str | None = None,
+) -> NDArray | PintArray:
+    r"""Calculate the :math:`C_6` coefficients of many pair states for many directions of the distance vector.
+
+    Like `get_c6_coefficients`, but for a grid of polar angles :math:`\theta` and azimuthal angles :math:`\phi`.
+    For each pair state, the second-order contributions are calculated only once per combination of the spherical
+    components of the dipole operators of both atoms. The :math:`C_6` coefficient for a direction is then obtained by
+    contracting them with the spherical components of the dipole-dipole Green tensor of the direction, so that fine
+    angular grids are cheap.
+
+    Args:
+        ket_tuples: The ket tuples (a, b) of the pair states.
+        system_atoms: The diagonalized systems of the two atoms, whose eigenstates correspond to the kets.
+        theta_degree: The angles between the distance vector and the z-axis in degrees.
+        phi_degree: The angles between the projection of the distance vector onto the xy-plane and the x-axis in
+            degrees. Must be broadcastable with theta_degree. Defaults to 0.
+        unit: The unit in which to return the :math:`C_6` coefficients. Default None returns a pint object.
+
+    Returns:
+        The :math:`C_6` coefficients as an array of shape ``(len(ket_tuples), *shape)``, where ``shape`` is the
+        broadcasted shape of theta_degree and phi_degree.
+
+    """
+    directions, shape = _get_directions(theta_degree, phi_degree)
+    pair_states = _get_indices_of_pair_states(ket_tuples, system_atoms)
+    cpp_function = _get_cpp_function(system_atoms, "calculate_c6_coefficients")
+    c6_au = np.asarray(cpp_function(system_atoms[0]._cpp, system_atoms[1]._cpp, pair_states, directions)).reshape(
+        len(ket_tuples), *shape
+    )
+    return QuantityArray.convert_au_to_user(c6_au, "c6", unit)
+
+
+def _get_indices_of_pair_states(
+    ket_tuples: Sequence[KetAtomTuple], system_atoms: tuple[SystemAtom, SystemAtom]
+) -> list[tuple[int, int]]:
+    eigenbases = [system.get_eigenbasis() for system in system_atoms]
+    indices = []
+    for ket_tuple in ket_tuples:
+        if len(ket_tuple) != 2:
+            raise ValueError("All ket tuples must contain exactly two kets")
+        idx1, idx2 = (
+            basis.get_corresponding_state_index(ket) for basis, ket in zip(eigenbases, ket_tuple, strict=True)
+        )
+        indices.append((idx1, idx2))
+    return indices
+
+
+def _get_direction(angle_degree: float) -> list[float]:
+    return [np.sin(np.deg2rad(angle_degree)), 0, np.cos(np.deg2rad(angle_degree))]
+
+
+def _get_directions(
+    theta_degree: float | ArrayLike, phi_degree: float | ArrayLike
+) -> tuple[list[list[float]], tuple[int, ...]]:
+    theta, phi = np.broadcast_arrays(np.deg2rad(theta_degree), np.deg2rad(phi_degree))
+    directions = np.stack([np.sin(theta) * np.cos(phi), np.sin(theta) * np.sin(phi), np.cos(theta)], axis=-1)
+    return directions.reshape(-1, 3).tolist(), theta.shape
+
+
+def _get_cpp_function(system_atoms: tuple[SystemAtom, SystemAtom], name: str) -> Callable[..., NDArray]:
+    if all(isinstance(system._cpp, _backend.SystemAtomReal) for system in system_atoms):
+        return getattr(_backend, f"{name}Real")  # type: ignore [no-any-return]
+    if all(isinstance(system._cpp, _backend.SystemAtomComplex) for system in system_atoms):
+        return getattr(_backend, f"{name}Complex")  # type: ignore [no-any-return]
+    raise TypeError("system_atoms must be either both of type SystemAtomReal or both of type SystemAtomComplex.")
@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+from pairinteraction import _backend
+
+if TYPE_CHECKING:
+    import os
+
+
+def get_profile() -> dict[str, Any]:
+    """Get the time spent in the stages of the C++ backend and the values of its counters.
+
+    The C++ backend measures the time spent in its main stages (e.g. reading matrix elements from the database,
+    constructing Hamiltonians, and diagonalizing) and counts quantities such as matrix dimensions and cache hits.
+    The measurements are accumulated since the start of the program or the last call of `reset_profile`.
+
+    Examples:
+        >>> import pairinteraction as pi
+        >>> pi.reset_profile()
+        >>> basis = pi.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+        >>> system = pi.SystemAtom(basis).set_electric_field([0, 0, 1], unit="V/cm").diagonalize()
+        >>> profile = pi.get_profile()
+        >>> profile["timers"]["System::diagonalize"]["count"]
+        1
+
+    Returns:
+        A dictionary with the keys "timers" and "counters". The timers map the name of a stage to the number of
+        measurements ("count"), the total and maximum time in seconds ("total_seconds", "max_seconds"), and the
+        total time per thread ("total_seconds_per_thread"). The counters map the name of a counter to the number of
+        values ("count") and their "sum", "min", and "max".
+
+    """
+    return json.loads(_backend.get_profile_as_json())  # type: ignore [no-any-return]
+
+
+def reset_profile() -> None:
+    """Remove all measurements and counters from the profile, see `get_profile`."""
+    _backend.reset_profile()
+
+
+def save_profile(filename: str | os.PathLike[str], file_format: Literal["json", "chrome_trace"] = "json") -> None:
+    """Save the profile of the C++ backend to a file.
+
+    Args:
+        filename: The name of the file to which the profile is written.
+        file_format: The format of the file. Either "json", to write the accumulated measurements as returned by
+            `get_profile`, or "chrome_trace", to write the individual measurements in the trace event format that
+            can be opened with chrome://tracing or https://ui.perfetto.dev. Default is "json".
+
+    """
+    if file_format == "json":
+        content = _backend.get_profile_as_json()
+    elif file_format == "chrome_trace":
+        content = _backend.get_profile_as_chrome_trace()
+    else:
+        raise ValueError(f"Unknown file format '{file_format}', must be 'json' or 'chrome_trace'.")
+    Path(filename).write_text(content, encoding="utf-8")
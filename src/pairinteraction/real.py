@@ -1,38 +1,59 @@
 # SPDX-FileCopyrightText: 2025 PairInteraction Developers
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
-from pairinteraction import (
-    green_tensor,
-    perturbative,
-    visualization,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pairinteraction._backend import run_unit_tests
+from pairinteraction._lazy_import import create_lazy_attribute_hooks
 from pairinteraction.basis import (
     BasisAtomReal as BasisAtom,
     BasisPairReal as BasisPair,
 )
 from pairinteraction.custom_logging import configure_logging
 from pairinteraction.database import Database, print_database_info
-from pairinteraction.diagonalization import diagonalize
+from pairinteraction.diagonalization import diagonalize, diagonalize_async, iter_diagonalize, track_states
 from pairinteraction.ket import (
     KetAtom,
     KetPairReal as KetPair,
 )
-from pairinteraction.perturbative import (
-    C3Real as C3,  # noqa: N814
-    C6Real as C6,  # noqa: N814
-    EffectiveSystemPairReal as EffectiveSystemPair,
-)
+from pairinteraction.lifetimes import get_lifetimes, get_transition_rates_many
+from pairinteraction.profiling import get_profile, reset_profile, save_profile
 from pairinteraction.state import (
     StateAtomReal as StateAtom,
     StatePairReal as StatePair,
 )
 from pairinteraction.system import (
     SystemAtomReal as SystemAtom,
+    SystemAtomScanReal as SystemAtomScan,
     SystemPairReal as SystemPair,
+    SystemPairScanReal as SystemPairScan,
 )
 from pairinteraction.units import ureg
 
+if TYPE_CHECKING:
+    from pairinteraction import green_tensor, perturbative, visualization
+    from pairinteraction.perturbative import (
+        C3Real as C3,  # noqa: N814
+        C6Real as C6,  # noqa: N814
+        EffectiveSystemPairReal as EffectiveSystemPair,
+    )
+
+# The following attributes are imported on first access, see pairinteraction/__init__.py
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str | None]] = {
+    "C3": ("pairinteraction.perturbative", "C3Real"),
+    "C6": ("pairinteraction.perturbative", "C6Real"),
+    "EffectiveSystemPair": ("pairinteraction.perturbative", "EffectiveSystemPairReal"),
+    "green_tensor": ("pairinteraction.green_tensor", None),
+    "perturbative": ("pairinteraction.perturbative", None),
+    "visualization": ("pairinteraction.visualization", None),
+}
+
+__getattr__, __dir__ = create_lazy_attribute_hooks(globals(), _LAZY_ATTRIBUTES)
+del create_lazy_attribute_hooks
+
+
 __all__ = [
     "C3",
     "C6",
@@ -45,13 +66,23 @@ __all__ = [
     "StateAtom",
     "StatePair",
     "SystemAtom",
+    "SystemAtomScan",
     "SystemPair",
+    "SystemPairScan",
     "configure_logging",
     "diagonalize",
+    "diagonalize_async",
+    "get_lifetimes",
+    "get_profile",
+    "get_transition_rates_many",
     "green_tensor",
+    "iter_diagonalize",
     "perturbative",
     "print_database_info",
+    "reset_profile",
     "run_unit_tests",
+    "save_profile",
+    "track_states",
     "ureg",
     "visualization",
 ]
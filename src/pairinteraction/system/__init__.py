@@ -2,13 +2,19 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 
 from pairinteraction.system.system_atom import SystemAtom, SystemAtomReal
+from pairinteraction.system.system_atom_scan import SystemAtomScan, SystemAtomScanReal
 from pairinteraction.system.system_base import SystemBase
 from pairinteraction.system.system_pair import SystemPair, SystemPairReal
+from pairinteraction.system.system_pair_scan import SystemPairScan, SystemPairScanReal
 
 __all__ = [
     "SystemAtom",
     "SystemAtomReal",
+    "SystemAtomScan",
+    "SystemAtomScanReal",
     "SystemBase",
     "SystemPair",
     "SystemPairReal",
+    "SystemPairScan",
+    "SystemPairScanReal",
 ]
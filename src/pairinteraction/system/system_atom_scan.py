@@ -0,0 +1,225 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+import numpy as np
+
+from pairinteraction import _backend
+from pairinteraction.diagonalization import diagonalize
+from pairinteraction.system.system_atom import SystemAtom, SystemAtomReal
+from pairinteraction.units import QuantityArray, QuantityScalar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from pairinteraction.basis import BasisAtom
+    from pairinteraction.diagonalization import Diagonalizer
+    from pairinteraction.enums import FloatType
+    from pairinteraction.units import (
+        ArrayLike,
+        Dimension,
+        PintArrayLike,
+        PintFloat,
+    )
+
+    Quantity = TypeVar("Quantity", float, "PintFloat")
+
+
+class SystemAtomScan:
+    """Single-atom systems for a scan over the electric and magnetic fields.
+
+    All systems of the scan share the same BasisAtom object. The Hamiltonian of a single atom is a sum of the
+    unperturbed energies and of multipole operators, weighted by the spherical components of the fields (and of the
+    field of an ion), of which only the weights differ between the systems. Therefore, the multipole operators are
+    calculated and transformed into the basis only once and reused for all systems of the scan, which makes
+    constructing the Hamiltonians much faster than constructing each :class:`SystemAtom` individually.
+
+    The fields and ion distance vectors are given per system. If only a single field (or ion distance vector) is
+    given, it is used for all systems.
+
+    Examples:
+        >>> import numpy as np
+        >>> import pairinteraction as pi
+        >>> basis = pi.BasisAtom("Rb", n=(58, 63), l=(0, 3))
+        >>> electric_fields = [[0, 0, e] for e in np.linspace(0, 10, 11)]
+        >>> scan = pi.SystemAtomScan(basis).set_electric_fields(electric_fields, unit="V/cm")
+        >>> scan.diagonalize()
+        SystemAtomScan(BasisAtom(n=(58, 63), l=(0, 3)), number_of_systems=11)
+        >>> all(system.is_diagonal for system in scan)
+        True
+        >>> eigenenergies = scan.systems[-1].get_eigenenergies(unit="GHz")
+
+    """
+
+    _cpp: _backend.SystemAtomScanComplex
+    _cpp_type = _backend.SystemAtomScanComplex
+    _system_class: type[SystemAtom] = SystemAtom
+
+    def __init__(self, basis: BasisAtom) -> None:
+        """Create a scan of single-atom systems.
+
+        Args:
+            basis: The :class:`pairinteraction.BasisAtom` object that describes the basis of all systems of the scan.
+
+        """
+        self._cpp = self._cpp_type(basis._cpp)
+        self._basis = basis
+        self._systems: list[SystemAtom] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.basis!r}, number_of_systems={len(self)})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self._systems)
+
+    def __iter__(self) -> Iterator[SystemAtom]:
+        return iter(self._systems)
+
+    def __getitem__(self, index: int) -> SystemAtom:
+        return self._systems[index]
+
+    @property
+    def basis(self) -> BasisAtom:
+        """The basis shared by all systems of the scan."""
+        return self._basis
+
+    @property
+    def systems(self) -> list[SystemAtom]:
+        """The :class:`pairinteraction.SystemAtom` objects of the scan, one for each step of the scan."""
+        return list(self._systems)
+
+    def set_electric_fields(
+        self: Self,
+        electric_fields: ArrayLike | PintArrayLike,
+        unit: str | None = None,
+    ) -> Self:
+        """Set the electric fields for the systems of the scan.
+
+        Args:
+            electric_fields: The electric fields in the given unit, one for each system, or a single one for all.
+            unit: The unit of the electric fields, e.g. "V/cm".
+                Default None expects a `pint.Quantity`.
+
+        """
+        self._cpp.set_electric_fields(_convert_vectors_to_au(electric_fields, unit, "electric_field"))
+        self._update_systems()
+        return self
+
+    def set_magnetic_fields(
+        self: Self,
+        magnetic_fields: ArrayLike | PintArrayLike,
+        unit: str | None = None,
+    ) -> Self:
+        """Set the magnetic fields for the systems of the scan.
+
+        Args:
+            magnetic_fields: The magnetic fields in the given unit, one for each system, or a single one for all.
+            unit: The unit of the magnetic fields, e.g. "gauss".
+                Default None expects a `pint.Quantity`.
+
+        """
+        self._cpp.set_magnetic_fields(_convert_vectors_to_au(magnetic_fields, unit, "magnetic_field"))
+        self._update_systems()
+        return self
+
+    def set_diamagnetism_enabled(self: Self, enable: bool = True) -> Self:
+        """Enable or disable diamagnetism for all systems of the scan.
+
+        Args:
+            enable: Whether to enable or disable diamagnetism.
+
+        """
+        self._cpp.set_diamagnetism_enabled(enable)
+        self._update_systems()
+        return self
+
+    def set_ion_distance_vectors(
+        self: Self,
+        distance_vectors: ArrayLike | PintArrayLike,
+        unit: str | None = None,
+    ) -> Self:
+        """Set the distance vectors between the atom and an ion for the systems of the scan.
+
+        Args:
+            distance_vectors: The distance vectors in the given unit, one for each system, or a single one for all.
+            unit: The unit of the distance vectors, e.g. "micrometer".
+                Default None expects a `pint.Quantity`.
+
+        """
+        self._cpp.set_ion_distance_vectors(_convert_vectors_to_au(distance_vectors, unit, "distance"))
+        self._update_systems()
+        return self
+
+    def set_ion_charge(self: Self, charge: float | PintFloat, unit: str | None = None) -> Self:
+        """Set the charge of the ion for all systems of the scan."""
+        self._cpp.set_ion_charge(QuantityScalar.convert_user_to_au(charge, unit, "charge"))
+        self._update_systems()
+        return self
+
+    def set_ion_interaction_order(self: Self, order: int) -> Self:
+        """Set the order of the Rydberg-ion interaction for all systems of the scan."""
+        self._cpp.set_ion_interaction_order(order)
+        self._update_systems()
+        return self
+
+    def diagonalize(
+        self: Self,
+        diagonalizer: Diagonalizer = "eigen",
+        float_type: FloatType = "float64",
+        rtol: float = 1e-6,
+        sort_by_energy: bool = True,
+        energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
+        energy_range_unit: str | None = None,
+        m0: int | None = None,
+        *,
+        warm_start: bool = False,
+        auto_rotate: bool = False,
+    ) -> Self:
+        """Diagonalize all systems of the scan in parallel using the C++ backend.
+
+        The arguments are the same as for :func:`pairinteraction.diagonalize`.
+        """
+        if len(self._systems) > 0:
+            diagonalize(
+                self._systems,
+                diagonalizer,
+                float_type,
+                rtol,
+                sort_by_energy,
+                energy_range,
+                energy_range_unit,
+                m0,
+                warm_start=warm_start,
+                auto_rotate=auto_rotate,
+            )
+        return self
+
+    def _update_systems(self) -> None:
+        systems: list[SystemAtom] = []
+        for cpp_system in self._cpp.get_systems():
+            system = self._system_class.__new__(self._system_class)
+            system._cpp = cpp_system
+            system._basis = self._basis
+            systems.append(system)
+        self._systems = systems
+
+
+class SystemAtomScanReal(SystemAtomScan):
+    _cpp: _backend.SystemAtomScanReal  # type: ignore [assignment]
+    _cpp_type = _backend.SystemAtomScanReal  # type: ignore [assignment]
+    _system_class = SystemAtomReal
+
+
+def _convert_vectors_to_au(
+    vectors: ArrayLike | PintArrayLike, unit: str | None, dimension: Dimension
+) -> list[list[float]]:
+    """Convert vectors to atomic units at once and return them as a list of three-component vectors."""
+    vectors_au = QuantityArray.convert_user_to_au(vectors, unit, dimension)
+    return np.reshape(vectors_au, (-1, 3)).tolist()  # type: ignore [no-any-return]
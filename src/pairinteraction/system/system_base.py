@@ -65,6 +65,8 @@ class SystemBase(ABC, Generic[BasisType]):
         energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
         energy_range_unit: str | None = None,
         m0: int | None = None,
+        *,
+        auto_rotate: bool = False,
     ) -> Self: ...
 
     @overload
@@ -79,6 +81,7 @@ class SystemBase(ABC, Generic[BasisType]):
         *,
         energy_unit: str | None,
         m0: int | None = None,
+        auto_rotate: bool = False,
     ) -> Self: ...
 
     def diagonalize(
@@ -91,6 +94,7 @@ class SystemBase(ABC, Generic[BasisType]):
         energy_range_unit: str | None = None,
         m0: int | None = None,
         *,
+        auto_rotate: bool = False,
         energy_unit: str | None = None,
     ) -> Self:
         """Diagonalize the Hamiltonian and update the basis to the eigenbasis.
@@ -101,6 +105,7 @@ class SystemBase(ABC, Generic[BasisType]):
             systems: A list of `SystemAtom` or `SystemPair` objects.
             diagonalizer: The diagonalizer method to use. Defaults to "eigen".
             float_type: The floating point precision to use for the diagonalization. Defaults to "float64".
+                See `diagonalize` for the "float32_refined" mode.
             rtol: The relative tolerance allowed for eigenenergies. The error in eigenenergies is bounded
                 by rtol * ||H||, where ||H|| is the norm of the Hamiltonian matrix. Defaults to 1e-6.
             sort_by_energy: Whether to sort the resulting basis by energy. Defaults to True.
@@ -110,6 +115,8 @@ class SystemBase(ABC, Generic[BasisType]):
                 Defaults to (None, None), i.e. calculate all eigenenergies.
             energy_range_unit: The unit in which the energy_range is given. Defaults to None assumes pint objects.
             m0: The search subspace size for the FEAST diagonalizer. Defaults to None.
+            auto_rotate: Whether to diagonalize the Hamiltonian in the frame of its symmetry axis, see `diagonalize`.
+                Defaults to False.
             energy_unit: Deprecated, use energy_range_unit instead.
 
         Returns:
@@ -125,6 +132,7 @@ class SystemBase(ABC, Generic[BasisType]):
             energy_range,
             energy_range_unit,
             m0,
+            auto_rotate=auto_rotate,
             energy_unit=energy_unit,
         )  # type: ignore [misc,call-overload]
         return self
@@ -161,7 +169,7 @@ class SystemBase(ABC, Generic[BasisType]):
     def get_eigenenergies(self, unit: str) -> NDArray: ...
 
     def get_eigenenergies(self, unit: str | None = None) -> NDArray | PintArray:
-        eigenenergies_au: NDArray = np.array(self._cpp.get_eigenenergies())
+        eigenenergies_au: NDArray = np.asarray(self._cpp.get_eigenenergies())
         return QuantityArray.convert_au_to_user(eigenenergies_au, "energy", unit)
 
     @overload
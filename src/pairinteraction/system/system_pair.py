@@ -13,6 +13,8 @@ from pairinteraction.system.system_base import SystemBase
 from pairinteraction.units import QuantityArray, QuantityScalar
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from typing_extensions import Self
 
     from pairinteraction.green_tensor import GreenTensorBase
@@ -154,20 +156,33 @@ class SystemPair(SystemBase[BasisPair]):
         distance = np.linalg.norm(self._distance_vector_au)
         return QuantityScalar.convert_au_to_user(float(distance), "distance", unit)
 
-    def set_green_tensor(self, green_tensor: GreenTensorBase) -> Self:
+    def set_green_tensor(
+        self,
+        green_tensor: GreenTensorBase,
+        transition_energies: Collection[PintFloat] | PintArray | Collection[float] | NDArray | None = None,
+        transition_energies_unit: str | None = None,
+    ) -> Self:
         """Set the Green tensor for the pair system.
 
+        If the Green tensor is not in the static limit, it is interpolated between the given transition energies.
+        When constructing the Hamiltonian, each multipole matrix element is then weighted with the Green tensor
+        at the transition frequency of the corresponding atomic transition.
+
         Args:
             green_tensor: The Green tensor to set for the system.
+            transition_energies: The transition energies at which the Green tensor is evaluated for the
+                interpolation. Must only be given if the Green tensor is not in the static limit.
+                The transition energies must cover the energies of all atomic transitions of the system, starting
+                at zero for transitions between degenerate states. The Green tensor is not extrapolated. If a
+                transition energy lies outside of this range, a ValueError is raised when the Hamiltonian is
+                constructed.
+            transition_energies_unit: The unit of the transition energies. Default None expects pint quantities.
 
         """
-        if not green_tensor.static_limit:
-            raise ValueError("Setting a Green tensor that is not in the static limit is currently not supported.")
-
         self._distance_vector_au = green_tensor.pos1_au - green_tensor.pos2_au
         use_real = isinstance(self, SystemPairReal)
 
-        gti = green_tensor.get_interpolator(use_real=use_real)
+        gti = green_tensor.get_interpolator(transition_energies, transition_energies_unit, use_real=use_real)  # type: ignore [call-overload]
         self._cpp.set_green_tensor_interpolator(gti._cpp)
         return self
 
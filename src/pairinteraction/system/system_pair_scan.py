@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, TypeVar
+
+import numpy as np
+
+from pairinteraction import _backend
+from pairinteraction.diagonalization import diagonalize
+from pairinteraction.system.system_pair import SystemPair, SystemPairReal
+from pairinteraction.units import QuantityScalar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from typing_extensions import Self
+
+    from pairinteraction.basis import BasisPair
+    from pairinteraction.diagonalization import Diagonalizer
+    from pairinteraction.enums import FloatType
+    from pairinteraction.units import (
+        ArrayLike,
+        PintArrayLike,
+        PintFloat,
+    )
+
+    Quantity = TypeVar("Quantity", float, "PintFloat")
+
+
+class SystemPairScan:
+    """Pair systems for a scan over the distance (vector) between the atoms.
+
+    All systems of the scan share the same BasisPair object. The pair Hamiltonian is a sum of the
+    unperturbed energies and of tensor products of single-atom multipole operators, weighted by the
+    entries of the Green tensor, of which only the weights depend on the distance vector.
+    Therefore, the tensor products are calculated and transformed into the pair basis only once and
+    reused for all systems of the scan, which makes constructing the Hamiltonians much faster
+    than constructing each :class:`SystemPair` individually.
+
+    Examples:
+        >>> import pairinteraction as pi
+        >>> ket = pi.KetAtom("Rb", n=60, l=0, m=0.5)
+        >>> basis = pi.BasisAtom("Rb", n=(58, 63), l=(0, 3))
+        >>> system = pi.SystemAtom(basis).set_magnetic_field([0, 0, 1], unit="G").diagonalize()
+        >>> pair_energy = 2 * system.get_corresponding_energy(ket, unit="GHz")
+        >>> pair_basis = pi.BasisPair(
+        ...     [system, system],
+        ...     energy=(pair_energy - 3, pair_energy + 3),
+        ...     energy_unit="GHz",
+        ... )
+        >>> scan = pi.SystemPairScan(pair_basis).set_distances([5, 6, 7], unit="micrometer")
+        >>> scan.diagonalize()
+        SystemPairScan(BasisPair(|Rb:59,S_1/2,-1/2; Rb:61,S_1/2,-1/2⟩ ... |Rb:58,F_7/2,7/2; Rb:59,S_1/2,1/2⟩), number_of_systems=3)
+        >>> eigenenergies = scan.systems[0].get_eigenenergies(unit="GHz")
+        >>> print(f"{eigenenergies[0] - pair_energy:.5f}")
+        -2.18394
+
+    """  # noqa: E501
+
+    _cpp: _backend.SystemPairScanComplex
+    _cpp_type = _backend.SystemPairScanComplex
+    _system_class: type[SystemPair] = SystemPair
+
+    def __init__(self, basis: BasisPair) -> None:
+        """Create a scan of pair systems.
+
+        Args:
+            basis: The :class:`pairinteraction.BasisPair` object that describes the basis of all systems of the scan.
+
+        """
+        self._cpp = self._cpp_type(basis._cpp)
+        self._basis = basis
+        self._interaction_order = 3
+        self._systems: list[SystemPair] = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.basis!r}, number_of_systems={len(self)})"
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __len__(self) -> int:
+        return len(self._systems)
+
+    def __iter__(self) -> Iterator[SystemPair]:
+        return iter(self._systems)
+
+    def __getitem__(self, index: int) -> SystemPair:
+        return self._systems[index]
+
+    @property
+    def basis(self) -> BasisPair:
+        """The basis shared by all systems of the scan."""
+        return self._basis
+
+    @property
+    def systems(self) -> list[SystemPair]:
+        """The :class:`pairinteraction.SystemPair` objects of the scan, one for each distance vector."""
+        return list(self._systems)
+
+    def set_interaction_order(self: Self, order: int) -> Self:
+        """Set the interaction order of all pair systems of the scan.
+
+        Args:
+            order: The interaction order to set for the pair systems.
+                The order must be 3, 4, or 5.
+
+        """
+        self._interaction_order = order
+        self._cpp.set_interaction_order(order)
+        self._update_systems()
+        return self
+
+    def set_distances(
+        self: Self,
+        distances: ArrayLike | PintArrayLike,
+        angle_degree: float = 0,
+        unit: str | None = None,
+    ) -> Self:
+        """Set the distances between the atoms for the systems of the scan.
+
+        Args:
+            distances: The distances between the atoms in the given unit, one for each system.
+            angle_degree: The angle between the distance vectors and the z-axis in degrees.
+                90 degrees corresponds to the x-axis.
+                Defaults to 0, which corresponds to the z-axis.
+            unit: The unit of the distances, e.g. "micrometer".
+                Default None expects a `pint.Quantity`.
+
+        """
+        distance_vectors = [
+            [np.sin(np.deg2rad(angle_degree)) * d, 0, np.cos(np.deg2rad(angle_degree)) * d] for d in distances
+        ]
+        return self.set_distance_vectors(distance_vectors, unit)
+
+    def set_distance_vectors(
+        self: Self,
+        distance_vectors: ArrayLike | PintArrayLike,
+        unit: str | None = None,
+    ) -> Self:
+        """Set the distance vectors between the atoms for the systems of the scan.
+
+        Args:
+            distance_vectors: The distance vectors between the atoms in the given unit, one for each system.
+            unit: The unit of the distance vectors, e.g. "micrometer".
+                Default None expects a `pint.Quantity`.
+
+        """
+        distance_vectors_au = [
+            [QuantityScalar.convert_user_to_au(v, unit, "distance") for v in vector] for vector in distance_vectors
+        ]
+        self._cpp.set_distance_vectors(distance_vectors_au)
+        self._update_systems()
+        return self
+
+    def diagonalize(
+        self: Self,
+        diagonalizer: Diagonalizer = "eigen",
+        float_type: FloatType = "float64",
+        rtol: float = 1e-6,
+        sort_by_energy: bool = True,
+        energy_range: tuple[Quantity | None, Quantity | None] = (None, None),
+        energy_range_unit: str | None = None,
+        m0: int | None = None,
+        *,
+        warm_start: bool = False,
+        auto_rotate: bool = False,
+    ) -> Self:
+        """Diagonalize all systems of the scan in parallel using the C++ backend.
+
+        The arguments are the same as for :func:`pairinteraction.diagonalize`.
+        """
+        if len(self._systems) > 0:
+            diagonalize(
+                self._systems,
+                diagonalizer,
+                float_type,
+                rtol,
+                sort_by_energy,
+                energy_range,
+                energy_range_unit,
+                m0,
+                warm_start=warm_start,
+                auto_rotate=auto_rotate,
+            )
+        return self
+
+    def _update_systems(self) -> None:
+        systems: list[SystemPair] = []
+        for cpp_system, vector_au in zip(self._cpp.get_systems(), self._cpp.get_distance_vectors(), strict=True):
+            system = self._system_class.__new__(self._system_class)
+            system._cpp = cpp_system
+            system._basis = self._basis
+            system._distance_vector_au = np.array(vector_au)
+            system._interaction_order = self._interaction_order
+            systems.append(system)
+        self._systems = systems
+
+
+class SystemPairScanReal(SystemPairScan):
+    _cpp: _backend.SystemPairScanReal  # type: ignore [assignment]
+    _cpp_type = _backend.SystemPairScanReal  # type: ignore [assignment]
+    _system_class = SystemPairReal
@@ -2,7 +2,9 @@
 # SPDX-License-Identifier: LGPL-3.0-or-later
 from __future__ import annotations
 
+import math
 from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, Union
 
 import numpy as np
@@ -12,6 +14,7 @@ from pint.facets.plain import PlainQuantity
 from scipy.sparse import csr_matrix
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
     from typing import TypeAlias
 
     import numpy.typing as npt
@@ -215,6 +218,16 @@ class QuantityAbstract(Generic[ValueTypeLike, ValueType]):
         unit: str | None,
         dimension: DimensionLike,
     ) -> ValueType:
+        # fast path: if the conversion to atomic units is a pure scaling (i.e. not for units with an offset or
+        # wavelengths), pint is only needed once per combination of dimension and unit to determine the factor
+        if unit is not None and not isinstance(value, PlainQuantity):
+            factor = cls.get_conversion_factor_unit_to_au(dimension, unit)
+            if factor is not None:
+                return cls.scale(value, factor)
+        elif unit is None and isinstance(value, ureg.Quantity):
+            factor = cls.get_conversion_factor_unit_to_au(dimension, value.units)
+            if factor is not None:
+                return cls.scale(value.magnitude, factor)
         return cls.from_pint_or_unit(value, unit, dimension).to_au()
 
     @classmethod
@@ -233,8 +246,39 @@ class QuantityAbstract(Generic[ValueTypeLike, ValueType]):
         dimension: DimensionLike,
         unit: str | None,
     ) -> ValueType | PlainQuantity[ValueType]:  # type: ignore [type-var]
+        if unit is not None:
+            # fast path: if the conversion from atomic units is a pure scaling, we can skip pint for the values
+            # and only use it once to determine the conversion factor
+            factor = cls.get_conversion_factor_au_to_unit(dimension, unit)
+            if factor is not None:
+                return cls.scale(values_au, factor)
         return cls.from_au(values_au, dimension).to_pint_or_unit(unit)
 
+    @classmethod
+    def get_conversion_factor_au_to_unit(cls, dimension: DimensionLike, unit: str) -> float | None:
+        """Return the factor to convert values from atomic units to the given unit.
+
+        Returns None if the conversion is not a pure scaling (e.g. for units with an offset like degC or for
+        wavelengths).
+        """
+        dimension_key = dimension if isinstance(dimension, str) else tuple(dimension)
+        return _get_conversion_factor_au_to_unit(dimension_key, unit)
+
+    @classmethod
+    def get_conversion_factor_unit_to_au(cls, dimension: DimensionLike, unit: str | PlainUnit) -> float | None:
+        """Return the factor to convert values from the given unit to atomic units.
+
+        Returns None if the conversion is not a pure scaling (e.g. for units with an offset like degC or for
+        wavelengths).
+        """
+        dimension_key = dimension if isinstance(dimension, str) else tuple(dimension)
+        return _get_conversion_factor_unit_to_au(dimension_key, unit)
+
+    @classmethod
+    def scale(cls, values: ValueTypeLike, factor: float) -> ValueType:
+        """Multiply the values by the factor, the result has the value type of the class."""
+        raise NotImplementedError("This method must be implemented in the derived classes.")
+
     @classmethod
     def convert_pint_to_user(
         cls,
@@ -251,6 +295,12 @@ class QuantityScalar(QuantityAbstract[float, float]):
         if not np.isscalar(magnitude):
             raise TypeError(f"value must be a scalar, not {type(magnitude)}")
 
+    @classmethod
+    def scale(cls, values: float, factor: float) -> float:
+        if not np.isscalar(values):
+            raise TypeError(f"value must be a scalar, not {type(values)}")
+        return values * factor  # type: ignore [no-any-return]
+
 
 class QuantityArray(QuantityAbstract["ArrayLike", "NDArray"]):
     def check_value_type(self) -> None:
@@ -258,9 +308,47 @@ class QuantityArray(QuantityAbstract["ArrayLike", "NDArray"]):
         if not isinstance(magnitude, Sequence) and not isinstance(magnitude, np.ndarray):
             raise TypeError(f"value must be an np.ndarray (or a Sequence), not {type(magnitude)}")
 
+    @classmethod
+    def scale(cls, values: ArrayLike, factor: float) -> NDArray:
+        if not isinstance(values, Sequence) and not isinstance(values, np.ndarray):
+            raise TypeError(f"value must be an np.ndarray (or a Sequence), not {type(values)}")
+        return np.asarray(values) * factor
+
 
 class QuantitySparse(QuantityAbstract["csr_matrix", "csr_matrix"]):
     def check_value_type(self) -> None:
         magnitude = self._quantity.magnitude
         if not isinstance(magnitude, csr_matrix):
             raise TypeError(f"value must be a scipy.sparse.csr_matrix, not {type(magnitude)}")
+
+    @classmethod
+    def scale(cls, values: csr_matrix, factor: float) -> csr_matrix:
+        if not isinstance(values, csr_matrix):
+            raise TypeError(f"value must be a scipy.sparse.csr_matrix, not {type(values)}")
+        # only scale the data array, the index arrays are shared with the input matrix
+        return csr_matrix((values.data * factor, values.indices, values.indptr), shape=values.shape)
+
+
+@lru_cache(maxsize=256)
+def _get_conversion_factor_au_to_unit(dimension: Dimension | tuple[Dimension, ...], unit: str) -> float | None:
+    return _get_linear_conversion_factor(lambda value: QuantityScalar.from_au(value, dimension).to_unit(unit))
+
+
+@lru_cache(maxsize=256)
+def _get_conversion_factor_unit_to_au(
+    dimension: Dimension | tuple[Dimension, ...], unit: str | PlainUnit
+) -> float | None:
+    return _get_linear_conversion_factor(lambda value: QuantityScalar(ureg.Quantity(value, unit), dimension).to_au())
+
+
+def _get_linear_conversion_factor(convert: Callable[[float], float]) -> float | None:
+    """Return the factor of a conversion, or None if the conversion is not a pure scaling.
+
+    Conversions that are not a pure scaling are e.g. conversions of units with an offset like degC or reciprocal
+    conversions like hartree -> nm. They are detected by probing with nonzero values, because a reciprocal conversion
+    of zero raises a ZeroDivisionError.
+    """
+    factor = float(convert(1.0))
+    if not math.isclose(float(convert(2.0)), 2 * factor, rel_tol=1e-12):
+        return None
+    return factor
@@ -68,68 +68,11 @@ def _calculate_two_atoms(parameters: ParametersTwoAtoms) -> ResultsTwoAtoms:
     n_atoms = 2
 
     kets = tuple(pi.KetAtom(parameters.get_species(i), **parameters.get_quantum_numbers(i)) for i in range(n_atoms))
-    bases = tuple(
-        pi.BasisAtom(parameters.get_species(i), **parameters.get_quantum_number_restrictions(i)) for i in range(n_atoms)
-    )
 
-    fields = {k: v for k, v in parameters.ranges.items() if k in ["Ex", "Ey", "Ez", "Bx", "By", "Bz"]}
-
-    basis_pair_list: list[pi_real.BasisPair] | list[pi_complex.BasisPair]
-    if all(v[0] == v[-1] for v in fields.values()):
-        # If all fields are constant, we can only have to diagonalize one SystemAtom per atom
-        # and can construct one BasisPair, which we can use for all steps
-        systems = tuple(
-            pi.SystemAtom(bases[i])
-            .set_electric_field(parameters.get_efield(0), unit="V/cm")
-            .set_magnetic_field(parameters.get_bfield(0), unit="G")
-            .set_diamagnetism_enabled(parameters.diamagnetism_enabled)
-            for i in range(n_atoms)
-        )
-        logger.debug("Diagonalizing SystemAtoms...")
-        pi.diagonalize(systems, **parameters.diagonalize_kwargs)
-        _backend.reset_task_status()
-        logger.debug("Done diagonalizing SystemAtoms.")
-        ket_pair_energy_0 = sum(systems[i].get_corresponding_energy(kets[i], "GHz") for i in range(n_atoms))
-        delta_energy = parameters.pair_delta_energy
-        basis_pair = pi.BasisPair(
-            systems,
-            energy=(ket_pair_energy_0 - delta_energy, ket_pair_energy_0 + delta_energy),
-            energy_unit="GHz",
-            m=parameters.pair_m_range,
-        )
-        # not very elegant, but works (note that importantly this does not copy the basis_pair objects)
-        basis_pair_list = parameters.steps * [basis_pair]
-    else:
-        # Otherwise, we have to diagonalize one SystemAtom per atom and per step
-        # and construct one BasisPair per step
-        systems_list = []
-        for step in range(parameters.steps):
-            systems = tuple(
-                pi.SystemAtom(bases[i])
-                .set_electric_field(parameters.get_efield(step), unit="V/cm")
-                .set_magnetic_field(parameters.get_bfield(step), unit="G")
-                .set_diamagnetism_enabled(parameters.diamagnetism_enabled)
-                for i in range(n_atoms)
-            )
-            systems_list.append(systems)
-        systems_flattened = [system for systems in systems_list for system in systems]
-        logger.debug("Diagonalizing SystemAtoms...")
-        pi.diagonalize(systems_flattened, **parameters.diagonalize_kwargs)
-        logger.debug("Done diagonalizing SystemAtoms.")
-        delta_energy = parameters.pair_delta_energy
-        basis_pair_list = []
-        for step in range(parameters.steps):
-            ket_pair_energy = sum(
-                systems_list[step][i].get_corresponding_energy(kets[i], "GHz") for i in range(n_atoms)
-            )
-            basis_pair = pi.BasisPair(
-                systems_list[step],
-                energy=(ket_pair_energy - delta_energy, ket_pair_energy + delta_energy),
-                energy_unit="GHz",
-                m=parameters.pair_m_range,
-            )
-            basis_pair_list.append(basis_pair)
-        ket_pair_energy_0 = sum(systems_list[-1][i].get_corresponding_energy(kets[i], "GHz") for i in range(n_atoms))
+    basis_pair_list = _create_basis_pairs(parameters, kets)
+    ket_pair_energy_0 = sum(
+        system.get_corresponding_energy(kets[i], "GHz") for i, system in enumerate(basis_pair_list[-1].system_atoms)
+    )
 
     system_pair_list: list[pi_real.SystemPair] | list[pi_complex.SystemPair] = []
     for step in range(parameters.steps):
@@ -157,3 +100,62 @@ def _calculate_two_atoms(parameters: ParametersTwoAtoms) -> ResultsTwoAtoms:
     )
 
     return results
+
+
+def _create_basis_pairs(
+    parameters: ParametersTwoAtoms, kets: tuple[pi_real.KetAtom, ...] | tuple[pi_complex.KetAtom, ...]
+) -> list[pi_real.BasisPair] | list[pi_complex.BasisPair]:
+    """Create the BasisPair of each step, reusing the objects of identical atoms and steps."""
+    pi = pi_real if parameters.is_real else pi_complex
+    n_atoms = 2
+
+    # Identical atoms share one BasisAtom, and atoms with identical bases and fields share one SystemAtom,
+    # so that each distinct SystemAtom is only diagonalized once, even if the fields repeat between steps
+    # (e.g. if only the distance is varied). Steps with identical SystemAtoms also share one BasisPair.
+    basis_keys = tuple(
+        (parameters.get_species(i), tuple(sorted(parameters.get_quantum_number_restrictions(i).items())))
+        for i in range(n_atoms)
+    )
+    bases = {key: pi.BasisAtom(key[0], **dict(key[1])) for key in basis_keys}
+
+    system_keys_list = [
+        tuple(
+            (
+                basis_key,
+                tuple(parameters.get_efield(step)),
+                tuple(parameters.get_bfield(step)),
+                parameters.diamagnetism_enabled,
+            )
+            for basis_key in basis_keys
+        )
+        for step in range(parameters.steps)
+    ]
+    systems: dict[tuple[object, ...], pi_real.SystemAtom | pi_complex.SystemAtom] = {}
+    for key in dict.fromkeys(key for system_keys in system_keys_list for key in system_keys):
+        basis_key, efield, bfield, diamagnetism_enabled = key
+        systems[key] = (
+            pi.SystemAtom(bases[basis_key])
+            .set_electric_field(efield, unit="V/cm")
+            .set_magnetic_field(bfield, unit="G")
+            .set_diamagnetism_enabled(diamagnetism_enabled)
+        )
+    logger.debug("Diagonalizing %d SystemAtoms...", len(systems))
+    pi.diagonalize(list(systems.values()), **parameters.diagonalize_kwargs)
+    _backend.reset_task_status()
+    logger.debug("Done diagonalizing SystemAtoms.")
+
+    delta_energy = parameters.pair_delta_energy
+    basis_pairs: dict[tuple[object, ...], pi_real.BasisPair | pi_complex.BasisPair] = {}
+    basis_pair_list: list[pi_real.BasisPair] | list[pi_complex.BasisPair] = []
+    for system_keys in system_keys_list:
+        if system_keys not in basis_pairs:
+            systems_pair = tuple(systems[key] for key in system_keys)
+            ket_pair_energy = sum(systems_pair[i].get_corresponding_energy(kets[i], "GHz") for i in range(n_atoms))
+            basis_pairs[system_keys] = pi.BasisPair(
+                systems_pair,
+                energy=(ket_pair_energy - delta_energy, ket_pair_energy + delta_energy),
+                energy_unit="GHz",
+                m=parameters.pair_m_range,
+            )
+        basis_pair_list.append(basis_pairs[system_keys])  # type: ignore [arg-type]
+    return basis_pair_list
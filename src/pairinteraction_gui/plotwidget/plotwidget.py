@@ -14,6 +14,7 @@ from PySide6.QtGui import QPalette
 from PySide6.QtWidgets import QHBoxLayout
 from scipy.optimize import curve_fit
 
+from pairinteraction.diagonalization import track_states
 from pairinteraction.state.state_atom import StateAtom
 from pairinteraction.visualization.colormaps import alphamagma
 from pairinteraction_gui.plotwidget.canvas import MatplotlibCanvas
@@ -235,7 +236,7 @@ class PlotEnergies(PlotWidget):
         self._click_cid = self.canvas.mpl_connect("button_press_event", on_click)  # type: ignore [arg-type]
         self.navigation_toolbar._home_callbacks = [self.clear_annotations]
 
-    def fit(self, fit_type: str = "c6") -> None:  # noqa: PLR0912, PLR0915, C901
+    def fit(self, fit_type: str = "c6") -> None:  # noqa: PLR0912, C901
         """Fits a potential curve and displays the fit values.
 
         Args:
@@ -275,41 +276,22 @@ class PlotEnergies(PlotWidget):
             self.fit_idx = 1
         self.fit_type = fit_type
 
-        # We want to follow the potential curves. The ordering of energies is just by value, so we
-        # need to follow the curve somehow. We go right to left, start at the nth largest value, keep our
-        # index as long as the difference in overlap is less than a factor 2 or less than 5% total difference.
-        # Otherwise, we search until we find an overlap that is less than a factor 2 different.
-        # This is of course a simple heuristic, a more sophisticated approach would do some global optimization
-        # of the curves. This approach is simple, fast and robust, but curves may e.g. merge.
-        # This does not at all take into account the line shapes of the curves. There is also no trade-off
-        # between overlap being close and not doing jumps.
-        idxs = [np.argpartition(overlaps_list[0], -self.fit_idx)[-self.fit_idx]]
-        last_overlap = overlaps_list[0][idxs[-1]]
-        for overlaps in overlaps_list[1:]:
-            idx = idxs[-1]
-            overlap = overlaps[idx]
-            if 0.5 * last_overlap < overlap < 2 * last_overlap or abs(overlap - last_overlap) < 0.05:
-                # we keep the current index
-                idxs.append(idx)
-                last_overlap = overlap
-            else:
-                # we search until we find an overlap that is less than a factor 2 different
-                possible_options = np.argwhere(
-                    np.logical_and(overlaps > 0.5 * last_overlap, overlaps < 2 * last_overlap)
-                ).flatten()
-                if len(possible_options) == 0:
-                    # there is no state in that range - our best bet is to keep the current index
-                    idxs.append(idx)
-                    last_overlap = overlap
-                else:
-                    # we select the closest possible option
-                    best_option = np.argmin(np.abs(possible_options - idx))
-                    idxs.append(possible_options[best_option])
-                    last_overlap = overlaps[idxs[-1]]
-
-        # this could be a call to np.take_along_axis if the sizes match, but the handling of inhomogeneous shapes
-        # in the plot() function makes me worry they won't, so I go for a slower python for loop...
-        energies_fit = np.array([energy[idx] for energy, idx in zip(energies, idxs, strict=True)])
+        # We want to follow the potential curves. The ordering of energies is just by value, so we track the
+        # eigenstates adiabatically via the overlaps of the eigenbases of consecutive steps. If the systems are not
+        # defined on the same basis (e.g. if the fields change along the pair potential), we fall back to
+        # following the curve via the overlaps with the state of interest.
+        idx0 = int(np.argpartition(overlaps_list[0], -self.fit_idx)[-self.fit_idx])
+        try:
+            idxs = track_states(self.results.systems)[:, idx0]
+        except ValueError:
+            idxs = follow_overlaps(overlaps_list, idx0)
+
+        # skip the steps in which the state was lost, e.g. because it left the energy range
+        is_tracked = idxs >= 0
+        x_values = x_values[is_tracked]
+        energies_fit = np.array(
+            [energy[idx] for energy, idx, tracked in zip(energies, idxs, is_tracked, strict=True) if tracked]
+        )
 
         # stop highlighting the previous fit
         if self.fit_data_highlight is not None:
@@ -473,3 +455,35 @@ def fit_c6(x: NDArray[Any], /, e0: float, c6: float) -> NDArray[Any]:
 
 def fit_c3_c6(x: NDArray[Any], /, e0: float, c3: float, c6: float) -> NDArray[Any]:
     return e0 + c3 / x**3 + c6 / x**6
+
+
+def follow_overlaps(overlaps_list: Sequence[NDArray[Any]], idx0: int) -> NDArray[Any]:
+    """Follow a potential curve via the overlaps with the state of interest.
+
+    We go right to left, start at idx0, keep our index as long as the difference in overlap is less than a factor 2
+    or less than 5% total difference. Otherwise, we search until we find an overlap that is less than a factor 2
+    different. This is a simple heuristic, which does not take into account the line shapes of the curves, so that
+    curves may e.g. merge.
+    """
+    idxs = [idx0]
+    last_overlap = overlaps_list[0][idx0]
+    for overlaps in overlaps_list[1:]:
+        idx = idxs[-1]
+        overlap = overlaps[idx]
+        if 0.5 * last_overlap < overlap < 2 * last_overlap or abs(overlap - last_overlap) < 0.05:
+            # we keep the current index
+            idxs.append(idx)
+            last_overlap = overlap
+            continue
+        # we search until we find an overlap that is less than a factor 2 different
+        possible_options = np.argwhere(np.logical_and(overlaps > 0.5 * last_overlap, overlaps < 2 * last_overlap))
+        possible_options = possible_options.flatten()
+        if len(possible_options) == 0:
+            # there is no state in that range - our best bet is to keep the current index
+            idxs.append(idx)
+            last_overlap = overlap
+        else:
+            # we select the closest possible option
+            idxs.append(possible_options[np.argmin(np.abs(possible_options - idx))])
+            last_overlap = overlaps[idxs[-1]]
+    return np.array(idxs)
@@ -55,6 +55,22 @@ def test_coefficients(basis: BasisPair) -> None:
     assert pytest.approx(coeffs.sum()) == basis.number_of_kets  # NOSONAR
 
 
+def test_ket_arrays(basis: BasisPair) -> None:
+    """Test the structure-of-arrays representation of the kets."""
+    ket_arrays = basis.get_ket_arrays(unit="GHz")
+    for array in ket_arrays:
+        assert len(array) == basis.number_of_kets
+    assert not ket_arrays.state_indices1.flags.writeable
+    assert np.shares_memory(ket_arrays.state_indices1, basis.get_ket_arrays().state_indices1)
+
+    number_of_states1 = basis.system_atoms[0].basis.number_of_states
+    assert np.all((ket_arrays.state_indices1 >= 0) & (ket_arrays.state_indices1 < number_of_states1))
+    for i in [0, 1, basis.number_of_kets - 1]:
+        ket = basis.get_ket(i)
+        assert pytest.approx(ket_arrays.energies[i]) == ket.get_energy(unit="GHz")
+        assert pytest.approx(ket_arrays.quantum_numbers_m[i]) == ket.m
+
+
 def test_get_amplitudes_and_overlaps(basis: BasisPair) -> None:
     """Test amplitude and overlap calculations."""
     # Test with ket
@@ -192,3 +192,87 @@ def test_obtaining_kets(pi_module: PairinteractionModule, species: str) -> None:
     assert ket.s == quantum_number_s if not is_mqdt else abs(ket.s - quantum_number_s) < 1
 
     # TODO check repr(ket) (once the mqdt databases are updated)
+
+
+def test_matrix_elements_cache(pi_module: PairinteractionModule) -> None:
+    """Test that identical bases share the cached matrix elements."""
+    database = pi_module.Database
+    database.clear_cache()
+    assert database.cache_info().entries == 0
+
+    def construct_hamiltonian() -> None:
+        basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+        pi_module.SystemAtom(basis).set_electric_field([0, 0, 1], unit="V/cm").get_hamiltonian(unit="GHz")
+
+    construct_hamiltonian()
+    info = database.cache_info()
+    assert info.misses > 0
+    assert info.entries == info.misses
+    assert info.bytes > 0
+
+    construct_hamiltonian()
+    assert database.cache_info().misses == info.misses
+    assert database.cache_info().hits >= info.hits + info.misses
+
+    database.set_cache_max_bytes(0)
+    assert database.cache_info().entries == 0
+    assert database.cache_info().bytes == 0
+    database.set_cache_max_bytes(info.max_bytes)
+    database.clear_cache()
+
+
+def test_matrix_elements_disk_cache(pi_module: PairinteractionModule, tmp_path: Path) -> None:
+    """Test that matrix elements are stored in and loaded from the persistent cache on disk."""
+    global_database = pi_module.Database.get_global_database()
+    try:
+        (tmp_path / "tables").symlink_to(global_database.database_dir / "tables", target_is_directory=True)
+    except OSError:
+        pytest.skip("Creating symbolic links is not supported.")
+
+    def construct_hamiltonian() -> np.ndarray:
+        database = pi_module.Database(use_cache=False, database_dir=tmp_path, use_disk_cache=True)
+        assert database.use_disk_cache
+        basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), database=database)
+        system = pi_module.SystemAtom(basis).set_electric_field([0, 0, 1], unit="V/cm")
+        return system.get_hamiltonian(unit="GHz").toarray()  # type: ignore [no-any-return]
+
+    pi_module.Database.clear_cache()
+    hamiltonian = construct_hamiltonian()
+    modification_times = {path: path.stat().st_mtime_ns for path in (tmp_path / "matrix_elements").glob("*.bin")}
+    assert len(modification_times) > 0
+
+    # Loading the matrix elements from disk must give the same Hamiltonian without rewriting the files
+    pi_module.Database.clear_cache()
+    assert np.allclose(construct_hamiltonian(), hamiltonian)
+    assert {
+        path: path.stat().st_mtime_ns for path in (tmp_path / "matrix_elements").glob("*.bin")
+    } == modification_times
+
+    # The matrix elements in memory are not shared between databases in different directories
+    misses = pi_module.Database.cache_info().misses
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), database=global_database)
+    pi_module.SystemAtom(basis).set_electric_field([0, 0, 1], unit="V/cm").get_hamiltonian(unit="GHz")
+    assert pi_module.Database.cache_info().misses > misses
+    pi_module.Database.clear_cache()
+
+
+def test_connection_pool(pi_module: PairinteractionModule) -> None:
+    """Test that the Hamiltonians of many systems can be constructed with a pool of database connections."""
+    database = pi_module.Database.get_global_database()
+    pool_size = database.connection_pool_size
+    assert pool_size >= 1
+
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, i], unit="V/cm") for i in range(8)]
+    try:
+        database.set_connection_pool_size(4)
+        assert database.connection_pool_size == 4
+        pi_module.diagonalize(systems)
+        reference = pi_module.SystemAtom(basis).set_electric_field([0, 0, 7], unit="V/cm")
+        reference.diagonalize()
+        assert np.allclose(systems[-1].get_eigenenergies("GHz"), reference.get_eigenenergies("GHz"))
+    finally:
+        database.set_connection_pool_size(pool_size)
+
+    with pytest.raises(ValueError, match="at least 1"):
+        database.set_connection_pool_size(0)
@@ -6,14 +6,19 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
+import pytest
 
 if TYPE_CHECKING:
+    from pairinteraction.diagonalization import Diagonalizer
+
     from .utils import PairinteractionModule
 
 from .utils import no_log_propagation
 
 
-def test_energy_range(pi_module: PairinteractionModule) -> None:
+@pytest.mark.parametrize("warm_start", [False, True])
+@pytest.mark.parametrize("diagonalizer", ["eigen", "lanczos"])
+def test_energy_range(pi_module: PairinteractionModule, diagonalizer: Diagonalizer, warm_start: bool) -> None:
     """Test restricting the energy range in the diagonalization."""
     ket = pi_module.KetAtom("Rb", n=60, l=0, m=0.5)
     pair_energy = 2 * ket.get_energy(unit="GHz")
@@ -38,10 +43,11 @@ def test_energy_range(pi_module: PairinteractionModule) -> None:
     system_pairs = [pi_module.SystemPair(basis_pair).set_distance(d, unit="micrometer") for d in distances]
     pi_module.diagonalize(
         system_pairs,
-        diagonalizer="eigen",
+        diagonalizer=diagonalizer,
         sort_by_energy=True,
         energy_range=(pair_energy - 5, pair_energy + 5),
         energy_range_unit="GHz",
+        warm_start=warm_start,
     )
     eigenenergies_restricted = [system.get_eigenenergies(unit="GHz") for system in system_pairs]
 
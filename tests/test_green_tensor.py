@@ -9,6 +9,10 @@ import numpy as np
 import pytest
 from pairinteraction import ureg
 from pairinteraction.green_tensor import GreenTensorFreeSpace
+from pairinteraction.green_tensor.dynamic_green_tensor import (
+    dynamic_green_tensor_scattered,
+    dynamic_green_tensor_scattered_many,
+)
 from pairinteraction.green_tensor.green_tensor_cavity import GreenTensorCavity
 from pairinteraction.green_tensor.green_tensor_surface import GreenTensorSurface
 
@@ -87,6 +91,40 @@ def test_static_green_tensor_pair_potential(
     )
 
 
+def test_dynamic_green_tensor_pair_potential(pi_module: PairinteractionModule) -> None:
+    ket = pi_module.KetAtom("Rb", n=60, l=0, m=0.5)
+    basis = pi_module.BasisAtom("Rb", n=(ket.n - 2, ket.n + 2), l=(0, 2))
+    system = pi_module.SystemAtom(basis)
+    pair_energy_ghz = 2 * ket.get_energy("GHz")
+    basis_pair = pi_module.BasisPair(
+        [system, system], energy=(pair_energy_ghz - 3, pair_energy_ghz + 3), energy_unit="GHz"
+    )
+
+    system_pair_static = pi_module.SystemPair(basis_pair)
+    gt = GreenTensorFreeSpace([0, 0, 0], [0, 0, 5], unit="micrometer", static_limit=True)
+    system_pair_static.set_green_tensor(gt)
+
+    # for free space, retardation effects are negligible at these distances and transition frequencies
+    system_pair_dynamic = pi_module.SystemPair(basis_pair)
+    gt = GreenTensorFreeSpace([0, 0, 0], [0, 0, 5], unit="micrometer", static_limit=False)
+    with pytest.raises(ValueError, match="transition_energies"):
+        system_pair_dynamic.set_green_tensor(gt)
+    system_pair_dynamic.set_green_tensor(gt, np.linspace(0, 500, 11), "GHz")
+
+    np.testing.assert_allclose(
+        system_pair_dynamic.get_hamiltonian("GHz").toarray(),
+        system_pair_static.get_hamiltonian("GHz").toarray(),
+        rtol=1e-3,
+        atol=1e-6,
+    )
+
+    # the Green tensor is not extrapolated to transition energies below the sampled ones
+    system_pair_dynamic = pi_module.SystemPair(basis_pair)
+    system_pair_dynamic.set_green_tensor(gt, np.linspace(10, 500, 11), "GHz")
+    with pytest.raises(ValueError, match="outside of the range"):
+        system_pair_dynamic.get_hamiltonian("GHz")
+
+
 @pytest.mark.parametrize("distance_vector_mum", DISTANCE_VECTOR_MUM_LIST)
 def test_vacuum_green_tensor(
     pi_module: PairinteractionModule, use_real: bool, distance_vector_mum: list[float]
@@ -232,3 +270,58 @@ def test_cavity_green_tensor_rejects_coincident_planes() -> None:
 
     with pytest.raises(ValueError, match="must be distinct"):
         gt.get(1, 1, transition_energy=0, scaled=True)
+
+
+def test_dynamic_green_tensor_scattered_many() -> None:
+    """Test the batched scattering Green tensors against the entry-wise quadratures of the scalar implementation."""
+    um, ghz = 1e-6, 2 * np.pi * 1e9
+    configurations = [
+        # pos1, pos2, z1, z2, omega, epsilon0, epsilon1, epsilon2
+        ([0, 0, 0], [3, 1, 1], -5, 10, 1 * ghz, 1, 1e6, 1),  # metallic surface
+        ([0, 0, 1], [2, 0, -1], -5, 5, 5 * ghz, 1, 1e6, 1e6),  # cavity
+        ([0, 0, 0], [3, 1, 1], -5, 10, 5 * ghz, 1, 4 + 0.1j, 1),  # dielectric surface
+        ([0, 0, 0], [3, 1, 1], -5, 10, 1000 * ghz, 1, 4 + 0.1j, 1),  # high frequency
+        ([0, 0, 0], [3, 1, 1], -5, 10, 5 * ghz, 1, np.nan, 1),  # configuration with a non-finite integrand
+    ]
+    pos1, pos2, z1, z2, omega, epsilon0, epsilon1, epsilon2 = (np.array(v) for v in zip(*configurations, strict=True))
+    with np.errstate(invalid="ignore"):
+        gt_many = dynamic_green_tensor_scattered_many(
+            pos1 * um, pos2 * um, z1 * um, z2 * um, omega, epsilon0, epsilon1, epsilon2, only_real_part=True
+        )
+    assert gt_many.shape == (len(configurations), 3, 3)
+
+    # The non-finite configuration must not affect the accuracy of the other configurations
+    assert np.all(np.isnan(gt_many[-1]))
+    for i, (p1, p2, *args) in enumerate(configurations[:-1]):
+        gt_reference = dynamic_green_tensor_scattered(
+            np.array(p1) * um, np.array(p2) * um, args[0] * um, args[1] * um, *args[2:], only_real_part=True
+        )
+        atol = 1e-7 * np.max(np.abs(gt_reference))
+        np.testing.assert_allclose(gt_many[i], gt_reference, rtol=1e-7, atol=atol)
+
+
+@pytest.mark.parametrize("green_tensor_class", [GreenTensorSurface, GreenTensorCavity])
+def test_get_many_green_tensors(green_tensor_class: type[GreenTensorSurface | GreenTensorCavity]) -> None:
+    geometry: dict[str, list[float]]
+    if green_tensor_class is GreenTensorSurface:
+        geometry = {"point_on_plane": [0, 0, -5], "surface_normal": [0, 1, 1]}
+    else:
+        geometry = {"point_on_plane1": [0, 0, -5], "point_on_plane2": [0, 0, 5], "surface_normal": [0, 0, 1]}
+    positions = [([0, 0, 0], [3, 1, 1]), ([0, 0, 1], [2, 0, -1])]
+    transition_energies = [1, 5, 20]  # planck_constant * GHz
+
+    gt = green_tensor_class(*positions[0], unit="micrometer", static_limit=False, **geometry)  # type: ignore [arg-type]
+    gt_many = gt.get_many(1, 1, transition_energies, "planck_constant * GHz", "1/bohr")
+    gt_many_positions = gt.get_many(
+        1, 1, transition_energies, "planck_constant * GHz", "1/bohr", positions=positions, positions_unit="micrometer"
+    )
+    assert gt_many.shape == (len(transition_energies), 3, 3)
+    assert gt_many_positions.shape == (len(positions), len(transition_energies), 3, 3)
+
+    for i, (pos1, pos2) in enumerate(positions):
+        gt = green_tensor_class(pos1, pos2, unit="micrometer", static_limit=False, **geometry)  # type: ignore [arg-type]
+        for j, transition_energy in enumerate(transition_energies):
+            gt_reference = gt.get(1, 1, transition_energy, "planck_constant * GHz", "1/bohr")
+            np.testing.assert_allclose(gt_many_positions[i, j], gt_reference, rtol=1e-8, atol=1e-20)
+            if i == 0:
+                np.testing.assert_allclose(gt_many[j], gt_reference, rtol=1e-8, atol=1e-20)
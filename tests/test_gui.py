@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any, Literal
 import matplotlib.pyplot as plt
 import numpy as np
 import pytest
+from pairinteraction_gui.calculate.calculate_two_atoms import ParametersTwoAtoms, _create_basis_pairs
 from pairinteraction_gui.main_window import MainWindow
 
 from .utils import REFERENCE_PATHS, compare_eigensystem_to_reference, no_log_propagation
@@ -15,6 +16,8 @@ from .utils import REFERENCE_PATHS, compare_eigensystem_to_reference, no_log_pro
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from pairinteraction_gui.config.basis_config import QuantumNumberRestrictions
+    from pairinteraction_gui.config.system_config import RangesKeys
     from pairinteraction_gui.page import LifetimesPage, OneAtomPage
     from pairinteraction_gui.page.two_atoms_page import TwoAtomsPage
     from pytestqt.qtbot import QtBot
@@ -151,6 +154,55 @@ def test_lifetimes_page(window_lifetimes: MainWindow) -> None:
         assert np.allclose(locals_globals["rates_summed"][key], rates)
 
 
+def _create_basis_pairs_for_steps(
+    ranges: dict[RangesKeys, list[float]],
+    restrictions: tuple[QuantumNumberRestrictions, QuantumNumberRestrictions] = (
+        {"n": (58, 62), "l": (0, 2)},
+        {"n": (58, 62), "l": (0, 2)},
+    ),
+) -> list[Any]:
+    parameters = ParametersTwoAtoms(
+        species=("Rb", "Rb"),
+        quantum_numbers=({"n": 60, "l": 0, "m": 0.5},) * 2,
+        quantum_number_restrictions=restrictions,
+        ranges=ranges,
+        diamagnetism_enabled=False,
+        diagonalize_kwargs={},
+        diagonalize_relative_energy_range=None,
+        pair_delta_energy=3,
+    )
+    kets = tuple(parameters.get_ket_atom(i) for i in range(2))
+    return _create_basis_pairs(parameters, kets)  # type: ignore [arg-type]
+
+
+def test_two_atoms_reuses_pair_bases() -> None:
+    """Test that steps with the same atoms and fields share their systems and pair basis."""
+    # The first two steps only differ in the distance, so that they must share all objects
+    basis_pairs = _create_basis_pairs_for_steps({"Distance": [1, 2, 3], "Ez": [1, 1, 2]})
+    assert basis_pairs[0] is basis_pairs[1]
+    assert basis_pairs[2] is not basis_pairs[0]
+    assert basis_pairs[2].system_atoms[0] is not basis_pairs[0].system_atoms[0]
+
+    # Identical atoms share one system
+    assert basis_pairs[0].system_atoms[0] is basis_pairs[0].system_atoms[1]
+
+    # Changing any field component must give new systems and a new pair basis
+    field_keys: list[RangesKeys] = ["Ex", "Ey", "Ez", "Bx", "By", "Bz"]
+    for key in field_keys:
+        basis_pairs = _create_basis_pairs_for_steps({"Distance": [1, 2], key: [0, 1]})
+        assert basis_pairs[1] is not basis_pairs[0]
+        assert basis_pairs[1].system_atoms[0] is not basis_pairs[0].system_atoms[0]
+
+    # Atoms with different restrictions do not share their system
+    basis_pairs = _create_basis_pairs_for_steps(
+        {"Distance": [1, 2]}, ({"n": (58, 62), "l": (0, 2)}, {"n": (58, 62), "l": (0, 3)})
+    )
+    assert basis_pairs[0] is basis_pairs[1]
+    system_atoms = basis_pairs[0].system_atoms
+    assert system_atoms[0] is not system_atoms[1]
+    assert system_atoms[0].basis.number_of_kets < system_atoms[1].basis.number_of_kets
+
+
 def _test_calculate_page(
     window: MainWindow,
     page_name: Literal["OneAtomPage", "TwoAtomsPage"],
@@ -0,0 +1,56 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+# Generous upper bound for the cumulative import time of pairinteraction, which is far above the typical
+# import time but catches if a heavy dependency is accidentally imported eagerly again
+IMPORT_TIME_BUDGET_SECONDS = 3.0
+
+LAZY_MODULES = [
+    "matplotlib",
+    "numba",
+    "pairinteraction.green_tensor",
+    "pairinteraction.perturbative",
+    "pairinteraction.visualization",
+]
+
+
+def get_import_times(statement: str) -> dict[str, float]:
+    """Run the statement in a fresh interpreter and return the cumulative import times in seconds."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("PAIRINTERACTION_TEST_")}
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", statement], capture_output=True, text=True, check=True, env=env
+    )
+
+    # lines have the format "import time: self [us] | cumulative | imported package"
+    import_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        import_times[name.strip()] = int(cumulative_us) * 1e-6
+    return import_times
+
+
+def test_import_time() -> None:
+    """Test that importing pairinteraction does not import heavy optional modules and stays within budget."""
+    import_times = get_import_times("import pairinteraction")
+
+    assert "pairinteraction" in import_times
+    for module in LAZY_MODULES:
+        assert module not in import_times, f"{module} should only be imported on first access"
+    assert import_times["pairinteraction"] < IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_lazy_attributes() -> None:
+    """Test that the lazily imported attributes are available on first access."""
+    import_times = get_import_times(
+        "import pairinteraction as pi; pi.C6; pi.green_tensor.GreenTensorFreeSpace; pi.real.EffectiveSystemPair"
+    )
+    assert "pairinteraction.perturbative" in import_times
+    assert "pairinteraction.green_tensor" in import_times
@@ -58,3 +58,21 @@ def test_ket_equal(pi_module: PairinteractionModule) -> None:
     ket1 = pi_module.KetAtom("Sr88_singlet", n=60, l=1, j=1, m=0)
     ket2 = pi_module.KetAtom("Sr88_triplet", n=60, l=1, j=1, m=0)
     assert ket1 != ket2
+
+
+def test_ket_from_arrays(pi_module: PairinteractionModule) -> None:
+    ns = [58, 59, 60, 61]
+    kets = pi_module.KetAtom.from_arrays("Rb", n=ns, l=[0, 1, 0, 1], j=0.5, m=[0.5, -0.5, 0.5, -0.5])
+    assert len(kets) == len(ns)
+    for ket, n, l, m in zip(kets, ns, [0, 1, 0, 1], [0.5, -0.5, 0.5, -0.5], strict=True):
+        assert isinstance(ket, pi_module.KetAtom)
+        assert ket == pi_module.KetAtom("Rb", n=n, l=l, j=0.5, m=m)
+
+    energies = [ket.get_energy("GHz") for ket in kets]
+    kets_by_energy = pi_module.KetAtom.from_arrays(
+        "Rb", energy=energies, energy_unit="GHz", l=[0, 1, 0, 1], j=0.5, m=[0.5, -0.5, 0.5, -0.5]
+    )
+    assert kets_by_energy == kets
+
+    with pytest.raises(ValueError, match="No state found"):
+        pi_module.KetAtom.from_arrays("Rb", n=[60, 1], l=0, j=0.5, m=0.5)
@@ -8,9 +8,12 @@ from typing import TYPE_CHECKING
 import numpy as np
 import pytest
 from pairinteraction import ureg
+from pairinteraction.units import QuantityArray, QuantityScalar
 from scipy.optimize import curve_fit
+from scipy.special import exprel
 
 if TYPE_CHECKING:
+    import pairinteraction as pi
     from pairinteraction.units import NDArray
 
     from .utils import PairinteractionModule
@@ -94,3 +97,57 @@ def test_transition_rates(pi_module: PairinteractionModule) -> None:
     assert len(rates_sp) == len(kets_sp)
     assert len(rates_bbr) == len(kets_bbr)
     assert np.isclose(1 / (sum(rates_sp) + sum(rates_bbr)), lifetime)
+
+
+def test_lifetimes_of_many_kets(pi_module: PairinteractionModule) -> None:
+    """Test the batched calculation against a separate calculation for each ket with its own basis."""
+    kets = [
+        pi_module.KetAtom("Rb", n=n, l=l, j=l + 0.5, m=m) for n in [52, 60, 68] for l in [0, 1] for m in [-0.5, 0.5]
+    ]
+    temperature_au = QuantityScalar.convert_user_to_au(300, "K", "temperature")
+
+    with no_log_propagation("cpp"):  # surpress low n state warnings from lifetime calculation
+        lifetimes = pi_module.get_lifetimes(kets, temperature=300, temperature_unit="K", unit="us")
+        lifetimes_0 = pi_module.get_lifetimes(kets, unit="us")
+        relevant_kets_sp, rates_sp = pi_module.get_transition_rates_many(kets, "spontaneous", unit="MHz")
+        relevant_kets_bbr, rates_bbr = pi_module.get_transition_rates_many(
+            kets, "black_body", temperature=300, temperature_unit="K", unit="MHz"
+        )
+
+        assert rates_sp.shape == (len(kets), len(relevant_kets_sp))
+        assert rates_bbr.shape == (len(kets), len(relevant_kets_bbr))
+        np.testing.assert_allclose(1 / (rates_sp.sum(axis=1) + rates_bbr.sum(axis=1)), lifetimes)
+
+        # each ket only decays to final states with n up to its own n + 30, although kets share a basis
+        n_final_bbr = np.array([ket.n for ket in relevant_kets_bbr])
+        for i, ket in enumerate(kets):
+            assert np.all(rates_bbr[i, n_final_bbr > ket.n + 30] == 0)
+
+        for i, ket in enumerate(kets):
+            lifetime_reference, lifetime_0_reference = _get_lifetimes_reference(pi_module, ket, temperature_au)
+            assert np.isclose(lifetimes[i], lifetime_reference, rtol=1e-10)
+            assert np.isclose(lifetimes_0[i], lifetime_0_reference, rtol=1e-10)
+
+    with pytest.raises(ValueError, match="temperature must be given"):
+        pi_module.get_transition_rates_many(kets, "black_body")
+
+
+def _get_lifetimes_reference(pi_module: PairinteractionModule, ket: pi.KetAtom, temperature_au: float) -> NDArray:
+    """Calculate the lifetime of a ket with and without black body transitions, using a basis only for this ket."""
+    basis = pi_module.BasisAtom(
+        ket.species, n=(1, ket.n + 30), l=(ket.l - 1, ket.l + 1), m=(ket.m - 1, ket.m + 1), additional_kets=[ket]
+    )
+    energy_differences_au = ket.get_energy("hartree") - pi_module.SystemAtom(basis).get_eigenenergies("hartree")
+    electric_dipole_moments_au = sum(
+        basis.get_matrix_elements(ket, "electric_dipole", q).to_base_units().magnitude for q in [-1, 0, 1]
+    )
+    einstein_factors_au = (
+        (4 / 3)
+        * np.abs(electric_dipole_moments_au) ** 2
+        * energy_differences_au**2
+        / ureg.Quantity(1, "speed_of_light").to_base_units().magnitude ** 3
+    )
+    rates_sp_au = einstein_factors_au * np.clip(energy_differences_au, 0, None)
+    rates_bbr_au = einstein_factors_au * temperature_au / exprel(energy_differences_au / temperature_au)
+    lifetimes_au = np.array([1 / np.sum(rates_sp_au + rates_bbr_au), 1 / np.sum(rates_sp_au)])
+    return QuantityArray.convert_au_to_user(lifetimes_au, "time", "us")
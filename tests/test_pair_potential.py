@@ -57,3 +57,35 @@ def test_pair_potential(pi_module: PairinteractionModule, generate_reference: bo
         pytest.skip("Reference data generated, skipping comparison test")
 
     compare_eigensystem_to_reference(reference_path, eigenenergies, overlaps, eigenvectors, kets)
+
+
+def test_pair_potential_streamed(pi_module: PairinteractionModule) -> None:
+    """Test that diagonalizing the systems in chunks gives the same results as diagonalizing them at once."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    system = pi_module.SystemAtom(basis)
+
+    ket = pi_module.KetAtom("Rb", n=60, l=0, m=0.5)
+    pair_energy = 2 * ket.get_energy(unit="GHz")
+    basis_pair = pi_module.BasisPair(
+        [system, system], energy=(pair_energy - 3, pair_energy + 3), energy_unit="GHz", m=(1, 1)
+    )
+
+    distances = np.linspace(1, 5, 5)
+    system_pairs = [pi_module.SystemPair(basis_pair).set_distance(d, unit="micrometer") for d in distances]
+    pi_module.diagonalize(system_pairs)
+
+    results = list(
+        pi_module.iter_diagonalize(
+            (pi_module.SystemPair(basis_pair).set_distance(d, unit="micrometer") for d in distances),
+            max_in_flight=2,
+            states_of_interest=[(ket, ket)],
+            eigenvector_indices=slice(0, 3),
+            unit="GHz",
+        )
+    )
+
+    assert [result.index for result in results] == list(range(len(distances)))
+    for system_pair, result in zip(system_pairs, results, strict=True):
+        np.testing.assert_allclose(result.eigenenergies, system_pair.get_eigenenergies(unit="GHz"))
+        np.testing.assert_allclose(result.overlaps[0], system_pair.get_eigenbasis().get_overlaps((ket, ket)))
+        assert result.eigenvectors.shape == (basis_pair.number_of_kets, 3)
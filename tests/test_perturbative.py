@@ -196,6 +196,90 @@ def test_c6(pi_module: PairinteractionModule) -> None:
     assert np.isclose(c6, -169.135)
 
 
+def test_c3_and_c6_coefficients(pi_module: PairinteractionModule) -> None:
+    """Test the calculation of C3 and C6 coefficients of many pair states without constructing a pair system."""
+    kets = [
+        pi_module.KetAtom("Rb", n=61, l=0, j=0.5, m=0.5),
+        pi_module.KetAtom("Rb", n=61, l=1, j=1.5, m=0.5),
+    ]
+
+    c3_obj = pi_module.C3(*kets)
+    c3_obj.set_magnetic_field([0, 0, 10], "gauss")
+    c3_reference = c3_obj.get(unit="planck_constant * gigahertz * micrometer^3")
+    c3 = pi_module.perturbative.get_c3_coefficients(
+        [(kets[0], kets[1]), (kets[1], kets[0])], c3_obj.system_atoms, unit="planck_constant * gigahertz * micrometer^3"
+    )
+    assert np.allclose(c3, c3_reference)
+
+    # The reference C6 coefficients take into account only pair states within an energy window
+    for ket in kets:
+        c6_obj = pi_module.C6(ket, ket)
+        c6_obj.set_magnetic_field([0, 0, 10], "gauss")
+        c6_reference = c6_obj.get(unit="planck_constant * gigahertz * micrometer^6")
+        c6 = pi_module.perturbative.get_c6_coefficients(
+            [(ket, ket)], c6_obj.system_atoms, unit="planck_constant * gigahertz * micrometer^6"
+        )
+        assert np.isclose(c6[0], c6_reference, rtol=2e-2)
+
+
+def test_c6_coefficients_of_degenerate_pair_states(pi_module: PairinteractionModule) -> None:
+    """Test that the C6 coefficients of pair states coupling to degenerate pair states are infinite."""
+    kets = [
+        pi_module.KetAtom("Rb", n=61, l=0, j=0.5, m=0.5),
+        pi_module.KetAtom("Rb", n=61, l=1, j=1.5, m=0.5),
+    ]
+
+    # Without fields, |a, b> is degenerate with |b, a>, to which it couples via the dipole-dipole interaction
+    c6_obj = pi_module.C6(kets[0], kets[0])
+    c6_reference = c6_obj.get(unit="planck_constant * gigahertz * micrometer^6")
+    c6 = pi_module.perturbative.get_c6_coefficients(
+        [(kets[0], kets[1]), (kets[1], kets[0]), (kets[0], kets[0])],
+        c6_obj.system_atoms,
+        unit="planck_constant * gigahertz * micrometer^6",
+    )
+    assert np.isinf(c6[0])
+    assert np.isinf(c6[1])
+    assert np.isclose(c6[2], c6_reference, rtol=2e-2)
+
+
+def test_c3_and_c6_angular_maps(pi_module: PairinteractionModule) -> None:
+    """Test the calculation of angular maps of C3 and C6 coefficients."""
+    kets = [
+        pi_module.KetAtom("Rb", n=61, l=0, j=0.5, m=0.5),
+        pi_module.KetAtom("Rb", n=61, l=1, j=1.5, m=0.5),
+    ]
+    c6_obj = pi_module.C6(kets[0], kets[0])
+    c6_obj.set_magnetic_field([0, 0, 10], "gauss")
+    system_atoms = c6_obj.system_atoms
+    ket_tuples = [(kets[0], kets[1]), (kets[1], kets[1])]
+    theta_degree = np.array([0, 30, 45, 90])
+    phi_degree = np.array([[0], [60]])
+
+    c3_map = pi_module.perturbative.get_c3_angular_map(
+        ket_tuples, system_atoms, theta_degree, phi_degree, unit="planck_constant * gigahertz * micrometer^3"
+    )
+    c6_map = pi_module.perturbative.get_c6_angular_map(
+        ket_tuples, system_atoms, theta_degree, phi_degree, unit="planck_constant * gigahertz * micrometer^6"
+    )
+    assert c3_map.shape == (2, 2, 4)
+    assert np.iscomplexobj(c3_map)
+    assert c6_map.shape == (2, 2, 4)
+
+    for i, angle_degree in enumerate(theta_degree):
+        c3 = pi_module.perturbative.get_c3_coefficients(
+            ket_tuples, system_atoms, angle_degree, unit="planck_constant * gigahertz * micrometer^3"
+        )
+        assert np.allclose(c3_map[:, 0, i], c3)
+        c6 = pi_module.perturbative.get_c6_coefficients(
+            ket_tuples[1:], system_atoms, angle_degree, unit="planck_constant * gigahertz * micrometer^6"
+        )
+        assert np.allclose(c6_map[1:, 0, i], c6)
+
+    # For states with m = 1/2 and a magnetic field along the z-axis, |C3| and C6 do not depend on the azimuthal angle
+    assert np.allclose(np.abs(c3_map[:, 1]), np.abs(c3_map[:, 0]))
+    assert np.allclose(c6_map[1:, 1], c6_map[1:, 0])
+
+
 def test_exact_resonance_detection(
     pi_module: PairinteractionModule, system_pair_sample: SystemPair, capsys: pytest.CaptureFixture[str]
 ) -> None:
@@ -0,0 +1,47 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from .utils import PairinteractionModule
+
+
+def test_profile(pi_module: PairinteractionModule, tmp_path: Path) -> None:
+    """Test that the stages of a calculation are profiled."""
+    pi_module.reset_profile()
+
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in range(3)]
+    pi_module.diagonalize(systems, diagonalizer="eigen")
+
+    profile = pi_module.get_profile()
+    timers, counters = profile["timers"], profile["counters"]
+    assert timers["System::diagonalize"]["count"] == 3
+    assert timers["SystemAtom::construct_hamiltonian"]["count"] == 3
+    assert timers["System::diagonalize"]["total_seconds"] >= timers["System::diagonalize"]["max_seconds"] > 0
+    assert sum(timers["System::diagonalize"]["total_seconds_per_thread"].values()) == pytest.approx(
+        timers["System::diagonalize"]["total_seconds"]
+    )
+    assert counters["System::diagonalize: matrix dimension"]["max"] == basis.number_of_states
+
+    pi_module.save_profile(tmp_path / "profile.json")
+    assert json.loads((tmp_path / "profile.json").read_text()) == profile
+
+    pi_module.save_profile(tmp_path / "trace.json", file_format="chrome_trace")
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    names = {event["name"] for event in trace["traceEvents"]}
+    assert {"System::diagonalize", "SystemAtom::construct_hamiltonian"} <= names
+
+    with pytest.raises(ValueError, match="Unknown file format"):
+        pi_module.save_profile(tmp_path / "profile.txt", file_format="txt")  # type: ignore [arg-type]
+
+    pi_module.reset_profile()
+    assert pi_module.get_profile() == {"timers": {}, "counters": {}}
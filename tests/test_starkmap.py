@@ -3,6 +3,8 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -45,3 +47,153 @@ def test_starkmap(pi_module: PairinteractionModule, generate_reference: bool) ->
         pytest.skip("Reference data generated, skipping comparison test")
 
     compare_eigensystem_to_reference(reference_path, eigenenergies, overlaps, eigenvectors, kets)
+
+
+def test_track_states(pi_module: PairinteractionModule) -> None:
+    """Test tracking the eigenstates of a Stark map adiabatically."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), m=(0.5, 0.5))
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in np.linspace(0, 1, 11)]
+    pi_module.diagonalize(systems, diagonalizer="eigen", sort_by_energy=True)
+
+    indices = pi_module.track_states(systems)
+    assert indices.shape == (len(systems), basis.number_of_states)
+    np.testing.assert_array_equal(indices[0], np.arange(basis.number_of_states))
+
+    # Every eigenstate is connected to a unique eigenstate and its energy changes only slightly between the steps
+    energies = np.array(
+        [system.get_eigenenergies(unit="GHz")[idxs] for system, idxs in zip(systems, indices, strict=True)]
+    )
+    assert all(len(np.unique(idxs)) == basis.number_of_states for idxs in indices)
+    assert np.max(np.abs(np.diff(energies, axis=0))) < 1
+
+    # Systems that are defined on different bases can not be tracked
+    other_basis = pi_module.BasisAtom("Rb", n=(59, 61), l=(0, 2), m=(0.5, 0.5))
+    other_system = pi_module.SystemAtom(other_basis)
+    pi_module.diagonalize([other_system])
+    with pytest.raises(ValueError, match="same basis"):
+        pi_module.track_states([*systems, other_system])
+
+
+def test_float32_refined(pi_module: PairinteractionModule) -> None:
+    """Test that refining the single-precision eigenpairs reaches the double-precision accuracy without fallback."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    electric_fields = np.linspace(0, 10, 5)
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in electric_fields]
+    reference_systems = [
+        pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in electric_fields
+    ]
+
+    pi_module.reset_profile()
+    pi_module.diagonalize(systems, float_type="float32_refined", rtol=1e-10)
+    counters = pi_module.get_profile()["counters"]
+    assert counters["DiagonalizerInterface::refine: number of iterations"]["count"] >= len(systems)
+    assert "DiagonalizerInterface::refine: number of fallbacks to float64" not in counters
+
+    pi_module.diagonalize(reference_systems, float_type="float64", rtol=1e-10)
+
+    for system, reference_system in zip(systems, reference_systems, strict=True):
+        energies = system.get_eigenenergies("GHz")
+        reference_energies = reference_system.get_eigenenergies("GHz")
+        np.testing.assert_allclose(energies, reference_energies, rtol=0, atol=1e-8 * np.max(np.abs(reference_energies)))
+
+
+def test_auto_rotate(pi_module: PairinteractionModule) -> None:
+    """Test diagonalizing a Stark map for a tilted field in the frame of the field."""
+    ket = pi_module.KetAtom("Rb", n=60, l=2, j=2.5, m=0.5)
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 3))
+    electric_fields = np.linspace(0, 5, 6)
+
+    systems = [pi_module.SystemAtom(basis).set_electric_field([e, 0, e], unit="V/cm") for e in electric_fields]
+    reference_systems = [
+        pi_module.SystemAtom(basis).set_electric_field([e, 0, e], unit="V/cm") for e in electric_fields
+    ]
+    pi_module.diagonalize(systems, rtol=1e-10, auto_rotate=True)
+    pi_module.diagonalize(reference_systems, rtol=1e-10)
+
+    # The eigenstates are returned in the original frame, which we check via the energy variance of |ket>, i.e.
+    # <ket|(H - E_ket)^2|ket>, which is independent of the choice of the eigenstates within degenerate subspaces
+    # but depends on the orientation of the field relative to the quantization axis of |ket>
+    ket_energy = ket.get_energy("GHz")
+    for system, reference_system in zip(systems, reference_systems, strict=True):
+        energies = system.get_eigenenergies("GHz")
+        reference_energies = reference_system.get_eigenenergies("GHz")
+        np.testing.assert_allclose(energies, reference_energies, rtol=0, atol=1e-6)
+
+        variance = system.basis.get_overlaps(ket) @ (energies - ket_energy) ** 2
+        reference_variance = reference_system.basis.get_overlaps(ket) @ (reference_energies - ket_energy) ** 2
+        assert np.isclose(variance, reference_variance, rtol=1e-6, atol=1e-10)
+
+
+def test_diagonalize_async(pi_module: PairinteractionModule) -> None:
+    """Test diagonalizing a Stark map asynchronously while streaming the progress, and cancelling it."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), m=(0.5, 0.5))
+    electric_fields = np.linspace(0, 1, 11)
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in electric_fields]
+    reference_systems = [
+        pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in electric_fields
+    ]
+    pi_module.diagonalize(reference_systems)
+
+    async def diagonalize_with_progress() -> list[int]:
+        return [p.number_of_finished_systems async for p in pi_module.diagonalize_async(systems, poll_interval=0.001)]
+
+    progress = asyncio.run(diagonalize_with_progress())
+    assert progress == sorted(progress)
+    assert progress[-1] == len(systems)
+    for system, reference_system in zip(systems, reference_systems, strict=True):
+        assert np.allclose(system.get_eigenenergies("GHz"), reference_system.get_eigenenergies("GHz"))
+
+    # Cancel the diagonalization as soon as the first system is finished, so that the backend aborts while it is
+    # still diagonalizing. The systems are not restricted to one m-block and outnumber the threads of the backend,
+    # so that many of them have not been started yet.
+    cancelled_basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 3))
+    cancelled_systems = [
+        pi_module.SystemAtom(cancelled_basis).set_electric_field([e, 0, e], unit="V/cm")
+        for e in np.linspace(0, 1, 10 * (os.cpu_count() or 1))
+    ]
+
+    async def diagonalize_and_cancel() -> list[int]:
+        task = pi_module.diagonalize_async(cancelled_systems, poll_interval=0.001)
+        progress: list[int] = []
+
+        async def cancel_on_first_progress() -> None:
+            async for p in task:
+                progress.append(p.number_of_finished_systems)
+                task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await cancel_on_first_progress()
+        assert task.done()
+        return progress
+
+    progress = asyncio.run(diagonalize_and_cancel())
+    assert len(progress) == 1
+    number_of_diagonalized_systems = sum(system.is_diagonal for system in cancelled_systems)
+    assert progress[0] <= number_of_diagonalized_systems < len(cancelled_systems)
+
+    # A cancelled diagonalization must not affect the next one
+    async def diagonalize_other_systems() -> None:
+        await pi_module.diagonalize_async(other_systems)
+
+    other_systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in electric_fields]
+    asyncio.run(diagonalize_other_systems())
+    assert all(system.is_diagonal for system in other_systems)
+
+
+def test_diagonalize_async_cancel_after_finish(pi_module: PairinteractionModule) -> None:
+    """Test that cancelling a finished asynchronous diagonalization does not abort later diagonalizations."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), m=(0.5, 0.5))
+    systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in [0, 0.5]]
+
+    async def diagonalize_and_cancel_afterwards() -> None:
+        task = pi_module.diagonalize_async(systems)
+        await task
+        assert task.done()
+        task.cancel()
+
+    asyncio.run(diagonalize_and_cancel_afterwards())
+    assert all(system.is_diagonal for system in systems)
+
+    other_systems = [pi_module.SystemAtom(basis).set_electric_field([0, 0, e], unit="V/cm") for e in [0, 0.5]]
+    pi_module.diagonalize(other_systems)
+    assert all(system.is_diagonal for system in other_systems)
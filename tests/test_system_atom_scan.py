@@ -0,0 +1,62 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+if TYPE_CHECKING:
+    from .utils import PairinteractionModule
+
+
+def test_system_atom_scan(pi_module: PairinteractionModule) -> None:
+    """Test that a scan gives the same results as individually constructed single-atom systems."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+
+    electric_fields = [[0.1 * e, 0, e] for e in np.linspace(0, 5, 6)]
+    magnetic_field = [0, 0, 10]
+    scan = (
+        pi_module.SystemAtomScan(basis)
+        .set_electric_fields(electric_fields, unit="V/cm")
+        .set_magnetic_fields([magnetic_field], unit="G")
+        .set_diamagnetism_enabled(True)
+    )
+    assert len(scan) == len(electric_fields)
+
+    references = [
+        pi_module.SystemAtom(basis)
+        .set_electric_field(e, unit="V/cm")
+        .set_magnetic_field(magnetic_field, unit="G")
+        .set_diamagnetism_enabled(True)
+        for e in electric_fields
+    ]
+    for system, reference in zip(scan, references, strict=True):
+        difference = system.get_hamiltonian(unit="GHz") - reference.get_hamiltonian(unit="GHz")
+        assert abs(difference).max() < 1e-10
+
+    scan.diagonalize(diagonalizer="eigen", sort_by_energy=True)
+    pi_module.diagonalize(references, diagonalizer="eigen", sort_by_energy=True)
+    for system, reference in zip(scan, references, strict=True):
+        assert system.is_diagonal
+        np.testing.assert_allclose(
+            system.get_eigenenergies(unit="GHz"), reference.get_eigenenergies(unit="GHz"), atol=1e-8
+        )
+
+
+def test_system_atom_scan_with_ion(pi_module: PairinteractionModule) -> None:
+    """Test a scan over the distance to an ion."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2), m=(0.5, 0.5))
+
+    distance_vectors = [[0, 0, d] for d in (5, 10, 20)]
+    scan = pi_module.SystemAtomScan(basis).set_ion_distance_vectors(distance_vectors, unit="micrometer")
+
+    for system, distance_vector in zip(scan, distance_vectors, strict=True):
+        reference = pi_module.SystemAtom(basis).set_ion_distance_vector(distance_vector, unit="micrometer")
+        difference = system.get_hamiltonian(unit="GHz") - reference.get_hamiltonian(unit="GHz")
+        assert abs(difference).max() < 1e-10
+
+    with pytest.raises(ValueError, match="must either agree or be at most one"):
+        scan.set_electric_fields([[0, 0, 1], [0, 0, 2]], unit="V/cm")
@@ -0,0 +1,54 @@
+# SPDX-FileCopyrightText: 2026 PairInteraction Developers
+# SPDX-License-Identifier: LGPL-3.0-or-later
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pytest
+
+if TYPE_CHECKING:
+    from .utils import PairinteractionModule
+
+
+def test_system_pair_scan(pi_module: PairinteractionModule) -> None:
+    """Test that a scan gives the same results as individually constructed pair systems."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    system = pi_module.SystemAtom(basis)
+
+    ket = pi_module.KetAtom("Rb", n=60, l=0, m=0.5)
+    pair_energy = 2 * ket.get_energy(unit="GHz")
+    basis_pair = pi_module.BasisPair([system, system], energy=(pair_energy - 3, pair_energy + 3), energy_unit="GHz")
+
+    distances = np.linspace(2, 6, 5)
+    scan = pi_module.SystemPairScan(basis_pair).set_interaction_order(4).set_distances(distances, 30, "micrometer")
+    assert len(scan) == len(distances)
+
+    references = [
+        pi_module.SystemPair(basis_pair).set_interaction_order(4).set_distance(d, 30, "micrometer") for d in distances
+    ]
+    for system_pair, reference in zip(scan, references, strict=True):
+        assert system_pair.get_distance(unit="micrometer") == pytest.approx(reference.get_distance(unit="micrometer"))
+        difference = system_pair.get_hamiltonian(unit="GHz") - reference.get_hamiltonian(unit="GHz")
+        assert abs(difference).max() < 1e-10
+
+    scan.diagonalize(diagonalizer="eigen", sort_by_energy=True)
+    pi_module.diagonalize(references, diagonalizer="eigen", sort_by_energy=True)
+    for system_pair, reference in zip(scan, references, strict=True):
+        assert system_pair.is_diagonal
+        np.testing.assert_allclose(
+            system_pair.get_eigenenergies(unit="GHz"), reference.get_eigenenergies(unit="GHz"), atol=1e-8
+        )
+
+
+def test_real_system_pair_scan_distance_vector_with_y_component_raises() -> None:
+    import pairinteraction.real as pi_real
+
+    ket = pi_real.KetAtom("Rb", n=60, l=0, j=0.5, m=0.5)
+    basis = pi_real.BasisAtom("Rb", n=(0, 0), additional_kets=[ket])
+    system = pi_real.SystemAtom(basis)
+    basis_pair = pi_real.BasisPair((system, system))
+
+    with pytest.raises(ValueError, match="y-component"):
+        pi_real.SystemPairScan(basis_pair).set_distance_vectors([[0, 0, 1], [0, 1, 0]], unit="micrometer")
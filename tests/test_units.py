@@ -6,7 +6,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import numpy as np
-from pairinteraction.units import AtomicUnits, QuantityScalar, ureg
+import pytest
+from pairinteraction.units import AtomicUnits, QuantityArray, QuantityScalar, ureg
+from pint.errors import DimensionalityError
+from scipy.sparse import csr_matrix
 
 if TYPE_CHECKING:
     from .utils import PairinteractionModule
@@ -69,3 +72,60 @@ def test_electric_dipole(pi_module: PairinteractionModule) -> None:
 
     assert np.isclose(-2 * c3.magnitude, hamiltonian[ket_ab_idx, ket_cc_idx])
     assert np.isclose(-2 * c3.magnitude, 5.73507543166919)
+
+
+def test_convert_au_to_user_fast_path(pi_module: PairinteractionModule) -> None:
+    """Test that the conversion with a unit string agrees with the conversion via pint."""
+    basis = pi_module.BasisAtom("Rb", n=(58, 62), l=(0, 2))
+    system = pi_module.SystemAtom(basis).set_electric_field([0, 0, 1], unit="V/cm").diagonalize()
+
+    eigenenergies = system.get_eigenenergies("GHz")
+    assert np.allclose(eigenenergies, system.get_eigenenergies().to("GHz", "spectroscopy").magnitude)
+
+    hamiltonian = system.get_hamiltonian("GHz")
+    hamiltonian_pint = system.get_hamiltonian().to("GHz", "spectroscopy").magnitude
+    assert isinstance(hamiltonian, csr_matrix)
+    assert np.allclose(hamiltonian.toarray(), hamiltonian_pint.toarray())
+
+    # units with an offset can not be converted by a scaling factor and fall back to pint
+    temperature_au = QuantityScalar.from_unit(300, "K", "temperature").to_au()
+    assert np.isclose(QuantityScalar.convert_au_to_user(temperature_au, "temperature", "degC"), 26.85)
+
+    # wavenumbers are proportional to the energy, wavelengths are reciprocal and fall back to pint
+    values_au = np.array([1.0, 0.5])
+    for unit, values in [
+        ("1/cm", [219474.6314, 109737.3157]),
+        ("cm^-1", [219474.6314, 109737.3157]),
+        ("nm", [45.56335253, 91.12670506]),
+    ]:
+        assert np.allclose(QuantityArray.convert_au_to_user(values_au, "energy", unit), values, rtol=1e-8)
+        assert np.allclose(
+            QuantityArray.convert_au_to_user(values_au, "energy", unit),
+            QuantityArray.from_au(values_au, "energy").to_unit(unit),
+        )
+        assert np.isclose(QuantityScalar.convert_au_to_user(0.5, "energy", unit), values[1], rtol=1e-8)
+
+
+def test_convert_user_to_au_fast_path() -> None:
+    """Test that the cached conversion factors agree with the conversion via pint."""
+    for value, unit, dimension in [
+        (5.0, "micrometer", "distance"),
+        (2.0, "GHz", "energy"),
+        (2.0, "1/cm", "energy"),
+        (2.0, "cm^-1", "energy"),
+        (780.0, "nm", "energy"),
+        (3.0, "gauss", "magnetic_field"),
+        (300.0, "degC", "temperature"),
+    ]:
+        value_au = QuantityScalar.from_unit(value, unit, dimension).to_au()
+        assert np.isclose(QuantityScalar.convert_user_to_au(value, unit, dimension), value_au)
+        assert np.isclose(QuantityScalar.convert_user_to_au(ureg.Quantity(value, unit), None, dimension), value_au)
+
+    values = np.linspace(1, 2, 5)
+    values_au = QuantityArray.from_unit(values, "GHz", "energy").to_au()
+    assert np.allclose(QuantityArray.convert_user_to_au(values, "GHz", "energy"), values_au)
+    assert np.allclose(QuantityArray.convert_user_to_au(list(values), "GHz", "energy"), values_au)
+
+    # the factors are only validated once, but invalid units must still raise an error
+    with pytest.raises(DimensionalityError):
+        QuantityScalar.convert_user_to_au(1.0, "GHz", "distance")
@@ -6,7 +6,7 @@ from __future__ import annotations
 import contextlib
 import logging
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol
+from typing import TYPE_CHECKING, Any, Protocol
 
 import numpy as np
 
@@ -68,10 +68,20 @@ class PairinteractionModule(Protocol):
     KetAtom: type[pi.KetAtom]
     BasisAtom: type[pi.BasisAtom]
     SystemAtom: type[pi.SystemAtom]
+    SystemAtomScan: type[pi.SystemAtomScan]
     KetPair: type[pi.KetPair]
     BasisPair: type[pi.BasisPair]
     SystemPair: type[pi.SystemPair]
+    SystemPairScan: type[pi.SystemPairScan]
     EffectiveSystemPair: type[pi.EffectiveSystemPair]
     C3: type[pi.C3]
     C6: type[pi.C6]
     diagonalize: Callable[..., None]
+    diagonalize_async: Callable[..., pi.diagonalization.DiagonalizationTask]
+    iter_diagonalize: Callable[..., Iterator[pi.diagonalization.DiagonalizationResult]]
+    track_states: Callable[..., NDArray]
+    get_lifetimes: Callable[..., NDArray]
+    get_transition_rates_many: Callable[..., tuple[list[pi.KetAtom], NDArray]]
+    get_profile: Callable[[], dict[str, Any]]
+    reset_profile: Callable[[], None]
+    save_profile: Callable[..., None]